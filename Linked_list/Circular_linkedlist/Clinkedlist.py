@@ -1,5 +1,6 @@
 # Circular Linked List Implementation in Python
 
+import gc
 from typing import TypeVar, Generic, Optional, List, Any, Iterator, Generator
 
 T = TypeVar('T')  # Type variable for generic typing
@@ -391,6 +392,47 @@ class CircularLinkedList(Generic[T]):
         
         return result
     
+    def iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """
+        Get an iterator over the values in lists of up to size values, starting at the head.
+        
+        Each chunk is a new list that is preallocated and filled in one tight
+        loop, so a consumer that processes whole batches pays for one
+        iterator step per chunk instead of one per value. Every chunk except
+        possibly the last holds exactly size values. Each value is visited
+        once; the list must not be changed until the iterator is exhausted.
+        
+        Args:
+            size: The maximum number of values per chunk
+            
+        Returns:
+            An iterator over lists of the values in order
+            
+        Raises:
+            ValueError: If size is not positive
+            
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(size)
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        return self._iter_chunks(size)
+    
+    def _iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """Fill and yield the chunks for iter_chunks()."""
+        if self._tail is None:
+            return
+        current = self._tail.next  # Start at the head
+        remaining = self._size
+        while remaining > 0:
+            count = size if size < remaining else remaining
+            chunk: List[Any] = [None] * count
+            for i in range(count):
+                chunk[i] = current.value
+                current = current.next
+            remaining -= count
+            yield chunk
+    
     @classmethod
     def from_list(cls, values: List[T]) -> 'CircularLinkedList[T]':
         """
@@ -412,6 +454,138 @@ class CircularLinkedList(Generic[T]):
         
         return circular_list
     
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Convert the circular linked list to a one-dimensional NumPy array, starting at the head.
+        
+        With a dtype, the values are written straight into an array of the
+        list's length with numpy.fromiter, without an intermediate list.
+        Without one, NumPy infers the dtype from all the values. NumPy is
+        imported only when this method is called.
+        
+        Args:
+            dtype: The NumPy dtype of the array, or None to infer it
+            
+        Returns:
+            A new numpy.ndarray holding the values in order
+            
+        Raises:
+            ImportError: If NumPy is not installed
+            
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(n)
+        """
+        import numpy as np
+        
+        if dtype is None:
+            return np.array(self.to_list())
+        return np.fromiter(self._values(), dtype=dtype, count=self._size)
+    
+    def _values(self) -> Iterator[T]:
+        """Yield each value once, starting at the head, without the shared iterator state."""
+        if self._tail is None:
+            return
+        current = self._tail.next
+        for _ in range(self._size):
+            yield current.value
+            current = current.next
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'CircularLinkedList[T]':
+        """
+        Create a new circular linked list from the items of a NumPy array along its first axis.
+        
+        The array is converted to Python objects in a single tolist() call,
+        so the list holds ints and floats rather than NumPy scalars, and the
+        rows of a 2-D array become lists. The nodes are then linked in one
+        pass by _link_values.
+        
+        Args:
+            arr: A NumPy array with at least one dimension
+            
+        Returns:
+            A new circular linked list containing the array's items in order
+            
+        Raises:
+            ValueError: If the array is zero-dimensional
+            
+        Time Complexity: O(n) - where n is the number of items
+        Space Complexity: O(n)
+        """
+        if arr.ndim == 0:
+            raise ValueError("Cannot create a linked list from a zero-dimensional array")
+        circular_list = cls()
+        circular_list._link_values(arr.tolist())
+        return circular_list
+    
+    def _link_values(self, values: List[T]) -> None:
+        """
+        Fill an empty list with new nodes holding values, linked into a circle in one pass.
+        
+        Used by from_numpy and when unpickling. The cyclic garbage collector is paused meanwhile, since none of the
+        new nodes can be garbage yet.
+        
+        Args:
+            values: The values in order, starting at the head
+            
+        Time Complexity: O(n) - where n is the number of values
+        Space Complexity: O(n)
+        """
+        if not values:
+            return
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            head = tail = Node(values[0])
+            for value in values[1:]:
+                node = Node(value)
+                tail.next = node
+                tail = node
+            tail.next = head
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self._tail = tail
+        self._size = len(values)
+    
+    def __getstate__(self) -> dict:
+        """
+        Get the list's state for pickle and copy, with the values as one flat list.
+        
+        Pickling the nodes themselves would recurse once per node through
+        Node.next (raising RecursionError for long lists) and store every
+        node as a separate object.
+        
+        Returns:
+            The instance attributes, with the nodes replaced by their values
+            
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(n)
+        """
+        state = self.__dict__.copy()
+        del state['_tail']
+        state['_iter_node'] = None
+        state['_iter_count'] = 0
+        state['_values'] = list(self._values())
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the list from the state returned by __getstate__, relinking the nodes in one pass.
+        
+        Args:
+            state: The state returned by __getstate__
+            
+        Time Complexity: O(n) - where n is the number of values
+        Space Complexity: O(n)
+        """
+        state = state.copy()
+        values = state.pop('_values')
+        self.__dict__.update(state)
+        self._tail = None
+        self._size = 0
+        self._link_values(values)
+    
     def rotate(self, k: int) -> None:
         """
         Rotate the list by k positions.
@@ -0,0 +1,391 @@
+# Aggregate Circular Linked List Implementation in Python
+
+from collections import deque
+from typing import TypeVar, Deque, List, Optional, Any
+
+from Clinkedlist import CircularLinkedList, Node
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+class AggregateCircularLinkedList(CircularLinkedList[T]):
+    """
+    A circular linked list that maintains running aggregates over its values.
+
+    The running sum and count are updated on every insertion and removal. The
+    minimum and maximum are tracked with monotonic deques of nodes, which stay
+    valid while the list is used as a sliding window: values are appended at the
+    end (or prepended at the beginning) and removed from the beginning with
+    remove_at(0). Any other mutation (removing a later node, inserting in the
+    middle or rotating) marks the extremes as stale, and they are rebuilt with a
+    single O(n) pass on the next read.
+
+    Stored values must support addition, subtraction and ordering.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty aggregate circular linked list.
+        """
+        super().__init__()
+        self._sum: Any = 0
+        self._min_nodes: Deque[Node[T]] = deque()  # Non-decreasing values
+        self._max_nodes: Deque[Node[T]] = deque()  # Non-increasing values
+        self._stale: bool = False
+
+    def append(self, value: T) -> None:
+        """
+        Add a new node with the given value to the end of the list.
+
+        Args:
+            value: The value to add to the list
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        super().append(value)
+        self._sum += value
+        if not self._stale:
+            self._push_back(self._tail)
+
+    def prepend(self, value: T) -> None:
+        """
+        Add a new node with the given value to the beginning of the list.
+
+        Args:
+            value: The value to add to the list
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        super().prepend(value)
+        self._sum += value
+        if not self._stale:
+            self._push_front(self._tail.next)
+
+    def insert_after(self, target_value: T, value: T) -> bool:
+        """
+        Insert a new node with the given value after the first occurrence of the target value.
+
+        Args:
+            target_value: The value to search for
+            value: The value to insert
+
+        Returns:
+            True if the insertion was successful, False if the target value was not found
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(1)
+        """
+        old_tail = self._tail
+        inserted = super().insert_after(target_value, value)
+        if inserted:
+            self._sum += value
+            if self._tail is not old_tail and not self._stale:
+                # Inserted after the tail, which is an append
+                self._push_back(self._tail)
+            else:
+                self._invalidate()
+        return inserted
+
+    def insert_at(self, index: int, value: T) -> None:
+        """
+        Insert a new node with the given value at the specified index.
+
+        Args:
+            index: The index at which to insert the value (0-based)
+            value: The value to insert
+
+        Raises:
+            IndexError: If the index is out of range
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(1)
+        """
+        # Index 0 and index == size are delegated to prepend/append,
+        # which already update the aggregates
+        middle = 0 < index < self._size
+        super().insert_at(index, value)
+        if middle:
+            self._sum += value
+            self._invalidate()
+
+    def remove(self, value: T) -> bool:
+        """
+        Remove the first occurrence of the specified value from the list.
+
+        Args:
+            value: The value to remove
+
+        Returns:
+            True if the value was found and removed, False otherwise
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(1)
+        """
+        head = None if self._tail is None else self._tail.next
+        removed = super().remove(value)
+        if removed:
+            self._sum -= value
+            if head is not None and head.value == value:
+                self._pop_front(head)
+            else:
+                self._invalidate()
+        return removed
+
+    def remove_at(self, index: int) -> T:
+        """
+        Remove and return the node at the specified index.
+
+        Args:
+            index: The index of the node to remove (0-based)
+
+        Returns:
+            The value of the removed node
+
+        Raises:
+            IndexError: If the index is out of range or the list is empty
+
+        Time Complexity: O(1) for index 0, O(n) otherwise
+        Space Complexity: O(1)
+        """
+        head = None if self._tail is None else self._tail.next
+        value = super().remove_at(index)
+        self._sum -= value
+        if index == 0:
+            self._pop_front(head)
+        else:
+            self._invalidate()
+        return value
+
+    def rotate(self, k: int) -> None:
+        """
+        Rotate the list by k positions.
+
+        The sum is unaffected; the min/max deques are marked as stale.
+
+        Args:
+            k: The number of positions to rotate
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(1)
+        """
+        if self.is_empty() or k % self._size == 0:
+            return
+        super().rotate(k)
+        self._invalidate()
+
+    def clear(self) -> None:
+        """
+        Remove all nodes from the list and reset the aggregates.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        super().clear()
+        self._sum = 0
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+        self._stale = False
+
+    def _link_values(self, values: List[T]) -> None:
+        """
+        Fill an empty list with values in one pass, then compute the sum.
+
+        Used by from_numpy and when unpickling. The min/max deques are marked
+        as stale and rebuilt on the next read.
+
+        Args:
+            values: The values in order, starting at the head
+
+        Time Complexity: O(n) - where n is the number of values
+        Space Complexity: O(n)
+        """
+        super()._link_values(values)
+        self._sum = sum(values)
+        self._invalidate()
+
+    def __getstate__(self) -> dict:
+        """
+        Get the list's state for pickle and copy.
+
+        The min/max deques hold nodes, so they are left out and the extremes
+        are marked as stale, to be rebuilt on the next read.
+
+        Returns:
+            The instance attributes, with the nodes replaced by their values
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(n)
+        """
+        state = super().__getstate__()
+        state['_min_nodes'] = deque()
+        state['_max_nodes'] = deque()
+        state['_stale'] = True
+        return state
+
+    def get_count(self) -> int:
+        """
+        Get the number of values in the list.
+
+        Returns:
+            The number of values
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size
+
+    def get_sum(self) -> Any:
+        """
+        Get the sum of the values in the list.
+
+        For floating point values the running sum may drift slightly from
+        sum(list) after many insertions and removals.
+
+        Returns:
+            The running sum, or 0 for an empty list
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._sum
+
+    def get_mean(self) -> float:
+        """
+        Get the arithmetic mean of the values in the list.
+
+        Returns:
+            The mean of the values
+
+        Raises:
+            ValueError: If the list is empty
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("Cannot compute the mean of an empty list")
+        return self._sum / self._size
+
+    def get_min(self) -> T:
+        """
+        Get the smallest value in the list.
+
+        Returns:
+            The minimum value
+
+        Raises:
+            ValueError: If the list is empty
+
+        Time Complexity: O(1), or O(n) once after a mutation that marked it stale
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("Cannot get the minimum of an empty list")
+        if self._stale:
+            self._rebuild()
+        return self._min_nodes[0].value
+
+    def get_max(self) -> T:
+        """
+        Get the largest value in the list.
+
+        Returns:
+            The maximum value
+
+        Raises:
+            ValueError: If the list is empty
+
+        Time Complexity: O(1), or O(n) once after a mutation that marked it stale
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise ValueError("Cannot get the maximum of an empty list")
+        if self._stale:
+            self._rebuild()
+        return self._max_nodes[0].value
+
+    def _push_back(self, node: Node[T]) -> None:
+        """
+        Add a node appended at the end to the min/max deques.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        value = node.value
+        min_nodes = self._min_nodes
+        while min_nodes and min_nodes[-1].value > value:
+            min_nodes.pop()
+        min_nodes.append(node)
+
+        max_nodes = self._max_nodes
+        while max_nodes and max_nodes[-1].value < value:
+            max_nodes.pop()
+        max_nodes.append(node)
+
+    def _push_front(self, node: Node[T]) -> None:
+        """
+        Add a node prepended at the beginning to the min/max deques.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        value = node.value
+        if not self._min_nodes or value <= self._min_nodes[0].value:
+            self._min_nodes.appendleft(node)
+        if not self._max_nodes or value >= self._max_nodes[0].value:
+            self._max_nodes.appendleft(node)
+
+    def _pop_front(self, node: Optional[Node[T]]) -> None:
+        """
+        Drop a node removed from the beginning from the min/max deques.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self._stale:
+            return
+        if self._min_nodes and self._min_nodes[0] is node:
+            self._min_nodes.popleft()
+        if self._max_nodes and self._max_nodes[0] is node:
+            self._max_nodes.popleft()
+
+    def _invalidate(self) -> None:
+        """
+        Mark the min/max deques as stale and release the nodes they hold.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        self._stale = True
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+
+    def _rebuild(self) -> None:
+        """
+        Rebuild the min/max deques from the current contents of the list.
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(n) in the worst case
+        """
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+        if self._tail is not None:
+            current = self._tail.next  # Start at the head
+            for _ in range(self._size):
+                self._push_back(current)
+                current = current.next
+        self._stale = False
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the aggregate circular linked list.
+
+        Returns:
+            A string representation of the list
+
+        Time Complexity: O(n) - where n is the number of nodes in the list
+        Space Complexity: O(n)
+        """
+        return f"AggregateCircularLinkedList({self.to_list()})"
@@ -0,0 +1,360 @@
+# Asyncio Round-Robin Runner Implementation in Python
+
+import asyncio
+import time
+from typing import Optional, AsyncIterator, Any
+
+from scheduler import TaskHandle, _RunRing
+
+
+class LatencyStats:
+    """
+    Running statistics of how long tasks waited in the ring for their turn.
+    """
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self) -> None:
+        """
+        Initialize empty statistics.
+        """
+        self.count: int = 0
+        self.total: float = 0.0  # Seconds
+        self.max: float = 0.0  # Seconds
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one wait.
+
+        Args:
+            seconds: How long the task waited
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        """The mean wait in seconds, or 0.0 if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Get the official string representation of the statistics.
+
+        Returns:
+            The official string representation of the statistics
+        """
+        return (f"LatencyStats(count={self.count}, mean={self.mean * 1e3:.3f}ms, "
+                f"max={self.max * 1e3:.3f}ms)")
+
+
+class AsyncTaskHandle(TaskHandle[AsyncIterator[Any]]):
+    """
+    A task's node in an AsyncRoundRobin run ring, returned by add().
+    """
+
+    def __init__(self, task: AsyncIterator[Any], weight: int, name: Optional[str]) -> None:
+        """
+        Initialize a handle for a task that has not run yet.
+
+        Args:
+            task: The async iterator that performs the task's work
+            weight: The task's share of each round
+            name: An optional name for the task
+        """
+        super().__init__(task, weight)
+        self.name: Optional[str] = name
+        self.latency: LatencyStats = LatencyStats()
+        self.cancelled: bool = False
+        self._ready_at: float = time.perf_counter()  # When the task last became ready
+        self._running: bool = False
+        self._closed: bool = False
+        self._done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def done(self) -> bool:
+        """
+        Check whether the task has finished or been cancelled and closed.
+
+        Returns:
+            True if the task is done, False otherwise
+        """
+        return self._done.done()
+
+    async def wait(self) -> bool:
+        """
+        Wait until the task is done.
+
+        Returns:
+            True if the task ran to completion, False if it was cancelled
+
+        Raises:
+            Exception: The exception raised by the task, if it failed
+        """
+        return await asyncio.shield(self._done)
+
+
+class AsyncRoundRobin:
+    """
+    An asyncio runner that drives tasks in ring order with time-slice budgets.
+
+    A task is an async iterator, usually an async generator, and each yield
+    is a point where it can be preempted. On its turn a task is stepped
+    (its __anext__ awaited) until it has used its time slice, which is
+    time_slice * weight plus any budget carried over: as in
+    DeficitRoundRobin, the overrun of a step that ran past the slice is
+    charged against the task's next turns. A task whose debt is at least a
+    whole slice skips its turns, gaining one slice each time, until it has
+    paid the debt off, so a task with long steps receives the same share of
+    the time as one with short steps. The debt never exceeds the overrun of
+    one step, and unused time is not carried over. Between turns the runner
+    yields to the event loop, so other coroutines never wait for more than
+    about one slice. Steps run one at a time, so a step that awaits I/O holds
+    the runner until it resumes; I/O-bound work belongs in its own asyncio
+    task.
+
+    The run ring is the same CircularLinkedList of handles used by
+    DeficitRoundRobin. Adding a task is O(1), and cancelling one marks its
+    handle in O(1); the task is unlinked when it reaches the head of the
+    ring, so nothing scans the ring. Each handle records how long the task
+    waited for each turn in handle.latency, and runner.latency aggregates
+    all tasks.
+    """
+
+    def __init__(self, time_slice: float = 0.005, max_tasks: Optional[int] = None) -> None:
+        """
+        Initialize an empty runner.
+
+        Must be called with an event loop running.
+
+        Args:
+            time_slice: The budget per turn in seconds of a task with weight 1
+            max_tasks: If given, add() waits while this many tasks are active
+
+        Raises:
+            ValueError: If the time slice or max_tasks is not positive
+        """
+        if time_slice <= 0:
+            raise ValueError("Time slice must be positive")
+        if max_tasks is not None and max_tasks <= 0:
+            raise ValueError("max_tasks must be positive")
+        self._time_slice: float = time_slice
+        self._ring: _RunRing[AsyncIterator[Any]] = _RunRing()
+        self._active: int = 0  # Number of tasks that have not finished or been cancelled
+        self._slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_tasks) if max_tasks is not None else None)
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._stopping: bool = False
+        self.latency: LatencyStats = LatencyStats()
+
+    @property
+    def time_slice(self) -> float:
+        """The budget per turn in seconds of a task with weight 1."""
+        return self._time_slice
+
+    async def add(self, task: AsyncIterator[Any], weight: int = 1,
+                  name: Optional[str] = None) -> AsyncTaskHandle:
+        """
+        Add a task at the end of the current round.
+
+        If the runner was created with max_tasks, this waits until fewer
+        than max_tasks tasks are active.
+
+        Args:
+            task: The async iterator that performs the task's work
+            weight: The task's share of each round relative to other tasks
+            name: An optional name for the task
+
+        Returns:
+            A handle for cancelling the task, waiting for it and reading its latency
+
+        Raises:
+            ValueError: If the weight is not positive
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        if self._slots is not None:
+            await self._slots.acquire()
+        handle = AsyncTaskHandle(task, weight, name)
+        self._ring.push(handle)
+        self._active += 1
+        self._wakeup.set()
+        return handle
+
+    def cancel(self, handle: AsyncTaskHandle) -> bool:
+        """
+        Cancel a task so that it does not run again.
+
+        The task's iterator is closed when the task reaches the head of the
+        ring, or right after its current step if it is running.
+
+        Args:
+            handle: The handle returned by add()
+
+        Returns:
+            True if the task was cancelled, False if it was already done or cancelled
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not handle.active:
+            return False
+        handle.cancelled = True
+        self._deactivate(handle)
+        return True
+
+    async def remove(self, handle: AsyncTaskHandle) -> bool:
+        """
+        Cancel a task and wait until its iterator has been closed.
+
+        A task must not remove itself from inside its own step (which would
+        wait for itself); it can call cancel() instead.
+
+        Args:
+            handle: The handle returned by add()
+
+        Returns:
+            True if the task was cancelled, False if it was already done or cancelled
+
+        Time Complexity: O(1), plus closing the iterator
+        Space Complexity: O(1)
+        """
+        cancelled = self.cancel(handle)
+        if handle._running:
+            await handle.wait()
+        else:
+            await self._close(handle)
+        return cancelled
+
+    def _deactivate(self, handle: AsyncTaskHandle) -> None:
+        """Mark a task as no longer active and free its slot."""
+        handle.active = False
+        self._active -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    async def _close(self, handle: AsyncTaskHandle) -> None:
+        """Close a task's iterator once and resolve its handle."""
+        if handle._closed:
+            return
+        handle._closed = True
+        close = getattr(handle.value, 'aclose', None)
+        try:
+            if handle.cancelled and close is not None:
+                await close()
+        finally:
+            if not handle._done.done():
+                handle._done.set_result(not handle.cancelled)
+
+    async def _turn(self, handle: AsyncTaskHandle) -> None:
+        """Step a task until it uses its budget, finishes or is cancelled."""
+        start = time.perf_counter()
+        wait = start - handle._ready_at
+        handle.latency.record(wait)
+        self.latency.record(wait)
+        budget = handle.deficit + self._time_slice * handle.weight
+        deadline = start + budget
+        now = start
+        finished = False
+        handle._running = True
+        try:
+            while handle.active:
+                try:
+                    await handle.value.__anext__()
+                except StopAsyncIteration:
+                    finished = True
+                    break
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+        finally:
+            handle._running = False
+        if finished and handle.active:
+            # A task cancelled during its last step was already deactivated
+            self._deactivate(handle)
+        # Only the overrun of the last step carries over; an early finish is not credited
+        handle.deficit = min(0.0, deadline - now)
+        handle._ready_at = time.perf_counter()
+
+    async def run(self, until_empty: bool = True) -> None:
+        """
+        Drive the tasks in ring order.
+
+        A task whose step raises an exception is removed from the ring, and
+        the exception is raised by its handle's wait().
+
+        Args:
+            until_empty: If True, return once no tasks are active; otherwise
+                keep waiting for new tasks until stop() is called
+        """
+        self._stopping = False
+        ring = self._ring
+        while not self._stopping:
+            if ring.is_empty():
+                if until_empty:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            handle = ring.head()
+            quantum = self._time_slice * handle.weight
+            if handle.active and handle.deficit <= -quantum:
+                # Still paying off an overrun: skip the turn, which takes no time
+                handle.deficit += quantum
+                ring.advance()
+                continue
+            if handle.active:
+                try:
+                    await self._turn(handle)
+                except Exception as error:
+                    # The task failed: drop it and hand the error to its waiters
+                    if handle.active:
+                        self._deactivate(handle)
+                    handle._closed = True
+                    if not handle._done.done():
+                        handle._done.set_exception(error)
+            if handle.active:
+                ring.advance()
+            else:
+                ring.pop_head()
+                await self._close(handle)
+            # Let the rest of the event loop run between turns
+            await asyncio.sleep(0)
+
+    def stop(self) -> None:
+        """
+        Make run() return after the current turn.
+        """
+        self._stopping = True
+        self._wakeup.set()
+
+    def is_empty(self) -> bool:
+        """
+        Check if there are no active tasks.
+
+        Returns:
+            True if there are no active tasks, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._active == 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of active tasks.
+
+        Returns:
+            The number of active tasks
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._active
@@ -0,0 +1,59 @@
+"""
+Benchmark for AggregateCircularLinkedList.
+
+Compares the per-tick cost of a rolling window (append, remove_at(0), read
+sum/min/max) using full scans over a CircularLinkedList against the running
+aggregates of AggregateCircularLinkedList, across several window sizes.
+"""
+
+import random
+import time
+
+from Clinkedlist import CircularLinkedList
+from aggregate import AggregateCircularLinkedList
+
+
+def scan_tick(window, value):
+    """Advance the window by one value and read the aggregates by scanning."""
+    window.append(value)
+    window.remove_at(0)
+    values = window.to_list()
+    return sum(values) + min(values) + max(values)
+
+
+def aggregate_tick(window, value):
+    """Advance the window by one value and read the running aggregates."""
+    window.append(value)
+    window.remove_at(0)
+    return window.get_sum() + window.get_min() + window.get_max()
+
+
+def time_ticks(window, tick, values):
+    """Return the mean time per tick in microseconds."""
+    start = time.perf_counter()
+    for value in values:
+        tick(window, value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def main():
+    rng = random.Random(0)
+    ticks = 2000
+
+    print(f"{'window':>10} {'scan us/tick':>14} {'aggregate us/tick':>18}")
+    for size in (10, 100, 1_000, 10_000, 100_000):
+        initial = [rng.random() for _ in range(size)]
+        values = [rng.random() for _ in range(ticks)]
+
+        scan_window = CircularLinkedList.from_list(initial)
+        aggregate_window = AggregateCircularLinkedList.from_list(initial)
+
+        # Full scans get slow quickly, so use fewer ticks for large windows
+        scan_values = values[:max(10, ticks * 100 // size)]
+        scan_us = time_ticks(scan_window, scan_tick, scan_values)
+        aggregate_us = time_ticks(aggregate_window, aggregate_tick, values)
+        print(f"{size:>10} {scan_us:>14.2f} {aggregate_us:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark for the AsyncRoundRobin runner.
+
+Runs many CPU-bound tasks, each a series of short steps, while a heartbeat
+coroutine measures how long the event loop is stalled. The tasks run once
+as in round_robin_scheduler from usage.py (a CircularLinkedList loop inside
+a coroutine, which never yields to the event loop) and then with
+AsyncRoundRobin at several time slices. For each run the benchmark reports
+the throughput in steps per second, the 99th percentile and longest
+heartbeat gaps, and the mean and maximum wait of a task for its turn.
+
+Usage:
+    python bench_async_runner.py [tasks] [steps]
+"""
+
+import asyncio
+import sys
+import time
+
+from Clinkedlist import CircularLinkedList
+from async_runner import AsyncRoundRobin
+
+STEP_SECONDS = 20e-6
+
+
+def busy(seconds):
+    """Spin for the given number of seconds."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def task(steps):
+    """An async generator task of CPU-bound steps."""
+    for _ in range(steps):
+        busy(STEP_SECONDS)
+        yield
+
+
+async def heartbeat(done, gaps):
+    """Record the gaps between heartbeats until done is set."""
+    last = time.perf_counter()
+    while not done.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def run_blocking(tasks, steps):
+    """Run the tasks the way usage.py does; return (steps, max gap, mean wait, max wait)."""
+    ring = CircularLinkedList()
+    for _ in range(tasks):
+        ring.append({"remaining": steps, "ready": time.perf_counter()})
+    waits = []
+    total = 0
+    while not ring.is_empty():
+        current = ring.get_at(0)
+        start = time.perf_counter()
+        waits.append(start - current["ready"])
+        busy(STEP_SECONDS)
+        total += 1
+        current["remaining"] -= 1
+        if current["remaining"] == 0:
+            ring.remove_at(0)
+        else:
+            current["ready"] = time.perf_counter()
+            ring.rotate(1)
+    return total, sum(waits) / len(waits), max(waits)
+
+
+async def prepare_runner(tasks, steps, time_slice):
+    """Add the tasks to an AsyncRoundRobin and return the coroutine that runs them."""
+    runner = AsyncRoundRobin(time_slice)
+    for _ in range(tasks):
+        await runner.add(task(steps))
+
+    async def run():
+        await runner.run()
+        return tasks * steps, runner.latency.mean, runner.latency.max
+
+    return run()
+
+
+async def measure(coroutine):
+    """Run a workload next to a heartbeat; return (steps/s, p99 gap, max gap, mean wait, max wait)."""
+    done = asyncio.Event()
+    gaps = []
+    beat = asyncio.create_task(heartbeat(done, gaps))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    total, mean_wait, max_wait = await coroutine
+    elapsed = time.perf_counter() - start
+    done.set()
+    await beat
+    gaps.sort()
+    return total / elapsed, gaps[len(gaps) * 99 // 100] * 1e3, gaps[-1] * 1e3, mean_wait * 1e3, max_wait * 1e3
+
+
+async def main_async(tasks, steps):
+    print(f"{tasks:,} tasks x {steps} steps of {STEP_SECONDS * 1e6:.0f} us")
+    print(f"{'runner':>24} {'steps/s':>10} {'p99 stall ms':>13} {'max stall ms':>13} "
+          f"{'mean wait ms':>13} {'max wait ms':>12}")
+    rows = [("CircularLinkedList loop", None)]
+    rows += [(f"AsyncRoundRobin {time_slice * 1e3:g} ms", time_slice) for time_slice in (0.0005, 0.002, 0.01)]
+    for name, time_slice in rows:
+        if time_slice is None:
+            coroutine = run_blocking(tasks, steps)
+        else:
+            coroutine = await prepare_runner(tasks, steps, time_slice)
+        rate, p99_stall, max_stall, mean_wait, max_wait = await measure(coroutine)
+        print(f"{name:>24} {rate:>10,.0f} {p99_stall:>13.2f} {max_stall:>13.2f} "
+              f"{mean_wait:>13.2f} {max_wait:>12.2f}")
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main_async(tasks, steps))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark for the HashRing consistent hash ring.
+
+Reports:
+
+- lookup throughput of HashRing.get (bisect over the sorted points) against
+  walking a CircularLinkedList of the same sorted points, for 16 members at
+  several numbers of virtual nodes
+- balance: the largest and smallest member loads relative to the mean, for
+  100,000 keys over 16 members
+- movement: the fraction of keys that change member when a 17th member is
+  added, against the ideal 1/17
+
+Usage:
+    python bench_hash_ring.py [keys]
+"""
+
+import sys
+import time
+
+from Clinkedlist import CircularLinkedList
+from hash_ring import HashRing, stable_hash
+
+MEMBERS = [f"worker-{i}" for i in range(16)]
+
+
+def linked_lookup(ring, key_hash):
+    """Find the owner of a hash by walking a CircularLinkedList of (point, owner) pairs."""
+    for point, owner in ring:
+        if point >= key_hash:
+            return owner
+    return ring.get_at(0)[1]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    keys = [f"user:{i}" for i in range(count)]
+    print(f"{len(MEMBERS)} members, {count:,} keys")
+    print(f"{'replicas':>9} {'points':>7} {'get/s':>10} {'linked/s':>10} {'max load':>9} {'min load':>9} "
+          f"{'moved':>7} {'ideal':>7}")
+    for replicas in (1, 16, 128, 512):
+        ring = HashRing(MEMBERS, replicas=replicas)
+
+        start = time.perf_counter()
+        owners = [ring.get(key) for key in keys]
+        get_rate = count / (time.perf_counter() - start)
+
+        pairs = CircularLinkedList.from_list(list(zip(ring._points, ring._owners)))
+        sample = [stable_hash(key) for key in keys[:max(100, count // max(1, ring.point_count() // 4))]]
+        start = time.perf_counter()
+        for key_hash in sample:
+            linked_lookup(pairs, key_hash)
+        linked_rate = len(sample) / (time.perf_counter() - start)
+
+        loads = {member: 0 for member in MEMBERS}
+        for owner in owners:
+            loads[owner] += 1
+        mean = count / len(MEMBERS)
+
+        ring.add("worker-16")
+        moved = sum(1 for key, owner in zip(keys, owners) if ring.get(key) != owner)
+        print(f"{replicas:>9} {len(pairs):>7,} {get_rate:>10,.0f} {linked_rate:>10,.0f} "
+              f"{max(loads.values()) / mean:>9.2f} {min(loads.values()) / mean:>9.2f} "
+              f"{moved / count:>7.3f} {1 / 17:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark for IndexedRing.
+
+Compares rotate(k) with a random k and get_at(i) at a random index on
+CircularLinkedList (which walks the nodes) and IndexedRing (which moves its
+anchor and descends its tree), across several ring sizes.
+
+Usage:
+    python bench_indexed_ring.py [operations]
+"""
+
+import random
+import sys
+import time
+
+from Clinkedlist import CircularLinkedList
+from indexed_ring import IndexedRing
+
+
+def time_calls(function, arguments):
+    """Return the mean time per call in microseconds."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    print(f"{'size':>10} {'rotate list us':>15} {'rotate ring us':>15} {'get_at list us':>15} {'get_at ring us':>15}")
+    for size in (100, 1_000, 10_000, 100_000, 1_000_000):
+        values = list(range(size))
+        linked = CircularLinkedList.from_list(values)
+        ring = IndexedRing.from_list(values)
+        # Walking the list is O(n), so it gets fewer operations on large rings
+        linked_operations = max(20, min(operations, operations * 1000 // size))
+        shifts = [rng.randrange(-size, size) for _ in range(operations)]
+        indices = [rng.randrange(size) for _ in range(operations)]
+        print(f"{size:>10,} "
+              f"{time_calls(linked.rotate, shifts[:linked_operations]):>15.2f} "
+              f"{time_calls(ring.rotate, shifts):>15.2f} "
+              f"{time_calls(linked.get_at, indices[:linked_operations]):>15.2f} "
+              f"{time_calls(ring.get_at, indices):>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
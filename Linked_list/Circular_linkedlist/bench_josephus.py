@@ -0,0 +1,63 @@
+"""
+Benchmark for the josephus module.
+
+Compares the elimination order computed by walking a CircularLinkedList
+(rotate k - 1 steps, then remove_at(0), as josephus_problem in usage.py does)
+with the Fenwick tree in elimination_order, and the survivor recurrence,
+across several circle sizes and steps.
+
+Usage:
+    python bench_josephus.py [max_n]
+"""
+
+import sys
+import time
+
+from Clinkedlist import CircularLinkedList
+from josephus import elimination_order, survivor
+
+# The linked-list walk is O(n * k), so it is only timed up to this size
+SIMULATION_LIMIT = 20_000
+
+
+def simulate(n, k):
+    """Return the elimination order by walking a CircularLinkedList."""
+    people = CircularLinkedList.from_list(list(range(1, n + 1)))
+    order = []
+    while not people.is_empty():
+        people.rotate(k - 1)
+        order.append(people.remove_at(0))
+    return order
+
+
+def timed(function, *args):
+    """Return (result, milliseconds) for function(*args)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{'n':>10} {'k':>6} {'linked list ms':>15} {'Fenwick ms':>11} {'survivor ms':>12}")
+    n = 1_000
+    while n <= max_n:
+        for k in (2, 100, 10_000):
+            order, fenwick_ms = timed(elimination_order, n, k)
+            last, survivor_ms = timed(survivor, n, k)
+            assert last == order[-1]
+            linked = "-"
+            if n <= SIMULATION_LIMIT:
+                expected, linked_ms = timed(simulate, n, k)
+                assert expected == order
+                linked = f"{linked_ms:.1f}"
+            print(f"{n:>10,} {k:>6,} {linked:>15} {fenwick_ms:>11.1f} {survivor_ms:>12.3f}")
+        n *= 10
+    n = 10 ** 15
+    for k in (2, 100):
+        _, survivor_ms = timed(survivor, n, k)
+        print(f"{n:>10.0e} {k:>6,} {'-':>15} {'-':>11} {survivor_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
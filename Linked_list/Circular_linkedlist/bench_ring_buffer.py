@@ -0,0 +1,86 @@
+"""
+Benchmark for RingBuffer.
+
+Measures a sliding window over a stream of metric samples, kept as a
+CircularLinkedList (append followed by remove_at(0)), a RingBuffer of objects
+and a typed RingBuffer of doubles, across several window sizes: the time per
+sample appended one at a time, the time per sample when the stream arrives in
+batches passed to extend, and the memory held by the window.
+
+Usage:
+    python bench_ring_buffer.py [samples]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from Clinkedlist import CircularLinkedList
+from ring_buffer import RingBuffer
+
+BATCH = 256
+
+
+def linked_window(size, samples):
+    """Keep the last size samples in a CircularLinkedList."""
+    window = CircularLinkedList()
+    for sample in samples:
+        window.append(sample)
+        if len(window) > size:
+            window.remove_at(0)
+    return window
+
+
+def ring_window(size, samples, typecode=None):
+    """Keep the last size samples in a RingBuffer, one append per sample."""
+    window = RingBuffer(size, typecode)
+    for sample in samples:
+        window.append(sample)
+    return window
+
+
+def ring_window_batched(size, samples, typecode=None):
+    """Keep the last size samples in a RingBuffer, extending it batch by batch."""
+    window = RingBuffer(size, typecode)
+    for start in range(0, len(samples), BATCH):
+        window.extend(samples[start:start + BATCH])
+    return window
+
+
+def measure(build, samples):
+    """Return (microseconds per sample, bytes still allocated by the window)."""
+    start = time.perf_counter()
+    build()
+    elapsed = (time.perf_counter() - start) / len(samples) * 1e6
+    tracemalloc.start()
+    window = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del window
+    return elapsed, held
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(0)
+    samples = [rng.gauss(100.0, 15.0) for _ in range(count)]
+    print(f"{count:,} samples, batches of {BATCH} for extend")
+    print(f"{'window':>8} {'structure':>26} {'us/sample':>10} {'held KiB':>10}")
+    for size in (100, 10_000, 100_000):
+        builds = (
+            ("CircularLinkedList", lambda: linked_window(size, samples)),
+            ("RingBuffer append", lambda: ring_window(size, samples)),
+            ("RingBuffer('d') append", lambda: ring_window(size, samples, 'd')),
+            ("RingBuffer extend", lambda: ring_window_batched(size, samples)),
+            ("RingBuffer('d') extend", lambda: ring_window_batched(size, samples, 'd')),
+        )
+        expected = samples[-size:]
+        for name, build in builds:
+            assert list(build()) == expected
+            elapsed, held = measure(build, samples)
+            print(f"{size:>8,} {name:>26} {elapsed:>10.3f} {held / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
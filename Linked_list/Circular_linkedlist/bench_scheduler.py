@@ -0,0 +1,112 @@
+"""
+Benchmark for the DeficitRoundRobin scheduler.
+
+Runs tasks with random amounts of work and weights until they all finish,
+while an external event cancels a random unfinished task every CANCEL_EVERY
+turns, and reports the throughput in turns per second. DeficitRoundRobin
+runs 100,000 active tasks. The same workload (without weights) also runs
+with the pattern from round_robin_scheduler in usage.py: a
+CircularLinkedList advanced with rotate(1), with tasks removed by
+remove(value). Because each cancellation scans the ring, that pattern runs
+on fewer tasks.
+
+Usage:
+    python bench_scheduler.py [tasks]
+"""
+
+import random
+import sys
+import time
+
+from Clinkedlist import CircularLinkedList
+from scheduler import DeficitRoundRobin
+
+CANCEL_EVERY = 10
+
+
+class Job:
+    """A task with an amount of remaining work and a weight."""
+
+    __slots__ = ('remaining', 'weight', 'handle')
+
+    def __init__(self, remaining, weight):
+        self.remaining = remaining
+        self.weight = weight
+        self.handle = None
+
+
+def make_jobs(count, seed=0):
+    """Return count jobs and the order in which to cancel them."""
+    rng = random.Random(seed)
+    jobs = [Job(rng.randint(1, 40), rng.choice((1, 1, 2, 4))) for _ in range(count)]
+    cancellations = jobs[:]
+    rng.shuffle(cancellations)
+    return jobs, cancellations
+
+
+def run_scheduler(jobs, cancellations, quantum):
+    """Run the jobs with DeficitRoundRobin and return the number of turns."""
+    scheduler = DeficitRoundRobin(quantum)
+    for job in jobs:
+        job.handle = scheduler.add(job, weight=job.weight)
+    turns = 0
+
+    def run(job, budget):
+        nonlocal turns
+        turns += 1
+        if turns % CANCEL_EVERY == 0:
+            while cancellations and not scheduler.remove(cancellations.pop().handle):
+                pass
+        if job.remaining <= budget:
+            return None
+        job.remaining -= budget
+        return budget
+
+    scheduler.run(run)
+    return turns
+
+
+def run_linked_list(jobs, cancellations, quantum):
+    """Run the jobs as round_robin_scheduler in usage.py does and return the number of turns."""
+    ring = CircularLinkedList()
+    for job in jobs:
+        ring.append(job)
+    turns = 0
+    while not ring.is_empty():
+        job = ring.get_at(0)
+        turns += 1
+        if turns % CANCEL_EVERY == 0:
+            cancelled = None
+            while cancellations and cancelled is None:
+                cancelled = cancellations.pop()
+                if not ring.remove(cancelled):
+                    cancelled = None
+            if cancelled is job:
+                continue
+        job.remaining -= min(quantum, job.remaining)
+        if job.remaining == 0:
+            ring.remove(job)
+        else:
+            ring.rotate(1)
+    return turns
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    quantum = 4
+    print(f"cancelling a random task every {CANCEL_EVERY} turns")
+    print(f"{'structure':>20} {'tasks':>9} {'turns':>11} {'seconds':>9} {'turns/s':>11}")
+    for name, runner, size in (
+        ("DeficitRoundRobin", run_scheduler, count),
+        ("DeficitRoundRobin", run_scheduler, count // 20),
+        ("CircularLinkedList", run_linked_list, count // 20),
+    ):
+        jobs, cancellations = make_jobs(size)
+        start = time.perf_counter()
+        turns = runner(jobs, cancellations, quantum)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20} {size:>9,} {turns:>11,} {elapsed:>9.2f} {turns / elapsed:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
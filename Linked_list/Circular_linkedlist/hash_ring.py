@@ -0,0 +1,305 @@
+# Consistent Hash Ring Implementation in Python
+
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import TypeVar, Generic, List, Iterable, Iterator, Callable, Dict, Any
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+def stable_hash(key: Any) -> int:
+    """
+    Hash a key to a 64-bit integer that is the same in every process.
+
+    Python's built-in hash() of strings is randomized per process, so it
+    cannot be used to agree on key placement between workers.
+
+    Args:
+        key: A bytes object, or any value whose str() identifies it
+
+    Returns:
+        An integer in [0, 2**64)
+    """
+    data = key if isinstance(key, bytes) else str(key).encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'big')
+
+
+class HashRing(Generic[T]):
+    """
+    A consistent hash ring that assigns keys to members.
+
+    Each member is placed on a circle of 64-bit hash values at several
+    points (virtual nodes), and a key belongs to the member owning the first
+    point at or clockwise from the key's hash. The points are kept in a sorted
+    list that is traversed circularly (past the last point comes the first),
+    so a lookup is a bisect in O(log n) instead of a walk around a
+    CircularLinkedList.
+
+    Adding a member only takes over the arcs just before its new points, and
+    removing one hands its arcs to the next points clockwise, so only about
+    1/m of the keys move when the ring has m members; every other key keeps
+    its member. More virtual nodes per member spread each member's share
+    over more, smaller arcs and balance the load.
+    """
+
+    def __init__(self, members: Iterable[T] = (), replicas: int = 128,
+                 hash_function: Callable[[Any], int] = stable_hash) -> None:
+        """
+        Initialize a ring with the given members.
+
+        Args:
+            members: The initial members, each with weight 1
+            replicas: The number of points (virtual nodes) per unit of weight
+            hash_function: Maps keys and virtual node names to integers
+
+        Raises:
+            ValueError: If replicas is not positive
+        """
+        if replicas <= 0:
+            raise ValueError("Replicas must be positive")
+        self._replicas: int = replicas
+        self._hash: Callable[[Any], int] = hash_function
+        self._points: List[int] = []  # Sorted hash values of the virtual nodes
+        self._owners: List[T] = []  # The member owning each point
+        self._weights: Dict[T, int] = {}
+        self.add_many(members)
+
+    def _member_points(self, member: T, weight: int) -> List[int]:
+        """Return the hash values of a member's virtual nodes."""
+        return [self._hash(f"{member}#{replica}") for replica in range(self._replicas * weight)]
+
+    def add(self, member: T, weight: int = 1) -> None:
+        """
+        Add a member to the ring.
+
+        Args:
+            member: The member to add; its str() names its virtual nodes
+            weight: The member's share relative to weight-1 members
+
+        Raises:
+            ValueError: If the member is already in the ring or the weight is not positive
+
+        Time Complexity: O(n + v log v) - where n is the number of points and v the new ones
+        Space Complexity: O(n)
+        """
+        self.add_many([member], weight)
+
+    def add_many(self, members: Iterable[T], weight: int = 1) -> None:
+        """
+        Add several members to the ring at once, rebuilding the points only once.
+
+        The whole batch is checked first, so if any member is rejected the
+        ring is left unchanged.
+
+        Args:
+            members: The members to add
+            weight: The weight of each member
+
+        Raises:
+            ValueError: If a member is already in the ring or the weight is not positive
+
+        Time Complexity: O(n + v log v) - where n is the number of points and v the new ones
+        Space Complexity: O(n + v)
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        members = list(members)
+        seen = set()
+        for member in members:
+            if member in self._weights or member in seen:
+                raise ValueError(f"{member!r} is already in the ring")
+            seen.add(member)
+        if not members:
+            return
+        pairs = []
+        for member in members:
+            self._weights[member] = weight
+            pairs.extend((point, member) for point in self._member_points(member, weight))
+        # The existing points are one sorted run, which sorting merges in linear time;
+        # ties between equal points are broken by member name, the same in every process
+        pairs.extend(zip(self._points, self._owners))
+        pairs.sort(key=lambda pair: (pair[0], str(pair[1])))
+        self._points = [point for point, _ in pairs]
+        self._owners = [owner for _, owner in pairs]
+
+    def remove(self, member: T) -> None:
+        """
+        Remove a member from the ring; its keys move to the next points clockwise.
+
+        Args:
+            member: The member to remove
+
+        Raises:
+            KeyError: If the member is not in the ring
+
+        Time Complexity: O(n) - where n is the number of points
+        Space Complexity: O(n)
+        """
+        del self._weights[member]
+        kept = [(point, owner) for point, owner in zip(self._points, self._owners) if owner != member]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def get(self, key: Any) -> T:
+        """
+        Get the member that owns a key.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The member owning the first point at or after the key's hash
+
+        Raises:
+            LookupError: If the ring has no members
+
+        Time Complexity: O(log n) - where n is the number of points
+        Space Complexity: O(1)
+        """
+        if not self._points:
+            raise LookupError("Cannot look up a key in an empty ring")
+        index = bisect_left(self._points, self._hash(key))
+        # Past the last point the circle wraps around to the first
+        return self._owners[index if index < len(self._points) else 0]
+
+    def get_many(self, key: Any, count: int) -> List[T]:
+        """
+        Get the first count distinct members clockwise from a key, for replication.
+
+        Args:
+            key: The key to look up
+            count: The number of members to return
+
+        Returns:
+            Up to count distinct members, the owner first (none if count is not positive)
+
+        Time Complexity: O(log n + p) - where p is the number of points passed
+        Space Complexity: O(count)
+        """
+        found: List[T] = []
+        if not self._points or count <= 0:
+            return found
+        count = min(count, len(self._weights))
+        size = len(self._points)
+        index = bisect_left(self._points, self._hash(key))
+        for step in range(size):
+            owner = self._owners[(index + step) % size]
+            if owner not in found:
+                found.append(owner)
+                if len(found) == count:
+                    break
+        return found
+
+    def shares(self) -> Dict[T, float]:
+        """
+        Get the fraction of the hash circle owned by each member.
+
+        Returns:
+            A dict mapping each member to the fraction of keys it is expected to own
+
+        Time Complexity: O(n) - where n is the number of points
+        Space Complexity: O(m) - where m is the number of members
+        """
+        shares = {member: 0 for member in self._weights}
+        if not self._points:
+            return {}
+        circle = 1 << 64
+        previous = self._points[-1] - circle
+        for point, owner in zip(self._points, self._owners):
+            # Each point owns the arc since the previous point
+            shares[owner] += point - previous
+            previous = point
+        return {member: arc / circle for member, arc in shares.items()}
+
+    def weight(self, member: T) -> int:
+        """
+        Get a member's weight.
+
+        Args:
+            member: The member
+
+        Returns:
+            The member's weight
+
+        Raises:
+            KeyError: If the member is not in the ring
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._weights[member]
+
+    def point_count(self) -> int:
+        """
+        Get the number of points (virtual nodes) on the ring.
+
+        Returns:
+            The number of points
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self._points)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the members in the order they were added.
+
+        Returns:
+            An iterator over the members
+
+        Time Complexity: O(m) for a full iteration
+        Space Complexity: O(1)
+        """
+        return iter(self._weights)
+
+    def __len__(self) -> int:
+        """
+        Get the number of members.
+
+        Returns:
+            The number of members
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self._weights)
+
+    def __contains__(self, member: T) -> bool:
+        """
+        Check if a member is in the ring.
+
+        Args:
+            member: The member to check for
+
+        Returns:
+            True if the member is in the ring, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return member in self._weights
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the ring.
+
+        Returns:
+            A string representation of the ring
+
+        Time Complexity: O(m) - where m is the number of members
+        Space Complexity: O(m)
+        """
+        return f"HashRing({list(self._weights)}, replicas={self._replicas})"
+
+    def __repr__(self) -> str:
+        """
+        Get the official string representation of the ring.
+
+        Returns:
+            The official string representation of the ring
+
+        Time Complexity: O(m) - where m is the number of members
+        Space Complexity: O(m)
+        """
+        return self.__str__()
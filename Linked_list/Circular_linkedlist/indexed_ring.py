@@ -0,0 +1,498 @@
+# Indexed Ring Implementation in Python
+
+import random
+from typing import TypeVar, Generic, Optional, List, Iterator, Tuple
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+class _TreeNode(Generic[T]):
+    """
+    A node of the order-statistic tree behind an IndexedRing.
+
+    Nodes are ordered by position (an implicit treap): a node's position is
+    the number of nodes before it in an in-order walk, found from the subtree
+    sizes.
+    """
+
+    __slots__ = ('value', 'priority', 'size', 'left', 'right')
+
+    def __init__(self, value: T, priority: float) -> None:
+        """
+        Initialize a new node with the given value and no children.
+
+        Args:
+            value: The value to store in the node
+            priority: The treap priority of the node
+        """
+        self.value: T = value
+        self.priority = priority
+        self.size = 1
+        self.left: Optional['_TreeNode[T]'] = None
+        self.right: Optional['_TreeNode[T]'] = None
+
+
+def _size(node: Optional[_TreeNode]) -> int:
+    """Return the number of nodes in a subtree."""
+    return node.size if node is not None else 0
+
+
+def _split(node: Optional[_TreeNode], count: int) -> Tuple[Optional[_TreeNode], Optional[_TreeNode]]:
+    """Split a tree into its first count nodes and the rest."""
+    if node is None:
+        return None, None
+    left_size = _size(node.left)
+    if count <= left_size:
+        first, node.left = _split(node.left, count)
+        node.size -= _size(first)
+        return first, node
+    node.right, second = _split(node.right, count - left_size - 1)
+    node.size -= _size(second)
+    return node, second
+
+
+def _merge(first: Optional[_TreeNode], second: Optional[_TreeNode]) -> Optional[_TreeNode]:
+    """Join two trees, placing every node of first before every node of second."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if first.priority > second.priority:
+        first.right = _merge(first.right, second)
+        first.size = 1 + _size(first.left) + _size(first.right)
+        return first
+    second.left = _merge(first, second.left)
+    second.size = 1 + _size(second.left) + _size(second.right)
+    return second
+
+
+class IndexedRing(Generic[T]):
+    """
+    A circular list with O(1) rotation and O(log n) positional access.
+
+    The values are kept in an order-statistic tree (a treap ordered by
+    position) in a fixed physical order, and the ring is read starting from
+    a movable anchor: logical index i is physical position (anchor + i) mod n.
+    Rotating only moves the anchor, which is O(1) for any k, while get_at,
+    insert_at and remove_at find their position in the tree in O(log n)
+    expected time.
+
+    Rotation follows CircularLinkedList.rotate: rotate(k) makes the value at
+    index k the first one, and negative k rotates the other way.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty ring.
+        """
+        self._root: Optional[_TreeNode[T]] = None
+        self._anchor: int = 0  # Physical position of the first value
+        self._random = random.Random()
+
+    def _physical(self, index: int) -> int:
+        """Return the physical position of a logical index in [0, size)."""
+        position = self._anchor + index
+        size = _size(self._root)
+        return position - size if position >= size else position
+
+    def _node_at(self, position: int) -> _TreeNode[T]:
+        """Return the node at a physical position."""
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if position < left_size:
+                node = node.left
+            elif position == left_size:
+                return node
+            else:
+                position -= left_size + 1
+                node = node.right
+
+    def _insert_physical(self, position: int, value: T) -> None:
+        """Insert a value at a physical position."""
+        node = _TreeNode(value, self._random.random())
+        first, second = _split(self._root, position)
+        self._root = _merge(_merge(first, node), second)
+
+    def append(self, value: T) -> None:
+        """
+        Add a new value at the end of the ring.
+
+        Args:
+            value: The value to add
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        self.insert_at(self.size(), value)
+
+    def prepend(self, value: T) -> None:
+        """
+        Add a new value at the beginning of the ring.
+
+        Args:
+            value: The value to add
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        self.insert_at(0, value)
+
+    def insert_at(self, index: int, value: T) -> None:
+        """
+        Insert a new value at the specified index.
+
+        Args:
+            index: The index at which to insert the value (0-based)
+            value: The value to insert
+
+        Raises:
+            IndexError: If the index is out of range
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        size = self.size()
+        if index < 0 or index > size:
+            raise IndexError("Index out of range")
+        position = self._anchor + index
+        if position <= size:
+            # The new value lands at or after the anchor
+            self._insert_physical(position, value)
+        else:
+            # The new value lands before the anchor, which moves up by one
+            self._insert_physical(position - size, value)
+            self._anchor += 1
+
+    def remove_at(self, index: int) -> T:
+        """
+        Remove and return the value at the specified index.
+
+        Args:
+            index: The index of the value to remove (0-based)
+
+        Returns:
+            The removed value
+
+        Raises:
+            IndexError: If the index is out of range or the ring is empty
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Cannot remove from an empty list")
+        size = self.size()
+        if index < 0 or index >= size:
+            raise IndexError("Index out of range")
+
+        position = self._physical(index)
+        first, rest = _split(self._root, position)
+        node, second = _split(rest, 1)
+        self._root = _merge(first, second)
+        if position < self._anchor:
+            self._anchor -= 1
+        if self._anchor >= size - 1:
+            self._anchor = 0
+        return node.value
+
+    def remove(self, value: T) -> bool:
+        """
+        Remove the first occurrence of the specified value.
+
+        Args:
+            value: The value to remove
+
+        Returns:
+            True if the value was found and removed, False otherwise
+
+        Time Complexity: O(n) - to find the value
+        Space Complexity: O(1)
+        """
+        index = self.find(value)
+        if index is None:
+            return False
+        self.remove_at(index)
+        return True
+
+    def find(self, value: T) -> Optional[int]:
+        """
+        Find the index of the first occurrence of the specified value.
+
+        Args:
+            value: The value to search for
+
+        Returns:
+            The index of the value if found, None otherwise
+
+        Time Complexity: O(n) - where n is the number of values in the ring
+        Space Complexity: O(log n)
+        """
+        for index, current in enumerate(self):
+            if current == value:
+                return index
+        return None
+
+    def get_at(self, index: int) -> T:
+        """
+        Get the value at the specified index.
+
+        Args:
+            index: The index of the value to get (0-based)
+
+        Returns:
+            The value at the specified index
+
+        Raises:
+            IndexError: If the index is out of range or the ring is empty
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Cannot get from an empty list")
+        if index < 0 or index >= self.size():
+            raise IndexError("Index out of range")
+        return self._node_at(self._physical(index)).value
+
+    def set_at(self, index: int, value: T) -> None:
+        """
+        Replace the value at the specified index.
+
+        Args:
+            index: The index of the value to replace (0-based)
+            value: The new value
+
+        Raises:
+            IndexError: If the index is out of range or the ring is empty
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        if self.is_empty():
+            raise IndexError("Cannot set in an empty list")
+        if index < 0 or index >= self.size():
+            raise IndexError("Index out of range")
+        self._node_at(self._physical(index)).value = value
+
+    def rotate(self, k: int) -> None:
+        """
+        Rotate the ring by k positions.
+
+        Positive values rotate clockwise (the kth element becomes the first),
+        negative values rotate counterclockwise (the kth-from-last element becomes the first).
+
+        Args:
+            k: The number of positions to rotate
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not self.is_empty():
+            self._anchor = (self._anchor + k) % self.size()
+
+    def clear(self) -> None:
+        """
+        Remove all values from the ring.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._root = None
+        self._anchor = 0
+
+    def is_empty(self) -> bool:
+        """
+        Check if the ring is empty.
+
+        Returns:
+            True if the ring is empty, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._root is None
+
+    def size(self) -> int:
+        """
+        Get the number of values in the ring.
+
+        Returns:
+            The number of values in the ring
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return _size(self._root)
+
+    def to_list(self) -> List[T]:
+        """
+        Convert the ring to a Python list, starting at index 0.
+
+        Returns:
+            A list containing all values in the ring
+
+        Time Complexity: O(n) - where n is the number of values in the ring
+        Space Complexity: O(n)
+        """
+        return list(self)
+
+    @classmethod
+    def from_list(cls, values: List[T]) -> 'IndexedRing[T]':
+        """
+        Create a new ring from a Python list.
+
+        The tree is built balanced in one pass, with priorities assigned in
+        level order so that it is a valid treap.
+
+        Args:
+            values: A list of values to add to the ring
+
+        Returns:
+            A new ring containing the specified values
+
+        Time Complexity: O(n log n) - for sorting the priorities
+        Space Complexity: O(n)
+        """
+        ring = cls()
+        nodes = [_TreeNode(value, 0.0) for value in values]
+
+        def build(low: int, high: int) -> Optional[_TreeNode[T]]:
+            if low >= high:
+                return None
+            middle = (low + high) // 2
+            node = nodes[middle]
+            node.left = build(low, middle)
+            node.right = build(middle + 1, high)
+            node.size = high - low
+            return node
+
+        ring._root = build(0, len(nodes))
+        priorities = sorted((ring._random.random() for _ in nodes), reverse=True)
+        level = [ring._root] if ring._root is not None else []
+        index = 0
+        while level:
+            following = []
+            for node in level:
+                node.priority = priorities[index]
+                index += 1
+                if node.left is not None:
+                    following.append(node.left)
+                if node.right is not None:
+                    following.append(node.right)
+            level = following
+        return ring
+
+    def _walk(self, start: int) -> Iterator[T]:
+        """Yield the values from a physical position to the end of the tree."""
+        stack: List[_TreeNode[T]] = []
+        node = self._root
+        # Descend to the start position, keeping the nodes still to be visited
+        while node is not None:
+            left_size = _size(node.left)
+            if start <= left_size:
+                stack.append(node)
+                node = node.left
+            else:
+                start -= left_size + 1
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the values starting at index 0.
+
+        Returns:
+            An iterator over the values
+
+        Time Complexity: O(n) for a full iteration
+        Space Complexity: O(log n)
+        """
+        anchor = self._anchor
+        walked = 0
+        for value in self._walk(anchor):
+            yield value
+            walked += 1
+        if anchor:
+            for value in self._walk(0):
+                if walked == self.size():
+                    break
+                yield value
+                walked += 1
+
+    def __len__(self) -> int:
+        """
+        Get the number of values in the ring.
+
+        Returns:
+            The number of values in the ring
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self.size()
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Get the value at the specified index, counting from the end if negative.
+
+        Args:
+            index: The index of the value to get
+
+        Returns:
+            The value at the specified index
+
+        Raises:
+            IndexError: If the index is out of range
+
+        Time Complexity: O(log n) expected
+        Space Complexity: O(1)
+        """
+        if index < 0:
+            index += self.size()
+        return self.get_at(index)
+
+    def __contains__(self, value: T) -> bool:
+        """
+        Check if the ring contains the specified value.
+
+        Args:
+            value: The value to check for
+
+        Returns:
+            True if the value is in the ring, False otherwise
+
+        Time Complexity: O(n) - where n is the number of values in the ring
+        Space Complexity: O(log n)
+        """
+        return self.find(value) is not None
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the ring.
+
+        Returns:
+            A string representation of the ring
+
+        Time Complexity: O(n) - where n is the number of values in the ring
+        Space Complexity: O(n)
+        """
+        return f"IndexedRing({self.to_list()})"
+
+    def __repr__(self) -> str:
+        """
+        Get the official string representation of the ring.
+
+        Returns:
+            The official string representation of the ring
+
+        Time Complexity: O(n) - where n is the number of values in the ring
+        Space Complexity: O(n)
+        """
+        return self.__str__()
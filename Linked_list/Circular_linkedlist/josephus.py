@@ -0,0 +1,167 @@
+"""
+Josephus Elimination
+
+Computes the Josephus problem without simulating the circle node by node.
+n people stand in a circle, counting starts at the first person, and every
+kth person is eliminated until one remains. Walking a CircularLinkedList k
+steps per elimination (as josephus_problem in usage.py does) costs O(n * k);
+this module instead finds each eliminated position with a Fenwick tree in
+O(log n), and the survivor alone with a recurrence.
+"""
+
+from typing import TypeVar, List, Sequence, Iterator
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+class _FenwickTree:
+    """
+    A Fenwick (binary indexed) tree over n slots that are each present or removed.
+
+    It finds and removes the rank-th present slot by descending the
+    implicit tree in O(log n).
+    """
+
+    __slots__ = ('_tree', '_top')
+
+    def __init__(self, n: int) -> None:
+        """
+        Initialize the tree with all n slots present.
+
+        Args:
+            n: The number of slots
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        # With every count equal to 1, node i covers the lowest set bit of i
+        self._tree = [0] + [i & -i for i in range(1, n + 1)]
+        self._top = 1 << n.bit_length() >> 1 if n else 0
+
+    def pop(self, rank: int) -> int:
+        """
+        Remove the present slot with the given 0-based rank and return it.
+
+        The descent visits exactly the nodes whose range contains the
+        selected slot (those it does not skip past), so they are decremented
+        on the way down instead of in a second pass.
+
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        tree = self._tree
+        size = len(tree)
+        position = 0
+        step = self._top
+        while step:
+            following = position + step
+            if following < size:
+                count = tree[following]
+                if count <= rank:
+                    position = following
+                    rank -= count
+                else:
+                    tree[following] = count - 1
+            step >>= 1
+        return position
+
+
+def _check(n: int, k: int) -> None:
+    """Validate the size of the circle and the step."""
+    if n < 1:
+        raise ValueError("n must be positive")
+    if k < 1:
+        raise ValueError("k must be positive")
+
+
+def eliminate(people: Sequence[T], k: int) -> Iterator[T]:
+    """
+    Yield the people in the order they are eliminated, ending with the survivor.
+
+    Args:
+        people: The people in circle order; counting starts at people[0]
+        k: Every kth person is eliminated
+
+    Returns:
+        An iterator over the people in elimination order
+
+    Raises:
+        ValueError: If people is empty or k is not positive
+
+    Time Complexity: O(n log n) - where n is the number of people
+    Space Complexity: O(n)
+    """
+    n = len(people)
+    _check(n, k)
+    tree = _FenwickTree(n)
+    rank = 0
+    for remaining in range(n, 0, -1):
+        rank = (rank + k - 1) % remaining
+        yield people[tree.pop(rank)]
+
+
+def elimination_order(n: int, k: int) -> List[int]:
+    """
+    Return the full elimination sequence for people numbered 1 to n.
+
+    The last number is the survivor, so elimination_order(7, 3) is
+    [3, 6, 2, 7, 5, 1, 4].
+
+    Args:
+        n: The number of people
+        k: Every kth person is eliminated
+
+    Returns:
+        The people's numbers in elimination order
+
+    Raises:
+        ValueError: If n or k is not positive
+
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+    """
+    return list(eliminate(range(1, n + 1), k))
+
+
+def survivor(n: int, k: int) -> int:
+    """
+    Return the number (1 to n) of the last person left.
+
+    For k < n the circle is reduced a whole lap at a time: removing every
+    kth person of n leaves n - n // k people, so the recurrence needs only
+    O(k log(n / k)) steps, which handles n far beyond what could be stored.
+    Otherwise the classic O(n) recurrence J(m) = (J(m - 1) + k) mod m is
+    used.
+
+    Args:
+        n: The number of people
+        k: Every kth person is eliminated
+
+    Returns:
+        The survivor's number
+
+    Raises:
+        ValueError: If n or k is not positive
+
+    Time Complexity: O(min(n, k log n))
+    Space Complexity: O(min(n, k log n))
+    """
+    _check(n, k)
+    if k == 1:
+        return n
+    # Shrink the circle one lap at a time while that removes people
+    sizes = []
+    while n >= k:
+        sizes.append(n)
+        n -= n // k
+    position = 0
+    for m in range(2, n + 1):
+        position = (position + k) % m
+    # Map the survivor's position back through each lap
+    for m in reversed(sizes):
+        position -= m % k
+        if position < 0:
+            position += m
+        else:
+            position += position // (k - 1)
+    return position + 1
@@ -0,0 +1,364 @@
+# Ring Buffer Implementation in Python
+
+from array import array
+from collections import deque
+from itertools import chain
+from typing import TypeVar, Generic, Optional, List, Iterable, Iterator, Tuple, Union, Any
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+class RingBuffer(Generic[T]):
+    """
+    A fixed-capacity circular buffer that overwrites its oldest values.
+
+    All storage is allocated up front in a single array, and a start index
+    and a size mark the live values, which wrap around the end of the array.
+    Appending to a full buffer replaces the oldest value, so the buffer always
+    holds the last capacity values and never allocates per value: it is the
+    array-backed counterpart of a CircularLinkedList used as a sliding window
+    with append followed by remove_at(0).
+
+    By default values are Python objects stored in a list. Passing an
+    array.array typecode ('d', 'q', 'f', ...) selects the typed numeric mode,
+    in which values are stored unboxed in an array.array and the two
+    contiguous segments of the buffer can be exported as zero-copy
+    memoryviews with segments().
+    """
+
+    def __init__(self, capacity: int, typecode: Optional[str] = None) -> None:
+        """
+        Initialize an empty ring buffer.
+
+        Args:
+            capacity: The maximum number of values the buffer holds
+            typecode: An array.array numeric typecode for the typed mode, or
+                None to store arbitrary objects
+
+        Raises:
+            ValueError: If the capacity is not positive or the typecode is not numeric
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if typecode is None:
+            self._data: Union[List[Any], array] = [None] * capacity
+        elif typecode in ('u', 'w'):
+            raise ValueError("RingBuffer requires a numeric typecode")
+        else:
+            self._data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._capacity: int = capacity
+        self._start: int = 0  # Index of the oldest value
+        self._size: int = 0  # Number of live values
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of values the buffer holds."""
+        return self._capacity
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """The array typecode of the typed mode, or None for objects."""
+        return self._data.typecode if isinstance(self._data, array) else None
+
+    def append(self, value: T) -> None:
+        """
+        Add a value at the end, overwriting the oldest value if the buffer is full.
+
+        Args:
+            value: The value to add
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self._size == self._capacity:
+            self._data[self._start] = value
+            self._start += 1
+            if self._start == self._capacity:
+                self._start = 0
+        else:
+            end = self._start + self._size
+            if end >= self._capacity:
+                end -= self._capacity
+            self._data[end] = value
+            self._size += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Add several values at the end, in order, overwriting the oldest values as needed.
+
+        Only the last capacity values of the input can survive, so an input
+        longer than the buffer is not copied in full. Lists, tuples, arrays
+        and other buffers (such as another buffer's segments) are copied with
+        at most two slice assignments; any other iterable is drained through
+        a bounded deque.
+
+        Args:
+            values: An iterable of values
+
+        Time Complexity: O(k) - where k is the number of values added
+        Space Complexity: O(min(k, capacity))
+        """
+        values = self._as_sequence(values)
+        count = len(values)
+        if count >= self._capacity:
+            # The buffer ends up holding exactly the last capacity values
+            self._write(0, values, count - self._capacity, count)
+            self._start = 0
+            self._size = self._capacity
+            return
+        end = (self._start + self._size) % self._capacity
+        first = min(count, self._capacity - end)
+        self._write(end, values, 0, first)
+        self._write(0, values, first, count)
+        overflow = self._size + count - self._capacity
+        if overflow > 0:
+            self._start = (self._start + overflow) % self._capacity
+            self._size = self._capacity
+        else:
+            self._size += count
+
+    def _as_sequence(self, values: Iterable[T]) -> Any:
+        """Return the values as something that supports len() and slicing."""
+        if isinstance(values, (list, tuple)):
+            return values
+        if isinstance(self._data, array):
+            if isinstance(values, array) and values.typecode == self._data.typecode:
+                return memoryview(values)
+            try:
+                view = memoryview(values)  # type: ignore[arg-type]
+            except TypeError:
+                view = None
+            if view is not None:
+                if view.ndim == 1 and view.format.lstrip('@') == self._data.typecode:
+                    return view
+                return view.tolist()
+        elif isinstance(values, (array, memoryview)):
+            return values.tolist()
+        return list(deque(values, maxlen=self._capacity))
+
+    def _write(self, position: int, values: Any, start: int, stop: int) -> None:
+        """Copy values[start:stop] into the storage at position."""
+        if start >= stop:
+            return
+        if isinstance(values, memoryview):
+            # Copy raw memory between buffers of the same format
+            with memoryview(self._data) as target:
+                target[position:position + stop - start] = values[start:stop]
+        elif isinstance(self._data, array):
+            self._data[position:position + stop - start] = array(self._data.typecode, values[start:stop])
+        else:
+            self._data[position:position + stop - start] = values[start:stop]
+
+    def popleft(self) -> T:
+        """
+        Remove and return the oldest value.
+
+        Returns:
+            The oldest value
+
+        Raises:
+            IndexError: If the buffer is empty
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self._size == 0:
+            raise IndexError("Cannot pop from an empty buffer")
+        value = self._data[self._start]
+        if not isinstance(self._data, array):
+            self._data[self._start] = None  # Release the reference
+        self._start += 1
+        if self._start == self._capacity:
+            self._start = 0
+        self._size -= 1
+        return value
+
+    def segments(self) -> Tuple[memoryview, memoryview]:
+        """
+        Return the live values as two zero-copy memoryviews, oldest first.
+
+        The first segment runs from the oldest value to the end of the
+        storage and the second from the start of the storage to the newest
+        value; the second is empty when the values do not wrap around.
+        Together they are the buffer contents in order, and can be passed to
+        numpy.frombuffer or written to a file without conversion. The views
+        share memory with the buffer, so later appends show through them.
+
+        Returns:
+            A tuple (first, second) of read-write memoryviews
+
+        Raises:
+            TypeError: If the buffer is not in the typed mode
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not isinstance(self._data, array):
+            raise TypeError("segments() requires a typed RingBuffer")
+        view = memoryview(self._data)
+        end = self._start + self._size
+        if end <= self._capacity:
+            return view[self._start:end], view[0:0]
+        return view[self._start:], view[:end - self._capacity]
+
+    def clear(self) -> None:
+        """
+        Remove all values from the buffer, keeping its storage.
+
+        Time Complexity: O(1) in the typed mode, O(capacity) for objects
+        Space Complexity: O(1)
+        """
+        if not isinstance(self._data, array):
+            self._data[:] = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+
+    def is_empty(self) -> bool:
+        """
+        Check if the buffer is empty.
+
+        Returns:
+            True if the buffer is empty, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """
+        Check if the buffer is full, so that the next append overwrites a value.
+
+        Returns:
+            True if the buffer is full, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size == self._capacity
+
+    def size(self) -> int:
+        """
+        Get the number of values in the buffer.
+
+        Returns:
+            The number of values in the buffer
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size
+
+    def to_list(self) -> List[T]:
+        """
+        Convert the buffer to a Python list, oldest value first.
+
+        Returns:
+            A list containing all values in the buffer
+
+        Time Complexity: O(n) - where n is the number of values in the buffer
+        Space Complexity: O(n)
+        """
+        end = self._start + self._size
+        if end <= self._capacity:
+            values = self._data[self._start:end]
+        else:
+            values = self._data[self._start:] + self._data[:end - self._capacity]
+        return values.tolist() if isinstance(values, array) else values
+
+    def _position(self, index: int) -> int:
+        """Return the storage position of an index, counting from the end if negative."""
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("Index out of range")
+        position = self._start + index
+        return position - self._capacity if position >= self._capacity else position
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Get the value at the specified index (0 is the oldest value).
+
+        Args:
+            index: The index of the value, counting from the end if negative
+
+        Returns:
+            The value at the specified index
+
+        Raises:
+            IndexError: If the index is out of range
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._data[self._position(index)]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """
+        Replace the value at the specified index (0 is the oldest value).
+
+        Args:
+            index: The index of the value, counting from the end if negative
+            value: The new value
+
+        Raises:
+            IndexError: If the index is out of range
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._data[self._position(index)] = value
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the values, oldest first.
+
+        The values are copied out in one or two slices when the iterator is
+        created, so changing the buffer during the iteration does not affect it.
+
+        Returns:
+            An iterator over the values
+
+        Time Complexity: O(n) for a full iteration
+        Space Complexity: O(n)
+        """
+        end = self._start + self._size
+        if end <= self._capacity:
+            return iter(self._data[self._start:end])
+        return chain(self._data[self._start:], self._data[:end - self._capacity])
+
+    def __len__(self) -> int:
+        """
+        Get the number of values in the buffer.
+
+        Returns:
+            The number of values in the buffer
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the buffer.
+
+        Returns:
+            A string representation of the buffer
+
+        Time Complexity: O(n) - where n is the number of values in the buffer
+        Space Complexity: O(n)
+        """
+        return f"RingBuffer({self.to_list()}, capacity={self._capacity})"
+
+    def __repr__(self) -> str:
+        """
+        Get the official string representation of the buffer.
+
+        Returns:
+            The official string representation of the buffer
+
+        Time Complexity: O(n) - where n is the number of values in the buffer
+        Space Complexity: O(n)
+        """
+        return self.__str__()
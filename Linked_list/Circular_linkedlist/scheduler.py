@@ -0,0 +1,338 @@
+# Deficit Round-Robin Scheduler Implementation in Python
+
+from typing import TypeVar, Generic, Optional, Callable, Iterator
+
+from Clinkedlist import CircularLinkedList, Node
+
+T = TypeVar('T')  # Type variable for generic typing
+
+
+class TaskHandle(Node[T]):
+    """
+    A task's node in the scheduler's run ring, returned by add().
+
+    The handle is the task's position in the ring, so the scheduler can
+    remove or reweight the task without searching for it.
+    """
+
+    def __init__(self, task: T, weight: int) -> None:
+        """
+        Initialize a handle for a task that has not run yet.
+
+        Args:
+            task: The task to schedule
+            weight: The task's share of each round
+        """
+        super().__init__(task)
+        self.weight: int = weight
+        self.deficit: int = 0  # Unused (at most one share) or overrun (if negative) budget carried over
+        self.active: bool = True  # False once the task finished or was removed
+
+    @property
+    def task(self) -> T:
+        """The scheduled task."""
+        return self.value
+
+    def __getstate__(self) -> dict:
+        """Return the handle's state for pickle, without the link, which the ring restores."""
+        state = self.__dict__.copy()
+        state['next'] = None
+        return state
+
+
+class _RunRing(CircularLinkedList[T]):
+    """
+    A circular linked list of task handles whose head is the next task to run.
+
+    Every operation the scheduler needs touches only the tail and the head,
+    so each is O(1).
+    """
+
+    def push(self, handle: TaskHandle[T]) -> None:
+        """Link a handle at the end of the ring, so it runs after every other task."""
+        if self._tail is None:
+            handle.next = handle
+        else:
+            handle.next = self._tail.next
+            self._tail.next = handle
+        self._tail = handle
+        self._size += 1
+
+    def head(self) -> TaskHandle[T]:
+        """Return the handle of the next task to run."""
+        return self._tail.next
+
+    def advance(self) -> None:
+        """Move the head to the end of the ring (rotate(1) in O(1))."""
+        self._tail = self._tail.next
+
+    def __getstate__(self) -> dict:
+        """Return the ring's state for pickle, with the handles in a flat list from the head."""
+        state = self.__dict__.copy()
+        del state['_tail']
+        state['_iter_node'] = None
+        state['_iter_count'] = 0
+        handles = []
+        if self._tail is not None:
+            handle = self._tail.next
+            for _ in range(self._size):
+                handles.append(handle)
+                handle = handle.next
+        state['_handles'] = handles
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the ring, linking the unpickled handles back into a circle."""
+        state = state.copy()
+        handles = state.pop('_handles')
+        self.__dict__.update(state)
+        self._tail = None
+        self._size = 0
+        for handle in handles:
+            self.push(handle)
+
+    def pop_head(self) -> None:
+        """Unlink the head handle."""
+        head = self._tail.next
+        if head is self._tail:
+            self._tail = None
+        else:
+            self._tail.next = head.next
+        head.next = None
+        self._size -= 1
+
+
+class DeficitRoundRobin(Generic[T]):
+    """
+    A weighted round-robin scheduler using deficit round robin.
+
+    Tasks wait in a circular linked list (the run ring) and are served in
+    ring order. On each turn a task receives a budget of quantum * weight
+    units plus whatever it carried over from its previous turn, and the run
+    function reports how many units it used. Unused budget is carried over,
+    up to one share (quantum * weight), so a task whose next piece of work
+    costs up to twice its share can save up for it, while an idle task that
+    keeps reporting 0 units cannot pile up credit and later take over the
+    ring. An overrun is charged against the next turns in full: a task whose
+    budget would not be positive skips its turn and gains one share instead,
+    so run is never called with a budget of 0 or less, and over many rounds
+    every task receives service in proportion to its weight.
+
+    Tasks are added at the end of the ring and removed through the handle
+    returned by add(), both in O(1): a finished task is unlinked as it leaves
+    the head of the ring, and a task removed from elsewhere is marked
+    inactive and unlinked, without running, when it reaches the head.
+    """
+
+    def __init__(self, quantum: int = 1) -> None:
+        """
+        Initialize an empty scheduler.
+
+        Args:
+            quantum: The budget per turn of a task with weight 1
+
+        Raises:
+            ValueError: If the quantum is not positive
+        """
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive")
+        self._quantum: int = quantum
+        self._ring: _RunRing[T] = _RunRing()
+        self._active: int = 0  # Number of tasks that have not been removed
+
+    @property
+    def quantum(self) -> int:
+        """The budget per turn of a task with weight 1."""
+        return self._quantum
+
+    def add(self, task: T, weight: int = 1) -> TaskHandle[T]:
+        """
+        Add a task at the end of the current round.
+
+        Args:
+            task: The task to schedule
+            weight: The task's share of each round relative to other tasks
+
+        Returns:
+            A handle for removing or reweighting the task
+
+        Raises:
+            ValueError: If the weight is not positive
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        handle = TaskHandle(task, weight)
+        self._ring.push(handle)
+        self._active += 1
+        return handle
+
+    def remove(self, handle: TaskHandle[T]) -> bool:
+        """
+        Remove a task so that it does not run again.
+
+        Args:
+            handle: The handle returned by add()
+
+        Returns:
+            True if the task was removed, False if it had already finished or been removed
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if not handle.active:
+            return False
+        handle.active = False
+        self._active -= 1
+        return True
+
+    def set_weight(self, handle: TaskHandle[T], weight: int) -> None:
+        """
+        Change a task's weight, starting with its next turn.
+
+        Args:
+            handle: The handle returned by add()
+            weight: The new weight
+
+        Raises:
+            ValueError: If the weight is not positive
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if weight <= 0:
+            raise ValueError("Weight must be positive")
+        handle.weight = weight
+
+    def step(self, run: Callable[[T, int], Optional[int]]) -> Optional[TaskHandle[T]]:
+        """
+        Give the next task its turn.
+
+        run(task, budget) performs up to budget units of the task's work and
+        returns the number of units it used, or None if the task is finished.
+        Tasks still paying off an overrun are skipped without running.
+
+        Args:
+            run: The function that runs a task with a budget
+
+        Returns:
+            The handle of the task that ran, or None if there are no tasks
+
+        Time Complexity: O(1) amortized, plus the cost of run
+        Space Complexity: O(1)
+        """
+        ring = self._ring
+        while not ring.is_empty():
+            handle = ring.head()
+            if not handle.active:
+                ring.pop_head()
+                continue
+            share = self._quantum * handle.weight
+            budget = handle.deficit + share
+            if budget <= 0:
+                # Still paying off an overrun: skip the turn
+                handle.deficit = budget
+                ring.advance()
+                continue
+            used = run(handle.value, budget)
+            if not handle.active:
+                # run removed its own task
+                ring.pop_head()
+            elif used is None:
+                handle.active = False
+                self._active -= 1
+                ring.pop_head()
+            else:
+                handle.deficit = min(budget - used, share)
+                ring.advance()
+            return handle
+        return None
+
+    def run(self, run: Callable[[T, int], Optional[int]], max_turns: Optional[int] = None) -> int:
+        """
+        Run turns until every task has finished or max_turns turns have run.
+
+        Args:
+            run: The function that runs a task with a budget, as for step()
+            max_turns: The maximum number of turns, or None for no limit
+
+        Returns:
+            The number of turns run
+
+        Time Complexity: O(turns), plus the cost of run
+        Space Complexity: O(1)
+        """
+        turns = 0
+        while max_turns is None or turns < max_turns:
+            if self.step(run) is None:
+                break
+            turns += 1
+        return turns
+
+    def tasks(self) -> Iterator[T]:
+        """
+        Iterate over the active tasks in the order they will run.
+
+        Returns:
+            An iterator over the tasks
+
+        Time Complexity: O(n) for a full iteration
+        Space Complexity: O(1)
+        """
+        if self._ring.is_empty():
+            return
+        handle = self._ring.head()
+        for _ in range(len(self._ring)):
+            if handle.active:
+                yield handle.value
+            handle = handle.next
+
+    def is_empty(self) -> bool:
+        """
+        Check if there are no active tasks.
+
+        Returns:
+            True if there are no active tasks, False otherwise
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._active == 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of active tasks.
+
+        Returns:
+            The number of active tasks
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._active
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the scheduler.
+
+        Returns:
+            A string representation of the scheduler
+
+        Time Complexity: O(n) - where n is the number of tasks in the ring
+        Space Complexity: O(n)
+        """
+        return f"DeficitRoundRobin({list(self.tasks())}, quantum={self._quantum})"
+
+    def __repr__(self) -> str:
+        """
+        Get the official string representation of the scheduler.
+
+        Returns:
+            The official string representation of the scheduler
+
+        Time Complexity: O(n) - where n is the number of tasks in the ring
+        Space Complexity: O(n)
+        """
+        return self.__str__()
@@ -2,9 +2,15 @@
 Unit tests for the CircularLinkedList class.
 """
 
+import pickle
 import unittest
 from Clinkedlist import CircularLinkedList
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestCircularLinkedList(unittest.TestCase):
     """
@@ -318,6 +324,53 @@ class TestCircularLinkedList(unittest.TestCase):
             items.append(item)
         self.assertEqual(items, [1, 2, 3])
     
+    def test_iter_chunks(self):
+        """
+        Test iterating through the list in chunks, starting at the head.
+        """
+        self.assertEqual(list(self.cll.iter_chunks(2)), [])
+        
+        for value in range(1, 6):
+            self.cll.append(value)
+        self.assertEqual(list(self.cll.iter_chunks(2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(self.cll.iter_chunks(5)), [[1, 2, 3, 4, 5]])
+        
+        self.cll.rotate(2)
+        self.assertEqual(list(self.cll.iter_chunks(3)), [[3, 4, 5], [1, 2]])
+        
+        with self.assertRaises(ValueError):
+            self.cll.iter_chunks(0)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_round_trip(self):
+        """
+        Test converting to and from NumPy arrays, starting at the head.
+        """
+        self.cll = CircularLinkedList.from_numpy(np.array([1.5, 2.5, 3.5]))
+        self.assertEqual(self.cll.to_list(), [1.5, 2.5, 3.5])
+        
+        self.cll.rotate(1)
+        self.assertEqual(self.cll.to_numpy().tolist(), [2.5, 3.5, 1.5])
+        self.assertEqual(self.cll.to_numpy(dtype=np.int64).tolist(), [2, 3, 1])
+        self.assertEqual(CircularLinkedList().to_numpy(dtype=float).shape, (0,))
+    
+    def test_pickle(self):
+        """
+        Test pickling lists far longer than the recursion limit.
+        """
+        self.assertTrue(pickle.loads(pickle.dumps(self.cll)).is_empty())
+        
+        for value in range(100_000):
+            self.cll.append(value)
+        self.cll.rotate(1)
+        restored = pickle.loads(pickle.dumps(self.cll))
+        self.assertEqual(len(restored), 100_000)
+        self.assertEqual(restored.to_list(), list(range(1, 100_000)) + [0])
+        self.assertEqual(list(restored), restored.to_list())
+        restored.append(-1)
+        self.assertEqual(restored.get_at(0), 1)
+        self.assertEqual(restored.get_at(100_000), -1)
+    
     def test_contains(self):
         """
         Test the __contains__ method.
@@ -0,0 +1,145 @@
+"""
+Unit tests for the AggregateCircularLinkedList class.
+"""
+
+import pickle
+import random
+import unittest
+from aggregate import AggregateCircularLinkedList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestAggregateCircularLinkedList(unittest.TestCase):
+    """
+    Test cases for the AggregateCircularLinkedList class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new AggregateCircularLinkedList before each test.
+        """
+        self.cll = AggregateCircularLinkedList()
+
+    def assertAggregates(self, cll):
+        """
+        Check every aggregate against a full scan of the list.
+        """
+        values = cll.to_list()
+        self.assertEqual(cll.get_count(), len(values))
+        self.assertEqual(cll.get_sum(), sum(values))
+        if values:
+            self.assertEqual(cll.get_min(), min(values))
+            self.assertEqual(cll.get_max(), max(values))
+
+    def test_empty(self):
+        """
+        Test aggregates of an empty list.
+        """
+        self.assertEqual(self.cll.get_sum(), 0)
+        with self.assertRaises(ValueError):
+            self.cll.get_min()
+        with self.assertRaises(ValueError):
+            self.cll.get_max()
+        with self.assertRaises(ValueError):
+            self.cll.get_mean()
+
+    def test_sliding_window(self):
+        """
+        Test the append / remove_at(0) window pattern.
+        """
+        window = 4
+        for value in [6, 2, 9, 9, 1, 4, 8, 3, 3, 7]:
+            self.cll.append(value)
+            if len(self.cll) > window:
+                self.cll.remove_at(0)
+            self.assertAggregates(self.cll)
+            self.assertFalse(self.cll._stale)
+        self.assertEqual(self.cll.get_mean(), sum(self.cll.to_list()) / window)
+
+    def test_other_mutations(self):
+        """
+        Test insertions, removals and rotation away from the head.
+        """
+        self.cll = AggregateCircularLinkedList.from_list([5, 1, 7, 3])
+        self.assertAggregates(self.cll)
+        self.cll.prepend(0)
+        self.assertAggregates(self.cll)
+        self.cll.insert_at(2, 11)
+        self.assertAggregates(self.cll)
+        self.cll.insert_at(len(self.cll), -4)
+        self.assertAggregates(self.cll)
+        self.assertTrue(self.cll.insert_after(7, 12))
+        self.assertFalse(self.cll.insert_after(100, 1))
+        self.assertAggregates(self.cll)
+        self.assertTrue(self.cll.insert_after(-4, 13))
+        self.assertAggregates(self.cll)
+        self.assertTrue(self.cll.remove(12))
+        self.assertFalse(self.cll.remove(100))
+        self.assertAggregates(self.cll)
+        self.cll.remove_at(len(self.cll) - 1)
+        self.assertAggregates(self.cll)
+        self.cll.rotate(2)
+        self.assertAggregates(self.cll)
+        self.assertTrue(self.cll.remove(self.cll.get_at(0)))
+        self.assertAggregates(self.cll)
+        self.cll.clear()
+        self.assertAggregates(self.cll)
+
+    def test_random_operations(self):
+        """
+        Test aggregates against full scans over a random operation mix.
+        """
+        rng = random.Random(26)
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.45 or self.cll.is_empty():
+                self.cll.append(rng.randint(-50, 50))
+            elif op < 0.55:
+                self.cll.prepend(rng.randint(-50, 50))
+            elif op < 0.85:
+                self.cll.remove_at(0)
+            elif op < 0.9:
+                self.cll.rotate(rng.randint(-5, 5))
+            else:
+                self.cll.remove_at(rng.randrange(len(self.cll)))
+            self.assertAggregates(self.cll)
+
+    def test_pickle(self):
+        """
+        Test that a pickled list keeps its aggregates.
+        """
+        for value in [5, 3, 8, 1, 9]:
+            self.cll.append(value)
+        self.cll.remove_at(0)
+        restored = pickle.loads(pickle.dumps(self.cll))
+        self.assertAggregates(restored)
+        restored.remove_at(restored.get_count() - 1)
+        self.assertAggregates(restored)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_from_numpy(self):
+        """
+        Test that a list built from an array has correct aggregates.
+        """
+        cll = AggregateCircularLinkedList.from_numpy(np.array([4, -2, 7]))
+        self.assertIsInstance(cll, AggregateCircularLinkedList)
+        self.assertAggregates(cll)
+        cll.remove_at(0)
+        self.assertAggregates(cll)
+        cll.append(-5)
+        self.assertAggregates(cll)
+
+    def test_str(self):
+        """
+        Test the string representation.
+        """
+        self.cll.append(1)
+        self.assertEqual(str(self.cll), "AggregateCircularLinkedList([1])")
+
+
+if __name__ == '__main__':
+    unittest.main()
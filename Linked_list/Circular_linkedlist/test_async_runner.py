@@ -0,0 +1,217 @@
+"""
+Unit tests for the AsyncRoundRobin runner.
+"""
+
+import asyncio
+import time
+import unittest
+from async_runner import AsyncRoundRobin
+
+
+async def steps(name, count, log, seconds=0.0):
+    """
+    An async generator task that logs count steps, each busy for the given seconds.
+    """
+    for i in range(count):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+        log.append((name, i))
+        yield
+
+
+class TestAsyncRoundRobin(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases for the AsyncRoundRobin class.
+    """
+
+    async def test_ring_order(self):
+        """
+        Test that tasks take turns in the order they were added.
+        """
+        # Every step overruns the slice, so each turn runs one step
+        runner = AsyncRoundRobin(time_slice=0.001)
+        log = []
+        first = await runner.add(steps("A", 2, log, seconds=0.002))
+        second = await runner.add(steps("B", 3, log, seconds=0.002), name="B")
+        self.assertEqual(len(runner), 2)
+        await runner.run()
+        self.assertEqual(log, [("A", 0), ("B", 0), ("A", 1), ("B", 1), ("B", 2)])
+        self.assertTrue(await first.wait())
+        self.assertTrue(second.done())
+        self.assertEqual(second.latency.count, 4)  # Three steps and the final StopAsyncIteration
+        self.assertTrue(runner.is_empty())
+
+    async def test_time_slices_and_weights(self):
+        """
+        Test that a turn runs steps until the slice is used, scaled by the weight.
+        """
+        runner = AsyncRoundRobin(time_slice=0.01)
+        log = []
+        await runner.add(steps("A", 100, log, seconds=0.001))
+        await runner.add(steps("B", 100, log, seconds=0.001), weight=3)
+        runner_task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.1)
+        runner.stop()
+        await runner_task
+        runs = []
+        for name, _ in log:
+            if not runs or runs[-1][0] != name:
+                runs.append([name, 0])
+            runs[-1][1] += 1
+        # Each full turn of A is about 10 steps and of B about 30
+        self.assertTrue(all(5 <= count <= 12 for name, count in runs[:-1] if name == "A"), runs)
+        self.assertTrue(all(20 <= count <= 32 for name, count in runs[:-1] if name == "B"), runs)
+
+    async def test_fair_share_with_long_steps(self):
+        """
+        Test that a task with steps much longer than the slice gets no more time than others.
+        """
+        runner = AsyncRoundRobin(time_slice=0.005)
+        cpu = {"hog": 0.0, "nice": 0.0}
+
+        async def busy(name, seconds):
+            while True:
+                start = time.perf_counter()
+                while time.perf_counter() - start < seconds:
+                    pass
+                cpu[name] += time.perf_counter() - start
+                yield
+
+        hog = await runner.add(busy("hog", 0.02))
+        await runner.add(busy("nice", 0.0005))
+        runner_task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0.6)
+        runner.stop()
+        await runner_task
+        total = cpu["hog"] + cpu["nice"]
+        self.assertAlmostEqual(cpu["hog"] / total, 0.5, delta=0.1, msg=cpu)
+        # The debt is repaid by skipped turns, so it stays within one step's overrun
+        self.assertGreaterEqual(hog.deficit, -0.02)
+
+    async def test_event_loop_stays_responsive(self):
+        """
+        Test that other coroutines run at least once per time slice.
+        """
+        runner = AsyncRoundRobin(time_slice=0.002)
+        for name in "ABCD":
+            await runner.add(steps(name, 200, [], seconds=0.0002))
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while not runner.is_empty():
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        await asyncio.gather(runner.run(), ticker())
+        self.assertLess(max(gaps), 0.02)
+        self.assertLess(runner.latency.max, 0.05)
+
+    async def test_cancel_and_remove(self):
+        """
+        Test cancelling tasks without running them again, including from inside a step.
+        """
+        runner = AsyncRoundRobin(time_slice=1e-9)
+        log = []
+        closed = []
+
+        async def task(name):
+            try:
+                for i in range(5):
+                    log.append((name, i))
+                    if name == "C" and i == 1:
+                        runner.cancel(handles["C"])
+                    yield
+            finally:
+                closed.append(name)
+
+        handles = {}
+        for name in "ABC":
+            handles[name] = await runner.add(task(name))
+        runner_task = asyncio.create_task(runner.run())
+        await asyncio.sleep(0)
+        self.assertTrue(await runner.remove(handles["B"]))
+        self.assertFalse(await runner.remove(handles["B"]))
+        self.assertFalse(await handles["B"].wait())
+        await runner_task
+        self.assertEqual([i for name, i in log if name == "C"], [0, 1])
+        self.assertEqual([i for name, i in log if name == "A"], [0, 1, 2, 3, 4])
+        # B was removed before its first step, so its body never ran
+        self.assertEqual([i for name, i in log if name == "B"], [])
+        self.assertEqual(sorted(closed), ["A", "C"])
+        self.assertFalse(await handles["C"].wait())
+
+    async def test_cancel_during_last_step(self):
+        """
+        Test that a task cancelled while its last step awaits is counted out only once.
+        """
+        runner = AsyncRoundRobin(max_tasks=1)
+
+        async def task():
+            yield
+            runner.cancel(handle)
+            await asyncio.sleep(0)
+
+        handle = await runner.add(task())
+        await runner.run()
+        self.assertEqual(len(runner), 0)
+        self.assertTrue(runner.is_empty())
+        await runner.add(steps("A", 1, []))
+        pending = asyncio.create_task(runner.add(steps("B", 1, [])))
+        await asyncio.sleep(0)
+        self.assertFalse(pending.done())
+        pending.cancel()
+
+    async def test_failed_task(self):
+        """
+        Test that a failing task is dropped and its error raised by wait().
+        """
+        runner = AsyncRoundRobin()
+        log = []
+
+        async def broken():
+            yield
+            raise KeyError("boom")
+
+        handle = await runner.add(broken())
+        await runner.add(steps("A", 3, log))
+        await runner.run()
+        self.assertEqual(len(log), 3)
+        with self.assertRaises(KeyError):
+            await handle.wait()
+
+    async def test_bounded_add(self):
+        """
+        Test that add() waits for a free slot when max_tasks tasks are active.
+        """
+        runner = AsyncRoundRobin(time_slice=1e-9, max_tasks=1)
+        first = await runner.add(steps("A", 2, []))
+        pending = asyncio.create_task(runner.add(steps("B", 2, [])))
+        await asyncio.sleep(0)
+        self.assertFalse(pending.done())
+        runner.cancel(first)
+        second = await pending
+        self.assertEqual(len(runner), 1)
+        await runner.run()
+        self.assertTrue(await second.wait())
+
+    async def test_wait_for_new_tasks(self):
+        """
+        Test that run(until_empty=False) picks up tasks added later.
+        """
+        runner = AsyncRoundRobin()
+        runner_task = asyncio.create_task(runner.run(until_empty=False))
+        await asyncio.sleep(0)
+        handle = await runner.add(steps("A", 2, []))
+        self.assertTrue(await handle.wait())
+        runner.stop()
+        await runner_task
+        with self.assertRaises(ValueError):
+            AsyncRoundRobin(time_slice=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
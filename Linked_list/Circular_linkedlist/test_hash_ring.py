@@ -0,0 +1,129 @@
+"""
+Unit tests for the HashRing class.
+"""
+
+import unittest
+from hash_ring import HashRing, stable_hash
+
+
+class TestHashRing(unittest.TestCase):
+    """
+    Test cases for the HashRing class.
+    """
+
+    def setUp(self):
+        """
+        Set up a ring of four workers before each test.
+        """
+        self.ring = HashRing([f"worker-{i}" for i in range(4)])
+        self.keys = [f"key-{i}" for i in range(20_000)]
+
+    def test_empty_ring(self):
+        """
+        Test lookups on an empty ring.
+        """
+        ring = HashRing()
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(ring.get_many("key", 2), [])
+        self.assertEqual(ring.shares(), {})
+        with self.assertRaises(LookupError):
+            ring.get("key")
+        with self.assertRaises(ValueError):
+            HashRing(replicas=0)
+
+    def test_lookup_wraps_around(self):
+        """
+        Test that keys past the last point belong to the member of the first point.
+        """
+        ring = HashRing(["a", "b"], replicas=1, hash_function=lambda key: {"a#0": 10, "b#0": 20}.get(key, key))
+        self.assertEqual([ring.get(key) for key in (5, 10, 15, 20, 25)], ["a", "a", "b", "b", "a"])
+        self.assertEqual(ring.get_many(25, 5), ["a", "b"])
+
+    def test_members(self):
+        """
+        Test adding, removing and querying members.
+        """
+        self.assertEqual(len(self.ring), 4)
+        self.assertIn("worker-0", self.ring)
+        self.assertEqual(self.ring.point_count(), 4 * 128)
+        with self.assertRaises(ValueError):
+            self.ring.add("worker-0")
+        self.ring.add("big", weight=3)
+        self.assertEqual(self.ring.weight("big"), 3)
+        self.assertEqual(self.ring.point_count(), 7 * 128)
+        self.ring.remove("big")
+        with self.assertRaises(KeyError):
+            self.ring.remove("big")
+        self.assertEqual(list(self.ring), [f"worker-{i}" for i in range(4)])
+        self.assertEqual(str(self.ring), "HashRing(['worker-0', 'worker-1', 'worker-2', 'worker-3'], replicas=128)")
+
+    def test_add_many_is_all_or_nothing(self):
+        """
+        Test that a batch with a duplicate member adds none of its members.
+        """
+        shares = self.ring.shares()
+        with self.assertRaises(ValueError):
+            self.ring.add_many(["a", "b", "worker-0"])
+        with self.assertRaises(ValueError):
+            self.ring.add_many(["a", "b", "a"])
+        self.assertEqual(len(self.ring), 4)
+        self.assertNotIn("a", self.ring)
+        self.assertEqual(self.ring.shares(), shares)
+        self.ring.add_many(["a", "b"])
+        self.assertEqual(self.ring.point_count(), 6 * 128)
+
+    def test_balance(self):
+        """
+        Test that keys and arcs are spread evenly, in proportion to the weights.
+        """
+        shares = self.ring.shares()
+        self.assertAlmostEqual(sum(shares.values()), 1.0)
+        for share in shares.values():
+            self.assertAlmostEqual(share, 0.25, delta=0.05)
+        self.ring.add("big", weight=4)
+        counts = {}
+        for key in self.keys:
+            owner = self.ring.get(key)
+            counts[owner] = counts.get(owner, 0) + 1
+        self.assertAlmostEqual(counts["big"] / len(self.keys), 0.5, delta=0.06)
+
+    def test_minimal_movement(self):
+        """
+        Test that adding or removing a member only moves the keys it takes or gives up.
+        """
+        before = {key: self.ring.get(key) for key in self.keys}
+        self.ring.add("worker-4")
+        after = {key: self.ring.get(key) for key in self.keys}
+        moved = [key for key in self.keys if before[key] != after[key]]
+        self.assertTrue(all(after[key] == "worker-4" for key in moved))
+        self.assertAlmostEqual(len(moved) / len(self.keys), 0.2, delta=0.05)
+
+        self.ring.remove("worker-1")
+        final = {key: self.ring.get(key) for key in self.keys}
+        moved = [key for key in self.keys if after[key] != final[key]]
+        self.assertTrue(all(after[key] == "worker-1" for key in moved))
+        self.assertEqual(len(moved), sum(1 for key in self.keys if after[key] == "worker-1"))
+
+    def test_get_many(self):
+        """
+        Test that replicas are distinct and start with the owner.
+        """
+        for key in self.keys[:200]:
+            replicas = self.ring.get_many(key, 3)
+            self.assertEqual(len(set(replicas)), 3)
+            self.assertEqual(replicas[0], self.ring.get(key))
+        self.assertEqual(len(self.ring.get_many("key", 10)), 4)
+        self.assertEqual(self.ring.get_many("key", 0), [])
+        self.assertEqual(self.ring.get_many("key", -1), [])
+
+    def test_stable_hash(self):
+        """
+        Test that the hash does not depend on the process.
+        """
+        self.assertEqual(stable_hash("abc"), stable_hash(b"abc"))
+        self.assertEqual(stable_hash("abc"), 0xd8bb14d833d59559)
+        self.assertTrue(0 <= stable_hash(12345) < 1 << 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
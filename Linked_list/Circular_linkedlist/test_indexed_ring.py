@@ -0,0 +1,140 @@
+"""
+Unit tests for the IndexedRing class.
+"""
+
+import random
+import unittest
+from Clinkedlist import CircularLinkedList
+from indexed_ring import IndexedRing
+
+
+class TestIndexedRing(unittest.TestCase):
+    """
+    Test cases for the IndexedRing class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new IndexedRing before each test.
+        """
+        self.ring = IndexedRing()
+
+    def assertTreap(self, ring):
+        """
+        Check the subtree sizes and heap order of the ring's tree.
+        """
+        def check(node):
+            if node is None:
+                return 0
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertLessEqual(child.priority, node.priority)
+            size = 1 + check(node.left) + check(node.right)
+            self.assertEqual(node.size, size)
+            return size
+        self.assertEqual(check(ring._root), len(ring))
+
+    def test_empty_ring(self):
+        """
+        Test the state of an empty ring.
+        """
+        self.assertTrue(self.ring.is_empty())
+        self.assertEqual(len(self.ring), 0)
+        self.assertEqual(self.ring.to_list(), [])
+        self.ring.rotate(3)
+        with self.assertRaises(IndexError):
+            self.ring.get_at(0)
+        with self.assertRaises(IndexError):
+            self.ring.remove_at(0)
+
+    def test_basic_operations(self):
+        """
+        Test appending, prepending, indexing and removing.
+        """
+        for value in (2, 3, 4):
+            self.ring.append(value)
+        self.ring.prepend(1)
+        self.ring.insert_at(2, 9)
+        self.assertEqual(self.ring.to_list(), [1, 2, 9, 3, 4])
+        self.assertEqual(self.ring.get_at(2), 9)
+        self.assertEqual(self.ring[-1], 4)
+        self.assertEqual(self.ring.find(3), 3)
+        self.assertIn(4, self.ring)
+        self.assertEqual(self.ring.remove_at(2), 9)
+        self.assertTrue(self.ring.remove(1))
+        self.assertFalse(self.ring.remove(1))
+        self.ring.set_at(0, 5)
+        self.assertEqual(str(self.ring), "IndexedRing([5, 3, 4])")
+        with self.assertRaises(IndexError):
+            self.ring.get_at(3)
+        with self.assertRaises(IndexError):
+            self.ring.insert_at(5, 0)
+
+    def test_rotate(self):
+        """
+        Test that rotation moves the first element like CircularLinkedList.rotate.
+        """
+        self.ring = IndexedRing.from_list([1, 2, 3, 4, 5])
+        self.ring.rotate(2)
+        self.assertEqual(self.ring.to_list(), [3, 4, 5, 1, 2])
+        self.ring.rotate(-1)
+        self.assertEqual(self.ring.to_list(), [2, 3, 4, 5, 1])
+        self.ring.rotate(10 ** 12)
+        self.assertEqual(self.ring.to_list(), [2, 3, 4, 5, 1])
+        self.assertEqual(self.ring.get_at(4), 1)
+
+    def test_edits_across_the_anchor(self):
+        """
+        Test insertions and removals on both sides of a rotated anchor.
+        """
+        self.ring = IndexedRing.from_list([1, 2, 3, 4])
+        self.ring.rotate(3)
+        self.ring.append(5)
+        self.ring.insert_at(1, 6)
+        self.assertEqual(self.ring.to_list(), [4, 6, 1, 2, 3, 5])
+        self.assertEqual(self.ring.remove_at(5), 5)
+        self.assertEqual(self.ring.remove_at(0), 4)
+        self.assertEqual(self.ring.to_list(), [6, 1, 2, 3])
+
+    def test_from_list_is_balanced(self):
+        """
+        Test that from_list builds a valid, shallow tree.
+        """
+        ring = IndexedRing.from_list(list(range(1000)))
+        self.assertTreap(ring)
+        self.assertEqual(ring.to_list(), list(range(1000)))
+
+        def depth(node):
+            return 0 if node is None else 1 + max(depth(node.left), depth(node.right))
+        self.assertLessEqual(depth(ring._root), 10)
+
+    def test_random_operations(self):
+        """
+        Test random operations against CircularLinkedList.
+        """
+        rng = random.Random(3)
+        expected = CircularLinkedList()
+        for step in range(2000):
+            roll = rng.random()
+            size = len(expected)
+            if roll < 0.35 or size == 0:
+                index = rng.randint(0, size)
+                self.ring.insert_at(index, step)
+                expected.insert_at(index, step)
+            elif roll < 0.6:
+                index = rng.randrange(size)
+                self.assertEqual(self.ring.remove_at(index), expected.remove_at(index))
+            elif roll < 0.8:
+                k = rng.randint(-2 * size, 2 * size)
+                self.ring.rotate(k)
+                expected.rotate(k)
+            else:
+                index = rng.randrange(size)
+                self.assertEqual(self.ring.get_at(index), expected.get_at(index))
+            self.assertEqual(len(self.ring), len(expected))
+        self.assertEqual(self.ring.to_list(), expected.to_list())
+        self.assertTreap(self.ring)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit tests for the josephus module.
+"""
+
+import unittest
+from Clinkedlist import CircularLinkedList
+from josephus import eliminate, elimination_order, survivor
+
+
+def simulate(n, k):
+    """
+    Return the elimination order by walking a CircularLinkedList, as usage.py does.
+    """
+    people = CircularLinkedList.from_list(list(range(1, n + 1)))
+    order = []
+    while not people.is_empty():
+        people.rotate(k - 1)
+        order.append(people.remove_at(0))
+    return order
+
+
+class TestJosephus(unittest.TestCase):
+    """
+    Test cases for the josephus module.
+    """
+
+    def test_known_order(self):
+        """
+        Test the classic example of 7 people with every 3rd eliminated.
+        """
+        self.assertEqual(elimination_order(7, 3), [3, 6, 2, 7, 5, 1, 4])
+        self.assertEqual(survivor(7, 3), 4)
+        self.assertEqual(survivor(41, 3), 31)
+
+    def test_matches_simulation(self):
+        """
+        Test the order and the survivor against the linked-list simulation.
+        """
+        for n in range(1, 40):
+            for k in range(1, 12):
+                expected = simulate(n, k)
+                self.assertEqual(elimination_order(n, k), expected, (n, k))
+                self.assertEqual(survivor(n, k), expected[-1], (n, k))
+
+    def test_survivor_large(self):
+        """
+        Test the survivor for circles too large to simulate.
+        """
+        # For k = 2 the survivor is 2 * (n - 2^floor(log2 n)) + 1
+        n = 10 ** 18 + 12345
+        self.assertEqual(survivor(n, 2), 2 * (n - (1 << (n.bit_length() - 1))) + 1)
+        self.assertEqual(survivor(100_000, 7), elimination_order(100_000, 7)[-1])
+
+    def test_eliminate_values(self):
+        """
+        Test eliminating arbitrary values lazily.
+        """
+        order = eliminate(["a", "b", "c", "d"], 2)
+        self.assertEqual(next(order), "b")
+        self.assertEqual(list(order), ["d", "c", "a"])
+
+    def test_invalid_arguments(self):
+        """
+        Test that n and k must be positive.
+        """
+        with self.assertRaises(ValueError):
+            elimination_order(0, 3)
+        with self.assertRaises(ValueError):
+            survivor(5, 0)
+        with self.assertRaises(ValueError):
+            list(eliminate([], 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
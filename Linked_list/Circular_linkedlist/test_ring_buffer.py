@@ -0,0 +1,146 @@
+"""
+Unit tests for the RingBuffer class.
+"""
+
+import random
+import unittest
+from array import array
+from collections import deque
+from ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    """
+    Test cases for the RingBuffer class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new RingBuffer before each test.
+        """
+        self.buffer = RingBuffer(4)
+
+    def test_empty_buffer(self):
+        """
+        Test the state of an empty buffer.
+        """
+        self.assertTrue(self.buffer.is_empty())
+        self.assertFalse(self.buffer.is_full())
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(self.buffer.to_list(), [])
+        self.assertIsNone(self.buffer.typecode)
+        with self.assertRaises(IndexError):
+            self.buffer[0]
+        with self.assertRaises(IndexError):
+            self.buffer.popleft()
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+        with self.assertRaises(ValueError):
+            RingBuffer(4, 'u')
+
+    def test_overwrites_oldest(self):
+        """
+        Test that appending to a full buffer drops the oldest value.
+        """
+        for value in range(6):
+            self.buffer.append(value)
+        self.assertTrue(self.buffer.is_full())
+        self.assertEqual(self.buffer.to_list(), [2, 3, 4, 5])
+        self.assertEqual(self.buffer[0], 2)
+        self.assertEqual(self.buffer[-1], 5)
+        self.buffer[1] = 30
+        self.assertEqual(list(self.buffer), [2, 30, 4, 5])
+        self.assertEqual(self.buffer.popleft(), 2)
+        self.assertEqual(str(self.buffer), "RingBuffer([30, 4, 5], capacity=4)")
+        self.buffer.clear()
+        self.assertEqual(self.buffer.to_list(), [])
+
+    def test_iterator_is_a_snapshot(self):
+        """
+        Test that changes after the iterator is created do not affect it, including after a wrap.
+        """
+        for value in range(6):
+            self.buffer.append(value)
+        values = iter(self.buffer)
+        self.assertEqual(next(values), 2)
+        for value in range(6, 9):
+            self.buffer.append(value)
+        self.assertEqual(list(values), [3, 4, 5])
+        untouched = iter(self.buffer)
+        self.buffer.clear()
+        self.assertEqual(list(untouched), [5, 6, 7, 8])
+
+    def test_extend(self):
+        """
+        Test extending with sequences, generators and inputs longer than the capacity.
+        """
+        self.buffer.extend([1, 2, 3])
+        self.buffer.extend((4, 5))
+        self.assertEqual(self.buffer.to_list(), [2, 3, 4, 5])
+        self.buffer.extend(x * 10 for x in range(7))
+        self.assertEqual(self.buffer.to_list(), [30, 40, 50, 60])
+        self.buffer.extend(range(100))
+        self.assertEqual(self.buffer.to_list(), [96, 97, 98, 99])
+
+    def test_typed_segments(self):
+        """
+        Test the typed mode and the zero-copy export of its segments.
+        """
+        buffer = RingBuffer(5, 'd')
+        buffer.extend(array('d', [1.0, 2.0, 3.0]))
+        first, second = buffer.segments()
+        self.assertEqual((first.tolist(), second.tolist()), ([1.0, 2.0, 3.0], []))
+        buffer.extend([4.0, 5.0, 6.0, 7.0])
+        first, second = buffer.segments()
+        self.assertEqual(first.tolist() + second.tolist(), buffer.to_list())
+        self.assertEqual(buffer.to_list(), [3.0, 4.0, 5.0, 6.0, 7.0])
+        self.assertEqual(first.format, 'd')
+        # The views share memory with the buffer
+        buffer[0] = 30.0
+        self.assertEqual(first[0], 30.0)
+
+        copy = RingBuffer(3, 'd')
+        copy.extend(first)
+        copy.extend(second)
+        self.assertEqual(copy.to_list(), [5.0, 6.0, 7.0])
+        with self.assertRaises(TypeError):
+            self.buffer.segments()
+
+    def test_typed_extend_converts(self):
+        """
+        Test that the typed mode accepts buffers of another format and plain iterables.
+        """
+        buffer = RingBuffer(4, 'q')
+        buffer.extend(array('b', [1, 2]))
+        buffer.extend(iter([3, 4, 5]))
+        self.assertEqual(buffer.to_list(), [2, 3, 4, 5])
+        self.assertEqual(buffer.typecode, 'q')
+
+    def test_random_operations(self):
+        """
+        Test random operations against a bounded deque.
+        """
+        rng = random.Random(4)
+        for typecode in (None, 'i'):
+            buffer = RingBuffer(7, typecode)
+            expected = deque(maxlen=7)
+            for step in range(2000):
+                roll = rng.random()
+                if roll < 0.5:
+                    buffer.append(step)
+                    expected.append(step)
+                elif roll < 0.7:
+                    values = list(range(step, step + rng.randint(0, 10)))
+                    buffer.extend(array('i', values) if typecode and roll < 0.6 else values)
+                    expected.extend(values)
+                elif roll < 0.8 and expected:
+                    self.assertEqual(buffer.popleft(), expected.popleft())
+                elif expected:
+                    index = rng.randrange(-len(expected), len(expected))
+                    self.assertEqual(buffer[index], expected[index])
+                self.assertEqual(len(buffer), len(expected))
+            self.assertEqual(buffer.to_list(), list(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Unit tests for the DeficitRoundRobin scheduler.
+"""
+
+import pickle
+import unittest
+from scheduler import DeficitRoundRobin
+
+
+class TestDeficitRoundRobin(unittest.TestCase):
+    """
+    Test cases for the DeficitRoundRobin class.
+    """
+
+    def setUp(self):
+        """
+        Set up a new scheduler before each test.
+        """
+        self.scheduler = DeficitRoundRobin(quantum=2)
+        self.log = []
+
+    def work(self):
+        """
+        Return a run function for tasks that are dicts with a name and remaining work.
+        """
+        def run(task, budget):
+            used = min(budget, task["remaining"])
+            task["remaining"] -= used
+            self.log.append((task["name"], used))
+            return None if task["remaining"] == 0 else used
+        return run
+
+    def test_round_robin_order(self):
+        """
+        Test that equal-weight tasks run in turn until they finish.
+        """
+        for name, remaining in (("A", 4), ("B", 2), ("C", 6)):
+            self.scheduler.add({"name": name, "remaining": remaining})
+        self.assertEqual(len(self.scheduler), 3)
+        turns = self.scheduler.run(self.work())
+        self.assertEqual(self.log, [("A", 2), ("B", 2), ("C", 2), ("A", 2), ("C", 2), ("C", 2)])
+        self.assertEqual(turns, 6)
+        self.assertTrue(self.scheduler.is_empty())
+        self.assertIsNone(self.scheduler.step(self.work()))
+
+    def test_weights_share_service(self):
+        """
+        Test that busy tasks receive service in proportion to their weights.
+        """
+        served = {"light": 0, "heavy": 0}
+        self.scheduler.add("light", weight=1)
+        self.scheduler.add("heavy", weight=3)
+
+        def run(task, budget):
+            # Work comes in units of 3, so budgets must accumulate
+            used = budget - budget % 3
+            served[task] += used
+            return used
+
+        self.scheduler.run(run, max_turns=1000)
+        self.assertAlmostEqual(served["heavy"] / served["light"], 3.0, delta=0.05)
+
+    def test_overrun_is_charged(self):
+        """
+        Test that using more than the budget reduces the next budget.
+        """
+        budgets = []
+        handle = self.scheduler.add("task")
+        self.scheduler.run(lambda task, budget: budgets.append(budget) or 3, max_turns=3)
+        self.assertEqual(budgets, [2, 1, 2])
+        self.assertEqual(handle.deficit, -1)
+
+    def test_overrunning_task_skips_turns(self):
+        """
+        Test that a task is not run again until its overrun is paid off.
+        """
+        budgets = []
+        self.scheduler.add("greedy")
+        self.scheduler.add("other")
+
+        def run(task, budget):
+            budgets.append((task, budget))
+            return 7 if task == "greedy" else budget
+
+        self.scheduler.run(run, max_turns=20)
+        self.assertTrue(all(budget > 0 for _, budget in budgets))
+        self.assertEqual(budgets[:5], [("greedy", 2), ("other", 2), ("other", 2), ("other", 2), ("greedy", 1)])
+
+    def test_idle_credit_is_capped(self):
+        """
+        Test that an idle task carries over at most one share of unused budget.
+        """
+        budgets = []
+        idle = self.scheduler.add("idle", weight=2)
+        self.scheduler.run(lambda task, budget: budgets.append(budget) or 0, max_turns=50)
+        self.assertEqual(idle.deficit, 4)
+        self.assertEqual(budgets[:3], [4, 8, 8])
+        self.assertEqual(max(budgets), 8)
+
+    def test_remove_through_handle(self):
+        """
+        Test removing tasks by handle, including from inside run.
+        """
+        handles = {name: self.scheduler.add(name) for name in "ABCD"}
+        self.assertTrue(self.scheduler.remove(handles["C"]))
+        self.assertFalse(self.scheduler.remove(handles["C"]))
+        self.assertEqual(list(self.scheduler.tasks()), ["A", "B", "D"])
+        ran = []
+
+        def run(task, budget):
+            ran.append(task)
+            if task == "B":
+                self.scheduler.remove(handles["B"])
+            return budget
+
+        self.scheduler.run(run, max_turns=6)
+        self.assertEqual(ran, ["A", "B", "D", "A", "D", "A"])
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertEqual(len(self.scheduler._ring), 2)
+        self.assertEqual(str(self.scheduler), "DeficitRoundRobin(['D', 'A'], quantum=2)")
+
+    def test_add_during_round(self):
+        """
+        Test that a task added while running joins the end of the round.
+        """
+        self.scheduler.add("A")
+        self.scheduler.add("B")
+        ran = []
+
+        def run(task, budget):
+            ran.append(task)
+            if task == "A" and len(ran) == 1:
+                self.scheduler.add("C")
+            return None
+
+        self.scheduler.run(run)
+        self.assertEqual(ran, ["A", "B", "C"])
+
+    def test_pickle(self):
+        """
+        Test that a pickled scheduler resumes with the same order, weights and deficits.
+        """
+        for name, remaining in (("A", 4), ("B", 2), ("C", 6)):
+            self.scheduler.add({"name": name, "remaining": remaining}, weight=2 if name == "C" else 1)
+        self.scheduler.step(self.work())
+        restored = pickle.loads(pickle.dumps(self.scheduler))
+        self.assertEqual([task["name"] for task in restored.tasks()], ["B", "C", "A"])
+        restored.run(self.work())
+        self.assertEqual(self.log, [("A", 2), ("B", 2), ("C", 4), ("A", 2), ("C", 2)])
+        self.assertTrue(restored.is_empty())
+
+    def test_invalid_arguments(self):
+        """
+        Test that the quantum and weights must be positive.
+        """
+        with self.assertRaises(ValueError):
+            DeficitRoundRobin(quantum=0)
+        with self.assertRaises(ValueError):
+            self.scheduler.add("A", weight=0)
+        handle = self.scheduler.add("A")
+        with self.assertRaises(ValueError):
+            self.scheduler.set_weight(handle, -1)
+        self.scheduler.set_weight(handle, 5)
+        self.assertEqual(handle.weight, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
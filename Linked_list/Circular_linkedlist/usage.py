@@ -3,6 +3,7 @@ Example usage of the CircularLinkedList class.
 """
 
 from Clinkedlist import CircularLinkedList
+from josephus import elimination_order, survivor as josephus_survivor
 
 
 def basic_usage():
@@ -151,6 +152,10 @@ def josephus_problem():
     
     survivor = people.get_at(0)
     print(f"Survivor: Person {survivor}")
+    
+    # The josephus module computes the same answers without walking the ring
+    print(f"Elimination order from josephus.elimination_order: {elimination_order(n, k)}")
+    print(f"Survivor of 1,000,000 people from josephus.survivor: Person {josephus_survivor(1_000_000, k)}")
 
 
 def media_playlist():
@@ -4,7 +4,10 @@ This module provides a comprehensive implementation of the Doubly Linked List da
 with type hints, proper error handling, and Pythonic interfaces.
 """
 
-from typing import TypeVar, Generic, Optional, Iterator, Any, Union, overload, cast
+import asyncio
+import gc
+import time
+from typing import TypeVar, Generic, Optional, Iterator, AsyncIterator, Any, List, Union, overload, cast
 
 
 T = TypeVar('T')  # Generic type for the data stored in the linked list
@@ -56,6 +59,7 @@ class DoublyLinkedList(Generic[T]):
         self.head: Optional[Node[T]] = None
         self.tail: Optional[Node[T]] = None
         self._size: int = 0
+        self._version: int = 0  # Bumped by every removal or reordering, see aiter()
     
     def append(self, value: T) -> Node[T]:
         """
@@ -282,6 +286,7 @@ class DoublyLinkedList(Generic[T]):
         node.next = None
         
         self._size -= 1
+        self._version += 1
         return data
     
     def remove_first(self) -> T:
@@ -443,6 +448,7 @@ class DoublyLinkedList(Generic[T]):
         self.head = None
         self.tail = None
         self._size = 0
+        self._version += 1
     
     def _validate_node(self, node: Node[T]) -> bool:
         """
@@ -491,6 +497,7 @@ class DoublyLinkedList(Generic[T]):
         current = self.head
         # Swap head and tail
         self.head, self.tail = self.tail, self.head
+        self._version += 1
         
         while current:
             # Swap the next and prev pointers
@@ -498,6 +505,129 @@ class DoublyLinkedList(Generic[T]):
             # Move to the next node (which is now current.prev due to swap)
             current = current.prev
     
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Convert the list to a one-dimensional NumPy array.
+        
+        With a dtype, the values are written straight into an array of the
+        list's length with numpy.fromiter, without an intermediate list.
+        Without one, NumPy infers the dtype from all the values, as
+        numpy.array(list(dll)) would. NumPy is imported only when this method
+        is called, so the list itself does not depend on it.
+        
+        Args:
+            dtype: The NumPy dtype of the array, or None to infer it.
+            
+        Returns:
+            A new numpy.ndarray holding the values in order.
+            
+        Raises:
+            ImportError: If NumPy is not installed.
+            
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        import numpy as np
+        
+        if dtype is None:
+            return np.array(list(self))
+        return np.fromiter(self, dtype=dtype, count=self._size)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'DoublyLinkedList[T]':
+        """
+        Create a list from the items of a NumPy array along its first axis.
+        
+        The array is converted to Python objects in a single tolist() call
+        (so the list holds ints and floats, not NumPy scalars, and the rows
+        of a 2-D array become lists), and the nodes are then linked in one
+        pass.
+        
+        Args:
+            arr: A NumPy array with at least one dimension.
+            
+        Returns:
+            A new DoublyLinkedList holding the array's items in order.
+            
+        Raises:
+            ValueError: If the array is zero-dimensional.
+            
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        if arr.ndim == 0:
+            raise ValueError("Cannot create a linked list from a zero-dimensional array")
+        result = cls()
+        result._link_values(arr.tolist())
+        return result
+    
+    def _link_values(self, values: List[T]) -> None:
+        """
+        Fill an empty list with new nodes holding values, linked in one pass.
+        
+        The cyclic garbage collector is paused meanwhile: none of the new
+        nodes can be garbage yet, and the collections their allocation would
+        trigger take most of the time. Subclasses that keep extra state about
+        the values override this to update it.
+        
+        Args:
+            values: The values in order.
+            
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        head = tail = None
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for value in values:
+                node = Node(value, tail)
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.head = head
+        self.tail = tail
+        self._size = len(values)
+    
+    def __getstate__(self) -> dict:
+        """
+        Return the list's state for pickle and copy, with the values as one flat list.
+        
+        Pickling the nodes themselves would recurse once per node through
+        Node.next (raising RecursionError for long lists) and store every
+        node as a separate object.
+        
+        Returns:
+            The instance attributes, with the nodes replaced by their values.
+            
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        state = self.__dict__.copy()
+        del state['head'], state['tail']
+        state['_values'] = list(self)
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the list from the state returned by __getstate__, relinking the nodes in one pass.
+        
+        Args:
+            state: The state returned by __getstate__.
+            
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        state = state.copy()
+        values = state.pop('_values')
+        self.__dict__.update(state)
+        self._link_values(values)
+    
     @overload
     def __getitem__(self, index: int) -> T: ...
     
@@ -599,6 +729,117 @@ class DoublyLinkedList(Generic[T]):
             yield current.data
             current = current.next
     
+    def iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """
+        Return an iterator over the values in the list in lists of up to size values.
+        
+        Each chunk is a new list that is preallocated and filled in one tight
+        loop, so a consumer that processes whole batches (for example with
+        NumPy) pays for one iterator step per chunk instead of one per value.
+        Every chunk except possibly the last holds exactly size values, and
+        the consumer may keep or modify the chunks.
+        
+        Values inserted while the iterator is suspended are visited. After a
+        removal, clear() or reverse() the iterator raises RuntimeError the
+        next time it resumes, as in aiter().
+        
+        Args:
+            size: The maximum number of values per chunk.
+            
+        Returns:
+            An iterator yielding lists of the values in the list, in order.
+            
+        Raises:
+            ValueError: If size is not positive.
+            
+        Time Complexity: O(1) for initialization, O(n) for full traversal
+        Space Complexity: O(size)
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        return self._iter_chunks(size)
+    
+    def _iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """Fill and yield the chunks for iter_chunks()."""
+        version = self._version
+        current = self.head
+        while current is not None:
+            chunk: List[Any] = [None] * size
+            for i in range(size):
+                if current is None:
+                    del chunk[i:]
+                    break
+                chunk[i] = current.data
+                current = current.next
+            yield chunk
+            if self._version != version:
+                raise RuntimeError("DoublyLinkedList changed during chunked iteration")
+    
+    def aiter(self, yield_every: int = 1024, yield_after_us: Optional[float] = None) -> AsyncIterator[T]:
+        """
+        Return an async iterator over the values that yields to the event loop.
+        
+        Walking a long list in a coroutine blocks every other coroutine until
+        it finishes. This iterator instead suspends (with asyncio.sleep(0))
+        after every yield_every values, and also once yield_after_us
+        microseconds have passed since it last suspended, if given. The time
+        includes the consumer's own work on each value.
+        
+        While the iterator is suspended other coroutines may change the list.
+        Insertions are safe: the iterator keeps its place, and values inserted
+        after it are visited. Removals, clear() and reverse() can unlink the
+        node the iterator stands on, so after any of them the iterator raises
+        RuntimeError the next time it resumes.
+        
+        Args:
+            yield_every: The maximum number of values between suspensions.
+            yield_after_us: The maximum time between suspensions in
+                microseconds, or None for no time limit.
+            
+        Returns:
+            An async iterator yielding the values in the list.
+            
+        Raises:
+            ValueError: If yield_every is not positive.
+            
+        Time Complexity: O(1) for initialization, O(n) for full traversal
+        Space Complexity: O(1)
+        """
+        if yield_every <= 0:
+            raise ValueError("yield_every must be positive")
+        return self._aiter(yield_every, None if yield_after_us is None else yield_after_us / 1e6)
+    
+    async def _aiter(self, yield_every: int, budget: Optional[float]) -> AsyncIterator[T]:
+        """Walk the list for aiter(), suspending every yield_every nodes or budget seconds."""
+        version = self._version
+        clock = time.perf_counter
+        started = clock()
+        count = 0
+        current = self.head
+        while current is not None:
+            yield current.data
+            count += 1
+            # The clock is read every 32 values to keep its cost negligible
+            if count >= yield_every or (budget is not None and count & 31 == 0 and clock() - started >= budget):
+                await asyncio.sleep(0)
+                count = 0
+                started = clock()
+            if self._version != version:
+                raise RuntimeError("DoublyLinkedList changed during async iteration")
+            current = current.next
+    
+    def __aiter__(self) -> AsyncIterator[T]:
+        """
+        Return an async iterator that yields to the event loop every 1024 values.
+        
+        Returns:
+            The async iterator returned by aiter() with its defaults.
+            
+        Time Complexity: O(1) for initialization, O(n) for full traversal
+        Space Complexity: O(1)
+        """
+        return self.aiter()
+    
     def __contains__(self, value: T) -> bool:
         """
         Check if the list contains the specified value.
@@ -0,0 +1,400 @@
+"""
+Aggregate Doubly Linked List Implementation
+
+This module provides a DoublyLinkedList subclass that keeps running aggregates
+(count, sum, min, max) up to date on every insertion and removal, so that rolling
+windows can read them in O(1) instead of scanning the list every tick.
+"""
+
+from collections import deque
+from typing import TypeVar, Deque, List, Any
+
+from Dlinkedlist import DoublyLinkedList, Node
+
+
+T = TypeVar('T')  # Generic type for the data stored in the linked list
+
+
+class AggregateDoublyLinkedList(DoublyLinkedList[T]):
+    """
+    A doubly linked list that maintains running aggregates over its values.
+
+    The running sum and count are updated on every insertion and removal. The
+    minimum and maximum are tracked with monotonic deques of nodes, which stay
+    valid while the list is used as a window: values may be appended at the tail
+    or prepended at the head, and are removed from the head. Any other mutation
+    (removing the tail or a middle node, inserting in the middle, reversing or
+    assigning by index) marks the extremes as stale, and they are rebuilt with
+    a single O(n) pass on the next read.
+
+    Stored values must support addition, subtraction and ordering. Values must
+    not be changed through node references returned by the list, since the list
+    cannot observe such changes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty aggregate doubly linked list.
+        """
+        super().__init__()
+        self._sum: Any = 0
+        self._min_nodes: Deque[Node[T]] = deque()  # Non-decreasing values
+        self._max_nodes: Deque[Node[T]] = deque()  # Non-increasing values
+        self._stale: bool = False
+
+    def append(self, value: T) -> Node[T]:
+        """
+        Add a new node with the given value to the end of the list.
+
+        Args:
+            value: The value to append.
+
+        Returns:
+            The newly created node.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        node = super().append(value)
+        self._sum += value
+        if not self._stale:
+            self._push_back(node)
+        return node
+
+    def prepend(self, value: T) -> Node[T]:
+        """
+        Add a new node with the given value to the beginning of the list.
+
+        Args:
+            value: The value to prepend.
+
+        Returns:
+            The newly created node.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        node = super().prepend(value)
+        self._sum += value
+        if not self._stale:
+            self._push_front(node)
+        return node
+
+    def insert_after(self, node: Node[T], value: T) -> Node[T]:
+        """
+        Insert a new node with the given value after the specified node.
+
+        Args:
+            node: The node after which to insert.
+            value: The value to insert.
+
+        Returns:
+            The newly created node.
+
+        Raises:
+            ValueError: If the node is not in this list.
+
+        Time Complexity: O(n) for node validation, as in DoublyLinkedList
+        Space Complexity: O(1)
+        """
+        new_node = super().insert_after(node, value)
+        self._sum += value
+        if new_node is self.tail and not self._stale:
+            self._push_back(new_node)
+        else:
+            self._invalidate()
+        return new_node
+
+    def insert_before(self, node: Node[T], value: T) -> Node[T]:
+        """
+        Insert a new node with the given value before the specified node.
+
+        Args:
+            node: The node before which to insert.
+            value: The value to insert.
+
+        Returns:
+            The newly created node.
+
+        Raises:
+            ValueError: If the node is not in this list.
+
+        Time Complexity: O(n) for node validation, as in DoublyLinkedList
+        Space Complexity: O(1)
+        """
+        new_node = super().insert_before(node, value)
+        self._sum += value
+        if new_node is self.head and not self._stale:
+            self._push_front(new_node)
+        else:
+            self._invalidate()
+        return new_node
+
+    def remove(self, node: Node[T]) -> T:
+        """
+        Remove the specified node from the list.
+
+        Removing the head keeps the min/max deques valid; removing any other
+        node marks them as stale.
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            The data stored in the removed node.
+
+        Raises:
+            ValueError: If the node is not in this list.
+
+        Time Complexity: O(1) for head/tail, O(n) otherwise (node validation)
+        Space Complexity: O(1)
+        """
+        was_head = node is self.head
+        data = super().remove(node)
+        self._sum -= data
+
+        if was_head:
+            if not self._stale:
+                if self._min_nodes and self._min_nodes[0] is node:
+                    self._min_nodes.popleft()
+                if self._max_nodes and self._max_nodes[0] is node:
+                    self._max_nodes.popleft()
+        else:
+            self._invalidate()
+
+        return data
+
+    def clear(self) -> None:
+        """
+        Remove all nodes from the list and reset the aggregates.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        super().clear()
+        self._sum = 0
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+        self._stale = False
+
+    def reverse(self) -> None:
+        """
+        Reverse the order of nodes in the list.
+
+        The sum is unaffected; the min/max deques are marked as stale.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        super().reverse()
+        if self._size > 1:
+            self._invalidate()
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """
+        Set the value at the specified index.
+
+        Args:
+            index: The index to set (0 <= index < len).
+            value: The value to set.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time Complexity: Same as get_at
+        Space Complexity: O(1)
+        """
+        # Handle negative indices
+        if index < 0:
+            index += len(self)
+
+        node = self.get_at(index)
+        self._sum += value - node.data
+        node.data = value
+        self._invalidate()
+
+    def _link_values(self, values: List[T]) -> None:
+        """
+        Fill an empty list with values in one pass, then compute the sum.
+
+        Used by from_numpy and when unpickling. The min/max deques are marked
+        as stale and rebuilt on the next read.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        super()._link_values(values)
+        self._sum = sum(values)
+        self._invalidate()
+
+    def __getstate__(self) -> dict:
+        """
+        Return the list's state for pickle and copy.
+
+        The min/max deques hold nodes, so they are left out; the list is
+        unpickled with stale extremes.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        state = super().__getstate__()
+        state['_min_nodes'] = deque()
+        state['_max_nodes'] = deque()
+        return state
+
+    def get_count(self) -> int:
+        """
+        Return the number of values in the list.
+
+        Returns:
+            The number of values.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._size
+
+    def get_sum(self) -> Any:
+        """
+        Return the sum of the values in the list.
+
+        For floating point values the running sum may drift slightly from
+        sum(list) after many insertions and removals.
+
+        Returns:
+            The running sum, or 0 for an empty list.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._sum
+
+    def get_mean(self) -> float:
+        """
+        Return the arithmetic mean of the values in the list.
+
+        Returns:
+            The mean of the values.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self._size == 0:
+            raise ValueError("Cannot compute the mean of an empty list")
+        return self._sum / self._size
+
+    def get_min(self) -> T:
+        """
+        Return the smallest value in the list.
+
+        Returns:
+            The minimum value.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Time Complexity: O(1), or O(n) once after a mutation that marked it stale
+        Space Complexity: O(1)
+        """
+        if self.head is None:
+            raise ValueError("Cannot get the minimum of an empty list")
+        if self._stale:
+            self._rebuild()
+        return self._min_nodes[0].data
+
+    def get_max(self) -> T:
+        """
+        Return the largest value in the list.
+
+        Returns:
+            The maximum value.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Time Complexity: O(1), or O(n) once after a mutation that marked it stale
+        Space Complexity: O(1)
+        """
+        if self.head is None:
+            raise ValueError("Cannot get the maximum of an empty list")
+        if self._stale:
+            self._rebuild()
+        return self._max_nodes[0].data
+
+    def _push_back(self, node: Node[T]) -> None:
+        """
+        Add a node appended at the tail to the min/max deques.
+
+        Nodes that can no longer be the extreme of any window ending at the
+        tail are evicted from the back of each deque.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        value = node.data
+        min_nodes = self._min_nodes
+        while min_nodes and min_nodes[-1].data > value:
+            min_nodes.pop()
+        min_nodes.append(node)
+
+        max_nodes = self._max_nodes
+        while max_nodes and max_nodes[-1].data < value:
+            max_nodes.pop()
+        max_nodes.append(node)
+
+    def _push_front(self, node: Node[T]) -> None:
+        """
+        Add a node prepended at the head to the min/max deques.
+
+        The node only becomes a candidate if it is at least as extreme as every
+        value after it.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        value = node.data
+        if not self._min_nodes or value <= self._min_nodes[0].data:
+            self._min_nodes.appendleft(node)
+        if not self._max_nodes or value >= self._max_nodes[0].data:
+            self._max_nodes.appendleft(node)
+
+    def _invalidate(self) -> None:
+        """
+        Mark the min/max deques as stale and release the nodes they hold.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+        self._stale = True
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+
+    def _rebuild(self) -> None:
+        """
+        Rebuild the min/max deques from the current contents of the list.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n) in the worst case
+        """
+        self._min_nodes.clear()
+        self._max_nodes.clear()
+        current = self.head
+        while current:
+            self._push_back(current)
+            current = current.next
+        self._stale = False
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the list.
+
+        Returns:
+            A string in the format "AggregateDoublyLinkedList([value1, value2, ...])".
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+        return f"AggregateDoublyLinkedList({str(self)})"
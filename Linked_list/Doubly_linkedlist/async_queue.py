@@ -0,0 +1,340 @@
+"""
+Asyncio Linked Queue Implementation
+
+This module provides asyncio queues stored in a DoublyLinkedList: LinkedQueue
+(first in, first out) and LinkedDeque (which can also add at the front and take
+from the back). Coroutines await get() and put() instead of polling the list,
+a bounded capacity makes producers wait for consumers, and get_batch() drains
+many items per wakeup.
+"""
+
+import asyncio
+from collections import deque
+from typing import TypeVar, Generic, Optional, Deque, List
+
+from Dlinkedlist import DoublyLinkedList
+
+
+T = TypeVar('T')  # Generic type for the data stored in the queue
+
+
+class LinkedQueue(Generic[T]):
+    """
+    A first-in, first-out asyncio queue backed by a DoublyLinkedList.
+
+    The interface follows asyncio.Queue: put() waits while the queue is full,
+    get() waits while it is empty, and the _nowait variants raise
+    asyncio.QueueFull and asyncio.QueueEmpty instead of waiting. Each put
+    wakes at most one waiting consumer and each get at most one waiting
+    producer, so no coroutine is woken without an item or a free slot for it.
+
+    get_batch() waits for the first item and then takes every available item
+    up to a limit without waiting again, so a consumer pays the cost of one
+    wakeup for a whole burst of items.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize an empty queue.
+
+        Args:
+            maxsize: The maximum number of items, or 0 for an unbounded queue.
+        """
+        self._maxsize = maxsize
+        self._items: DoublyLinkedList[T] = DoublyLinkedList()
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of items, or 0 for an unbounded queue."""
+        return self._maxsize
+
+    def qsize(self) -> int:
+        """
+        Return the number of items in the queue.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """
+        Return True if the queue has no items.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._items.head is None
+
+    def full(self) -> bool:
+        """
+        Return True if the queue has maxsize items.
+
+        An unbounded queue is never full.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return 0 < self._maxsize <= len(self._items)
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]) -> None:
+        """Wake the first waiter that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters: Deque[asyncio.Future], ready, timeout: Optional[float] = None) -> bool:
+        """
+        Wait in line until ready() is true.
+
+        Returns:
+            True once ready() is true, False if the timeout expired first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                if deadline is None:
+                    await waiter
+                else:
+                    await asyncio.wait_for(waiter, max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                self._abandon(waiters, waiter, ready)
+                return ready()
+            except BaseException:
+                self._abandon(waiters, waiter, ready)
+                raise
+        return True
+
+    def _abandon(self, waiters: Deque[asyncio.Future], waiter: asyncio.Future, ready) -> None:
+        """Leave the line, passing on a wakeup that was already given to this waiter."""
+        waiter.cancel()
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if ready():
+            self._wakeup_next(waiters)
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Add an item at the back of the queue without waiting.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._wakeup_next(self._getters)
+
+    async def put(self, item: T) -> None:
+        """
+        Add an item at the back of the queue, waiting while the queue is full.
+
+        Args:
+            item: The item to add.
+
+        Time Complexity: O(1) once there is room
+        Space Complexity: O(1)
+        """
+        if self.full():
+            await self._wait(self._putters, lambda: not self.full())
+        self.put_nowait(item)
+
+    def get_nowait(self) -> T:
+        """
+        Remove and return the item at the front of the queue without waiting.
+
+        Returns:
+            The oldest item.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._items.remove_first()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> T:
+        """
+        Remove and return the item at the front of the queue, waiting while it is empty.
+
+        Returns:
+            The oldest item.
+
+        Time Complexity: O(1) once an item is available
+        Space Complexity: O(1)
+        """
+        if self.empty():
+            await self._wait(self._getters, lambda: not self.empty())
+        return self.get_nowait()
+
+    def _take_front(self, max_n: int) -> List[T]:
+        """Detach up to max_n nodes from the front of the list in one splice."""
+        items = self._items
+        batch = []
+        node = items.head
+        while node is not None and len(batch) < max_n:
+            batch.append(node.data)
+            node.prev = None  # Break the back link so the detached nodes are freed at once
+            node = node.next
+        items.head = node
+        if node is None:
+            items.tail = None
+        else:
+            node.prev = None
+        items._size -= len(batch)
+        items._version += 1
+        return batch
+
+    async def get_batch(self, max_n: int, timeout: Optional[float] = None) -> List[T]:
+        """
+        Remove and return up to max_n items from the front of the queue.
+
+        Waits until at least one item is available (or the timeout expires),
+        then takes every available item up to max_n without waiting again.
+
+        Args:
+            max_n: The maximum number of items to return.
+            timeout: The maximum number of seconds to wait for the first item,
+                or None to wait indefinitely.
+
+        Returns:
+            A list of between 1 and max_n items, oldest first, or an empty
+            list if the timeout expired before any item arrived.
+
+        Raises:
+            ValueError: If max_n is not positive.
+
+        Time Complexity: O(k) where k is the number of items returned
+        Space Complexity: O(k)
+        """
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        if self.empty() and not await self._wait(self._getters, lambda: not self.empty(), timeout):
+            return []
+        batch = self._take_front(max_n)
+        # Each item taken frees a slot for one waiting producer
+        for _ in range(len(batch)):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        if not self.empty():
+            # Items are left over for the next consumer in line
+            self._wakeup_next(self._getters)
+        return batch
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the queue.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the queue.
+
+        Returns:
+            A string showing the items, maxsize and waiting coroutines.
+        """
+        return (f"{type(self).__name__}({list(self._items)}, maxsize={self._maxsize}, "
+                f"getters={len(self._getters)}, putters={len(self._putters)})")
+
+
+class LinkedDeque(LinkedQueue[T]):
+    """
+    An asyncio double-ended queue backed by a DoublyLinkedList.
+
+    Besides the LinkedQueue operations, which add at the back and take from
+    the front, items can be added at the front with put_left() (to retry an
+    item before newer work) and taken from the back with get_right() (to
+    process the newest item first). Both ends wait and wake the same way as
+    in LinkedQueue.
+    """
+
+    def put_left_nowait(self, item: T) -> None:
+        """
+        Add an item at the front of the deque without waiting.
+
+        Args:
+            item: The item to add.
+
+        Raises:
+            asyncio.QueueFull: If the deque is full.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.prepend(item)
+        self._wakeup_next(self._getters)
+
+    async def put_left(self, item: T) -> None:
+        """
+        Add an item at the front of the deque, waiting while the deque is full.
+
+        Args:
+            item: The item to add.
+
+        Time Complexity: O(1) once there is room
+        Space Complexity: O(1)
+        """
+        if self.full():
+            await self._wait(self._putters, lambda: not self.full())
+        self.put_left_nowait(item)
+
+    def get_right_nowait(self) -> T:
+        """
+        Remove and return the item at the back of the deque without waiting.
+
+        Returns:
+            The newest item.
+
+        Raises:
+            asyncio.QueueEmpty: If the deque is empty.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._items.remove_last()
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get_right(self) -> T:
+        """
+        Remove and return the item at the back of the deque, waiting while it is empty.
+
+        Returns:
+            The newest item.
+
+        Time Complexity: O(1) once an item is available
+        Space Complexity: O(1)
+        """
+        if self.empty():
+            await self._wait(self._getters, lambda: not self.empty())
+        return self.get_right_nowait()
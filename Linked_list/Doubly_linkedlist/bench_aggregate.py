@@ -0,0 +1,61 @@
+"""
+Benchmark for AggregateDoublyLinkedList.
+
+Compares the per-tick cost of a rolling window (append, drop the oldest value,
+read sum/min/max) using full scans over a DoublyLinkedList against the running
+aggregates of AggregateDoublyLinkedList, across several window sizes.
+"""
+
+import random
+import time
+
+from Dlinkedlist import DoublyLinkedList
+from aggregate import AggregateDoublyLinkedList
+
+
+def scan_tick(window: DoublyLinkedList, value: float) -> float:
+    """Advance the window by one value and read the aggregates by scanning."""
+    window.append(value)
+    window.remove_first()
+    return sum(window) + min(window) + max(window)
+
+
+def aggregate_tick(window: AggregateDoublyLinkedList, value: float) -> float:
+    """Advance the window by one value and read the running aggregates."""
+    window.append(value)
+    window.remove_first()
+    return window.get_sum() + window.get_min() + window.get_max()
+
+
+def time_ticks(window, tick, values) -> float:
+    """Return the mean time per tick in microseconds."""
+    start = time.perf_counter()
+    for value in values:
+        tick(window, value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def main() -> None:
+    rng = random.Random(0)
+    ticks = 2000
+
+    print(f"{'window':>10} {'scan us/tick':>14} {'aggregate us/tick':>18}")
+    for size in (10, 100, 1_000, 10_000, 100_000):
+        initial = [rng.random() for _ in range(size)]
+        values = [rng.random() for _ in range(ticks)]
+
+        scan_window = DoublyLinkedList[float]()
+        aggregate_window = AggregateDoublyLinkedList[float]()
+        for value in initial:
+            scan_window.append(value)
+            aggregate_window.append(value)
+
+        # Full scans get slow quickly, so use fewer ticks for large windows
+        scan_values = values[:max(10, ticks * 100 // size)]
+        scan_us = time_ticks(scan_window, scan_tick, scan_values)
+        aggregate_us = time_ticks(aggregate_window, aggregate_tick, values)
+        print(f"{size:>10} {scan_us:>14.2f} {aggregate_us:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
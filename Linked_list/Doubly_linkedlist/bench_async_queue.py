@@ -0,0 +1,85 @@
+"""
+Benchmark for the asyncio LinkedQueue.
+
+One producer puts items into a bounded queue and one consumer takes them,
+either one at a time with get() or in batches with get_batch(). The same
+workload runs on asyncio.Queue (with get(), and with a batch drained by hand
+with get() followed by get_nowait()) and on LinkedQueue. Reports items per
+second and consumer calls (get or get_batch awaits) per item.
+
+Usage:
+    python bench_async_queue.py [items] [maxsize]
+"""
+
+import asyncio
+import sys
+import time
+
+from async_queue import LinkedQueue
+
+BATCH = 256
+
+
+async def consume_single(queue, count):
+    """Take count items one at a time; return the number of gets."""
+    for _ in range(count):
+        await queue.get()
+    return count
+
+
+async def consume_batches(queue, count):
+    """Take count items with get_batch; return the number of batches."""
+    taken = batches = 0
+    while taken < count:
+        taken += len(await queue.get_batch(BATCH))
+        batches += 1
+    return batches
+
+
+async def consume_asyncio_batches(queue, count):
+    """Take count items from an asyncio.Queue in batches drained by hand; return the number of batches."""
+    taken = batches = 0
+    while taken < count:
+        batch = [await queue.get()]
+        while len(batch) < BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        taken += len(batch)
+        batches += 1
+    return batches
+
+
+async def produce(queue, count):
+    """Put count items."""
+    for i in range(count):
+        await queue.put(i)
+
+
+async def measure(queue, consumer, count):
+    """Return (items per second, consumer calls per item) for one run."""
+    start = time.perf_counter()
+    _, calls = await asyncio.gather(produce(queue, count), consumer(queue, count))
+    elapsed = time.perf_counter() - start
+    return count / elapsed, calls / count
+
+
+async def main_async(count, maxsize):
+    print(f"{count:,} items, maxsize {maxsize}, batches of up to {BATCH}")
+    print(f"{'queue':>32} {'items/s':>11} {'calls/item':>11}")
+    for name, factory, consumer in (
+        ("asyncio.Queue get", asyncio.Queue, consume_single),
+        ("asyncio.Queue get+get_nowait", asyncio.Queue, consume_asyncio_batches),
+        ("LinkedQueue get", LinkedQueue, consume_single),
+        ("LinkedQueue get_batch", LinkedQueue, consume_batches),
+    ):
+        rate, calls = await measure(factory(maxsize), consumer, count)
+        print(f"{name:>32} {rate:>11,.0f} {calls:>11.3f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    maxsize = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    asyncio.run(main_async(count, maxsize))
+
+
+if __name__ == "__main__":
+    main()
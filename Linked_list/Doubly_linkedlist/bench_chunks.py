@@ -0,0 +1,67 @@
+"""
+Benchmark for chunked iteration over a DoublyLinkedList.
+
+A batch consumer (standing in for one that hands each batch to NumPy)
+converts the list into arrays of doubles of a fixed size. It either collects
+each batch from the per-element iterator or takes it from iter_chunks().
+Reports the time per element for several chunk sizes.
+
+Usage:
+    python bench_chunks.py [elements]
+"""
+
+import sys
+import time
+from array import array
+
+from Dlinkedlist import DoublyLinkedList
+
+SIZES = (64, 1024, 16384)
+
+
+def batches_from_iter(values, size):
+    """Build arrays of size elements from the per-element iterator."""
+    batches = []
+    batch = []
+    for value in values:
+        batch.append(value)
+        if len(batch) == size:
+            batches.append(array('d', batch))
+            batch = []
+    if batch:
+        batches.append(array('d', batch))
+    return batches
+
+
+def batches_from_chunks(values, size):
+    """Build arrays of size elements from iter_chunks()."""
+    return [array('d', chunk) for chunk in values.iter_chunks(size)]
+
+
+def best_of(repeats, func, *args):
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = DoublyLinkedList()
+    for i in range(n):
+        values.append(float(i))
+    assert batches_from_iter(values, 1000) == batches_from_chunks(values, 1000)
+
+    print(f"{n:,} elements, ns per element")
+    print(f"{'chunk':>7} {'__iter__':>10} {'iter_chunks':>12} {'speedup':>8}")
+    for size in SIZES:
+        per_element = best_of(3, batches_from_iter, values, size) / n * 1e9
+        chunked = best_of(3, batches_from_chunks, values, size) / n * 1e9
+        print(f"{size:>7} {per_element:>10.1f} {chunked:>12.1f} {per_element / chunked:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
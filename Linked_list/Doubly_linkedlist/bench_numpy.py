@@ -0,0 +1,61 @@
+"""
+Benchmark for NumPy conversion of a DoublyLinkedList.
+
+Compares to_numpy() with building an array from list(dll), and from_numpy()
+with appending each element of an array. Requires NumPy.
+
+Usage:
+    python bench_numpy.py [elements]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from Dlinkedlist import DoublyLinkedList
+
+
+def best_of(repeats, func, *args):
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def export_via_list(values):
+    """Build an array of doubles from an intermediate Python list."""
+    return np.array(list(values), dtype=np.float64)
+
+
+def import_by_append(arr):
+    """Build a list by appending each element of the array."""
+    values = DoublyLinkedList()
+    for value in arr:
+        values.append(value)
+    return values
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    arr = np.arange(n, dtype=np.float64)
+    values = DoublyLinkedList.from_numpy(arr)
+    assert np.array_equal(values.to_numpy(np.float64), arr)
+
+    rows = [
+        ("export", "np.array(list(dll))", best_of(3, export_via_list, values),
+         "to_numpy(np.float64)", best_of(3, values.to_numpy, np.float64)),
+        ("import", "append per element", best_of(3, import_by_append, arr),
+         "from_numpy", best_of(3, DoublyLinkedList.from_numpy, arr)),
+    ]
+    print(f"{n:,} doubles, ns per element")
+    for name, old, old_time, new, new_time in rows:
+        print(f"{name}: {old} {old_time / n * 1e9:.1f}, {new} {new_time / n * 1e9:.1f} "
+              f"({old_time / new_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark for parallel_map and parallel_reduce over a DoublyLinkedList.
+
+Applies a CPU-bound function (a few hundred rounds of an integer hash) to
+every value of a list, serially in this process and with parallel_map on 1 to
+N worker processes, and sums the results with parallel_reduce. For reference
+it also runs ProcessPoolExecutor.map with one task per value, which pickles
+and sends every value on its own. Reports wall time and speedup over the
+serial loop. Speedups above 1x need as many free CPU cores as workers.
+
+Usage:
+    python bench_parallel.py [elements] [max_workers]
+"""
+
+import operator
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Dlinkedlist import DoublyLinkedList
+from parallel import parallel_map, parallel_reduce
+
+ROUNDS = 100
+
+
+def work(value: int) -> int:
+    """A CPU-bound function of one value."""
+    for _ in range(ROUNDS):
+        value = (value * 1103515245 + 12345) & 0xFFFFFFFF
+    return value
+
+
+def timed(func, *args, **kwargs):
+    """Return (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    values = DoublyLinkedList()
+    for i in range(n):
+        values.append(i)
+
+    expected, serial = timed(lambda: [work(value) for value in values])
+    print(f"{n:,} values, {os.cpu_count()} CPUs")
+    print(f"{'method':<34} {'seconds':>8} {'speedup':>8}")
+    print(f"{'serial loop':<34} {serial:>8.2f} {1:>7.2f}x")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        subset = list(values)[:n // 10]
+        _, seconds = timed(lambda: list(pool.map(work, subset)))
+        # Scaled up from a tenth of the values, since one task per value is slow
+        seconds *= n / len(subset)
+        print(f"{f'pool.map per value, {max_workers} workers':<34} {seconds:>8.2f} {serial / seconds:>7.2f}x")
+
+    for workers in range(1, max_workers + 1):
+        # A fresh pool per run, so worker start-up is included
+        result, seconds = timed(parallel_map, work, values, workers=workers)
+        assert list(result) == expected
+        print(f"{f'parallel_map, {workers} workers':<34} {seconds:>8.2f} {serial / seconds:>7.2f}x")
+
+    total, seconds = timed(parallel_reduce, operator.add, result, workers=max_workers)
+    assert total == sum(expected)
+    print(f"{f'parallel_reduce(add), {max_workers} workers':<34} {seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
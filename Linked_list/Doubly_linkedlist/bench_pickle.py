@@ -0,0 +1,85 @@
+"""
+Benchmark for pickling the linked lists.
+
+Pickles and unpickles a SinglyLinkedList, DoublyLinkedList and
+CircularLinkedList of integers, whose state is a flat list of values, and a
+plain Python list of the same values for reference. Reports the time of each
+direction and the size of the pickle. For comparison it also pickles a chain
+of nodes directly, the way the lists were pickled before: the size per node
+at a short length, and the length at which it raises RecursionError.
+
+Usage:
+    python bench_pickle.py [elements]
+"""
+
+import os
+import pickle
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'Singly_linkedlist'))
+sys.path.insert(0, os.path.join(HERE, '..', 'Circular_linkedlist'))
+
+from Clinkedlist import CircularLinkedList
+from Dlinkedlist import DoublyLinkedList
+from Slinkedlist import SinglyLinkedList
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def build(cls, n):
+    """Build a list of the integers 0 to n - 1."""
+    values = cls()
+    if cls is SinglyLinkedList:
+        # append walks the whole list, so link the nodes from the back
+        for i in reversed(range(n)):
+            values.prepend(i)
+    else:
+        for i in range(n):
+            values.append(i)
+    return values
+
+
+def best_of(repeats, func, *args):
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def node_chain_limit():
+    """Return the bytes per node of pickling 300 nodes directly, and the first length that fails."""
+    small = build(DoublyLinkedList, 300)
+    per_node = len(pickle.dumps(small.head, PROTOCOL)) / 300
+    n = 300
+    while True:
+        try:
+            pickle.dumps(build(DoublyLinkedList, n).head, PROTOCOL)
+        except RecursionError:
+            return per_node, n
+        n += 100
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n:,} integers, pickle protocol {PROTOCOL}")
+    print(f"{'structure':<20} {'dumps':>9} {'loads':>9} {'size':>10}")
+    for name, cls in (("list", list), ("SinglyLinkedList", SinglyLinkedList),
+                      ("DoublyLinkedList", DoublyLinkedList), ("CircularLinkedList", CircularLinkedList)):
+        values = list(range(n)) if cls is list else build(cls, n)
+        data = pickle.dumps(values, PROTOCOL)
+        assert list(pickle.loads(data)) == list(range(n))
+        dumps = best_of(3, pickle.dumps, values, PROTOCOL)
+        loads = best_of(3, pickle.loads, data)
+        print(f"{name:<20} {dumps * 1e3:>7.0f}ms {loads * 1e3:>7.0f}ms {len(data) / 2**20:>7.1f}MiB")
+
+    per_node, limit = node_chain_limit()
+    print(f"Pickling nodes directly: {per_node:.1f} bytes/node, RecursionError at {limit:,} nodes")
+
+
+if __name__ == "__main__":
+    main()
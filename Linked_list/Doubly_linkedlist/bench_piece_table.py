@@ -0,0 +1,104 @@
+"""
+Benchmark for the PieceTable text buffer.
+
+Replays a typing trace on a large file: the cursor jumps to a random line,
+types a burst of characters with a few backspaces and line breaks, and the
+current line is read back after every keystroke (as an editor redraws it).
+The same trace is replayed on a DoublyLinkedList of lines, edited with
+__getitem__ and __setitem__ as in text_editor_example in usage.py.
+
+Usage:
+    python bench_piece_table.py [lines] [bursts]
+"""
+
+import random
+import sys
+import time
+
+from Dlinkedlist import DoublyLinkedList
+from piece_table import PieceTable
+
+BURST = "typing a few words"
+
+
+def make_trace(lines: int, bursts: int, seed: int = 5):
+    """Generate (line, column, keys) bursts; keys are characters or '\\b' for backspace."""
+    rng = random.Random(seed)
+    trace = []
+    for _ in range(bursts):
+        keys = list(BURST)
+        keys[rng.randrange(len(keys))] = "\b"
+        keys.append("\n" if rng.random() < 0.3 else " ")
+        trace.append((rng.randrange(lines // 2), rng.randint(0, 5), keys))
+    return trace
+
+
+def replay_piece_table(doc: PieceTable, trace) -> int:
+    """Replay the trace on a PieceTable and return the number of keystrokes."""
+    keystrokes = 0
+    for line, column, keys in trace:
+        offset = doc.line_start(line) + column
+        for key in keys:
+            if key == "\b":
+                offset -= 1
+                doc.delete(offset, 1)
+            else:
+                doc.insert(offset, key)
+                offset += 1
+            doc.get_line(doc.line_of(offset))
+            keystrokes += 1
+    return keystrokes
+
+
+def replay_linked_lines(lines: DoublyLinkedList, trace) -> int:
+    """Replay the trace on a DoublyLinkedList of lines and return the number of keystrokes."""
+    keystrokes = 0
+    for line, column, keys in trace:
+        for key in keys:
+            text = lines[line]
+            if key == "\b":
+                column -= 1
+                lines[line] = text[:column] + text[column + 1:]
+            elif key == "\n":
+                lines[line] = text[:column]
+                lines.insert_at(line + 1, text[column:])
+                line, column = line + 1, 0
+            else:
+                lines[line] = text[:column] + key + text[column:]
+                column += 1
+            lines[line]
+            keystrokes += 1
+    return keystrokes
+
+
+def main() -> None:
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bursts = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    source = [f"line {i}: the quick brown fox jumps over the lazy dog" for i in range(line_count)]
+    text = "\n".join(source)
+    trace = make_trace(line_count, bursts)
+
+    start = time.perf_counter()
+    doc = PieceTable(text)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    keystrokes = replay_piece_table(doc, trace)
+    piece_time = time.perf_counter() - start
+
+    lines = DoublyLinkedList[str]()
+    for line in source:
+        lines.append(line)
+    short_trace = trace[:max(1, bursts // 50)]
+    start = time.perf_counter()
+    linked_keystrokes = replay_linked_lines(lines, short_trace)
+    linked_time = time.perf_counter() - start
+
+    print(f"{line_count:,} lines ({len(text) / 1e6:.1f} MB), PieceTable built in {build:.2f} s")
+    print(f"{'structure':>18} {'keystrokes':>11} {'us/keystroke':>13}")
+    print(f"{'PieceTable':>18} {keystrokes:>11,} {piece_time / keystrokes * 1e6:>13.1f}")
+    print(f"{'DoublyLinkedList':>18} {linked_keystrokes:>11,} {linked_time / linked_keystrokes * 1e6:>13.1f}")
+    print(f"PieceTable ended with {doc.piece_count:,} pieces")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark for the Rope implementation.
+
+Compares Rope with str concatenation and ''.join on log-assembly workloads:
+
+- append: add many short segments to the end of a growing text (with and
+  without another reference to the text, which decides whether CPython can
+  resize the string in place)
+- prepend: add segments to the start of a growing text
+- insert: splice segments into the middle of a large text
+- substring: take many large substrings of a large text
+
+Usage:
+    python bench_rope.py [segments]
+"""
+
+import random
+import sys
+import time
+
+from Dlinkedlist import DoublyLinkedList
+from rope import Rope
+
+
+def timed(function) -> float:
+    """Return the time taken by function() in milliseconds."""
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(2)
+    segments = DoublyLinkedList[str]()
+    for i in range(count):
+        segments.append(f"2024-01-01T00:00:{i % 60:02d} worker-{i % 8} handled request {i}\n")
+    pieces = list(segments)
+    positions = [rng.random() for _ in range(count // 10)]
+
+    def append_str():
+        text = ""
+        for piece in pieces:
+            text = text + piece
+        return text
+
+    def append_str_shared():
+        # Another reference to the text (as when it is also stored in a list
+        # node) disables CPython's in-place resize, so every + copies
+        text = shared = ""
+        for piece in pieces:
+            text = text + piece
+            shared = text
+        return shared
+
+    def append_rope():
+        rope = Rope()
+        for piece in pieces:
+            rope = rope + piece
+        return rope.flatten()
+
+    def prepend_str():
+        text = ""
+        for piece in pieces[:count // 5]:
+            text = piece + text
+        return text
+
+    def prepend_rope():
+        rope = Rope()
+        for piece in pieces[:count // 5]:
+            rope = piece + rope
+        return rope.flatten()
+
+    base_text = "".join(pieces)
+    base_rope = Rope.from_iterable(segments)
+
+    def insert_str():
+        text = base_text
+        for position, piece in zip(positions, pieces):
+            index = int(position * len(text))
+            text = text[:index] + piece + text[index:]
+        return text
+
+    def insert_rope():
+        rope = base_rope
+        for position, piece in zip(positions, pieces):
+            rope = rope.insert(int(position * len(rope)), piece)
+        return rope.flatten()
+
+    def substring_str():
+        size = len(base_text) // 2
+        for p in positions:
+            base_text[int(p * size):int(p * size) + size]
+
+    def substring_rope():
+        size = len(base_rope) // 2
+        for p in positions:
+            base_rope[int(p * size):int(p * size) + size]
+
+    assert append_str() == append_rope()
+    assert insert_str() == insert_rope()
+
+    print(f"{count:,} segments, {len(base_text) / 1e6:.1f} MB assembled")
+    print(f"{'workload':>28} {'str ms':>10} {'join ms':>10} {'Rope ms':>10}")
+    print(f"{'append':>28} {timed(append_str):>10.1f} {timed(lambda: ''.join(segments)):>10.1f} "
+          f"{timed(append_rope):>10.1f}")
+    print(f"{'append (text shared)':>28} {timed(append_str_shared):>10.1f} {'':>10} {'':>10}")
+    print(f"{'build from segments':>28} {'':>10} {timed(lambda: ''.join(segments)):>10.1f} "
+          f"{timed(lambda: Rope.from_iterable(segments)):>10.1f}")
+    print(f"{'prepend (' + format(count // 5, ',') + ')':>28} {timed(prepend_str):>10.1f} {'':>10} "
+          f"{timed(prepend_rope):>10.1f}")
+    print(f"{'insert (' + format(len(positions), ',') + ')':>28} {timed(insert_str):>10.1f} {'':>10} "
+          f"{timed(insert_rope):>10.1f}")
+    print(f"{'substring (' + format(len(positions), ',') + ')':>28} {timed(substring_str):>10.1f} {'':>10} "
+          f"{timed(substring_rope):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
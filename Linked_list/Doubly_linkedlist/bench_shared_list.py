@@ -0,0 +1,90 @@
+"""
+Benchmark for the shared-memory SharedLinkedList.
+
+Compares a DoublyLinkedList of integers, which every worker process would
+hold its own copy of, with one SharedLinkedList that the workers attach to.
+Reports the memory per copy, the time to traverse each list, and the time
+for worker processes to get the list: rebuilding a DoublyLinkedList from a
+pickled payload versus attaching by name.
+
+Usage:
+    python bench_shared_list.py [elements] [workers]
+"""
+
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from Dlinkedlist import DoublyLinkedList
+from shared_list import SharedLinkedList
+
+
+def build(values):
+    """Build a DoublyLinkedList of the values."""
+    result = DoublyLinkedList()
+    for value in values:
+        result.append(value)
+    return result
+
+
+def copy_and_sum(values):
+    """Worker: rebuild a private list from a payload and sum it."""
+    return sum(build(values))
+
+
+def attach_and_sum(name):
+    """Worker: attach to the shared list and sum it in place."""
+    with SharedLinkedList.attach(name) as shared:
+        return sum(shared)
+
+
+def best_of(repeats, func, *args):
+    """Return the best wall time of several runs."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    payload = list(range(1_000_000_000, 1_000_000_000 + n))  # Large enough to be real int objects
+
+    tracemalloc.start()
+    values = build(payload)
+    private_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    shared = SharedLinkedList.from_values(values, 'q', 'i')
+    try:
+        print(f"{n:,} int64 values, {workers} workers")
+        print(f"memory per copy: DoublyLinkedList {private_bytes / n:.0f} B/value, "
+              f"SharedLinkedList {shared.nbytes / n:.0f} B/value (one copy for all workers)")
+        print(f"  {workers} workers with private copies: {private_bytes * workers / 2**20:.0f} MiB, "
+              f"shared: {shared.nbytes / 2**20:.0f} MiB")
+
+        for name, func in (("sum(DoublyLinkedList)", lambda: sum(values)),
+                           ("sum(SharedLinkedList)", lambda: sum(shared)),
+                           ("sum(SharedLinkedList.to_list())", lambda: sum(shared.to_list()))):
+            print(f"{name:<34} {best_of(3, func) / n * 1e9:6.1f} ns/value")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(abs, range(workers)))  # Start the workers
+            start = time.perf_counter()
+            totals = list(pool.map(copy_and_sum, [payload] * workers))
+            copied = time.perf_counter() - start
+            start = time.perf_counter()
+            assert list(pool.map(attach_and_sum, [shared.name] * workers)) == totals
+            attached = time.perf_counter() - start
+        print(f"{workers} workers, pickle payload + rebuild + sum: {copied:.2f} s; "
+              f"attach + sum: {attached:.2f} s")
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Parallel Map and Reduce over a Doubly Linked List
+
+This module runs CPU-bound functions over the values of a DoublyLinkedList in
+a pool of worker processes. The list is cut into contiguous chunks in a single
+pass, and each task ships one chunk of values (a plain list), not nodes, so a
+task costs one pickle of its values however long the list is. The results come
+back in list order: parallel_map links them into a new list, and
+parallel_reduce combines the partial results of the chunks.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+from typing import TypeVar, Callable, Iterator, List, Optional, Any
+
+from Dlinkedlist import DoublyLinkedList, Node
+
+
+T = TypeVar('T')  # Generic type for the values of the input list
+R = TypeVar('R')  # Generic type for the results
+
+_MISSING = object()  # Marks that parallel_reduce was called without an initial value
+
+
+def _map_chunk(fn: Callable[[T], R], chunk: List[T]) -> List[R]:
+    """Apply fn to each value of a chunk in a worker process."""
+    return list(map(fn, chunk))
+
+
+def _reduce_chunk(fn: Callable[[R, R], R], chunk: List[R]) -> R:
+    """Reduce a non-empty chunk in a worker process."""
+    return reduce(fn, chunk)
+
+
+def _chunk_size(size: int, workers: int, chunk: Optional[int]) -> int:
+    """Validate or choose the number of values per task."""
+    if chunk is not None:
+        if chunk <= 0:
+            raise ValueError("chunk must be positive")
+        return chunk
+    # Four tasks per worker keep the workers busy when some chunks take longer
+    return max(1, -(-size // (workers * 4)))
+
+
+def _run(fn: Callable, task: Callable, values: DoublyLinkedList[T], workers: Optional[int],
+         chunk: Optional[int], executor: Optional[Executor]) -> Iterator[Any]:
+    """Run task(fn, chunk) for each chunk of values and return the results in order."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    chunks = values.iter_chunks(_chunk_size(len(values), workers, chunk))
+    if executor is not None:
+        return executor.map(task, repeat(fn), chunks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Collect the results before the pool shuts down
+        return iter(list(pool.map(task, repeat(fn), chunks)))
+
+
+def parallel_map(fn: Callable[[T], R], values: DoublyLinkedList[T], workers: Optional[int] = None,
+                 chunk: Optional[int] = None, executor: Optional[Executor] = None) -> DoublyLinkedList[R]:
+    """
+    Apply fn to every value of a list in worker processes.
+
+    fn and the values must be picklable, so fn has to be defined at the top
+    level of a module. The input list must not be changed until the call
+    returns.
+
+    Args:
+        fn: The function to apply to each value.
+        values: The list to map over.
+        workers: The number of worker processes, by default os.cpu_count().
+        chunk: The number of values per task, by default enough for about
+            four tasks per worker.
+        executor: An existing executor to run the tasks in instead of a new
+            process pool, which saves starting the workers on every call.
+
+    Returns:
+        A new DoublyLinkedList holding fn(value) for each value, in order.
+
+    Raises:
+        ValueError: If workers or chunk is not positive.
+
+    Time Complexity: O(n / workers) for the calls to fn, plus O(n) to split and relink
+    Space Complexity: O(n)
+    """
+    result: DoublyLinkedList[R] = DoublyLinkedList()
+    tail = None
+    for mapped in _run(fn, _map_chunk, values, workers, chunk, executor):
+        # Splice each chunk of results onto the end of the new list
+        for value in mapped:
+            node = Node(value, tail)
+            if tail is None:
+                result.head = node
+            else:
+                tail.next = node
+            tail = node
+        result._size += len(mapped)
+    result.tail = tail
+    return result
+
+
+def parallel_reduce(fn: Callable[[R, R], R], values: DoublyLinkedList[R], initial: Any = _MISSING,
+                    workers: Optional[int] = None, chunk: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> R:
+    """
+    Reduce the values of a list with fn, reducing the chunks in worker processes.
+
+    Each worker reduces its chunks from left to right, and the partial results
+    are then reduced in list order in the calling process, so the result
+    equals functools.reduce(fn, values, initial) whenever fn is associative
+    (for example addition, max, or merging sorted runs). initial is used once,
+    in the final reduction.
+
+    Args:
+        fn: An associative function of two arguments.
+        values: The list to reduce.
+        initial: A value placed before the values, and the result for an
+            empty list.
+        workers: The number of worker processes, by default os.cpu_count().
+        chunk: The number of values per task, by default enough for about
+            four tasks per worker.
+        executor: An existing executor to run the tasks in instead of a new
+            process pool.
+
+    Returns:
+        The reduced value.
+
+    Raises:
+        TypeError: If the list is empty and no initial value is given.
+        ValueError: If workers or chunk is not positive.
+
+    Time Complexity: O(n / workers) for the calls to fn, plus O(n) to split the list
+    Space Complexity: O(n)
+    """
+    if values.head is None:
+        if initial is _MISSING:
+            raise TypeError("parallel_reduce() of empty list with no initial value")
+        return initial
+    partials = _run(fn, _reduce_chunk, values, workers, chunk, executor)
+    if initial is _MISSING:
+        return reduce(fn, partials)
+    return reduce(fn, partials, initial)
@@ -0,0 +1,489 @@
+"""
+Piece Table Text Buffer
+
+This module provides a piece table for editing large documents. The text is
+never copied on an edit: it lives in append-only buffers (the original file
+and the text added since), and the document is a sequence of pieces, each
+pointing at a span of one buffer.
+
+The pieces are kept in a balanced binary tree (a treap) ordered by position
+in the document. Every node also stores the total length and number of line
+breaks of its subtree, so finding an offset, a line, or the line containing
+an offset takes O(log p) time for p pieces. Each buffer keeps a cached index
+of its line breaks, so a piece never has to be scanned to count or locate
+them.
+"""
+
+import io
+import random
+import re
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+
+ADD_CHUNK_SIZE = 1 << 16  # Characters per add-buffer chunk
+
+_NEWLINE = re.compile('\n')
+
+
+class _Piece:
+    """
+    A span of one buffer, stored as a node of the piece tree.
+
+    Attributes:
+        buffer (int): The index of the buffer the span is in.
+        start (int): The offset of the span in the buffer.
+        length (int): The number of characters in the span.
+        breaks (int): The number of line breaks in the span.
+        priority (float): The random treap priority of the node.
+        left (Optional[_Piece]): The subtree of earlier pieces.
+        right (Optional[_Piece]): The subtree of later pieces.
+        total_length (int): The number of characters in the subtree.
+        total_breaks (int): The number of line breaks in the subtree.
+    """
+
+    __slots__ = ('buffer', 'start', 'length', 'breaks', 'priority',
+                 'left', 'right', 'total_length', 'total_breaks')
+
+    def __init__(self, buffer: int, start: int, length: int, breaks: int) -> None:
+        """
+        Initialize a piece with no children.
+
+        Args:
+            buffer: The index of the buffer the span is in.
+            start: The offset of the span in the buffer.
+            length: The number of characters in the span.
+            breaks: The number of line breaks in the span.
+        """
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.breaks = breaks
+        self.priority = random.random()
+        self.left: Optional[_Piece] = None
+        self.right: Optional[_Piece] = None
+        self.total_length = length
+        self.total_breaks = breaks
+
+    def update(self) -> None:
+        """Recompute the subtree totals from the children."""
+        length = self.length
+        breaks = self.breaks
+        if self.left is not None:
+            length += self.left.total_length
+            breaks += self.left.total_breaks
+        if self.right is not None:
+            length += self.right.total_length
+            breaks += self.right.total_breaks
+        self.total_length = length
+        self.total_breaks = breaks
+
+
+def _merge(left: Optional[_Piece], right: Optional[_Piece]) -> Optional[_Piece]:
+    """Join two trees, where every piece of left comes before every piece of right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+class PieceTable:
+    """
+    A text buffer backed by a piece table.
+
+    Insertions append the new text to the add buffer and splice one piece
+    into the tree; deletions only remove or trim pieces. Consecutive typing
+    at the end of the last insertion extends that piece instead of creating
+    a new one.
+
+    Offsets and line numbers are zero-based. Lines are separated by '\\n';
+    a document with k line breaks has k + 1 lines.
+
+    Attributes:
+        _buffers (List[str]): The original text followed by the full
+            add-buffer chunks.
+        _add (io.StringIO): The add-buffer chunk being filled, which is
+            buffer number len(_buffers). Text is written to it in place, so
+            appending costs the length of the text, not of the chunk.
+        _add_length (int): The number of characters in _add.
+        _breaks (List[List[int]]): The offsets of the line breaks in each
+            buffer, including _add, in increasing order.
+        _root (Optional[_Piece]): The root of the piece tree.
+        _last (Optional[_Piece]): The piece created by the last insertion,
+            while it can still be extended.
+        _last_end (int): The document offset just past _last.
+    """
+
+    def __init__(self, text: str = "") -> None:
+        """
+        Initialize a piece table holding text.
+
+        Args:
+            text: The original document.
+
+        Time complexity: O(n) to index the line breaks of text
+        Space complexity: O(b), where b is the number of line breaks
+        """
+        self._buffers: List[str] = [text]
+        self._add = io.StringIO()
+        self._add_length = 0
+        self._breaks: List[List[int]] = [[m.start() for m in _NEWLINE.finditer(text)], []]
+        self._root: Optional[_Piece] = None
+        if text:
+            self._root = _Piece(0, 0, len(text), len(self._breaks[0]))
+        self._last: Optional[_Piece] = None
+        self._last_end = -1
+
+    def __len__(self) -> int:
+        """
+        Return the number of characters in the document.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self._root.total_length if self._root is not None else 0
+
+    @property
+    def line_count(self) -> int:
+        """The number of lines in the document."""
+        return (self._root.total_breaks if self._root is not None else 0) + 1
+
+    @property
+    def piece_count(self) -> int:
+        """The number of pieces the document is split into."""
+        count = 0
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return count
+
+    def _count_breaks(self, buffer: int, start: int, end: int) -> int:
+        """Return the number of line breaks in buffer[start:end]."""
+        breaks = self._breaks[buffer]
+        return bisect_left(breaks, end) - bisect_left(breaks, start)
+
+    def _span(self, buffer: int, start: int, end: int) -> str:
+        """Return buffer[start:end], reading the chunk being filled in place."""
+        if buffer < len(self._buffers):
+            return self._buffers[buffer][start:end]
+        self._add.seek(start)
+        return self._add.read(end - start)
+
+    def _split(self, node: Optional[_Piece], offset: int) -> Tuple[Optional[_Piece], Optional[_Piece]]:
+        """
+        Split a tree into the first offset characters and the rest.
+
+        A piece that straddles the offset is cut in two.
+        """
+        if node is None:
+            return None, None
+        left_length = node.left.total_length if node.left is not None else 0
+        if offset <= left_length:
+            left, node.left = self._split(node.left, offset)
+            node.update()
+            return left, node
+        offset -= left_length
+        if offset < node.length:
+            # Cut this piece: the tail becomes a new piece in the right tree
+            start = node.start + offset
+            end = node.start + node.length
+            tail = _Piece(node.buffer, start, end - start, self._count_breaks(node.buffer, start, end))
+            node.length = offset
+            node.breaks -= tail.breaks
+            right = _merge(tail, node.right)
+            node.right = None
+            node.update()
+            return node, right
+        node.right, right = self._split(node.right, offset - node.length)
+        node.update()
+        return node, right
+
+    def _append_text(self, text: str) -> Tuple[int, int, int]:
+        """
+        Append text to the add buffer.
+
+        Args:
+            text: The text to append.
+
+        Returns:
+            The buffer index, start offset and number of line breaks of the
+            appended span.
+        """
+        if self._add_length and self._add_length + len(text) > ADD_CHUNK_SIZE:
+            # The chunk is full: freeze it as a string and start a new one
+            self._buffers.append(self._add.getvalue())
+            self._breaks.append([])
+            self._add = io.StringIO()
+            self._add_length = 0
+        index = len(self._buffers)
+        start = self._add_length
+        self._add.seek(start)
+        self._add.write(text)
+        self._add_length += len(text)
+        breaks = [start + m.start() for m in _NEWLINE.finditer(text)]
+        self._breaks[index].extend(breaks)
+        return index, start, len(breaks)
+
+    def insert(self, offset: int, text: str) -> None:
+        """
+        Insert text at an offset.
+
+        Args:
+            offset: The position to insert at, from 0 to len(self).
+            text: The text to insert.
+
+        Raises:
+            IndexError: If offset is out of range.
+
+        Time complexity: O(log p + k) amortized, where k is the length of text
+        Space complexity: O(k)
+        """
+        if not 0 <= offset <= len(self):
+            raise IndexError("Offset out of range")
+        if not text:
+            return
+
+        last = self._last
+        if last is not None and offset == self._last_end:
+            if last.buffer == len(self._buffers) and last.start + last.length == self._add_length \
+                    and self._add_length + len(text) <= ADD_CHUNK_SIZE:
+                # Typing continues the last insertion: extend its piece in place
+                _, _, breaks = self._append_text(text)
+                self._grow_last(offset - 1, len(text), breaks)
+                self._last_end += len(text)
+                return
+
+        buffer, start, breaks = self._append_text(text)
+        piece = _Piece(buffer, start, len(text), breaks)
+        left, right = self._split(self._root, offset)
+        self._root = _merge(_merge(left, piece), right)
+        self._last = piece
+        self._last_end = offset + len(text)
+
+    def _grow_last(self, offset: int, length: int, breaks: int) -> None:
+        """
+        Lengthen the piece holding the character at offset, which is _last.
+
+        The totals of every node on the path from the root are updated.
+        """
+        node = self._root
+        while True:
+            node.total_length += length
+            node.total_breaks += breaks
+            left_length = node.left.total_length if node.left is not None else 0
+            if offset < left_length:
+                node = node.left
+            elif offset < left_length + node.length:
+                break
+            else:
+                offset -= left_length + node.length
+                node = node.right
+        node.length += length
+        node.breaks += breaks
+
+    def delete(self, offset: int, length: int) -> str:
+        """
+        Delete length characters starting at offset.
+
+        Args:
+            offset: The position of the first character to delete.
+            length: The number of characters to delete.
+
+        Returns:
+            The deleted text.
+
+        Raises:
+            IndexError: If the range is out of bounds.
+
+        Time complexity: O(log p + d), where d is the number of pieces removed
+        Space complexity: O(length)
+        """
+        if offset < 0 or length < 0 or offset + length > len(self):
+            raise IndexError("Range out of bounds")
+        if not length:
+            return ""
+        left, rest = self._split(self._root, offset)
+        middle, right = self._split(rest, length)
+        spans: List[str] = []
+        self._collect(middle, 0, 0, length, spans)
+        self._root = _merge(left, right)
+        self._last = None
+        return "".join(spans)
+
+    def _collect(self, node: Optional[_Piece], base: int, start: int, end: int,
+                 spans: List[str]) -> None:
+        """
+        Append the text of a subtree that lies in [start, end) to spans.
+
+        Subtrees entirely outside the range are skipped.
+
+        Args:
+            node: The root of the subtree.
+            base: The document offset of the first character of the subtree.
+            start: The offset of the first character to collect.
+            end: The offset just past the last character to collect.
+            spans: The list to append the text to.
+        """
+        if node is None or base >= end or base + node.total_length <= start:
+            return
+        left_length = node.left.total_length if node.left is not None else 0
+        self._collect(node.left, base, start, end, spans)
+        node_start = base + left_length
+        node_end = node_start + node.length
+        if node_end > start and node_start < end:
+            lo = max(start, node_start) - node_start + node.start
+            hi = min(end, node_end) - node_start + node.start
+            spans.append(self._span(node.buffer, lo, hi))
+        self._collect(node.right, node_end, start, end, spans)
+
+    def get_text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """
+        Return the text between two offsets.
+
+        Args:
+            start: The offset of the first character (default 0).
+            end: The offset just past the last character (default: the end).
+
+        Returns:
+            The text in [start, end).
+
+        Time complexity: O(log p + q + m), where q is the number of pieces in
+            the range and m is the length of the result
+        Space complexity: O(m)
+        """
+        size = len(self)
+        if end is None or end > size:
+            end = size
+        start = max(0, start)
+        if start >= end:
+            return ""
+        spans: List[str] = []
+        self._collect(self._root, 0, start, end, spans)
+        return "".join(spans)
+
+    def line_start(self, line: int) -> int:
+        """
+        Return the offset of the first character of a line.
+
+        Args:
+            line: The line number.
+
+        Returns:
+            The offset where the line starts.
+
+        Raises:
+            IndexError: If the line does not exist.
+
+        Time complexity: O(log p + log b)
+        Space complexity: O(1)
+        """
+        if not 0 <= line < self.line_count:
+            raise IndexError("Line out of range")
+        if line == 0:
+            return 0
+        # Find the line-th line break; the line starts just after it
+        node = self._root
+        base = 0
+        while True:
+            left = node.left
+            left_breaks = left.total_breaks if left is not None else 0
+            left_length = left.total_length if left is not None else 0
+            if line <= left_breaks:
+                node = left
+            elif line <= left_breaks + node.breaks:
+                breaks = self._breaks[node.buffer]
+                index = bisect_left(breaks, node.start) + line - left_breaks - 1
+                return base + left_length + breaks[index] - node.start + 1
+            else:
+                line -= left_breaks + node.breaks
+                base += left_length + node.length
+                node = node.right
+
+    def line_of(self, offset: int) -> int:
+        """
+        Return the number of the line containing an offset.
+
+        Args:
+            offset: An offset from 0 to len(self).
+
+        Returns:
+            The line number.
+
+        Raises:
+            IndexError: If offset is out of range.
+
+        Time complexity: O(log p + log b)
+        Space complexity: O(1)
+        """
+        if not 0 <= offset <= len(self):
+            raise IndexError("Offset out of range")
+        line = 0
+        node = self._root
+        while node is not None:
+            left = node.left
+            left_length = left.total_length if left is not None else 0
+            if offset < left_length:
+                node = left
+                continue
+            line += left.total_breaks if left is not None else 0
+            offset -= left_length
+            if offset < node.length:
+                return line + self._count_breaks(node.buffer, node.start, node.start + offset)
+            line += node.breaks
+            offset -= node.length
+            node = node.right
+        return line
+
+    def get_line(self, line: int) -> str:
+        """
+        Return the text of a line, without its line break.
+
+        Args:
+            line: The line number.
+
+        Returns:
+            The text of the line.
+
+        Raises:
+            IndexError: If the line does not exist.
+
+        Time complexity: O(log p + log b + m), where m is the line length
+        Space complexity: O(m)
+        """
+        start = self.line_start(line)
+        if line + 1 < self.line_count:
+            end = self.line_start(line + 1) - 1
+        else:
+            end = len(self)
+        return self.get_text(start, end)
+
+    def __str__(self) -> str:
+        """
+        Return the whole document.
+
+        Time complexity: O(p + n)
+        Space complexity: O(n)
+        """
+        return self.get_text()
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the piece table.
+
+        Time complexity: O(p)
+        Space complexity: O(1)
+        """
+        return (f"{self.__class__.__name__}(length={len(self)}, lines={self.line_count}, "
+                f"pieces={self.piece_count})")
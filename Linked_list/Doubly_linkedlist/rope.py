@@ -0,0 +1,448 @@
+"""
+Rope Implementation
+
+This module provides a rope: a balanced binary tree of string pieces for
+building and slicing large texts. Concatenation, splitting, indexing and
+substrings take O(log n) time and share the existing leaves instead of
+copying them, so assembling a large text from many segments (for example the
+segments of a DoublyLinkedList) never recopies what has already been joined.
+
+Ropes are immutable: every operation returns a new rope that shares most of
+its structure with the old one.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+DEFAULT_LEAF_SIZE = 512
+
+
+class _Leaf:
+    """
+    A leaf of the rope: a view of text[start:end].
+
+    Slicing a leaf only creates a new view, so the text is never copied.
+
+    Attributes:
+        text (str): The string the leaf points into.
+        start (int): The offset of the first character in text.
+        end (int): The offset just past the last character in text.
+        length (int): The number of characters in the leaf.
+        height (int): Always 0.
+    """
+
+    __slots__ = ('text', 'start', 'end', 'length')
+
+    height = 0
+
+    def __init__(self, text: str, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Initialize a leaf.
+
+        Args:
+            text: The string the leaf points into.
+            start: The offset of the first character (default 0).
+            end: The offset just past the last character (default: the end).
+        """
+        self.text = text
+        self.start = start
+        self.end = len(text) if end is None else end
+        self.length = self.end - start
+
+    def value(self) -> str:
+        """Return the characters of the leaf, copying only if it is a partial view."""
+        if self.start == 0 and self.end == len(self.text):
+            return self.text
+        return self.text[self.start:self.end]
+
+
+class _Branch:
+    """
+    An internal node of the rope.
+
+    Attributes:
+        left (Union[_Leaf, _Branch]): The first part of the text.
+        right (Union[_Leaf, _Branch]): The second part of the text.
+        length (int): The number of characters in the subtree.
+        height (int): The height of the subtree (a leaf has height 0).
+    """
+
+    __slots__ = ('left', 'right', 'length', 'height')
+
+    def __init__(self, left: '_Node', right: '_Node') -> None:
+        """
+        Initialize a branch over two subtrees.
+
+        Args:
+            left: The first part of the text.
+            right: The second part of the text.
+        """
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.height = max(left.height, right.height) + 1
+
+
+_Node = Union[_Leaf, _Branch]
+
+_EMPTY = _Leaf("")
+
+
+def _balanced(left: _Node, right: _Node) -> _Branch:
+    """
+    Make a branch over two AVL-balanced subtrees whose heights differ by at most 2.
+
+    One or two rotations restore the AVL property (heights of siblings differ
+    by at most 1).
+    """
+    if left.height > right.height + 1:
+        if left.left.height >= left.right.height:
+            return _Branch(left.left, _Branch(left.right, right))
+        middle = left.right
+        return _Branch(_Branch(left.left, middle.left), _Branch(middle.right, right))
+    if right.height > left.height + 1:
+        if right.right.height >= right.left.height:
+            return _Branch(_Branch(left, right.left), right.right)
+        middle = right.left
+        return _Branch(_Branch(left, middle.left), _Branch(middle.right, right.right))
+    return _Branch(left, right)
+
+
+def _join(left: _Node, right: _Node, leaf_size: int) -> _Node:
+    """
+    Concatenate two trees, keeping the result AVL-balanced.
+
+    The shorter tree is attached along the edge of the taller one, so the
+    cost is proportional to the difference of their heights. Two leaves whose
+    combined length is at most leaf_size are merged into one.
+
+    Time complexity: O(|h(left) - h(right)| + 1)
+    """
+    if not left.length:
+        return right
+    if not right.length:
+        return left
+    if left.height > right.height + 1:
+        return _balanced(left.left, _join(left.right, right, leaf_size))
+    if right.height > left.height + 1:
+        return _balanced(_join(left, right.left, leaf_size), right.right)
+    if not left.height and not right.height and left.length + right.length <= leaf_size:
+        return _Leaf(left.value() + right.value())
+    return _Branch(left, right)
+
+
+def _split(node: _Node, index: int, leaf_size: int) -> Tuple[_Node, _Node]:
+    """
+    Split a tree into its first index characters and the rest.
+
+    Time complexity: O(log n)
+    """
+    if index <= 0:
+        return _EMPTY, node
+    if index >= node.length:
+        return node, _EMPTY
+    if not node.height:
+        middle = node.start + index
+        return _Leaf(node.text, node.start, middle), _Leaf(node.text, middle, node.end)
+    left_length = node.left.length
+    if index == left_length:
+        return node.left, node.right
+    if index < left_length:
+        first, second = _split(node.left, index, leaf_size)
+        return first, _join(second, node.right, leaf_size)
+    first, second = _split(node.right, index - left_length, leaf_size)
+    return _join(node.left, first, leaf_size), second
+
+
+class Rope:
+    """
+    An immutable balanced rope of text.
+
+    Leaves hold views of existing strings. Small pieces are packed into
+    leaves of up to leaf_size characters; larger pieces become leaves of
+    their own and are never copied. The tree is kept AVL-balanced, so its
+    height is O(log n).
+
+    The flattened string is built the first time it is needed (by str,
+    flatten, == or hashing) and cached on the rope.
+
+    Attributes:
+        _root (Union[_Leaf, _Branch]): The root of the tree.
+        _leaf_size (int): The maximum length of a merged leaf.
+        _flat (Optional[str]): The cached flattened text.
+    """
+
+    __slots__ = ('_root', '_leaf_size', '_flat')
+
+    def __init__(self, text: str = "", leaf_size: int = DEFAULT_LEAF_SIZE) -> None:
+        """
+        Initialize a rope holding text.
+
+        Args:
+            text: The initial text.
+            leaf_size: The maximum length of a leaf built by merging small
+                pieces. Larger values make the tree shallower but copy more
+                when small pieces are appended (default 512).
+
+        Raises:
+            ValueError: If leaf_size is less than 1.
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")
+        self._root: _Node = _Leaf(text) if text else _EMPTY
+        self._leaf_size = leaf_size
+        self._flat: Optional[str] = text
+
+    @classmethod
+    def _wrap(cls, root: _Node, leaf_size: int) -> 'Rope':
+        """Return a rope with the given tree."""
+        rope = cls.__new__(cls)
+        rope._root = root
+        rope._leaf_size = leaf_size
+        rope._flat = None
+        return rope
+
+    @classmethod
+    def from_iterable(cls, pieces: Iterable[str], leaf_size: int = DEFAULT_LEAF_SIZE) -> 'Rope':
+        """
+        Build a rope from a sequence of strings, such as a DoublyLinkedList of segments.
+
+        Runs of small pieces are packed into leaves of about leaf_size
+        characters, and the leaves are joined pairwise into a balanced tree.
+
+        Args:
+            pieces: The strings, in order.
+            leaf_size: The maximum length of a merged leaf.
+
+        Returns:
+            A rope holding the concatenation of the pieces.
+
+        Time complexity: O(k + s), where k is the number of pieces and s is
+            the total length of the small pieces that are packed
+        Space complexity: O(k)
+        """
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")
+        leaves: List[_Node] = []
+        pending: List[str] = []
+        pending_length = 0
+        for piece in pieces:
+            if len(piece) >= leaf_size:
+                if pending:
+                    leaves.append(_Leaf("".join(pending)))
+                    pending, pending_length = [], 0
+                leaves.append(_Leaf(piece))
+            elif piece:
+                if pending_length + len(piece) > leaf_size:
+                    leaves.append(_Leaf("".join(pending)))
+                    pending, pending_length = [], 0
+                pending.append(piece)
+                pending_length += len(piece)
+        if pending:
+            leaves.append(_Leaf("".join(pending)))
+
+        while len(leaves) > 1:
+            paired = [_join(leaves[i], leaves[i + 1], leaf_size) for i in range(0, len(leaves) - 1, 2)]
+            if len(leaves) % 2:
+                paired.append(leaves[-1])
+            leaves = paired
+        return cls._wrap(leaves[0] if leaves else _EMPTY, leaf_size)
+
+    @property
+    def depth(self) -> int:
+        """The height of the tree."""
+        return self._root.height
+
+    def __len__(self) -> int:
+        """
+        Return the number of characters in the rope.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self._root.length
+
+    def concat(self, other: Union['Rope', str]) -> 'Rope':
+        """
+        Return a rope holding this text followed by other.
+
+        Args:
+            other: A rope or a string.
+
+        Returns:
+            The concatenated rope.
+
+        Time complexity: O(log n)
+        Space complexity: O(log n)
+        """
+        if isinstance(other, str):
+            other = _Leaf(other) if other else _EMPTY
+        else:
+            other = other._root
+        return Rope._wrap(_join(self._root, other, self._leaf_size), self._leaf_size)
+
+    def __add__(self, other: Union['Rope', str]) -> 'Rope':
+        """Return self.concat(other)."""
+        if not isinstance(other, (Rope, str)):
+            return NotImplemented
+        return self.concat(other)
+
+    def __radd__(self, other: str) -> 'Rope':
+        """Return a rope holding the string other followed by this text."""
+        if not isinstance(other, str):
+            return NotImplemented
+        return Rope(other, self._leaf_size).concat(self)
+
+    def split(self, index: int) -> Tuple['Rope', 'Rope']:
+        """
+        Split the rope at an index.
+
+        Args:
+            index: The number of characters in the first part. Values out of
+                range are clamped.
+
+        Returns:
+            A tuple of ropes holding text[:index] and text[index:].
+
+        Time complexity: O(log n)
+        Space complexity: O(log n)
+        """
+        first, second = _split(self._root, index, self._leaf_size)
+        return Rope._wrap(first, self._leaf_size), Rope._wrap(second, self._leaf_size)
+
+    def substring(self, start: int, end: Optional[int] = None) -> 'Rope':
+        """
+        Return the characters between two indices as a rope.
+
+        Args:
+            start: The index of the first character.
+            end: The index just past the last character (default: the end).
+
+        Returns:
+            A rope holding text[start:end].
+
+        Time complexity: O(log n)
+        Space complexity: O(log n)
+        """
+        start, end, _ = slice(start, end).indices(len(self))
+        if start >= end:
+            return Rope._wrap(_EMPTY, self._leaf_size)
+        tail = _split(self._root, start, self._leaf_size)[1]
+        return Rope._wrap(_split(tail, end - start, self._leaf_size)[0], self._leaf_size)
+
+    def insert(self, index: int, text: Union['Rope', str]) -> 'Rope':
+        """
+        Return a rope with text inserted at an index.
+
+        Time complexity: O(log n)
+        """
+        first, second = self.split(index)
+        return first.concat(text).concat(second)
+
+    def delete(self, start: int, end: int) -> 'Rope':
+        """
+        Return a rope without the characters between two indices.
+
+        Time complexity: O(log n)
+        """
+        return self.substring(0, start).concat(self.substring(end))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'Rope']:
+        """
+        Return a character, or a rope for a slice.
+
+        Args:
+            index: An integer index (negative values count from the end) or a
+                slice with a step of 1.
+
+        Returns:
+            The character at index, or a rope holding the slice.
+
+        Raises:
+            IndexError: If the integer index is out of range.
+            ValueError: If the slice has a step other than 1.
+
+        Time complexity: O(log n)
+        Space complexity: O(log n)
+        """
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Rope slices do not support a step")
+            return self.substring(*slice(index.start, index.stop).indices(len(self))[:2])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Rope index out of range")
+        node = self._root
+        while node.height:
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+        return node.text[node.start + index]
+
+    def chunks(self) -> Iterator[str]:
+        """
+        Iterate over the leaves of the rope as strings, in order.
+
+        Time complexity: O(1) amortized per leaf
+        Space complexity: O(log n)
+        """
+        stack: List[_Node] = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.height:
+                stack.append(node.right)
+                stack.append(node.left)
+            elif node.length:
+                yield node.value()
+
+    def flatten(self) -> str:
+        """
+        Return the whole text as a string.
+
+        The string is built once and cached, so later calls are O(1).
+
+        Time complexity: O(n) the first time, O(1) afterwards
+        Space complexity: O(n)
+        """
+        if self._flat is None:
+            self._flat = "".join(self.chunks())
+        return self._flat
+
+    def __str__(self) -> str:
+        """Return the whole text as a string."""
+        return self.flatten()
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the characters of the rope.
+
+        Time complexity: O(n)
+        Space complexity: O(log n)
+        """
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another rope or a string by content."""
+        if isinstance(other, Rope):
+            return len(self) == len(other) and self.flatten() == other.flatten()
+        if isinstance(other, str):
+            return len(self) == len(other) and self.flatten() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return the hash of the flattened text."""
+        return hash(self.flatten())
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the rope.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return f"{self.__class__.__name__}(length={len(self)}, depth={self.depth})"
@@ -0,0 +1,581 @@
+"""
+Shared-Memory Doubly Linked List Implementation
+
+This module provides SharedLinkedList, a doubly linked list of numbers stored
+in a multiprocessing.shared_memory block instead of in Python node objects.
+Other processes attach to the block by name and read the list in place, so a
+read-mostly list is held once in memory rather than copied into every worker.
+"""
+
+import sys
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Optional, Iterable, Union
+
+
+Number = Union[int, float]
+
+_MAGIC = 0x53484C4C  # Marks a block laid out by this module ("SHLL")
+_NIL = -1  # The link of a missing node
+
+# Header slots, each a signed 64-bit integer at the start of the block
+_MAGIC_SLOT, _SEQUENCE, _CAPACITY, _SIZE, _HEAD, _TAIL, _FREE, _TYPECODE, _LINK_TYPECODE = range(9)
+_HEADER_SLOTS = 9
+
+_VALUE_TYPECODES = 'bBhHiIlLqQfd'
+_LINK_TYPECODES = 'iq'  # int32 or int64 links
+_BATCH = 256  # Values an iterator reads between checks of the sequence number
+
+
+def _open_untracked(name: str) -> SharedMemory:
+    """
+    Open an existing block without registering it with the resource tracker.
+
+    Only the creator owns the block. A registered block would be unlinked by
+    the resource tracker of an attaching process when that process exits.
+    Before Python 3.13, SharedMemory always registers, so registration is
+    switched off while the block is opened.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to a multiple of 8 bytes."""
+    return (offset + 7) & ~7
+
+
+class SharedLinkedList:
+    """
+    A doubly linked list of numbers in a shared memory block.
+
+    The block holds a header followed by a fixed number (the capacity) of
+    fixed-width records. Record i is a value of one array typecode (for
+    example 'd' for doubles or 'q' for 64-bit integers) and int32 or int64
+    prev and next links, which are record numbers rather than pointers, so
+    the list means the same thing in every process that maps the block. The
+    values, prev links and next links are stored as three columns and read
+    through memoryview casts, without copying or unpickling anything.
+    Unused records form a free list through their next links.
+
+    One process writes and any number read (single writer, multiple
+    readers). The header holds a sequence number that the writer makes odd
+    before it changes any record and even again afterwards. A reader that
+    finds the number odd, or changed at the end of its read, knows that it
+    may have seen a half-made change: to_list() then reads again, and an
+    iterator raises RuntimeError. Readers never block the writer.
+
+    The process that creates the list with create() is its writer and
+    should unlink() the block when the list is no longer needed; other
+    processes call attach(name) and close() when done.
+    """
+
+    def __init__(self, shm: SharedMemory, writer: bool) -> None:
+        """
+        Map the columns of an initialized block. Use create() or attach().
+
+        Args:
+            shm: The shared memory block.
+            writer: Whether this process may change the list.
+        """
+        self._shm = shm
+        self._writer = writer
+        buffer = shm.buf
+        self._header = buffer[:_HEADER_SLOTS * 8].cast('q')
+        header = self._header
+        if header[_MAGIC_SLOT] != _MAGIC:
+            header.release()
+            raise ValueError(f"Shared memory block {shm.name!r} does not hold a SharedLinkedList")
+        capacity = header[_CAPACITY]
+        typecode = chr(header[_TYPECODE])
+        link_typecode = chr(header[_LINK_TYPECODE])
+        value_size = array(typecode).itemsize
+        link_size = array(link_typecode).itemsize
+        start = _align(_HEADER_SLOTS * 8)
+        end = start + capacity * value_size
+        self._values = buffer[start:end].cast(typecode)
+        start = _align(end)
+        end = start + capacity * link_size
+        self._prev = buffer[start:end].cast(link_typecode)
+        start = _align(end)
+        end = start + capacity * link_size
+        self._next = buffer[start:end].cast(link_typecode)
+
+    @staticmethod
+    def block_size(capacity: int, typecode: str = 'q', link_typecode: str = 'i') -> int:
+        """
+        Return the number of bytes of shared memory a list needs.
+
+        Args:
+            capacity: The maximum number of values.
+            typecode: The array typecode of the values.
+            link_typecode: 'i' for int32 links or 'q' for int64 links.
+
+        Returns:
+            The size in bytes of the header and the three columns.
+        """
+        value_size = array(typecode).itemsize
+        link_size = array(link_typecode).itemsize
+        size = _align(_HEADER_SLOTS * 8)
+        size = _align(size + capacity * value_size)
+        size = _align(size + capacity * link_size)
+        return size + capacity * link_size
+
+    @classmethod
+    def create(cls, capacity: int, typecode: str = 'q', link_typecode: str = 'i',
+               name: Optional[str] = None) -> 'SharedLinkedList':
+        """
+        Create an empty list in a new shared memory block, with this process as its writer.
+
+        Args:
+            capacity: The maximum number of values.
+            typecode: The array typecode of the values (default 'q', a signed
+                64-bit integer).
+            link_typecode: 'i' for int32 links (up to 2**31 - 1 records,
+                4 bytes per link) or 'q' for int64 links.
+            name: The name of the block, or None for a random name.
+
+        Returns:
+            The new list.
+
+        Raises:
+            ValueError: If the capacity or a typecode is invalid.
+            FileExistsError: If a block with the name already exists.
+        """
+        if typecode not in _VALUE_TYPECODES:
+            raise ValueError(f"Unsupported value typecode {typecode!r}")
+        if link_typecode not in _LINK_TYPECODES:
+            raise ValueError("link_typecode must be 'i' (int32) or 'q' (int64)")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if capacity >= 1 << (8 * array(link_typecode).itemsize - 1):
+            raise ValueError(f"Capacity {capacity} does not fit in {link_typecode!r} links")
+        shm = SharedMemory(name=name, create=True, size=cls.block_size(capacity, typecode, link_typecode))
+        header = shm.buf[:_HEADER_SLOTS * 8].cast('q')
+        header[_SEQUENCE] = 0
+        header[_CAPACITY] = capacity
+        header[_SIZE] = 0
+        header[_HEAD] = _NIL
+        header[_TAIL] = _NIL
+        header[_FREE] = 0
+        header[_TYPECODE] = ord(typecode)
+        header[_LINK_TYPECODE] = ord(link_typecode)
+        header[_MAGIC_SLOT] = _MAGIC  # Written last, once the header is complete
+        header.release()
+        shared = cls(shm, writer=True)
+        # Chain every record into the free list
+        shared._next[:capacity - 1] = array(link_typecode, range(1, capacity))
+        shared._next[capacity - 1] = _NIL
+        return shared
+
+    @classmethod
+    def from_values(cls, values: Iterable[Number], typecode: str = 'q', link_typecode: str = 'i',
+                    name: Optional[str] = None, capacity: Optional[int] = None) -> 'SharedLinkedList':
+        """
+        Create a list holding the given values, for example those of a DoublyLinkedList.
+
+        Args:
+            values: The values in list order.
+            typecode: The array typecode of the values.
+            link_typecode: 'i' for int32 links or 'q' for int64 links.
+            name: The name of the block, or None for a random name.
+            capacity: The maximum number of values, by default the number given.
+
+        Returns:
+            The new list, with this process as its writer.
+        """
+        values = list(values)
+        shared = cls.create(capacity or max(1, len(values)), typecode, link_typecode, name)
+        shared.extend(values)
+        return shared
+
+    @classmethod
+    def attach(cls, name: str, writer: bool = False) -> 'SharedLinkedList':
+        """
+        Attach to a list created by another process.
+
+        Args:
+            name: The name of the block (the creator's .name).
+            writer: Whether this process takes over writing. Only one
+                process may write at a time.
+
+        Returns:
+            The list, read in place from the shared block.
+
+        Raises:
+            FileNotFoundError: If no block has the name.
+            ValueError: If the block does not hold a SharedLinkedList.
+        """
+        return cls(_open_untracked(name), writer)
+
+    @property
+    def name(self) -> str:
+        """The name other processes pass to attach()."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of values."""
+        return self._header[_CAPACITY]
+
+    @property
+    def typecode(self) -> str:
+        """The array typecode of the values."""
+        return self._values.format
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the shared block in bytes."""
+        return self._shm.size
+
+    # Writer operations
+
+    def _begin_write(self) -> None:
+        """Make the sequence number odd before changing records."""
+        if not self._writer:
+            raise PermissionError("This SharedLinkedList was attached read-only")
+        self._header[_SEQUENCE] += 1
+
+    def _end_write(self) -> None:
+        """Make the sequence number even again once the change is complete."""
+        self._header[_SEQUENCE] += 1
+
+    def _allocate(self, value: Number) -> int:
+        """Take a record from the free list and store a value in it."""
+        header = self._header
+        record = header[_FREE]
+        if record == _NIL:
+            raise OverflowError(f"SharedLinkedList is full (capacity {header[_CAPACITY]})")
+        # Store first: a value the column rejects leaves the record on the free list
+        self._values[record] = value
+        header[_FREE] = self._next[record]
+        return record
+
+    def _release(self, record: int) -> None:
+        """Return a record to the free list."""
+        self._next[record] = self._header[_FREE]
+        self._header[_FREE] = record
+
+    def append(self, value: Number) -> None:
+        """
+        Add a value at the end of the list.
+
+        Args:
+            value: The value to add.
+
+        Raises:
+            OverflowError: If the list is full.
+            PermissionError: If this process is not the writer.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._begin_write()
+        try:
+            header = self._header
+            record = self._allocate(value)
+            tail = header[_TAIL]
+            self._prev[record] = tail
+            self._next[record] = _NIL
+            if tail == _NIL:
+                header[_HEAD] = record
+            else:
+                self._next[tail] = record
+            header[_TAIL] = record
+            header[_SIZE] += 1
+        finally:
+            self._end_write()
+
+    def prepend(self, value: Number) -> None:
+        """
+        Add a value at the beginning of the list.
+
+        Args:
+            value: The value to add.
+
+        Raises:
+            OverflowError: If the list is full.
+            PermissionError: If this process is not the writer.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._begin_write()
+        try:
+            header = self._header
+            record = self._allocate(value)
+            head = header[_HEAD]
+            self._prev[record] = _NIL
+            self._next[record] = head
+            if head == _NIL:
+                header[_TAIL] = record
+            else:
+                self._prev[head] = record
+            header[_HEAD] = record
+            header[_SIZE] += 1
+        finally:
+            self._end_write()
+
+    def extend(self, values: Iterable[Number]) -> None:
+        """
+        Add values at the end of the list as one change.
+
+        Args:
+            values: The values to add, in order.
+
+        Raises:
+            OverflowError: If the values do not fit; none of them are added.
+            PermissionError: If this process is not the writer.
+            TypeError: If a value has the wrong type for the typecode (or
+                OverflowError if it is out of range); none of them are added.
+
+        Time Complexity: O(k) where k is the number of values
+        Space Complexity: O(k)
+        """
+        # Convert the whole batch before any record is taken, so a bad value changes nothing
+        values = array(self.typecode, values)
+        if len(values) > self.capacity - len(self):
+            raise OverflowError(f"SharedLinkedList has room for {self.capacity - len(self)} more values")
+        self._begin_write()
+        try:
+            header = self._header
+            prev_links, next_links, stored = self._prev, self._next, self._values
+            tail = header[_TAIL]
+            free = header[_FREE]
+            for value in values:
+                record = free
+                free = next_links[record]
+                stored[record] = value
+                prev_links[record] = tail
+                if tail == _NIL:
+                    header[_HEAD] = record
+                else:
+                    next_links[tail] = record
+                tail = record
+            if values:
+                next_links[tail] = _NIL
+                header[_TAIL] = tail
+            header[_FREE] = free
+            header[_SIZE] += len(values)
+        finally:
+            self._end_write()
+
+    def _unlink(self, record: int) -> Number:
+        """Unlink a record from the list, free it and return its value."""
+        header = self._header
+        prev, following = self._prev[record], self._next[record]
+        if prev == _NIL:
+            header[_HEAD] = following
+        else:
+            self._next[prev] = following
+        if following == _NIL:
+            header[_TAIL] = prev
+        else:
+            self._prev[following] = prev
+        header[_SIZE] -= 1
+        value = self._values[record]
+        self._release(record)
+        return value
+
+    def remove_first(self) -> Number:
+        """
+        Remove and return the first value.
+
+        Raises:
+            IndexError: If the list is empty.
+            PermissionError: If this process is not the writer.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._begin_write()
+        try:
+            head = self._header[_HEAD]
+            if head == _NIL:
+                raise IndexError("Cannot remove from an empty list")
+            return self._unlink(head)
+        finally:
+            self._end_write()
+
+    def remove_last(self) -> Number:
+        """
+        Remove and return the last value.
+
+        Raises:
+            IndexError: If the list is empty.
+            PermissionError: If this process is not the writer.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        self._begin_write()
+        try:
+            tail = self._header[_TAIL]
+            if tail == _NIL:
+                raise IndexError("Cannot remove from an empty list")
+            return self._unlink(tail)
+        finally:
+            self._end_write()
+
+    def clear(self) -> None:
+        """
+        Remove all values.
+
+        Raises:
+            PermissionError: If this process is not the writer.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+        self._begin_write()
+        try:
+            header = self._header
+            record = header[_HEAD]
+            while record != _NIL:
+                following = self._next[record]
+                self._release(record)
+                record = following
+            header[_HEAD] = header[_TAIL] = _NIL
+            header[_SIZE] = 0
+        finally:
+            self._end_write()
+
+    # Reader operations
+
+    def _stable_sequence(self) -> int:
+        """Wait until no write is in progress and return the sequence number."""
+        header = self._header
+        sequence = header[_SEQUENCE]
+        while sequence & 1:
+            sequence = header[_SEQUENCE]
+        return sequence
+
+    def to_list(self) -> List[Number]:
+        """
+        Return a consistent copy of the values in order.
+
+        The values are copied in one pass; if the writer changed the list
+        meanwhile, the copy is discarded and taken again.
+
+        Returns:
+            A list of the values.
+
+        Time Complexity: O(n) per attempt
+        Space Complexity: O(n)
+        """
+        header, links, stored = self._header, self._next, self._values
+        while True:
+            sequence = self._stable_sequence()
+            size = header[_SIZE]
+            result = [0] * size
+            record = header[_HEAD]
+            for i in range(size):
+                if record == _NIL:
+                    break  # A concurrent removal; the sequence check below retries
+                result[i] = stored[record]
+                record = links[record]
+            if header[_SEQUENCE] == sequence:
+                return result
+
+    def __iter__(self) -> Iterator[Number]:
+        """
+        Iterate over the values in order, reading them in place.
+
+        Values are read in batches of 256, and each batch is yielded only
+        after checking that the writer did not change the list while it was
+        read.
+
+        Raises:
+            RuntimeError: If the writer changes the list during the iteration.
+
+        Time Complexity: O(n) for a full iteration
+        Space Complexity: O(1)
+        """
+        header, links, stored = self._header, self._next, self._values
+        sequence = self._stable_sequence()
+        record = header[_HEAD]
+        while record != _NIL:
+            # Read a batch, then check that the writer did not change it meanwhile
+            batch = []
+            for _ in range(_BATCH):
+                batch.append(stored[record])
+                record = links[record]
+                if record == _NIL:
+                    break
+            if header[_SEQUENCE] != sequence:
+                raise RuntimeError("SharedLinkedList changed during iteration")
+            yield from batch
+
+    def __reversed__(self) -> Iterator[Number]:
+        """
+        Iterate over the values from the last to the first, reading them in place.
+
+        Raises:
+            RuntimeError: If the writer changes the list during the iteration.
+
+        Time Complexity: O(n) for a full iteration
+        Space Complexity: O(1)
+        """
+        header, links, stored = self._header, self._prev, self._values
+        sequence = self._stable_sequence()
+        record = header[_TAIL]
+        while record != _NIL:
+            # Read a batch, then check that the writer did not change it meanwhile
+            batch = []
+            for _ in range(_BATCH):
+                batch.append(stored[record])
+                record = links[record]
+                if record == _NIL:
+                    break
+            if header[_SEQUENCE] != sequence:
+                raise RuntimeError("SharedLinkedList changed during iteration")
+            yield from batch
+
+    def __len__(self) -> int:
+        """
+        Return the number of values.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        return self._header[_SIZE]
+
+    # Lifetime
+
+    def close(self) -> None:
+        """
+        Unmap the block from this process. The list stays available to others.
+        """
+        for view in (self._values, self._prev, self._next, self._header):
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the block once every process has closed it. Only the creator may call this.
+        """
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedLinkedList':
+        """Return the list, for use in a with statement that closes it."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the list."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the list.
+
+        Returns:
+            A string showing the block name, the values and the capacity.
+        """
+        return f"SharedLinkedList({self.name!r}, {self.to_list()}, capacity={self.capacity})"
@@ -5,11 +5,18 @@ This module provides comprehensive tests for all functionality of the
 DoublyLinkedList class, including edge cases and error conditions.
 """
 
+import copy
+import pickle
 import unittest
 import time
 from typing import Any, List, Optional
 from Dlinkedlist import DoublyLinkedList, Node
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestNode(unittest.TestCase):
     """Test cases for the Node class."""
@@ -475,6 +482,62 @@ class TestDoublyLinkedList(unittest.TestCase):
         empty_iter = iter(self.empty_list)
         self.assertEqual(list(empty_iter), [])
     
+    def test_iter_chunks(self) -> None:
+        """Test iteration through the list in chunks."""
+        self.assertEqual(list(self.populated_list.iter_chunks(2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(self.populated_list.iter_chunks(8)), [[1, 2, 3, 4, 5]])
+        self.assertEqual(list(self.empty_list.iter_chunks(1)), [])
+        
+        with self.assertRaises(ValueError):
+            self.populated_list.iter_chunks(-2)
+        
+        # Values appended while the iterator is suspended are visited
+        chunks = self.populated_list.iter_chunks(3)
+        self.assertEqual(next(chunks), [1, 2, 3])
+        self.populated_list.append(6)
+        self.assertEqual(next(chunks), [4, 5, 6])
+        
+        # Removing while the iterator is suspended is detected
+        chunks = self.populated_list.iter_chunks(3)
+        next(chunks)
+        self.populated_list.remove_last()
+        with self.assertRaises(RuntimeError):
+            next(chunks)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_round_trip(self) -> None:
+        """Test converting to and from NumPy arrays."""
+        exported = self.populated_list.to_numpy(dtype=np.int32)
+        self.assertEqual(exported.dtype, np.int32)
+        self.assertEqual(exported.tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(self.empty_list.to_numpy(dtype=float).shape, (0,))
+        
+        imported = DoublyLinkedList.from_numpy(np.array([[1, 2], [3, 4]]))
+        self.assertEqual(list(imported), [[1, 2], [3, 4]])
+        self.assertEqual(imported.tail.data, [3, 4])
+        self.assertEqual(imported.tail.prev.data, [1, 2])
+        self.assertEqual(len(DoublyLinkedList.from_numpy(np.array([]))), 0)
+    
+    def test_pickle(self) -> None:
+        """Test pickling and copying, including lists far longer than the recursion limit."""
+        long_list = DoublyLinkedList[int]()
+        for i in range(100_000):
+            long_list.append(i)
+        
+        restored = pickle.loads(pickle.dumps(long_list))
+        self.assertEqual(len(restored), 100_000)
+        self.assertEqual(list(restored), list(range(100_000)))
+        self.assertEqual(restored.tail.prev.data, 99_998)
+        restored.remove_last()
+        self.assertEqual(restored.tail.data, 99_998)
+        
+        copied = copy.deepcopy(self.populated_list)
+        self.assertEqual(list(copied), [1, 2, 3, 4, 5])
+        self.assertIsNot(copied.head, self.populated_list.head)
+        empty = pickle.loads(pickle.dumps(self.empty_list))
+        self.assertIsNone(empty.head)
+        self.assertIsNone(empty.tail)
+    
     def test_contains(self) -> None:
         """Test membership checking."""
         # Check existing values
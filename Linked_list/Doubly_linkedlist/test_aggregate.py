@@ -0,0 +1,144 @@
+"""
+Unit tests for the AggregateDoublyLinkedList implementation.
+"""
+
+import pickle
+import random
+import unittest
+from aggregate import AggregateDoublyLinkedList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestAggregateDoublyLinkedList(unittest.TestCase):
+    """Test cases for the AggregateDoublyLinkedList class."""
+
+    def setUp(self) -> None:
+        """Set up a fresh AggregateDoublyLinkedList for each test."""
+        self.dll = AggregateDoublyLinkedList[int]()
+
+    def assertAggregates(self, dll: AggregateDoublyLinkedList) -> None:
+        """Check every aggregate against a full scan of the list."""
+        values = list(dll)
+        self.assertEqual(dll.get_count(), len(values))
+        self.assertEqual(dll.get_sum(), sum(values))
+        if values:
+            self.assertEqual(dll.get_min(), min(values))
+            self.assertEqual(dll.get_max(), max(values))
+
+    def test_empty(self) -> None:
+        """Test aggregates of an empty list."""
+        self.assertEqual(self.dll.get_count(), 0)
+        self.assertEqual(self.dll.get_sum(), 0)
+        with self.assertRaises(ValueError):
+            self.dll.get_min()
+        with self.assertRaises(ValueError):
+            self.dll.get_max()
+        with self.assertRaises(ValueError):
+            self.dll.get_mean()
+
+    def test_sliding_window(self) -> None:
+        """Test aggregates for a window fed at the tail and drained at the head."""
+        window = 5
+        for value in [5, 3, 8, 1, 9, 2, 7, 7, 4, 6, 0, 10]:
+            self.dll.append(value)
+            if len(self.dll) > window:
+                self.dll.remove_first()
+            self.assertAggregates(self.dll)
+            self.assertFalse(self.dll._stale)
+        self.assertAlmostEqual(self.dll.get_mean(), sum(self.dll) / window)
+
+    def test_prepend(self) -> None:
+        """Test aggregates when values are prepended."""
+        for value in [4, 2, 2, 9, 1]:
+            self.dll.prepend(value)
+            self.assertAggregates(self.dll)
+        self.dll.remove_first()
+        self.assertAggregates(self.dll)
+
+    def test_remove_tail_and_middle(self) -> None:
+        """Test that removals away from the head still give correct results."""
+        for value in [1, 5, 3]:
+            self.dll.append(value)
+        self.dll.remove_last()
+        self.assertAggregates(self.dll)
+        self.dll.remove_first()
+        self.assertAggregates(self.dll)
+
+        for value in [8, 2, 6]:
+            self.dll.append(value)
+        self.dll.remove(self.dll.get_at(2))
+        self.assertAggregates(self.dll)
+
+    def test_insert_setitem_reverse(self) -> None:
+        """Test insertions, index assignment and reversal."""
+        for value in [3, 1, 4]:
+            self.dll.append(value)
+        self.dll.insert_after(self.dll.head, 10)
+        self.assertAggregates(self.dll)
+        self.dll.insert_before(self.dll.head, -2)
+        self.assertAggregates(self.dll)
+        self.dll.insert_at(2, 0)
+        self.assertAggregates(self.dll)
+        self.dll[1] = 20
+        self.assertAggregates(self.dll)
+        self.dll[-1] = -5
+        self.assertAggregates(self.dll)
+        self.dll.reverse()
+        self.assertAggregates(self.dll)
+
+    def test_clear(self) -> None:
+        """Test that clear resets the aggregates."""
+        for value in range(10):
+            self.dll.append(value)
+        self.dll.clear()
+        self.assertAggregates(self.dll)
+        self.dll.append(7)
+        self.assertAggregates(self.dll)
+
+    def test_random_operations(self) -> None:
+        """Test aggregates against full scans over a random operation mix."""
+        rng = random.Random(26)
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.45 or len(self.dll) == 0:
+                self.dll.append(rng.randint(-50, 50))
+            elif op < 0.55:
+                self.dll.prepend(rng.randint(-50, 50))
+            elif op < 0.85:
+                self.dll.remove_first()
+            elif op < 0.9:
+                self.dll.remove_last()
+            else:
+                self.dll.remove_at(rng.randrange(len(self.dll)))
+            self.assertAggregates(self.dll)
+
+    def test_pickle(self) -> None:
+        """Test that a pickled list keeps its aggregates."""
+        for value in [5, 3, 8, 1, 9]:
+            self.dll.append(value)
+        self.dll.remove_first()
+        restored = pickle.loads(pickle.dumps(self.dll))
+        self.assertAggregates(restored)
+        restored.remove_last()
+        self.assertAggregates(restored)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_from_numpy(self) -> None:
+        """Test that a list built from an array has correct aggregates."""
+        dll = AggregateDoublyLinkedList.from_numpy(np.array([4, -2, 7]))
+        self.assertAggregates(dll)
+        dll.remove_first()
+        self.assertAggregates(dll)
+
+    def test_repr(self) -> None:
+        """Test detailed string representation."""
+        self.dll.append(1)
+        self.assertEqual(repr(self.dll), "AggregateDoublyLinkedList([1])")
+
+
+if __name__ == "__main__":
+    unittest.main()
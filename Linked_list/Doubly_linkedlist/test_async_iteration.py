@@ -0,0 +1,120 @@
+"""
+Unit tests for async iteration over a DoublyLinkedList.
+"""
+
+import asyncio
+import time
+import unittest
+from Dlinkedlist import DoublyLinkedList
+
+
+async def max_stall(iteration):
+    """
+    Run an iteration next to a heartbeat and return the longest gap between beats in seconds.
+    """
+    done = False
+    gaps = []
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await iteration
+    finally:
+        done = True
+        await beat
+    return max(gaps)
+
+
+class TestAsyncIteration(unittest.IsolatedAsyncioTestCase):
+    """Test cases for DoublyLinkedList.aiter and __aiter__."""
+
+    def setUp(self) -> None:
+        """Set up a list of 200,000 values."""
+        self.list = DoublyLinkedList[int]()
+        for i in range(200_000):
+            self.list.append(i)
+
+    async def collect(self, iterator, work=0.0):
+        """Collect the values of an async iterator, spinning for work seconds per value."""
+        values = []
+        async for value in iterator:
+            if work:
+                end = time.perf_counter() + work
+                while time.perf_counter() < end:
+                    pass
+            values.append(value)
+        return values
+
+    async def test_values(self) -> None:
+        """Test that async iteration visits every value in order."""
+        self.assertEqual(await self.collect(self.list), list(range(200_000)))
+        self.assertEqual(await self.collect(DoublyLinkedList[int]().aiter()), [])
+        with self.assertRaises(ValueError):
+            self.list.aiter(yield_every=0)
+
+    async def test_worst_case_stall_by_count(self) -> None:
+        """Test that the event loop is never blocked for more than about yield_every values."""
+        large = DoublyLinkedList[int]()
+        for i in range(1_000_000):
+            large.append(i)
+
+        async def walk():
+            return list(large)
+
+        blocking = await max_stall(walk())
+        stall = await max_stall(self.collect(large.aiter(yield_every=1000)))
+        # One suspension per 1000 of 1,000,000 values, so the stall is a small fraction of a
+        # full walk (with room for timer noise)
+        self.assertLess(stall, blocking / 5, (stall, blocking))
+
+    async def test_worst_case_stall_by_time(self) -> None:
+        """Test that yield_after_us bounds the stall when each value takes time to consume."""
+        values = self.list.aiter(yield_every=1 << 30, yield_after_us=2_000)
+        stall = await max_stall(self.collect(self._first(values, 2_000), work=20e-6))
+        # 2 ms budget plus up to 32 values of 20 us between clock reads
+        self.assertLess(stall, 0.02)
+
+    async def _first(self, iterator, count):
+        """Yield the first count values of an async iterator."""
+        async for value in iterator:
+            yield value
+            count -= 1
+            if count == 0:
+                return
+
+    async def test_insertions_are_safe(self) -> None:
+        """Test that values appended during iteration are visited."""
+        small = DoublyLinkedList[int]()
+        for i in range(3):
+            small.append(i)
+        seen = []
+        async for value in small.aiter(yield_every=1):
+            seen.append(value)
+            if value == 0:
+                small.append(3)
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+    async def test_removal_raises(self) -> None:
+        """Test that removing nodes while an iterator is suspended makes it raise."""
+        iterator = self.list.aiter(yield_every=10)
+        self.assertEqual(await iterator.__anext__(), 0)
+        self.list.remove_first()
+        with self.assertRaises(RuntimeError):
+            await iterator.__anext__()
+        iterator = self.list.aiter()
+        await iterator.__anext__()
+        self.list.reverse()
+        with self.assertRaises(RuntimeError):
+            await iterator.__anext__()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for the asyncio LinkedQueue and LinkedDeque.
+"""
+
+import asyncio
+import unittest
+from async_queue import LinkedQueue, LinkedDeque
+
+
+class TestLinkedQueue(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the LinkedQueue class."""
+
+    async def test_fifo_order(self):
+        """Test that items come out in the order they were put."""
+        queue = LinkedQueue()
+        for i in range(5):
+            await queue.put(i)
+        self.assertEqual(queue.qsize(), 5)
+        self.assertFalse(queue.full())
+        self.assertEqual([await queue.get() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(queue.empty())
+        with self.assertRaises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    async def test_get_waits_for_put(self):
+        """Test that a waiting consumer is woken by a producer."""
+        queue = LinkedQueue()
+        consumer = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+        queue.put_nowait("item")
+        self.assertEqual(await consumer, "item")
+
+    async def test_backpressure(self):
+        """Test that producers wait while the queue is full."""
+        queue = LinkedQueue(maxsize=2)
+        await queue.put(1)
+        await queue.put(2)
+        self.assertTrue(queue.full())
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_nowait(3)
+        producer = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await queue.get(), 1)
+        await producer
+        self.assertEqual(await queue.get_batch(10), [2, 3])
+
+    async def test_get_batch(self):
+        """Test that a batch drains the available items up to the limit."""
+        queue = LinkedQueue()
+        for i in range(7):
+            queue.put_nowait(i)
+        self.assertEqual(await queue.get_batch(3), [0, 1, 2])
+        self.assertEqual(await queue.get_batch(10), [3, 4, 5, 6])
+        self.assertEqual(await queue.get_batch(10, timeout=0.01), [])
+        with self.assertRaises(ValueError):
+            await queue.get_batch(0)
+
+    async def test_get_batch_wakes_producers(self):
+        """Test that a batch frees a slot for each item it takes."""
+        queue = LinkedQueue(maxsize=3)
+        producers = [asyncio.create_task(queue.put(i)) for i in range(6)]
+        await asyncio.sleep(0)
+        self.assertEqual(await queue.get_batch(3), [0, 1, 2])
+        await asyncio.gather(*producers)
+        self.assertEqual(await queue.get_batch(3), [3, 4, 5])
+
+    async def test_get_batch_waits_then_drains(self):
+        """Test that a waiting batch returns everything put before it runs."""
+        queue = LinkedQueue()
+        batch = asyncio.create_task(queue.get_batch(100, timeout=1))
+        await asyncio.sleep(0)
+        for i in range(50):
+            queue.put_nowait(i)
+        self.assertEqual(await batch, list(range(50)))
+
+    async def test_cancelled_getter_passes_wakeup(self):
+        """Test that cancelling a woken consumer does not lose the wakeup."""
+        queue = LinkedQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait("item")
+        first.cancel()
+        self.assertEqual(await second, "item")
+        self.assertTrue(first.cancelled())
+
+    async def test_many_producers_and_consumers(self):
+        """Test that every item is delivered exactly once."""
+        queue = LinkedQueue(maxsize=8)
+        received = []
+
+        async def produce(start):
+            for i in range(start, start + 200):
+                await queue.put(i)
+
+        async def consume():
+            while True:
+                batch = await queue.get_batch(16, timeout=0.05)
+                if not batch:
+                    return
+                received.extend(batch)
+
+        await asyncio.gather(*(produce(i * 200) for i in range(5)), *(consume() for _ in range(3)))
+        self.assertEqual(sorted(received), list(range(1000)))
+
+
+class TestLinkedDeque(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the LinkedDeque class."""
+
+    async def test_both_ends(self):
+        """Test adding and taking at both ends."""
+        deque = LinkedDeque(maxsize=3)
+        await deque.put(2)
+        await deque.put_left(1)
+        await deque.put(3)
+        with self.assertRaises(asyncio.QueueFull):
+            deque.put_left_nowait(0)
+        self.assertEqual(await deque.get_right(), 3)
+        self.assertEqual(await deque.get(), 1)
+        self.assertEqual(deque.get_right_nowait(), 2)
+        with self.assertRaises(asyncio.QueueEmpty):
+            deque.get_right_nowait()
+        self.assertEqual(repr(deque), "LinkedDeque([], maxsize=3, getters=0, putters=0)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for parallel map and reduce over a DoublyLinkedList.
+"""
+
+import operator
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from Dlinkedlist import DoublyLinkedList
+from parallel import parallel_map, parallel_reduce
+
+
+def square(value: int) -> int:
+    """Square a value (defined at module level so that workers can unpickle it)."""
+    return value * value
+
+
+def concat(left: str, right: str) -> str:
+    """Concatenate two strings, an associative but not commutative operation."""
+    return left + right
+
+
+class TestParallel(unittest.TestCase):
+    """Test cases for parallel_map and parallel_reduce."""
+
+    def setUp(self) -> None:
+        """Set up a list of 1,000 values."""
+        self.list = DoublyLinkedList[int]()
+        for i in range(1000):
+            self.list.append(i)
+
+    def test_map(self) -> None:
+        """Test that results are spliced back in order, whatever the chunk size."""
+        expected = [i * i for i in range(1000)]
+        for chunk in (None, 1, 7, 1000, 5000):
+            result = parallel_map(square, self.list, workers=2, chunk=chunk)
+            self.assertEqual(list(result), expected)
+            self.assertEqual(len(result), 1000)
+            self.assertEqual(result.tail.data, 999 * 999)
+            self.assertEqual(result.tail.prev.data, 998 * 998)
+        self.assertEqual(len(parallel_map(square, DoublyLinkedList[int](), workers=2)), 0)
+
+    def test_reduce(self) -> None:
+        """Test that chunk results are combined in order."""
+        self.assertEqual(parallel_reduce(operator.add, self.list, workers=2, chunk=64), sum(range(1000)))
+        self.assertEqual(parallel_reduce(max, self.list, workers=2), 999)
+
+        letters = DoublyLinkedList[str]()
+        for letter in "abcdefghij":
+            letters.append(letter)
+        self.assertEqual(parallel_reduce(concat, letters, ">", workers=2, chunk=3), ">abcdefghij")
+
+        self.assertEqual(parallel_reduce(operator.add, DoublyLinkedList[int](), 0), 0)
+        with self.assertRaises(TypeError):
+            parallel_reduce(operator.add, DoublyLinkedList[int]())
+
+    def test_shared_executor_and_validation(self) -> None:
+        """Test running in a caller's executor and rejecting bad arguments."""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            first = parallel_map(square, self.list, executor=executor)
+            total = parallel_reduce(operator.add, first, executor=executor, chunk=100)
+        self.assertEqual(total, sum(i * i for i in range(1000)))
+
+        with self.assertRaises(ValueError):
+            parallel_map(square, self.list, workers=0)
+        with self.assertRaises(ValueError):
+            parallel_map(square, self.list, chunk=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the PieceTable implementation.
+"""
+
+import random
+import unittest
+import piece_table
+from piece_table import PieceTable
+
+
+class TestPieceTable(unittest.TestCase):
+    """Test cases for the PieceTable class."""
+
+    def setUp(self) -> None:
+        """Set up a fresh three-line document for each test."""
+        self.doc = PieceTable("first line\nsecond line\nthird")
+
+    def assertMatches(self, doc: PieceTable, text: str) -> None:
+        """Check the document, its lines and its line index against a string."""
+        self.assertEqual(str(doc), text)
+        self.assertEqual(len(doc), len(text))
+        lines = text.split("\n")
+        self.assertEqual(doc.line_count, len(lines))
+        offset = 0
+        for number, line in enumerate(lines):
+            self.assertEqual(doc.get_line(number), line)
+            self.assertEqual(doc.line_start(number), offset)
+            self.assertEqual(doc.line_of(offset), number)
+            offset += len(line) + 1
+
+    def test_empty(self) -> None:
+        """Test an empty document."""
+        doc = PieceTable()
+        self.assertMatches(doc, "")
+        doc.insert(0, "a\nb")
+        self.assertMatches(doc, "a\nb")
+
+    def test_lines(self) -> None:
+        """Test line lookups on the original text."""
+        self.assertMatches(self.doc, "first line\nsecond line\nthird")
+        self.assertEqual(self.doc.line_of(13), 1)
+        with self.assertRaises(IndexError):
+            self.doc.get_line(3)
+        with self.assertRaises(IndexError):
+            self.doc.line_of(len(self.doc) + 1)
+
+    def test_insert_and_delete(self) -> None:
+        """Test inserting and deleting text at arbitrary offsets."""
+        self.doc.insert(6, "new\n")
+        self.assertMatches(self.doc, "first new\nline\nsecond line\nthird")
+        self.assertEqual(self.doc.delete(0, 6), "first ")
+        self.assertMatches(self.doc, "new\nline\nsecond line\nthird")
+        self.assertEqual(self.doc.delete(3, 6), "\nline\n")
+        self.assertMatches(self.doc, "newsecond line\nthird")
+        self.assertEqual(self.doc.get_text(3, 9), "second")
+        with self.assertRaises(IndexError):
+            self.doc.insert(100, "x")
+        with self.assertRaises(IndexError):
+            self.doc.delete(10, 100)
+
+    def test_typing_extends_last_piece(self) -> None:
+        """Test that consecutive typing does not create new pieces."""
+        self.doc.insert(5, "!")
+        pieces = self.doc.piece_count
+        for offset, char in enumerate("?? and\nmore", start=6):
+            self.doc.insert(offset, char)
+        self.assertEqual(self.doc.piece_count, pieces)
+        self.assertMatches(self.doc, "first!?? and\nmore line\nsecond line\nthird")
+
+    def test_add_buffer_chunks(self) -> None:
+        """Test edits that span several add-buffer chunks."""
+        original = piece_table.ADD_CHUNK_SIZE
+        piece_table.ADD_CHUNK_SIZE = 8
+        try:
+            doc = PieceTable("abc")
+            text = "abc"
+            for i in range(20):
+                doc.insert(len(doc), f"{i}\n")
+                text += f"{i}\n"
+            self.assertGreater(len(doc._buffers), 3)
+            self.assertMatches(doc, text)
+        finally:
+            piece_table.ADD_CHUNK_SIZE = original
+
+    def test_random_edits(self) -> None:
+        """Test random edits against a plain string."""
+        rng = random.Random(3)
+        text = "".join(rng.choice("ab\n") for _ in range(50))
+        doc = PieceTable(text)
+        for _ in range(400):
+            if rng.random() < 0.6 or not text:
+                offset = rng.randint(0, len(text))
+                new = "".join(rng.choice("xy\n") for _ in range(rng.randint(1, 4)))
+                doc.insert(offset, new)
+                text = text[:offset] + new + text[offset:]
+            else:
+                offset = rng.randrange(len(text))
+                length = rng.randint(0, min(5, len(text) - offset))
+                self.assertEqual(doc.delete(offset, length), text[offset:offset + length])
+                text = text[:offset] + text[offset + length:]
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, len(text))
+            self.assertEqual(doc.get_text(start, end), text[start:end])
+        self.assertMatches(doc, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the Rope implementation.
+"""
+
+import random
+import unittest
+from Dlinkedlist import DoublyLinkedList
+from rope import Rope
+
+
+class TestRope(unittest.TestCase):
+    """Test cases for the Rope class."""
+
+    def assertBalanced(self, rope: Rope) -> None:
+        """Check that every branch of the rope is AVL-balanced."""
+        def height(node):
+            if not node.height:
+                return 0
+            left, right = height(node.left), height(node.right)
+            self.assertLessEqual(abs(left - right), 1)
+            self.assertEqual(node.length, node.left.length + node.right.length)
+            return max(left, right) + 1
+        self.assertEqual(height(rope._root), rope.depth)
+
+    def test_basic_operations(self) -> None:
+        """Test concatenation, indexing, slicing and splitting."""
+        rope = Rope("hello") + " " + Rope("world")
+        self.assertEqual(str(rope), "hello world")
+        self.assertEqual(len(rope), 11)
+        self.assertEqual(rope[4], "o")
+        self.assertEqual(rope[-1], "d")
+        self.assertEqual(rope[3:8], "lo wo")
+        self.assertEqual(("> " + rope).flatten(), "> hello world")
+        first, second = rope.split(5)
+        self.assertEqual((str(first), str(second)), ("hello", " world"))
+        self.assertEqual(rope.insert(5, ",").delete(0, 1), "ello, world")
+        with self.assertRaises(IndexError):
+            rope[11]
+        with self.assertRaises(ValueError):
+            rope[::2]
+
+    def test_empty(self) -> None:
+        """Test an empty rope."""
+        rope = Rope()
+        self.assertEqual(len(rope), 0)
+        self.assertEqual(str(rope), "")
+        self.assertEqual(str(rope + ""), "")
+        self.assertEqual(list(rope.chunks()), [])
+        self.assertEqual(Rope.from_iterable([]), "")
+
+    def test_leaves_are_shared(self) -> None:
+        """Test that large pieces are stored without copying."""
+        big = "x" * 10_000
+        rope = Rope.from_iterable([big, "tail"], leaf_size=64)
+        self.assertIs(next(rope.chunks()), big)
+        self.assertIs(rope.split(10_000)[0]._root.text, big)
+
+    def test_from_linked_list(self) -> None:
+        """Test building a rope from the segments of a DoublyLinkedList."""
+        segments = DoublyLinkedList[str]()
+        for i in range(1000):
+            segments.append(f"segment {i}\n")
+        rope = Rope.from_iterable(segments, leaf_size=100)
+        self.assertEqual(rope, "".join(segments))
+        self.assertBalanced(rope)
+        self.assertLessEqual(rope.depth, 12)
+
+    def test_flatten_is_cached(self) -> None:
+        """Test that flatten builds the string once."""
+        rope = Rope("a") + "b" + "c"
+        self.assertIsNone(rope._flat)
+        flat = rope.flatten()
+        self.assertIs(rope.flatten(), flat)
+        self.assertEqual(hash(rope), hash("abc"))
+
+    def test_random_operations(self) -> None:
+        """Test random edits against a plain string, checking the balance."""
+        rng = random.Random(7)
+        for leaf_size in (1, 8, 64):
+            rope, text = Rope(leaf_size=leaf_size), ""
+            for _ in range(500):
+                roll = rng.random()
+                piece = "".join(rng.choice("abc") for _ in range(rng.randint(0, 10)))
+                if roll < 0.3:
+                    rope, text = rope + piece, text + piece
+                elif roll < 0.45:
+                    rope, text = piece + rope, piece + text
+                elif roll < 0.65:
+                    index = rng.randint(0, len(text))
+                    rope = rope.insert(index, Rope(piece))
+                    text = text[:index] + piece + text[index:]
+                elif roll < 0.8:
+                    start = rng.randint(0, len(text))
+                    end = rng.randint(start, len(text))
+                    rope, text = rope.delete(start, end), text[:start] + text[end:]
+                else:
+                    start = rng.randint(-len(text) - 1, len(text))
+                    end = rng.randint(-len(text) - 1, len(text))
+                    self.assertEqual(rope[start:end], text[start:end])
+                self.assertEqual(len(rope), len(text))
+            self.assertBalanced(rope)
+            self.assertEqual(rope, text)
+            self.assertEqual("".join(rope), text)
+
+    def test_invalid_leaf_size(self) -> None:
+        """Test that leaf_size must be positive."""
+        with self.assertRaises(ValueError):
+            Rope("abc", leaf_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
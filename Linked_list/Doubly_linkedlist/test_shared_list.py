@@ -0,0 +1,127 @@
+"""
+Unit tests for the SharedLinkedList implementation.
+"""
+
+import multiprocessing
+import unittest
+from shared_list import SharedLinkedList
+
+
+def total_in_worker(name: str, results) -> None:
+    """Attach to a list in another process and report its sum and reversed order."""
+    with SharedLinkedList.attach(name) as shared:
+        results.put((sum(shared), list(reversed(shared))))
+
+
+class TestSharedLinkedList(unittest.TestCase):
+    """Test cases for the SharedLinkedList class."""
+
+    def setUp(self) -> None:
+        """Create a list with room for 8 integers."""
+        self.shared = SharedLinkedList.create(8, 'q')
+
+    def tearDown(self) -> None:
+        """Close and destroy the block."""
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_operations(self) -> None:
+        """Test adding and removing at both ends, and reusing freed records."""
+        shared = self.shared
+        self.assertEqual(shared.to_list(), [])
+        shared.append(2)
+        shared.append(3)
+        shared.prepend(1)
+        self.assertEqual(list(shared), [1, 2, 3])
+        self.assertEqual(list(reversed(shared)), [3, 2, 1])
+        self.assertEqual(len(shared), 3)
+
+        self.assertEqual(shared.remove_first(), 1)
+        self.assertEqual(shared.remove_last(), 3)
+        self.assertEqual(shared.to_list(), [2])
+
+        shared.extend(range(10, 17))
+        self.assertEqual(len(shared), 8)
+        with self.assertRaises(OverflowError):
+            shared.append(99)
+        with self.assertRaises(OverflowError):
+            shared.extend([1])
+
+        shared.clear()
+        self.assertEqual(len(shared), 0)
+        with self.assertRaises(IndexError):
+            shared.remove_first()
+        shared.extend(range(8))
+        self.assertEqual(shared.to_list(), list(range(8)))
+
+    def test_rejected_values(self) -> None:
+        """Test that values the typecode cannot store leave the list unchanged."""
+        shared = self.shared
+        shared.extend([1, 2])
+        with self.assertRaises(TypeError):
+            shared.extend([3, 4, 'x'])
+        self.assertEqual(len(shared), 2)
+        self.assertEqual(list(shared), [1, 2])
+        for value in (1.5, 'x', 2 ** 70):
+            with self.assertRaises((TypeError, ValueError, OverflowError)):
+                shared.append(value)
+        shared.extend(range(3, 9))
+        self.assertEqual(list(shared), list(range(1, 9)))
+
+    def test_attach(self) -> None:
+        """Test that an attached list sees the writer's changes and cannot write."""
+        self.shared.extend([5, 6, 7])
+        with SharedLinkedList.attach(self.shared.name) as reader:
+            self.assertEqual(reader.to_list(), [5, 6, 7])
+            self.assertEqual(reader.typecode, 'q')
+            self.assertEqual(reader.capacity, 8)
+            self.shared.remove_first()
+            self.assertEqual(list(reader), [6, 7])
+            with self.assertRaises(PermissionError):
+                reader.append(1)
+
+    def test_other_process(self) -> None:
+        """Test reading the list from a child process."""
+        self.shared.extend([1, 2, 3, 4])
+        results = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=total_in_worker, args=(self.shared.name, results))
+        worker.start()
+        self.assertEqual(results.get(timeout=30), (10, [4, 3, 2, 1]))
+        worker.join()
+        self.assertEqual(worker.exitcode, 0)
+
+    def test_iteration_detects_writes(self) -> None:
+        """Test that an iterator raises if the writer changes the list under it."""
+        shared = SharedLinkedList.from_values(range(1000))
+        try:
+            iterator = iter(shared)
+            self.assertEqual(next(iterator), 0)
+            shared.remove_last()
+            # The rest of the batch already read is still yielded, then the change is detected
+            with self.assertRaises(RuntimeError):
+                for _ in iterator:
+                    pass
+            self.assertEqual(sum(shared), sum(range(999)))
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_validation(self) -> None:
+        """Test invalid arguments and links of both widths."""
+        with self.assertRaises(ValueError):
+            SharedLinkedList.create(0)
+        with self.assertRaises(ValueError):
+            SharedLinkedList.create(4, 'u')
+        with self.assertRaises(ValueError):
+            SharedLinkedList.create(4, 'd', link_typecode='h')
+        wide = SharedLinkedList.from_values([0.5, 1.5], 'd', link_typecode='q')
+        try:
+            self.assertEqual(wide.to_list(), [0.5, 1.5])
+            self.assertEqual(wide.nbytes, SharedLinkedList.block_size(2, 'd', 'q'))
+        finally:
+            wide.close()
+            wide.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
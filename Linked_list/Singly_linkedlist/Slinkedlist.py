@@ -4,7 +4,10 @@ Singly Linked List Implementation
 This module provides a comprehensive implementation of a Singly Linked List data structure.
 """
 
-from typing import TypeVar, Generic, Optional, Iterator, Any, List
+import asyncio
+import gc
+import time
+from typing import TypeVar, Generic, Optional, Iterator, AsyncIterator, Any, List
 
 T = TypeVar('T')  # Generic type for the data stored in the list
 
@@ -43,6 +46,7 @@ class SinglyLinkedList(Generic[T]):
         """
         self._head: Optional[Node[T]] = None
         self._size: int = 0
+        self._version: int = 0  # Bumped by every removal or reordering, see aiter()
         
         # Add initial values if provided
         if iterable:
@@ -74,6 +78,114 @@ class SinglyLinkedList(Generic[T]):
             yield current.data
             current = current.next
     
+    def iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """
+        Return an iterator over the list's elements in lists of up to size elements.
+
+        Each chunk is a new list that is preallocated and filled in one tight
+        loop, so a consumer that processes whole batches (for example with
+        NumPy) pays the cost of one iterator step per chunk instead of one
+        per element. Every chunk except possibly the last holds exactly size
+        elements, and the consumer may keep or modify the chunks.
+
+        Elements inserted while the iterator is suspended are visited. After
+        a removal, clear() or reverse() the iterator raises RuntimeError the
+        next time it resumes, as in aiter().
+
+        Args:
+            size: The maximum number of elements per chunk
+
+        Returns:
+            An iterator over lists of the data elements of the list in order
+
+        Raises:
+            ValueError: If size is not positive
+
+        Time Complexity: O(n) overall, O(size) per chunk
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        return self._iter_chunks(size)
+
+    def _iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """Fill and yield the chunks for iter_chunks()."""
+        version = self._version
+        current = self._head
+        while current is not None:
+            chunk: List[Any] = [None] * size
+            for i in range(size):
+                if current is None:
+                    del chunk[i:]
+                    break
+                chunk[i] = current.data
+                current = current.next
+            yield chunk
+            if self._version != version:
+                raise RuntimeError("SinglyLinkedList changed during chunked iteration")
+
+    def aiter(self, yield_every: int = 1024, yield_after_us: Optional[float] = None) -> AsyncIterator[T]:
+        """
+        Return an async iterator over the list's elements that yields to the event loop.
+
+        Walking a long list in a coroutine blocks every other coroutine until
+        it finishes. This iterator instead suspends (with asyncio.sleep(0))
+        after every yield_every elements, and also once yield_after_us
+        microseconds have passed since it last suspended, if given. The time
+        includes the consumer's own work on each element.
+
+        While the iterator is suspended other coroutines may change the list.
+        Insertions are safe: the iterator keeps its place, and elements
+        inserted after it are visited. Removals, clear() and reverse() can
+        unlink the node the iterator stands on, so after any of them the
+        iterator raises RuntimeError the next time it resumes.
+
+        Args:
+            yield_every: The maximum number of elements between suspensions
+            yield_after_us: The maximum time between suspensions in
+                microseconds, or None for no time limit
+
+        Returns:
+            An async iterator over the data elements of the list in order
+
+        Raises:
+            ValueError: If yield_every is not positive
+
+        Time Complexity: O(n) overall, O(1) per element
+        """
+        if yield_every <= 0:
+            raise ValueError("yield_every must be positive")
+        return self._aiter(yield_every, None if yield_after_us is None else yield_after_us / 1e6)
+
+    async def _aiter(self, yield_every: int, budget: Optional[float]) -> AsyncIterator[T]:
+        """Walk the list for aiter(), suspending every yield_every nodes or budget seconds."""
+        version = self._version
+        clock = time.perf_counter
+        started = clock()
+        count = 0
+        current = self._head
+        while current is not None:
+            yield current.data
+            count += 1
+            # The clock is read every 32 elements to keep its cost negligible
+            if count >= yield_every or (budget is not None and count & 31 == 0 and clock() - started >= budget):
+                await asyncio.sleep(0)
+                count = 0
+                started = clock()
+            if self._version != version:
+                raise RuntimeError("SinglyLinkedList changed during async iteration")
+            current = current.next
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """
+        Return an async iterator that yields to the event loop every 1024 elements.
+
+        Returns:
+            The async iterator returned by aiter() with its defaults
+
+        Time Complexity: O(n) overall, O(1) per element
+        """
+        return self.aiter()
+
     def __str__(self) -> str:
         """
         Return a string representation of the list.
@@ -240,6 +352,7 @@ class SinglyLinkedList(Generic[T]):
         value = self._head.data  # type: ignore
         self._head = self._head.next  # type: ignore
         self._size -= 1
+        self._version += 1
         
         return value
     
@@ -276,6 +389,7 @@ class SinglyLinkedList(Generic[T]):
         value = current.next.data  # type: ignore
         current.next = current.next.next  # type: ignore
         self._size -= 1
+        self._version += 1
         
         return value
     
@@ -324,6 +438,7 @@ class SinglyLinkedList(Generic[T]):
         """
         self._head = None
         self._size = 0
+        self._version += 1
     
     def copy(self) -> 'SinglyLinkedList[T]':
         """
@@ -355,6 +470,7 @@ class SinglyLinkedList(Generic[T]):
             current = next_temp
         
         self._head = prev
+        self._version += 1
     
     def to_list(self) -> List[T]:
         """
@@ -367,6 +483,109 @@ class SinglyLinkedList(Generic[T]):
         """
         return list(self)
 
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Convert the linked list to a one-dimensional NumPy array.
+
+        With a dtype, the values are written straight into an array of the
+        list's length with numpy.fromiter, without an intermediate list.
+        Without one, NumPy infers the dtype from all the values, as
+        numpy.array(list) would. NumPy is imported only when this method is
+        called, so the list itself does not depend on it.
+
+        Args:
+            dtype: The NumPy dtype of the array, or None to infer it
+
+        Returns:
+            A new numpy.ndarray holding the elements in order
+
+        Raises:
+            ImportError: If NumPy is not installed
+
+        Time Complexity: O(n)
+        """
+        import numpy as np
+
+        if dtype is None:
+            return np.array(list(self))
+        return np.fromiter(self, dtype=dtype, count=self._size)
+
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'SinglyLinkedList[T]':
+        """
+        Create a linked list from the items of a NumPy array along its first axis.
+
+        The array is converted to Python objects in a single tolist() call
+        (so the list holds ints and floats, not NumPy scalars, and the rows
+        of a 2-D array become lists), and the nodes are then linked in one
+        pass.
+
+        Args:
+            arr: A NumPy array with at least one dimension
+
+        Returns:
+            A new SinglyLinkedList holding the array's items in order
+
+        Raises:
+            ValueError: If the array is zero-dimensional
+
+        Time Complexity: O(n)
+        """
+        if arr.ndim == 0:
+            raise ValueError("Cannot create a linked list from a zero-dimensional array")
+        result = cls()
+        result._link_values(arr.tolist())
+        return result
+
+    def _link_values(self, values: List[T]) -> None:
+        """
+        Replace the contents of an empty list with new nodes holding values.
+
+        The nodes are linked from the last to the first in one pass. The
+        cyclic garbage collector is paused meanwhile: none of the new nodes
+        can be garbage yet, and the collections their allocation would
+        trigger take most of the time.
+
+        Time Complexity: O(n)
+        """
+        head = None
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for value in reversed(values):
+                head = Node(value, head)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self._head = head
+        self._size = len(values)
+
+    def __getstate__(self) -> dict:
+        """
+        Return the list's state for pickle and copy, with the elements as one flat list.
+
+        Pickling the nodes themselves would recurse once per node through
+        Node.next (raising RecursionError for long lists) and store every
+        node as a separate object.
+
+        Time Complexity: O(n)
+        """
+        state = self.__dict__.copy()
+        del state['_head']
+        state['_values'] = list(self)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore the list from the state returned by __getstate__, relinking the nodes in one pass.
+
+        Time Complexity: O(n)
+        """
+        state = state.copy()
+        values = state.pop('_values')
+        self.__dict__.update(state)
+        self._link_values(values)
+
 
 
 # # Singly linked list data structure implementation in python
@@ -2,9 +2,16 @@
 Unit tests for the SinglyLinkedList implementation.
 """
 
+import copy
+import pickle
 import unittest
 from Slinkedlist import SinglyLinkedList
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class TestSinglyLinkedList(unittest.TestCase):
     """Test cases for the SinglyLinkedList class."""
     
@@ -238,6 +245,57 @@ class TestSinglyLinkedList(unittest.TestCase):
         
         self.assertEqual(items, [1, 2, 3])
     
+    def test_iter_chunks(self):
+        """Test iterating over the list in chunks."""
+        ll = SinglyLinkedList([1, 2, 3, 4, 5])
+        
+        self.assertEqual(list(ll.iter_chunks(2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(ll.iter_chunks(5)), [[1, 2, 3, 4, 5]])
+        self.assertEqual(list(SinglyLinkedList().iter_chunks(3)), [])
+        
+        with self.assertRaises(ValueError):
+            ll.iter_chunks(0)
+        
+        # Removing while the iterator is suspended is detected
+        chunks = ll.iter_chunks(2)
+        next(chunks)
+        ll.remove_head()
+        with self.assertRaises(RuntimeError):
+            next(chunks)
+    
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_round_trip(self):
+        """Test converting to and from NumPy arrays."""
+        ll = SinglyLinkedList([1, 2, 3])
+        
+        exported = ll.to_numpy(dtype=np.float64)
+        self.assertEqual(exported.dtype, np.float64)
+        self.assertEqual(exported.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(ll.to_numpy().tolist(), [1, 2, 3])
+        self.assertEqual(SinglyLinkedList().to_numpy(dtype=np.int64).shape, (0,))
+        
+        imported = SinglyLinkedList.from_numpy(np.arange(4))
+        self.assertEqual(imported.to_list(), [0, 1, 2, 3])
+        self.assertEqual(len(imported), 4)
+        self.assertIs(type(imported.get(0)), int)
+        with self.assertRaises(ValueError):
+            SinglyLinkedList.from_numpy(np.array(5))
+    
+    def test_pickle(self):
+        """Test pickling and copying, including lists far longer than the recursion limit."""
+        ll = SinglyLinkedList()
+        for i in reversed(range(100_000)):
+            ll.prepend(i)
+        
+        restored = pickle.loads(pickle.dumps(ll))
+        self.assertEqual(len(restored), 100_000)
+        self.assertEqual(restored.to_list(), list(range(100_000)))
+        restored.append(-1)
+        self.assertEqual(restored.get(100_000), -1)
+        
+        self.assertEqual(copy.deepcopy(SinglyLinkedList([1, [2]])).to_list(), [1, [2]])
+        self.assertTrue(pickle.loads(pickle.dumps(SinglyLinkedList())).is_empty())
+    
     def test_string_representation(self):
         """Test string representation of the list."""
         ll = SinglyLinkedList([1, 2, 3])
@@ -0,0 +1,83 @@
+"""
+Unit tests for async iteration over a SinglyLinkedList.
+"""
+
+import asyncio
+import time
+import unittest
+from Slinkedlist import SinglyLinkedList
+
+
+async def max_stall(iteration):
+    """
+    Run an iteration next to a heartbeat and return the longest gap between beats in seconds.
+    """
+    done = False
+    gaps = []
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await iteration
+    finally:
+        done = True
+        await beat
+    return max(gaps)
+
+
+class TestAsyncIteration(unittest.IsolatedAsyncioTestCase):
+    """Test cases for SinglyLinkedList.aiter and __aiter__."""
+
+    def setUp(self) -> None:
+        """Set up a list of 1,000,000 values, built at the head since append walks the list."""
+        self.list = SinglyLinkedList[int]()
+        for i in reversed(range(1_000_000)):
+            self.list.prepend(i)
+
+    async def collect(self, iterator):
+        """Collect the values of an async iterator."""
+        return [value async for value in iterator]
+
+    async def test_values(self) -> None:
+        """Test that async iteration visits every value in order."""
+        self.assertEqual(await self.collect(self.list), list(range(1_000_000)))
+        self.assertEqual(await self.collect(SinglyLinkedList[int]().aiter()), [])
+        with self.assertRaises(ValueError):
+            self.list.aiter(yield_every=-1)
+
+    async def test_worst_case_stall(self) -> None:
+        """Test that the event loop is never blocked for more than about yield_every values."""
+        async def walk():
+            return list(self.list)
+
+        blocking = await max_stall(walk())
+        stall = await max_stall(self.collect(self.list.aiter(yield_every=1000)))
+        self.assertLess(stall, blocking / 5, (stall, blocking))
+
+    async def test_mutation_during_iteration(self) -> None:
+        """Test that insertions are visited and removals make a suspended iterator raise."""
+        small = SinglyLinkedList[int]([0, 1, 2])
+        seen = []
+        async for value in small.aiter(yield_every=1):
+            seen.append(value)
+            if value == 0:
+                small.append(3)
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+        iterator = small.aiter(yield_every=1)
+        self.assertEqual(await iterator.__anext__(), 0)
+        small.remove(1)
+        with self.assertRaises(RuntimeError):
+            await iterator.__anext__()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Benchmark for the batched ArrayStack operations.
+
+Compares pushing and popping a batch of elements one at a time against
+push_many / pop_many, and reading the top of the stack with repeated pops
+and pushes against peek_n, for batch sizes from 10 to 100,000.
+"""
+
+import time
+
+from stack import ArrayStack
+
+
+def best_of(repeats, func, *args):
+    """Return the fastest of several runs of func(*args), in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loop_round_trip(stack, items):
+    """Push and then pop every item individually."""
+    for item in items:
+        stack.push(item)
+    for _ in range(len(items)):
+        stack.pop()
+
+
+def batch_round_trip(stack, items):
+    """Push and then pop all items with a single call each."""
+    stack.push_many(items)
+    stack.pop_many(len(items))
+
+
+def loop_peek(stack, n):
+    """Read the top n elements by popping them and pushing them back."""
+    top = [stack.pop() for _ in range(n)]
+    for item in reversed(top):
+        stack.push(item)
+
+
+def main():
+    print(f"{'batch':>8} {'loop ms':>10} {'batch ms':>10} {'speedup':>8} "
+          f"{'loop peek ms':>13} {'peek_n ms':>10} {'speedup':>8}")
+    for size in (10, 100, 1_000, 10_000, 100_000):
+        items = list(range(size))
+        repeats = max(3, 200_000 // size)
+        stack = ArrayStack[int]()
+        stack.push_many(items)  # Peeks need a populated stack
+
+        loop = best_of(repeats, loop_round_trip, stack, items) * 1e3
+        batch = best_of(repeats, batch_round_trip, stack, items) * 1e3
+        loop_peek_ms = best_of(repeats, loop_peek, stack, size) * 1e3
+        peek_ms = best_of(repeats, stack.peek_n, size) * 1e3
+        print(f"{size:>8} {loop:>10.4f} {batch:>10.4f} {loop / batch:>7.1f}x "
+              f"{loop_peek_ms:>13.4f} {peek_ms:>10.4f} {loop_peek_ms / peek_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for the streaming bracket validator.
+
+Validates synthetic inputs in 1 MiB chunks and reports throughput in GB/s,
+next to the original approach of pushing every character of a string onto an
+ArrayStack. Three inputs are used:
+
+- json: a JSON-like dump with nested objects and arrays (mixed bracket types)
+- sexpr: an S-expression dump that only uses parentheses (counter path)
+- text: prose with a few brackets
+
+Usage:
+    python bench_bracket_validator.py [megabytes]
+"""
+
+import json
+import random
+import sys
+import time
+
+from stack import ArrayStack
+from bracket_validator import validate_chunks
+
+CHUNK_SIZE = 1 << 20
+
+
+def per_character(expression: str) -> bool:
+    """The original balanced_parentheses: push every bracket onto an ArrayStack."""
+    stack = ArrayStack[str]()
+    brackets = {')': '(', '}': '{', ']': '['}
+    for char in expression:
+        if char in '({[':
+            stack.push(char)
+        elif char in ')}]':
+            if stack.is_empty() or stack.pop() != brackets[char]:
+                return False
+    return stack.is_empty()
+
+
+def make_chunk(kind: str) -> bytes:
+    """Build a balanced 1 MiB-ish block of the given kind of input."""
+    rng = random.Random(7)
+    if kind == "json":
+        records = [{"id": i, "tags": ["a", "b"], "pos": {"x": rng.random(), "y": [1, 2, 3]}}
+                   for i in range(8000)]
+        data = json.dumps(records).encode()
+    elif kind == "sexpr":
+        data = b" ".join(b"(define (f%d x) (if (> x %d) (* x 2) (+ x 1)))" % (i, i)
+                         for i in range(20000))
+    else:
+        words = [b"lorem", b"ipsum", b"(dolor)", b"sit", b"amet,", b"[consectetur]", b"adipiscing"]
+        data = b" ".join(rng.choice(words) for _ in range(150000))
+    return data[:CHUNK_SIZE] if kind == "text" else data
+
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    print(f"{'input':>6} {'streaming GB/s':>15} {'per-char GB/s':>14} {'speedup':>8}")
+    for kind in ("json", "sexpr", "text"):
+        block = make_chunk(kind)
+        repeats = max(1, megabytes * (1 << 20) // len(block))
+
+        start = time.perf_counter()
+        result = validate_chunks(block for _ in range(repeats))
+        streaming = len(block) * repeats / (time.perf_counter() - start) / 1e9
+        assert result.valid, result
+
+        # The per-character version is far slower, so time it on one block
+        text = block.decode()
+        start = time.perf_counter()
+        assert per_character(text)
+        per_char = len(block) / (time.perf_counter() - start) / 1e9
+
+        print(f"{kind:>6} {streaming:>15.3f} {per_char:>14.4f} {streaming / per_char:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
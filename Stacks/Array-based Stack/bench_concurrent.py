@@ -0,0 +1,185 @@
+"""
+Benchmark for the thread-safe stacks.
+
+Runs a task-spawning workload (a binary tree of tasks, where each task does a
+little work and spawns two children until a fixed depth) on 1 to N threads
+with three scheduling strategies:
+
+- global-lock: an ArrayStack shared by all workers, every call under one lock
+- concurrent: a shared ConcurrentStack
+- work-stealing: one WorkStealingDeque per worker, stealing when idle
+
+On builds with the GIL, pure Python work cannot run in parallel, so the
+interesting number is the scheduling overhead. On free-threaded builds
+(python3.13t and later) the work-stealing strategy should scale with the
+number of threads.
+
+Usage:
+    python bench_concurrent.py [max_threads] [tree_depth]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+from stack import ArrayStack, EmptyStackError
+from concurrent_stack import ConcurrentStack, WorkStealingDeque
+
+WORK = 200  # Size of the loop each task runs
+
+
+def work() -> int:
+    """Simulate the CPU work done by one task."""
+    total = 0
+    for i in range(WORK):
+        total += i
+    return total
+
+
+def run_global_lock(threads: int, depth: int) -> int:
+    """Run the workload on one ArrayStack guarded by a single lock."""
+    stack = ArrayStack()
+    lock = threading.Lock()
+    total = 2 ** (depth + 1) - 1
+    completed = [0] * threads
+    stack.push(0)
+
+    def worker(index: int) -> None:
+        done = 0
+        while True:
+            with lock:
+                level = stack.pop() if not stack.is_empty() else None
+            if level is None:
+                # Publish our own count before checking whether everyone is done
+                completed[index] += done
+                done = 0
+                if sum(completed) >= total:
+                    break
+                time.sleep(0)
+                continue
+            work()
+            if level < depth:
+                with lock:
+                    stack.push(level + 1)
+                    stack.push(level + 1)
+            done += 1
+            if done % 64 == 0:
+                completed[index] += done
+                done = 0
+        completed[index] += done
+
+    _run_workers(worker, threads)
+    return sum(completed)
+
+
+def run_concurrent(threads: int, depth: int) -> int:
+    """Run the workload on one shared ConcurrentStack."""
+    stack = ConcurrentStack()
+    total = 2 ** (depth + 1) - 1
+    completed = [0] * threads
+    stack.push(0)
+
+    def worker(index: int) -> None:
+        done = 0
+        while True:
+            try:
+                level = stack.pop_wait(timeout=0.001)
+            except EmptyStackError:
+                # Publish our own count before checking whether everyone is done
+                completed[index] += done
+                done = 0
+                if sum(completed) >= total:
+                    break
+                time.sleep(0)
+                continue
+            work()
+            if level < depth:
+                stack.push_many((level + 1, level + 1))
+            done += 1
+            if done % 64 == 0:
+                completed[index] += done
+                done = 0
+        completed[index] += done
+
+    _run_workers(worker, threads)
+    return sum(completed)
+
+
+def run_work_stealing(threads: int, depth: int) -> int:
+    """Run the workload on per-worker WorkStealingDeques."""
+    deques = [WorkStealingDeque() for _ in range(threads)]
+    total = 2 ** (depth + 1) - 1
+    completed = [0] * threads
+    deques[0].push(0)
+
+    def worker(index: int) -> None:
+        own = deques[index]
+        victims = [d for i, d in enumerate(deques) if i != index]
+        rng = random.Random(index)
+        done = 0
+        while True:
+            try:
+                level = own.pop()
+            except EmptyStackError:
+                level = None
+                rng.shuffle(victims)
+                for victim in victims:
+                    try:
+                        level = victim.steal()
+                        break
+                    except EmptyStackError:
+                        pass
+                if level is None:
+                    # Publish our own count before checking whether everyone is done
+                    completed[index] += done
+                    done = 0
+                    if sum(completed) >= total:
+                        break
+                    time.sleep(0)
+                    continue
+            work()
+            if level < depth:
+                own.push(level + 1)
+                own.push(level + 1)
+            done += 1
+            if done % 64 == 0:
+                completed[index] += done
+                done = 0
+        completed[index] += done
+
+    _run_workers(worker, threads)
+    return sum(completed)
+
+
+def _run_workers(worker, threads: int) -> None:
+    """Start one thread per worker index and wait for all of them."""
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else min(8, os.cpu_count() or 1)
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+          f"{2 ** (depth + 1) - 1} tasks")
+    print(f"{'threads':>8} {'global-lock':>14} {'concurrent':>14} {'work-stealing':>14}   (ktasks/s)")
+
+    threads = 1
+    while threads <= max_threads:
+        rates = []
+        for run in (run_global_lock, run_concurrent, run_work_stealing):
+            start = time.perf_counter()
+            tasks = run(threads, depth)
+            rates.append(tasks / (time.perf_counter() - start) / 1e3)
+        print(f"{threads:>8} {rates[0]:>14.1f} {rates[1]:>14.1f} {rates[2]:>14.1f}")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for the expression compiler and evaluator.
+
+Evaluates a rules-engine style expression over many rows of variable values
+in four ways:
+
+- reparse: compile the expression for every row (no cache)
+- cached: fetch the compiled program from the LRU cache for every row
+- program: evaluate one compiled program row by row
+- columns: evaluate one compiled program over whole columns at once
+
+Python's built-in eval of a precompiled code object is shown for reference.
+
+Usage:
+    python bench_expression.py [rows]
+"""
+
+import random
+import sys
+import time
+
+from expression import compile_expression, evaluate
+
+SOURCE = "price * qty * (1 - discount) > limit and not blocked or max(score, 0) >= 90"
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(3)
+    columns = {
+        'price': [rng.uniform(1, 100) for _ in range(rows)],
+        'qty': [rng.randint(1, 20) for _ in range(rows)],
+        'discount': [rng.choice((0, 0.1, 0.25)) for _ in range(rows)],
+        'limit': [rng.uniform(100, 1000) for _ in range(rows)],
+        'blocked': [rng.random() < 0.1 for _ in range(rows)],
+        'score': [rng.randint(-10, 100) for _ in range(rows)],
+    }
+    bindings = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    program = compile_expression(SOURCE)
+    reparse_rows = bindings[:rows // 20]
+
+    timings = []
+
+    start = time.perf_counter()
+    for row in reparse_rows:
+        compile_expression.__wrapped__(SOURCE).evaluate(row)
+    timings.append(("reparse", len(reparse_rows), time.perf_counter() - start))
+
+    start = time.perf_counter()
+    for row in bindings:
+        evaluate(SOURCE, row)
+    timings.append(("cached", rows, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    expected = program.evaluate_many(bindings)
+    timings.append(("program", rows, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    result = program.evaluate_columns(columns)
+    timings.append(("columns", rows, time.perf_counter() - start))
+    assert result == expected
+
+    code = compile(SOURCE, "<rule>", "eval")
+    start = time.perf_counter()
+    for row in bindings:
+        eval(code, {'max': max}, row)
+    timings.append(("python eval", rows, time.perf_counter() - start))
+
+    print(f"{'mode':>12} {'rows/s':>14} {'ns/row':>10}")
+    for name, count, elapsed in timings:
+        print(f"{name:>12} {count / elapsed:>14,.0f} {elapsed / count * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
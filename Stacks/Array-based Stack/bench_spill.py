@@ -0,0 +1,70 @@
+"""
+Benchmark for SpillingStack.
+
+Pushes DFS-like (node, edge) frames onto a stack to a given depth and pops them
+all again, reporting throughput and the peak resident set size (RSS) of the
+process. Each configuration runs in a fresh subprocess so that peak RSS is
+measured independently.
+
+Usage:
+    python bench_spill.py [depth ...]
+
+Pass depths larger than the available memory to see ArrayStack fail while
+SpillingStack keeps a flat memory profile (this can take a while and needs
+free disk space of roughly 16 bytes per frame).
+"""
+
+import resource
+import subprocess
+import sys
+import time
+
+from stack import ArrayStack
+from spill_stack import SpillingStack
+
+DEFAULT_DEPTHS = [1_000_000, 10_000_000, 30_000_000]
+
+
+def run(kind: str, depth: int) -> None:
+    """Run one configuration and print depth, throughput and peak RSS."""
+    if kind == "array":
+        stack = ArrayStack()
+    elif kind == "spill-struct":
+        stack = SpillingStack(hot_limit=1_000_000, record_format='qq')
+    else:
+        stack = SpillingStack(hot_limit=1_000_000)
+
+    start = time.perf_counter()
+    push = stack.push
+    for node in range(depth):
+        push((node, node & 7))
+    pop = stack.pop
+    for _ in range(depth):
+        pop()
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is reported in kilobytes on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{kind:>13} {depth:>12,} {2 * depth / elapsed / 1e6:>10.2f} {peak_mb:>12.1f}")
+
+
+def main() -> None:
+    depths = [int(arg) for arg in sys.argv[1:]] or DEFAULT_DEPTHS
+    print(f"{'structure':>13} {'depth':>12} {'Mops/s':>10} {'peak RSS MB':>12}")
+    for depth in depths:
+        for kind in ("array", "spill-struct", "spill-pickle"):
+            result = subprocess.run(
+                [sys.executable, __file__, "--run", kind, str(depth)],
+                capture_output=True, text=True,
+            )
+            if result.returncode == 0:
+                print(result.stdout, end="")
+            else:
+                print(f"{kind:>13} {depth:>12,} {'failed (likely out of memory)':>23}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--run":
+        run(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,107 @@
+"""
+Memory benchmark for the undo/redo history.
+
+Replays a simulated editing session (typing with occasional backspaces and
+cursor jumps) on a document and measures the memory held by the history with
+tracemalloc, for:
+
+- snapshots: a full copy of the text per edit, like the TextEditor example in
+  Linked_list/Singly_linkedlist/usage.py
+- deltas: UndoHistory without coalescing
+- coalesced: UndoHistory with the default coalescing
+- budget: UndoHistory with coalescing and a 64 KiB budget
+
+Usage:
+    python bench_undo.py [edits] [document_kb]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                                'Linked_list', 'Singly_linkedlist'))
+
+from Slinkedlist import SinglyLinkedList
+from undo import TextDocument, UndoHistory
+
+
+def make_session(edits: int, length: int):
+    """Generate (kind, position) edit operations for a document of the given length."""
+    rng = random.Random(11)
+    cursor = length // 2
+    operations = []
+    for _ in range(edits):
+        roll = rng.random()
+        if roll < 0.03:
+            cursor = rng.randint(0, length)
+            operations.append(("jump", cursor))
+        elif roll < 0.15 and cursor > 0:
+            cursor -= 1
+            length -= 1
+            operations.append(("backspace", cursor))
+        else:
+            operations.append(("type", cursor))
+            cursor += 1
+            length += 1
+    return operations
+
+
+def replay_snapshots(text: str, operations) -> SinglyLinkedList:
+    """Replay the session storing a full copy of the text per edit."""
+    history = SinglyLinkedList([text])
+    for kind, position in operations:
+        if kind == "type":
+            text = text[:position] + "x" + text[position:]
+        elif kind == "backspace":
+            text = text[:position] + text[position + 1:]
+        else:
+            continue
+        history.prepend(text)
+    return history
+
+
+def replay_deltas(text: str, operations, history: UndoHistory) -> TextDocument:
+    """Replay the session recording deltas in an UndoHistory."""
+    doc = TextDocument(text, history)
+    for kind, position in operations:
+        if kind == "type":
+            doc.insert(position, "x")
+        elif kind == "backspace":
+            doc.delete(position, 1)
+        else:
+            history.seal()
+    return doc
+
+
+def measure(name: str, replay) -> None:
+    """Run a replay under tracemalloc and print the memory it retains."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = replay()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    steps = len(result) if isinstance(result, SinglyLinkedList) else len(result.history)
+    print(f"{name:>10} {current / 1024:>12,.1f} {steps:>12,} {elapsed * 1e3:>10.1f}")
+    del result
+
+
+def main() -> None:
+    edits = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    kilobytes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    text = ("lorem ipsum dolor sit amet " * (kilobytes * 40))[:kilobytes * 1024]
+    operations = make_session(edits, len(text))
+
+    print(f"{edits:,} edits on a {kilobytes} KiB document")
+    print(f"{'history':>10} {'memory KiB':>12} {'undo steps':>12} {'time ms':>10}")
+    measure("snapshots", lambda: replay_snapshots(text, operations))
+    measure("deltas", lambda: replay_deltas(text, operations, UndoHistory(budget=1 << 30, coalesce_limit=0)))
+    measure("coalesced", lambda: replay_deltas(text, operations, UndoHistory(budget=1 << 30)))
+    measure("budget", lambda: replay_deltas(text, operations, UndoHistory(budget=64 * 1024)))
+
+
+if __name__ == "__main__":
+    main()
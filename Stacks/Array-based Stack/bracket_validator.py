@@ -0,0 +1,356 @@
+"""
+Streaming bracket validation built on ArrayStack.
+
+This module checks that the brackets in a byte stream are balanced and
+correctly nested, without loading the whole input into memory. Input is
+consumed in chunks from files or any iterable of bytes, and the offset of the
+first error is reported.
+
+Each chunk is first reduced to its bracket bytes with bytes.translate, which
+skips runs of other bytes at C speed, and adjacent matched pairs such as "()"
+are then removed with bytes.replace. What is left of chunks that only contain
+one bracket type is checked with a running depth counter. Only the remainder
+of chunks that mix bracket types goes through the stack one bracket at a time.
+When a chunk turns out to be invalid, it is scanned again in full to find the
+offset of the first error.
+
+Brackets inside string literals are not treated specially.
+"""
+
+import re
+from itertools import accumulate
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+from stack import ArrayStack
+
+DEFAULT_PAIRS = b'()[]{}'
+
+class ValidationResult:
+    """
+    The outcome of validating a stream.
+
+    A result is truthy when the stream is balanced.
+
+    Attributes:
+        valid (bool): True if every bracket was matched.
+        offset (Optional[int]): The byte offset of the first error, or None.
+            For unclosed brackets this is the length of the input.
+        message (str): A description of the first error, or "" if valid.
+    """
+
+    __slots__ = ('valid', 'offset', 'message')
+
+    def __init__(self, valid: bool, offset: Optional[int] = None, message: str = "") -> None:
+        """
+        Initialize a validation result.
+
+        Args:
+            valid: True if every bracket was matched.
+            offset: The byte offset of the first error, or None.
+            message: A description of the first error.
+        """
+        self.valid = valid
+        self.offset = offset
+        self.message = message
+
+    def __bool__(self) -> bool:
+        """Return True if the stream is balanced."""
+        return self.valid
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the result."""
+        if self.valid:
+            return "ValidationResult(valid=True)"
+        return f"ValidationResult(valid=False, offset={self.offset}, message={self.message!r})"
+
+class StreamingBracketValidator:
+    """
+    An incremental validator for brackets in a byte stream.
+
+    Feed chunks in order with feed, then call finish to get the result. The
+    validator keeps a stack of open brackets, run-length encoded as
+    [opener, count] entries, so a run of identical openers costs one entry.
+    After the first error, later chunks are ignored.
+
+    Attributes:
+        _stack (ArrayStack[List[int]]): Runs of open brackets.
+        _offset (int): The number of bytes consumed so far.
+        _error (Optional[ValidationResult]): The first error, if any.
+    """
+
+    def __init__(self, pairs: bytes = DEFAULT_PAIRS) -> None:
+        """
+        Initialize a validator.
+
+        Args:
+            pairs: Opening and closing bytes of each bracket type, in pairs
+                (default b'()[]{}').
+
+        Raises:
+            ValueError: If pairs does not consist of distinct byte pairs.
+        """
+        if len(pairs) % 2 or len(set(pairs)) != len(pairs) or not pairs:
+            raise ValueError("pairs must be a non-empty sequence of distinct opening/closing bytes")
+
+        openers = pairs[0::2]
+        closers = pairs[1::2]
+        self._openers = openers
+        self._closers = closers
+        self._match = {closer: opener for opener, closer in zip(openers, closers)}
+        self._closer_of = {opener: closer for opener, closer in zip(openers, closers)}
+
+        # Deletes every non-bracket byte
+        self._delete = bytes(b for b in range(256) if b not in pairs)
+        # Maps openers to +1 and closers to -1 (as signed bytes)
+        self._pair_bytes = [bytes((opener, closer)) for opener, closer in zip(openers, closers)]
+        self._closer_bytes = [bytes((closer,)) for closer in closers]
+        self._deltas = bytes.maketrans(openers + closers, b'\x01' * len(openers) + b'\xff' * len(closers))
+        self._bracket_re = re.compile(b'[' + re.escape(pairs) + b']')
+
+        self._stack: ArrayStack[List[int]] = ArrayStack()
+        self._offset = 0
+        self._error: Optional[ValidationResult] = None
+
+    @property
+    def offset(self) -> int:
+        """The number of bytes consumed so far."""
+        return self._offset
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Validate the next chunk of the stream.
+
+        Args:
+            chunk: The next bytes of the input.
+
+        Returns:
+            False if an error has been found (in this or an earlier chunk),
+            True otherwise.
+
+        Time complexity: O(m) in C plus O(r) in Python, where m is the chunk
+            length and r is the number of brackets left after reduction
+        Space complexity: O(m)
+        """
+        if self._error is not None:
+            return False
+
+        brackets = chunk.translate(None, self._delete)
+        reduced = self._reduce(brackets)
+        if reduced:
+            kinds = [opener for opener, closer in zip(self._openers, self._closers)
+                     if opener in reduced or closer in reduced]
+            if len(kinds) == 1:
+                valid = self._count_single(reduced, kinds[0])
+            else:
+                saved = self._save(sum(map(reduced.count, self._closer_bytes)))
+                valid = self._scan_mixed(reduced) is None
+                if not valid:
+                    self._restore(saved)
+            if not valid:
+                # Replay the whole chunk from the saved state to locate the error
+                self._record_error(chunk, brackets, *self._scan_mixed(brackets))
+                return False
+
+        self._offset += len(chunk)
+        return True
+
+    def finish(self) -> ValidationResult:
+        """
+        Finish validation and return the result.
+
+        Returns:
+            The first error found, an error for unclosed brackets, or a valid
+            result.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self._error is not None:
+            return self._error
+        if not self._stack.is_empty():
+            opener = self._stack.peek()[0]
+            unclosed = sum(run[1] for run in self._stack)
+            return ValidationResult(
+                False, self._offset,
+                f"{unclosed} unclosed bracket(s) at end of input, innermost {chr(opener)!r}",
+            )
+        return ValidationResult(True)
+
+    def _reduce(self, brackets: bytes) -> bytes:
+        """
+        Remove adjacent matched pairs such as "()" from a run of brackets.
+
+        An adjacent opener and closer of the same type always match each
+        other, so removing them does not change whether the input is valid.
+        Each round removes the innermost layer of nesting with bytes.replace,
+        at C speed. Rounds stop once they no longer shrink the input much.
+
+        Args:
+            brackets: The bracket bytes of a chunk.
+
+        Returns:
+            The bracket bytes with the innermost matched pairs removed.
+        """
+        pairs = self._pair_bytes
+        while len(brackets) > 1:
+            reduced = brackets
+            for pair in pairs:
+                reduced = reduced.replace(pair, b'')
+            removed = len(brackets) - len(reduced)
+            brackets = reduced
+            if removed * 16 < len(reduced):
+                break
+        return brackets
+
+    def _count_single(self, brackets: bytes, opener: int) -> bool:
+        """
+        Validate a chunk that only contains one bracket type, using a counter.
+
+        Closers in the chunk may consume the run of the same opener on top of
+        the stack, so the running depth may drop to minus that run's length.
+        The stack is only updated if the chunk is valid.
+
+        Args:
+            brackets: The bracket bytes of the chunk.
+            opener: The opening byte of the only bracket type in the chunk.
+
+        Returns:
+            True if the chunk is valid, False otherwise.
+        """
+        stack = self._stack
+        top = None if stack.is_empty() else stack.peek()
+        available = top[1] if top is not None and top[0] == opener else 0
+
+        deltas = memoryview(brackets.translate(self._deltas)).cast('b')
+        if min(accumulate(deltas)) < -available:
+            return False
+
+        net = sum(deltas)
+        if available:
+            top[1] += net
+            if top[1] == 0:
+                stack.pop()
+        elif net:
+            stack.push([opener, net])
+        return True
+
+    def _scan_mixed(self, brackets: bytes) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Validate a chunk that mixes bracket types, one bracket at a time.
+
+        Args:
+            brackets: The bracket bytes of the chunk.
+
+        Returns:
+            None if the chunk is valid, otherwise the index in brackets of the
+            first error and the opener that was expected there (or None).
+        """
+        stack = self._stack
+        match = self._match
+        top = None if stack.is_empty() else stack.peek()
+
+        for index, byte in enumerate(brackets):
+            if byte in match:
+                if top is None or top[0] != match[byte]:
+                    return index, None if top is None else top[0]
+                top[1] -= 1
+                if top[1] == 0:
+                    stack.pop()
+                    top = None if stack.is_empty() else stack.peek()
+            elif top is not None and top[0] == byte:
+                top[1] += 1
+            else:
+                top = [byte, 1]
+                stack.push(top)
+        return None
+
+    def _save(self, closers: int) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Save the part of the stack that a scan with the given closers can change.
+
+        Each closer changes at most one run, so only the top runs are copied.
+
+        Args:
+            closers: The number of closing brackets the scan will see.
+
+        Returns:
+            The stack size below the saved runs, and the saved runs.
+        """
+        stack = self._stack
+        count = min(closers, stack.size())
+        return stack.size() - count, [tuple(run) for run in stack.peek_n(count)]
+
+    def _restore(self, saved: Tuple[int, List[Tuple[int, int]]]) -> None:
+        """
+        Undo a scan by restoring the runs saved by _save.
+
+        Args:
+            saved: The value returned by _save before the scan.
+        """
+        base, runs = saved
+        stack = self._stack
+        while stack.size() > base:
+            stack.pop()
+        stack.push_many([list(run) for run in runs])
+
+    def _record_error(self, chunk: bytes, brackets: bytes, error_index: int,
+                      expected: Optional[int]) -> None:
+        """
+        Record the first error, finding its byte offset within the chunk.
+
+        This rescans the chunk with a regular expression, which only happens
+        once per stream.
+
+        Args:
+            chunk: The chunk containing the error.
+            brackets: The bracket bytes of the chunk.
+            error_index: The index in brackets of the offending closer.
+            expected: The opener whose closer was expected, or None if no
+                bracket was open.
+        """
+        for index, found in enumerate(self._bracket_re.finditer(chunk)):
+            if index == error_index:
+                position = found.start()
+                break
+
+        closer = chr(brackets[error_index])
+        if expected is None:
+            message = f"unexpected closing {closer!r}"
+        else:
+            message = f"mismatched {closer!r}, expected {chr(self._closer_of[expected])!r}"
+        self._error = ValidationResult(False, self._offset + position, message)
+
+def validate_chunks(chunks: Iterable[bytes], pairs: bytes = DEFAULT_PAIRS) -> ValidationResult:
+    """
+    Validate the brackets in a stream given as an iterable of byte chunks.
+
+    Args:
+        chunks: The input, in order.
+        pairs: Opening and closing bytes of each bracket type.
+
+    Returns:
+        The validation result.
+    """
+    validator = StreamingBracketValidator(pairs)
+    for chunk in chunks:
+        if not validator.feed(chunk):
+            break
+    return validator.finish()
+
+def validate_file(source: Union[str, BinaryIO], chunk_size: int = 1 << 20,
+                  pairs: bytes = DEFAULT_PAIRS) -> ValidationResult:
+    """
+    Validate the brackets in a file, reading it in chunks.
+
+    Args:
+        source: A path or a binary file object.
+        chunk_size: The number of bytes to read at a time (default 1 MiB).
+        pairs: Opening and closing bytes of each bracket type.
+
+    Returns:
+        The validation result.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            return validate_file(file, chunk_size, pairs)
+    return validate_chunks(iter(lambda: source.read(chunk_size), b''), pairs)
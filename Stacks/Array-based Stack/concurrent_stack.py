@@ -0,0 +1,417 @@
+"""
+Thread-safe stacks in Python.
+
+This module provides two structures for sharing work between threads:
+
+- ConcurrentStack: an ArrayStack guarded by its own lock, with a blocking
+  pop_wait that can wait for another thread to push.
+- WorkStealingDeque: a per-worker deque where the owning thread pushes and
+  pops at one end (LIFO, for locality) and idle threads steal from the other
+  end (FIFO, taking the oldest and usually largest tasks).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import TypeVar, Generic, Deque, Iterable, Iterator, List, Optional, Any
+
+from stack import ArrayStack, EmptyStackError
+
+T = TypeVar('T')
+
+class ConcurrentStack(ArrayStack[T]):
+    """
+    A thread-safe array-based stack.
+
+    Every operation holds the stack's own lock for the duration of a single
+    list operation, so threads only contend with each other when they touch
+    the same stack. pop behaves like ArrayStack.pop and raises
+    EmptyStackError on an empty stack, so a ConcurrentStack can replace an
+    ArrayStack unchanged; pop_wait waits for an element, like
+    queue.LifoQueue.get.
+
+    Type parameters:
+        T: The type of elements stored in the stack.
+
+    Attributes:
+        _data (List[T]): Internal list used to store stack elements.
+        _lock (threading.Lock): Lock guarding _data.
+        _not_empty (threading.Condition): Signalled when an element is pushed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty stack."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def push(self, item: T) -> None:
+        """
+        Add an element to the top of the stack and wake one waiting thread.
+
+        Args:
+            item: The element to add to the stack.
+
+        Time complexity: O(1) amortized
+        Space complexity: O(1)
+        """
+        with self._not_empty:
+            self._data.append(item)
+            self._not_empty.notify()
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """
+        Add several elements to the top of the stack as one atomic operation.
+
+        Args:
+            items: An iterable of elements to add to the stack.
+
+        Time complexity: O(k) amortized, where k is the number of elements
+        Space complexity: O(k)
+        """
+        items = list(items)
+        with self._not_empty:
+            self._data.extend(items)
+            self._not_empty.notify(len(items))
+
+    def pop(self) -> T:
+        """
+        Remove and return the element at the top of the stack without waiting.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        with self._lock:
+            return super().pop()
+
+    def pop_wait(self, timeout: Optional[float] = None) -> T:
+        """
+        Remove and return the element at the top of the stack, waiting for one if it is empty.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait
+                indefinitely.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If no element was pushed before the timeout expired.
+            ValueError: If timeout is negative.
+
+        Time complexity: O(1), plus any time spent waiting
+        Space complexity: O(1)
+        """
+        with self._not_empty:
+            data = self._data
+            if not data:
+                if timeout is None:
+                    while not data:
+                        self._not_empty.wait()
+                elif timeout < 0:
+                    raise ValueError("timeout must be a non-negative number")
+                else:
+                    deadline = time.monotonic() + timeout
+                    while not data:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise EmptyStackError("Timed out waiting for an element")
+                        self._not_empty.wait(remaining)
+            return data.pop()
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Remove and return the top n elements as one atomic operation.
+
+        This method does not block.
+
+        Args:
+            n: The number of elements to remove.
+
+        Returns:
+            A list of the removed elements, with the former top last.
+
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            return super().pop_many(n)
+
+    def peek(self) -> T:
+        """
+        Return the element at the top of the stack without removing it.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        with self._lock:
+            return super().peek()
+
+    def peek_n(self, n: int) -> List[T]:
+        """
+        Return the top n elements of the stack without removing them.
+
+        Args:
+            n: The number of elements to return.
+
+        Returns:
+            A list of the top n elements, with the top of the stack last.
+
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            return super().peek_n(n)
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Return an iterator over a snapshot of the stack, from top to bottom.
+
+        Returns:
+            An iterator over the elements present when it was created.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            snapshot = self._data[:]
+        return reversed(snapshot)
+
+    def iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """
+        Return an iterator over a snapshot of the stack in slices of up to size elements.
+
+        The slices are in stack order from bottom to top, as in
+        ArrayStack.iter_chunks.
+
+        Args:
+            size: The maximum number of elements per slice.
+
+        Returns:
+            An iterator over lists of the elements present when it was created.
+
+        Raises:
+            ValueError: If size is not positive.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        with self._lock:
+            snapshot = self._data[:]
+        return (snapshot[start:start + size] for start in range(0, len(snapshot), size))
+
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Convert the stack contents to a NumPy array, bottom to top, under the lock.
+
+        Args:
+            dtype: The NumPy dtype of the array, or None to infer it.
+
+        Returns:
+            A new numpy.ndarray with the top of the stack last.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            return super().to_numpy(dtype)
+
+    def __contains__(self, item: T) -> bool:
+        """
+        Check if an item is in the stack.
+
+        Args:
+            item: The item to check for.
+
+        Returns:
+            True if the item is in the stack, False otherwise.
+
+        Time complexity: O(n)
+        Space complexity: O(1)
+        """
+        with self._lock:
+            return item in self._data
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the stack, taken under the lock.
+
+        Returns:
+            A string representation showing the stack contents from top to bottom.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            return super().__str__()
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the stack, taken under the lock.
+
+        Returns:
+            A string representation that could be used to recreate the stack.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        with self._lock:
+            return super().__repr__()
+
+class WorkStealingDeque(Generic[T]):
+    """
+    A work-stealing deque for one owner thread and any number of thieves.
+
+    The owner pushes and pops tasks at the bottom, so it works depth-first on
+    its most recent (cache-warm) tasks. Other threads call steal to take the
+    oldest task from the top when they run out of work.
+
+    The deque is backed by collections.deque, whose append, pop and popleft
+    operations are atomic, including on free-threaded builds. No lock is
+    taken, and when the owner and a thief race for the last task exactly one
+    of them gets it.
+
+    Type parameters:
+        T: The type of tasks stored in the deque.
+
+    Attributes:
+        _tasks (Deque[T]): The tasks, oldest on the left.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty work-stealing deque."""
+        self._tasks: Deque[T] = deque()
+
+    def push(self, task: T) -> None:
+        """
+        Add a task at the owner's end. Only the owner thread should call this.
+
+        Args:
+            task: The task to add.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._tasks.append(task)
+
+    def pop(self) -> T:
+        """
+        Remove and return the newest task. Only the owner thread should call this.
+
+        Returns:
+            The most recently pushed task.
+
+        Raises:
+            EmptyStackError: If the deque is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        try:
+            return self._tasks.pop()
+        except IndexError:
+            raise EmptyStackError("Cannot pop from an empty deque") from None
+
+    def steal(self) -> T:
+        """
+        Remove and return the oldest task. Any thread may call this.
+
+        Returns:
+            The least recently pushed task.
+
+        Raises:
+            EmptyStackError: If the deque is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        try:
+            return self._tasks.popleft()
+        except IndexError:
+            raise EmptyStackError("Cannot steal from an empty deque") from None
+
+    def is_empty(self) -> bool:
+        """
+        Check if the deque is empty.
+
+        The answer may be out of date as soon as it is returned if other
+        threads are using the deque.
+
+        Returns:
+            True if the deque contains no tasks, False otherwise.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return not self._tasks
+
+    def size(self) -> int:
+        """
+        Return the number of tasks in the deque.
+
+        Returns:
+            The number of tasks.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return len(self._tasks)
+
+    def __len__(self) -> int:
+        """
+        Return the number of tasks in the deque.
+
+        Returns:
+            The number of tasks.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return len(self._tasks)
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the deque.
+
+        Returns:
+            A string listing the tasks from oldest to newest.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        return f"{self.__class__.__name__}({list(self._tasks)!r})"
@@ -0,0 +1,579 @@
+"""
+Stack-based expression compiler and evaluator.
+
+This module compiles infix expressions such as "price * qty > limit and not
+blocked" into postfix programs with the shunting-yard algorithm, using
+ArrayStack for the operator stack. A compiled Program can then be evaluated
+against many sets of variable bindings without parsing the source again.
+
+Compiled programs are cached by source text in an LRU cache, so code that
+evaluates the same expressions over and over can simply call evaluate.
+
+Supported syntax:
+
+- numbers (1, 2.5, 1e-3), variables, and the literals true and false
+- arithmetic: + - * / // % ** and unary - +
+- comparisons: < <= > >= == != (left-associative, not chained)
+- logic: and, or, not (and/or short-circuit, as in Python)
+- function calls: abs, min, max, round, sqrt, floor, ceil, exp, log
+"""
+
+import math
+import operator
+import re
+from functools import lru_cache
+from itertools import compress, islice, repeat
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from stack import ArrayStack
+
+CACHE_SIZE = 1024
+MAX_FOLD_BITS = 128  # Largest integer constant folding may create, as in CPython's optimizer
+
+# Instruction kinds
+LOAD, CONST, UNARY, BINARY, CALL, JUMP_IF_FALSE, JUMP_IF_TRUE, LABEL = range(8)
+
+# Binary operators: symbol -> (precedence, right-associative, function)
+# and/or have no function: they compile to jumps (see LOGICAL_JUMPS)
+BINARY_OPERATORS: Dict[str, Tuple[int, bool, Optional[Callable[[Any, Any], Any]]]] = {
+    'or': (1, False, None),
+    'and': (2, False, None),
+    '<': (4, False, operator.lt),
+    '<=': (4, False, operator.le),
+    '>': (4, False, operator.gt),
+    '>=': (4, False, operator.ge),
+    '==': (4, False, operator.eq),
+    '!=': (4, False, operator.ne),
+    '+': (5, False, operator.add),
+    '-': (5, False, operator.sub),
+    '*': (6, False, operator.mul),
+    '/': (6, False, operator.truediv),
+    '//': (6, False, operator.floordiv),
+    '%': (6, False, operator.mod),
+    '**': (8, True, operator.pow),
+}
+
+# Prefix operators: symbol -> (precedence, function)
+UNARY_OPERATORS: Dict[str, Tuple[int, Callable[[Any], Any]]] = {
+    'not': (3, operator.not_),
+    '-': (7, operator.neg),
+    '+': (7, operator.pos),
+}
+
+# Functions: name -> (function, minimum arguments, maximum arguments or None)
+FUNCTIONS: Dict[str, Tuple[Callable[..., Any], int, Optional[int]]] = {
+    'abs': (abs, 1, 1),
+    'min': (min, 1, None),
+    'max': (max, 1, None),
+    'round': (round, 1, 2),
+    'sqrt': (math.sqrt, 1, 1),
+    'floor': (math.floor, 1, 1),
+    'ceil': (math.ceil, 1, 1),
+    'exp': (math.exp, 1, 1),
+    'log': (math.log, 1, 2),
+}
+
+# Short-circuit operators: symbol -> the jump that skips the right operand
+LOGICAL_JUMPS = {'and': JUMP_IF_FALSE, 'or': JUMP_IF_TRUE}
+
+LITERALS = {'true': True, 'false': False}
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<symbol>\*\*|//|<=|>=|==|!=|[-+*/%<>(),])
+    )""", re.VERBOSE)
+
+class ExpressionError(Exception):
+    """
+    Exception raised when an expression cannot be compiled.
+
+    Attributes:
+        position (int): The offset in the source where the error was found.
+    """
+
+    def __init__(self, message: str, position: int) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            message: A description of the error.
+            position: The offset in the source where the error was found.
+        """
+        super().__init__(f"{message} at position {position}")
+        self.position = position
+
+class Program:
+    """
+    A compiled postfix program for one expression.
+
+    A program is a tuple of (kind, argument) instructions that runs on a
+    value stack: LOAD pushes a variable, CONST pushes a constant, and UNARY,
+    BINARY and CALL replace their operands with the result. and/or compile
+    to JUMP_IF_FALSE/JUMP_IF_TRUE after the left operand: if the left value
+    decides the result, the jump keeps it and skips the right operand (its
+    argument is the number of instructions to skip) to a LABEL, which does
+    nothing; otherwise it pops the left value. Programs are immutable and
+    may be shared between threads.
+
+    Attributes:
+        source (str): The expression the program was compiled from.
+        variables (Tuple[str, ...]): The variables the program reads, in
+            order of first use.
+        _code (Tuple[Tuple[int, Any], ...]): The instructions.
+        _text (Tuple[str, ...]): The postfix token of each instruction.
+    """
+
+    __slots__ = ('source', 'variables', '_code', '_text')
+
+    def __init__(self, source: str, code: List[Tuple[int, Any]], text: List[str]) -> None:
+        """
+        Initialize a program from compiled instructions.
+
+        Args:
+            source: The expression the program was compiled from.
+            code: The instructions, in postfix order.
+            text: The postfix token of each instruction.
+        """
+        self.source = source
+        self._code = tuple(code)
+        self._text = tuple(text)
+        self.variables = tuple(dict.fromkeys(arg for kind, arg in code if kind == LOAD))
+
+    @property
+    def postfix(self) -> str:
+        """The program in postfix notation, e.g. "a b 2 * +"."""
+        return " ".join(token for token in self._text if token)
+
+    def evaluate(self, bindings: Mapping[str, Any]) -> Any:
+        """
+        Evaluate the program with one set of variable values.
+
+        The program was checked when it was compiled, so the value stack can
+        never underflow, and a plain list is used for speed.
+
+        Args:
+            bindings: A mapping from variable names to values.
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            KeyError: If a variable is missing from bindings.
+
+        Time complexity: O(p), where p is the number of instructions
+        Space complexity: O(p)
+        """
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+        code = iter(self._code)
+        for kind, arg in code:
+            if kind == LOAD:
+                push(bindings[arg])
+            elif kind == CONST:
+                push(arg)
+            elif kind == BINARY:
+                right = pop()
+                stack[-1] = arg(stack[-1], right)
+            elif kind == UNARY:
+                stack[-1] = arg(stack[-1])
+            elif kind == CALL:
+                function, count = arg
+                args = stack[-count:]
+                del stack[-count:]
+                push(function(*args))
+            elif kind == JUMP_IF_FALSE:
+                if stack[-1]:
+                    pop()
+                else:
+                    next(islice(code, arg, arg), None)  # Skip the right operand
+            elif kind == JUMP_IF_TRUE:
+                if stack[-1]:
+                    next(islice(code, arg, arg), None)
+                else:
+                    pop()
+        return stack[0]
+
+    def evaluate_many(self, rows: Iterable[Mapping[str, Any]]) -> List[Any]:
+        """
+        Evaluate the program once for each set of variable values.
+
+        Args:
+            rows: An iterable of mappings from variable names to values.
+
+        Returns:
+            A list with the value of the expression for each row.
+
+        Time complexity: O(r * p), where r is the number of rows
+        Space complexity: O(r + p)
+        """
+        evaluate = self.evaluate
+        return [evaluate(row) for row in rows]
+
+    def evaluate_columns(self, columns: Mapping[str, Sequence[Any]],
+                         length: Optional[int] = None) -> List[Any]:
+        """
+        Evaluate the program over columns of values at once.
+
+        Row i of the result uses element i of every column. The program runs
+        once, with a whole column on the stack in place of each value: every
+        instruction chains a map over its operand columns, so the work per
+        element happens in C and the result is built in one final pass. The
+        right operand of and/or is evaluated only over the rows whose left
+        value does not decide the result, as evaluate would.
+
+        Args:
+            columns: A mapping from variable names to equal-length sequences.
+            length: The number of rows. Only needed when the program reads
+                no variables; otherwise the shortest column is used.
+
+        Returns:
+            A list with the value of the expression for each row.
+
+        Raises:
+            KeyError: If a variable is missing from columns.
+            ValueError: If the program reads no variables and length is None.
+
+        Time complexity: O(r * p), with a much smaller constant than evaluate_many
+        Space complexity: O(r + p)
+        """
+        if not self.variables:
+            if length is None:
+                raise ValueError("length is required for a program without variables")
+            return [self.evaluate({})] * length
+        if length is None:
+            length = min(len(columns[name]) for name in self.variables)
+        return list(islice(self._run_columns(self._code, columns, length), length))
+
+    @staticmethod
+    def _run_columns(code: Sequence[Tuple[int, Any]], columns: Mapping[str, Sequence[Any]],
+                     length: int) -> Iterable[Any]:
+        """
+        Run instructions over columns of length rows and return the result column.
+
+        A jump materializes its left column, runs the right operand's
+        instructions over just the rows that need it, and merges the two.
+        """
+        stack: List[Iterable[Any]] = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        while pc < len(code):
+            kind, arg = code[pc]
+            pc += 1
+            if kind == LOAD:
+                push(columns[arg])
+            elif kind == CONST:
+                push(repeat(arg))
+            elif kind == BINARY:
+                right = pop()
+                stack[-1] = map(arg, stack[-1], right)
+            elif kind == UNARY:
+                stack[-1] = map(arg, stack[-1])
+            elif kind == CALL:
+                function, count = arg
+                args = stack[-count:]
+                del stack[-count:]
+                push(map(function, *args))
+            elif kind == JUMP_IF_FALSE or kind == JUMP_IF_TRUE:
+                left = list(islice(pop(), length))
+                if kind == JUMP_IF_FALSE:
+                    needed = [bool(value) for value in left]
+                else:
+                    needed = [not value for value in left]
+                operand = code[pc:pc + arg]
+                selected = {name: list(compress(columns[name], needed))
+                            for op, name in operand if op == LOAD}
+                right = iter(Program._run_columns(operand, selected, sum(needed)))
+                push([next(right) if need else value for value, need in zip(left, needed)])
+                pc += arg
+        return stack[0]
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the program.
+
+        Returns:
+            A string showing the source expression.
+        """
+        return f"{self.__class__.__name__}({self.source!r})"
+
+def _tokenize(source: str) -> List[Tuple[str, str, int]]:
+    """
+    Split an expression into tokens.
+
+    Args:
+        source: The expression.
+
+    Returns:
+        A list of (kind, text, position) tuples, where kind is 'number',
+        'name' or 'symbol'.
+
+    Raises:
+        ExpressionError: If the source contains an invalid character.
+    """
+    tokens = []
+    position = 0
+    end = len(source.rstrip())
+    while position < end:
+        found = _TOKEN_RE.match(source, position)
+        if found is None or found.lastgroup is None:
+            start = len(source) - len(source[position:].lstrip())
+            raise ExpressionError(f"unexpected character {source[start]!r}", start)
+        tokens.append((found.lastgroup, found.group(found.lastgroup), found.start(found.lastgroup)))
+        position = found.end()
+    return tokens
+
+def _fold_is_small(function: Callable[..., Any], values: List[Any]) -> bool:
+    """
+    Check that folding a * b or a ** b over integers stays within MAX_FOLD_BITS.
+
+    Without the check, a constant such as 9 ** 9 ** 9 would take minutes to
+    compute at compile time, even in an operand that never runs.
+    """
+    if function not in (operator.mul, operator.pow) or not all(type(v) in (int, bool) for v in values):
+        return True
+    left, right = values
+    if function is operator.mul:
+        return left.bit_length() + right.bit_length() <= MAX_FOLD_BITS
+    return right <= 0 or left.bit_length() * right <= MAX_FOLD_BITS
+
+def _emit(code: List[Tuple[int, Any]], text: List[str], kind: int, arg: Any,
+          token: str, operands: int) -> None:
+    """
+    Append an instruction, folding it into a constant if its operands are constant.
+
+    Integer products and powers are only folded while the result stays
+    small (see _fold_is_small); larger ones are computed at evaluation time.
+
+    Args:
+        code: The instructions so far.
+        text: The postfix tokens so far.
+        kind: The instruction kind.
+        arg: The instruction argument.
+        token: The postfix token of the instruction.
+        operands: The number of values the instruction consumes.
+    """
+    if operands and len(code) >= operands and all(k == CONST for k, _ in code[-operands:]):
+        values = [value for _, value in code[-operands:]]
+        if kind == BINARY and not _fold_is_small(arg, values):
+            code.append((kind, arg))
+            text.append(token)
+            return
+        try:
+            if kind == CALL:
+                result = arg[0](*values)
+            else:
+                result = arg(*values)
+        except (ArithmeticError, ValueError, TypeError):
+            # Leave the error to be raised at evaluation time
+            pass
+        else:
+            del code[-operands:]
+            del text[-operands:]
+            code.append((CONST, result))
+            text.append(repr(result))
+            return
+    code.append((kind, arg))
+    text.append(token)
+
+def _patch_jump(code: List[Tuple[int, Any]], text: List[str], index: int, symbol: str) -> None:
+    """
+    Finish an and/or once its right operand is compiled.
+
+    The jump at index is pointed past the right operand, to a new LABEL
+    instruction. If the left operand is a constant, the jump is folded away
+    instead, keeping whichever operand is the result.
+
+    Args:
+        code: The instructions so far.
+        text: The postfix tokens so far.
+        index: The position of the operator's jump instruction.
+        symbol: 'and' or 'or'.
+    """
+    left_kind, left_value = code[index - 1]
+    if left_kind == CONST:
+        if bool(left_value) == (symbol == 'or'):
+            # The left operand is the result
+            del code[index:]
+            del text[index:]
+        else:
+            del code[index - 1:index + 1]
+            del text[index - 1:index + 1]
+        return
+    code[index] = (code[index][0], len(code) - index - 1)
+    code.append((LABEL, None))
+    text.append(symbol)
+
+def _emit_call(code: List[Tuple[int, Any]], text: List[str], name: str,
+               count: int, position: int) -> None:
+    """
+    Append a function call instruction after checking its argument count.
+
+    Args:
+        code: The instructions so far.
+        text: The postfix tokens so far.
+        name: The function name.
+        count: The number of arguments passed.
+        position: The offset of the function name in the source.
+
+    Raises:
+        ExpressionError: If the function does not accept count arguments.
+    """
+    function, minimum, maximum = FUNCTIONS[name]
+    if count < minimum or (maximum is not None and count > maximum):
+        raise ExpressionError(f"wrong number of arguments for {name}()", position)
+    _emit(code, text, CALL, (function, count), f"{name}/{count}", count)
+
+def _compile(source: str) -> Program:
+    """
+    Compile an expression with the shunting-yard algorithm.
+
+    Operators wait on an ArrayStack until an operator of lower precedence (or
+    a closing parenthesis) arrives, then move to the output. A second stack
+    counts the arguments of each function call being parsed.
+
+    Args:
+        source: The expression.
+
+    Returns:
+        The compiled program.
+
+    Raises:
+        ExpressionError: If the expression is not valid.
+    """
+    code: List[Tuple[int, Any]] = []
+    text: List[str] = []
+    # Entries are (kind, symbol, position), kind being 'binary', 'unary', 'call' or '('
+    operators: ArrayStack[Tuple[str, str, int]] = ArrayStack()
+    arg_counts: ArrayStack[int] = ArrayStack()
+    # The position in code of the jump of each and/or on the operator stack
+    jumps: ArrayStack[int] = ArrayStack()
+    expect_operand = True
+
+    def emit_operator(entry: Tuple[str, str, int]) -> None:
+        kind, symbol, position = entry
+        if kind == 'binary' and symbol in LOGICAL_JUMPS:
+            _patch_jump(code, text, jumps.pop(), symbol)
+        elif kind == 'binary':
+            _emit(code, text, BINARY, BINARY_OPERATORS[symbol][2], symbol, 2)
+        elif kind == 'unary':
+            _emit(code, text, UNARY, UNARY_OPERATORS[symbol][1], 'neg' if symbol == '-' else symbol, 1)
+        else:
+            raise ExpressionError("unmatched '('", position)
+
+    def in_call() -> bool:
+        # True if the innermost open parenthesis belongs to a function call
+        return operators.size() > 1 and operators.peek_n(2)[0][0] == 'call'
+
+    for kind, token, position in _tokenize(source):
+        after_call = not operators.is_empty() and operators.peek()[0] == 'call'
+        if after_call and token != '(':
+            raise ExpressionError(f"expected '(' after {operators.peek()[1]}", position)
+
+        if expect_operand:
+            if kind == 'number':
+                value = float(token) if any(c in token for c in '.eE') else int(token)
+                _emit(code, text, CONST, value, token, 0)
+                expect_operand = False
+            elif kind == 'name' and token in LITERALS:
+                _emit(code, text, CONST, LITERALS[token], token, 0)
+                expect_operand = False
+            elif kind == 'name' and token in FUNCTIONS:
+                operators.push(('call', token, position))
+            elif token in UNARY_OPERATORS:
+                operators.push(('unary', token, position))
+            elif kind == 'name' and token not in BINARY_OPERATORS:
+                _emit(code, text, LOAD, token, token, 0)
+                expect_operand = False
+            elif token == '(':
+                if after_call:
+                    arg_counts.push(1)
+                operators.push(('(', token, position))
+            else:
+                raise ExpressionError(f"expected an operand, found {token!r}", position)
+        elif token in BINARY_OPERATORS:
+            precedence, right_associative, _ = BINARY_OPERATORS[token]
+            while not operators.is_empty():
+                top_kind, top_symbol, _ = operators.peek()
+                if top_kind == 'binary':
+                    top_precedence = BINARY_OPERATORS[top_symbol][0]
+                elif top_kind == 'unary':
+                    top_precedence = UNARY_OPERATORS[top_symbol][0]
+                else:
+                    break
+                if top_precedence < precedence or (top_precedence == precedence and right_associative):
+                    break
+                emit_operator(operators.pop())
+            if token in LOGICAL_JUMPS:
+                # The left operand is complete; the jump is patched once the right one is
+                jumps.push(len(code))
+                code.append((LOGICAL_JUMPS[token], 0))
+                text.append('')
+            operators.push(('binary', token, position))
+            expect_operand = True
+        elif token in (')', ','):
+            while not operators.is_empty() and operators.peek()[0] != '(':
+                emit_operator(operators.pop())
+            if operators.is_empty() or (token == ',' and not in_call()):
+                raise ExpressionError(f"unexpected {token!r}", position)
+            if token == ',':
+                arg_counts.push(arg_counts.pop() + 1)
+                expect_operand = True
+            else:
+                call = in_call()
+                operators.pop()
+                if call:
+                    _, name, call_position = operators.pop()
+                    _emit_call(code, text, name, arg_counts.pop(), call_position)
+        else:
+            raise ExpressionError(f"expected an operator, found {token!r}", position)
+
+    if expect_operand:
+        raise ExpressionError("unexpected end of expression", len(source))
+    while not operators.is_empty():
+        emit_operator(operators.pop())
+    return Program(source, code, text)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(source: str) -> Program:
+    """
+    Compile an expression, reusing the program if it was compiled recently.
+
+    Programs are kept in an LRU cache keyed by source text. Use
+    compile_expression.cache_info() to inspect it and
+    compile_expression.cache_clear() to empty it.
+
+    Args:
+        source: The expression.
+
+    Returns:
+        The compiled program.
+
+    Raises:
+        ExpressionError: If the expression is not valid.
+
+    Time complexity: O(1) on a cache hit, O(n) otherwise, where n is the
+        length of the source
+    Space complexity: O(n)
+    """
+    return _compile(source)
+
+def evaluate(source: str, bindings: Mapping[str, Any]) -> Any:
+    """
+    Compile (or fetch from the cache) an expression and evaluate it.
+
+    Args:
+        source: The expression.
+        bindings: A mapping from variable names to values.
+
+    Returns:
+        The value of the expression.
+
+    Raises:
+        ExpressionError: If the expression is not valid.
+        KeyError: If a variable is missing from bindings.
+    """
+    return compile_expression(source).evaluate(bindings)
@@ -0,0 +1,273 @@
+"""
+Aggregate-tracking stacks in Python.
+
+This module provides stacks that keep a running aggregate of their contents
+alongside the stored elements, so that queries such as "what is the smallest
+element on the stack?" are answered in O(1) instead of scanning the stack.
+
+- MonoidStack: aggregates with any associative binary operation.
+- MinStack: tracks the minimum element.
+- MaxStack: tracks the maximum element.
+"""
+
+from typing import TypeVar, Callable, Iterable, List, Any
+
+from stack import ArrayStack, EmptyStackError
+
+T = TypeVar('T')
+
+class MonoidStack(ArrayStack[T]):
+    """
+    An array-based stack that maintains the aggregate of all its elements.
+
+    The aggregate of a stack holding a1, ..., an (bottom to top) is
+    op(...op(op(a1, a2), a3)..., an). Since elements only enter and leave at
+    the top, the aggregate of every prefix is stored next to the stack and the
+    current aggregate is always the one for the top element.
+
+    In compressed mode the prefix aggregates are run-length encoded: a new
+    entry is only stored when pushing changes the aggregate, and otherwise the
+    repeat count of the current entry is incremented. For operations such as
+    min and max, where most pushes leave the aggregate unchanged, this stores
+    only the changes of the extreme.
+
+    Type parameters:
+        T: The type of elements stored in the stack.
+
+    Attributes:
+        _data (List[T]): Internal list used to store stack elements.
+        _op (Callable[[T, T], T]): Associative operation used to aggregate.
+        _compressed (bool): Whether the prefix aggregates are run-length encoded.
+        _aggregates (List[T]): Prefix aggregates (one per element, or one per run).
+        _counts (List[int]): Run lengths of _aggregates (compressed mode only).
+    """
+
+    def __init__(self, op: Callable[[T, T], T], compressed: bool = False) -> None:
+        """
+        Initialize an empty aggregate-tracking stack.
+
+        Args:
+            op: An associative binary operation, such as min, max or operator.add.
+            compressed: If True, store only changes of the aggregate.
+        """
+        super().__init__()
+        self._op = op
+        self._compressed = compressed
+        self._aggregates: List[T] = []
+        self._counts: List[int] = []
+
+    def push(self, item: T) -> None:
+        """
+        Add an element to the top of the stack and update the aggregate.
+
+        Args:
+            item: The element to add to the stack.
+
+        Time complexity: O(1) amortized
+        Space complexity: O(1)
+        """
+        aggregates = self._aggregates
+        if aggregates:
+            value = self._op(aggregates[-1], item)
+        else:
+            value = item
+
+        self._data.append(item)
+        if not self._compressed:
+            aggregates.append(value)
+        elif aggregates and aggregates[-1] == value:
+            self._counts[-1] += 1
+        else:
+            aggregates.append(value)
+            self._counts.append(1)
+
+    def pop(self) -> T:
+        """
+        Remove and return the element at the top of the stack.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        item = super().pop()
+        if not self._compressed:
+            self._aggregates.pop()
+        elif self._counts[-1] == 1:
+            self._aggregates.pop()
+            self._counts.pop()
+        else:
+            self._counts[-1] -= 1
+        return item
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """
+        Add several elements to the top of the stack, in order.
+
+        Args:
+            items: An iterable of elements to add to the stack.
+
+        Time complexity: O(k) amortized, where k is the number of elements
+        Space complexity: O(k)
+        """
+        push = self.push
+        for item in items:
+            push(item)
+
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Remove and return the top n elements of the stack.
+
+        Args:
+            n: The number of elements to remove.
+
+        Returns:
+            A list of the removed elements, with the former top last.
+
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        items = super().pop_many(n)
+        if not self._compressed:
+            del self._aggregates[len(self._data):]
+            return items
+
+        # Drop whole runs while they fit in the batch, then shorten the last one
+        remaining = n
+        counts = self._counts
+        while remaining and counts[-1] <= remaining:
+            remaining -= counts.pop()
+            self._aggregates.pop()
+        if remaining:
+            counts[-1] -= remaining
+        return items
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        super().clear()
+        self._aggregates.clear()
+        self._counts.clear()
+
+    @classmethod
+    def from_numpy(cls, arr: Any, *args: Any, **kwargs: Any) -> 'MonoidStack[T]':
+        """
+        Create a stack from the items of a NumPy array along its first axis.
+
+        The items are pushed in order, so the last item ends up on top and
+        the aggregates are computed as they are pushed.
+
+        Args:
+            arr: A NumPy array with at least one dimension.
+            *args: Arguments for the constructor, such as op for MonoidStack.
+            **kwargs: Keyword arguments for the constructor, such as compressed.
+
+        Returns:
+            A new stack holding the array's items.
+
+        Raises:
+            ValueError: If the array is zero-dimensional.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if arr.ndim == 0:
+            raise ValueError("Cannot create a stack from a zero-dimensional array")
+        stack = cls(*args, **kwargs)
+        stack.push_many(arr.tolist())
+        return stack
+
+    def get_aggregate(self) -> T:
+        """
+        Return the aggregate of all elements in the stack.
+
+        Returns:
+            The result of folding op over the stack from bottom to top.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self.is_empty():
+            raise EmptyStackError("Cannot aggregate an empty stack")
+        return self._aggregates[-1]
+
+class MinStack(MonoidStack[T]):
+    """
+    A stack that can return its minimum element in O(1) time.
+
+    Elements must support ordering with <.
+    """
+
+    def __init__(self, compressed: bool = False) -> None:
+        """
+        Initialize an empty min stack.
+
+        Args:
+            compressed: If True, store only changes of the minimum.
+        """
+        super().__init__(min, compressed)
+
+    def get_min(self) -> T:
+        """
+        Return the minimum element in the stack.
+
+        Returns:
+            The smallest element currently on the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self.is_empty():
+            raise EmptyStackError("Cannot get the minimum of an empty stack")
+        return self._aggregates[-1]
+
+class MaxStack(MonoidStack[T]):
+    """
+    A stack that can return its maximum element in O(1) time.
+
+    Elements must support ordering with <.
+    """
+
+    def __init__(self, compressed: bool = False) -> None:
+        """
+        Initialize an empty max stack.
+
+        Args:
+            compressed: If True, store only changes of the maximum.
+        """
+        super().__init__(max, compressed)
+
+    def get_max(self) -> T:
+        """
+        Return the maximum element in the stack.
+
+        Returns:
+            The largest element currently on the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self.is_empty():
+            raise EmptyStackError("Cannot get the maximum of an empty stack")
+        return self._aggregates[-1]
@@ -0,0 +1,418 @@
+"""
+Disk-spilling Stack implementation in Python.
+
+This module provides a stack for workloads that are too deep to fit in memory,
+such as iterative depth-first search over very large graphs. The top of the
+stack is kept in an in-memory list, and older elements are paged out in
+segments to a memory-mapped temporary file, so RAM use stays bounded no matter
+how deep the stack grows.
+"""
+
+import mmap
+import pickle
+import struct
+import tempfile
+from typing import TypeVar, Generic, List, Iterator, Optional, Tuple, Any
+
+from stack import EmptyStackError
+
+T = TypeVar('T')
+
+_INITIAL_FILE_SIZE = 1 << 20  # 1 MiB
+
+class SpillingStack(Generic[T]):
+    """
+    A stack that keeps its top in memory and spills cold elements to disk.
+
+    Elements are pushed onto an in-memory "hot" list. When the hot list holds
+    more than hot_limit elements, its oldest segment_size elements are
+    serialized into a memory-mapped temporary file. When the hot list runs
+    empty, the most recently spilled segment is loaded back. Only the top of
+    the stack is ever accessed, so each element is written and read at most
+    once per spill, and a spilled segment is a single sequential write.
+
+    Segments are serialized in one of two ways:
+
+    - Fixed-width records: with record_format set to a struct format (for
+      example 'q' for integers or 'qq' for (node, edge) frames), each element
+      is packed into a fixed number of bytes. Formats with several fields
+      store tuples. This is compact and fast.
+    - Length-prefixed records: without a record_format, each segment is
+      pickled into a single variable-length record whose offset and length are
+      kept in the segment index. Any picklable element can be stored.
+
+    The stack holds a temporary file, so close it (or use it as a context
+    manager) when done. The file is removed automatically when closed.
+
+    Type parameters:
+        T: The type of elements stored in the stack.
+
+    Attributes:
+        _hot (List[T]): In-memory top of the stack, bottom to top.
+        _segments (List[Tuple[int, int]]): (offset, byte length) of each
+            spilled segment, oldest first.
+        _spilled (int): The number of elements stored on disk.
+    """
+
+    def __init__(self, hot_limit: int = 1_000_000, segment_size: Optional[int] = None,
+                 record_format: Optional[str] = None, directory: Optional[str] = None) -> None:
+        """
+        Initialize an empty spilling stack.
+
+        Args:
+            hot_limit: The maximum number of elements kept in memory.
+            segment_size: The number of elements moved to or from disk at a
+                time (default hot_limit // 2). Must not exceed hot_limit.
+            record_format: A struct format for fixed-width records, or None to
+                pickle each segment as a length-prefixed record.
+            directory: The directory for the temporary file (default: the
+                system temporary directory).
+
+        Raises:
+            ValueError: If hot_limit or segment_size is out of range.
+            struct.error: If record_format is not a valid struct format.
+        """
+        if segment_size is None:
+            segment_size = max(1, hot_limit // 2)
+        if hot_limit < 1:
+            raise ValueError("hot_limit must be at least 1")
+        if not 1 <= segment_size <= hot_limit:
+            raise ValueError("segment_size must be between 1 and hot_limit")
+
+        self._hot: List[T] = []
+        self._hot_limit = hot_limit
+        self._segment_size = segment_size
+        self._segments: List[Tuple[int, int]] = []
+        self._spilled = 0
+
+        self._record: Optional[struct.Struct] = None
+        self._segment_record: Optional[struct.Struct] = None
+        self._single_field = False
+        if record_format is not None:
+            self._record = struct.Struct(record_format)
+            fields = len(self._record.unpack(bytes(self._record.size)))
+            self._single_field = fields == 1
+            prefix = record_format[0] if record_format[0] in '@=<>!' else ''
+            code = record_format[len(prefix):]
+            if self._single_field and len(code) == 1 and code not in 'sp':
+                # A whole segment can be packed with one repeated format
+                # (a count before 's' or 'p' is a byte length, not a repeat)
+                self._segment_record = struct.Struct(f"{prefix}{segment_size}{code}")
+
+        self._directory = directory
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._end = 0  # Offset just past the last spilled segment
+
+    @property
+    def spilled(self) -> int:
+        """The number of elements currently stored on disk."""
+        return self._spilled
+
+    def push(self, item: T) -> None:
+        """
+        Add an element to the top of the stack.
+
+        Args:
+            item: The element to add to the stack.
+
+        Time complexity: O(1) amortized
+        Space complexity: O(1) amortized in memory
+        """
+        hot = self._hot
+        hot.append(item)
+        if len(hot) > self._hot_limit:
+            self._spill()
+
+    def pop(self) -> T:
+        """
+        Remove and return the element at the top of the stack.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1) amortized
+        Space complexity: O(1) amortized
+        """
+        if not self._hot:
+            if not self._segments:
+                raise EmptyStackError("Cannot pop from an empty stack")
+            self._load()
+        return self._hot.pop()
+
+    def peek(self) -> T:
+        """
+        Return the element at the top of the stack without removing it.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1) amortized
+        Space complexity: O(1) amortized
+        """
+        if not self._hot:
+            if not self._segments:
+                raise EmptyStackError("Cannot peek at an empty stack")
+            self._load()
+        return self._hot[-1]
+
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+
+        Returns:
+            True if the stack contains no elements, False otherwise.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return not self._hot and not self._segments
+
+    def size(self) -> int:
+        """
+        Return the number of elements in the stack.
+
+        Returns:
+            The number of elements in the stack, in memory and on disk.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return len(self._hot) + self._spilled
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the stack.
+
+        The spill file is kept and reused by later spills.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._hot.clear()
+        self._segments.clear()
+        self._spilled = 0
+        self._end = 0
+
+    def close(self) -> None:
+        """
+        Remove all elements and release the spill file.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self.clear()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'SpillingStack[T]':
+        """Return the stack for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the stack when leaving a with statement."""
+        self.close()
+
+    def _encode(self, items: List[T]) -> bytes:
+        """
+        Serialize a segment of elements.
+
+        Args:
+            items: The elements of the segment, bottom to top.
+
+        Returns:
+            The serialized segment.
+        """
+        if self._record is None:
+            return pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+        if self._segment_record is not None:
+            return self._segment_record.pack(*items)
+        if self._single_field:
+            return b''.join(map(self._record.pack, items))
+        pack = self._record.pack
+        return b''.join([pack(*item) for item in items])
+
+    def _decode(self, data: bytes) -> List[T]:
+        """
+        Deserialize a segment of elements.
+
+        Args:
+            data: A segment produced by _encode.
+
+        Returns:
+            The elements of the segment, bottom to top.
+        """
+        if self._record is None:
+            return pickle.loads(data)
+        if self._segment_record is not None:
+            return list(self._segment_record.unpack(data))
+        if self._single_field:
+            return [fields[0] for fields in self._record.iter_unpack(data)]
+        return list(self._record.iter_unpack(data))
+
+    def _spill(self) -> None:
+        """
+        Move the oldest segment of the hot list to the spill file.
+
+        Time complexity: O(segment_size)
+        Space complexity: O(segment_size) temporarily
+        """
+        count = self._segment_size
+        data = self._encode(self._hot[:count])
+        start = self._end
+        end = start + len(data)
+        self._reserve(end)
+        self._map[start:end] = data
+        self._release(start, end)
+
+        del self._hot[:count]
+        self._segments.append((start, len(data)))
+        self._spilled += count
+        self._end = end
+
+    def _load(self) -> None:
+        """
+        Move the most recently spilled segment back into the hot list.
+
+        The space it used in the file is reused by the next spill.
+
+        Time complexity: O(segment_size)
+        Space complexity: O(segment_size)
+        """
+        start, length = self._segments.pop()
+        self._hot = self._decode(self._map[start:start + length])
+        self._release(start, start + length)
+        self._spilled -= len(self._hot)
+        self._end = start
+
+    def _release(self, start: int, end: int) -> None:
+        """
+        Drop a written range of the mapping from the resident set.
+
+        The mapping is shared, so the data stays in the file (and the page
+        cache) and is paged back in when the segment is loaded. Without this,
+        spilled pages would keep counting towards the process RSS until the
+        kernel reclaims them.
+
+        Args:
+            start: The first byte of the range.
+            end: The byte just past the range.
+        """
+        if hasattr(self._map, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+            aligned = start - start % mmap.PAGESIZE
+            self._map.madvise(mmap.MADV_DONTNEED, aligned, end - aligned)
+
+    def _reserve(self, size: int) -> None:
+        """
+        Make sure the spill file can hold at least size bytes.
+
+        The file and its mapping grow geometrically, so the cost of remapping
+        is amortized over many spills.
+
+        Args:
+            size: The number of bytes that must fit in the file.
+        """
+        if self._map is not None and size <= len(self._map):
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+
+        capacity = _INITIAL_FILE_SIZE if self._map is None else len(self._map)
+        while capacity < size:
+            capacity *= 2
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._file.truncate(capacity)
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the stack.
+
+        This method enables the use of the built-in len() function.
+
+        Returns:
+            The number of elements in the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            A string representation showing the stack contents from top to bottom.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if self.is_empty():
+            return "Stack: []"
+
+        items = [str(item) for item in self]
+        items[0] += " (top)"
+        if len(items) > 1:
+            items[-1] += " (bottom)"
+        return "Stack: [" + ", ".join(items) + "]"
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the stack.
+
+        Returns:
+            A string representation with the element counts in memory and on disk.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return f"{self.__class__.__name__}(in_memory={len(self._hot)}, spilled={self._spilled})"
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Return an iterator over the stack elements from top to bottom.
+
+        Spilled segments are read from disk one at a time, so iteration needs
+        at most one extra segment in memory. The stack must not be modified
+        during iteration.
+
+        Returns:
+            An iterator over stack elements.
+
+        Time complexity: O(1) per element
+        Space complexity: O(segment_size)
+        """
+        yield from reversed(self._hot)
+        for start, length in reversed(self._segments):
+            yield from reversed(self._decode(self._map[start:start + length]))
+
+    def __contains__(self, item: T) -> bool:
+        """
+        Check if an item is in the stack.
+
+        Args:
+            item: The item to check for.
+
+        Returns:
+            True if the item is in the stack, False otherwise.
+
+        Time complexity: O(n)
+        Space complexity: O(segment_size)
+        """
+        for value in self:
+            if value is item or value == item:
+                return True
+        return False
@@ -5,7 +5,7 @@ This module provides a generic stack data structure implementation
 using a Python list (dynamic array) as the underlying storage.
 """
 
-from typing import TypeVar, Generic, List, Iterator, Optional
+from typing import TypeVar, Generic, List, Iterator, Iterable, Optional, Any
 
 T = TypeVar('T')
 
@@ -63,6 +63,169 @@ class ArrayStack(Generic[T]):
             raise EmptyStackError("Cannot pop from an empty stack")
         return self._data.pop()
     
+    def push_many(self, items: Iterable[T]) -> None:
+        """
+        Add several elements to the top of the stack, in order.
+        
+        The last element of items ends up on top of the stack. This is
+        equivalent to calling push for each element, but extends the
+        underlying list in a single call.
+        
+        Args:
+            items: An iterable of elements to add to the stack.
+            
+        Time complexity: O(k) amortized, where k is the number of elements
+        Space complexity: O(k)
+        """
+        self._data.extend(items)
+    
+    def pop_many(self, n: int) -> List[T]:
+        """
+        Remove and return the top n elements of the stack.
+        
+        The elements are returned in stack order from bottom to top, so the
+        last element of the result is the former top of the stack, and
+        push_many(pop_many(n)) leaves the stack unchanged.
+        
+        Args:
+            n: The number of elements to remove.
+            
+        Returns:
+            A list of the removed elements.
+            
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+            
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        start = self._batch_start(n, "pop")
+        items = self._data[start:]
+        del self._data[start:]
+        return items
+    
+    def peek_n(self, n: int) -> List[T]:
+        """
+        Return the top n elements of the stack without removing them.
+        
+        The elements are returned in the same order as pop_many.
+        
+        Args:
+            n: The number of elements to return.
+            
+        Returns:
+            A list of the top n elements, with the top of the stack last.
+            
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+            
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        return self._data[self._batch_start(n, "peek at"):]
+    
+    def iter_chunks(self, size: int) -> Iterator[List[T]]:
+        """
+        Return an iterator over the stack elements in slices of up to size elements.
+        
+        The slices are taken from the underlying list in stack order from
+        bottom to top, the same order as pop_many and peek_n, so joining them
+        gives the stack contents with the top of the stack last. Each slice is
+        a single C-level copy, and every slice except possibly the last holds
+        exactly size elements. A slice is taken when the iterator reaches it,
+        so the stack should not be changed until the iterator is exhausted.
+        
+        Args:
+            size: The maximum number of elements per slice.
+            
+        Returns:
+            An iterator over lists of stack elements.
+            
+        Raises:
+            ValueError: If size is not positive.
+            
+        Time complexity: O(n) for a full iteration
+        Space complexity: O(size)
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        data = self._data
+        return (data[start:start + size] for start in range(0, len(data), size))
+    
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Convert the stack contents to a NumPy array, bottom to top.
+        
+        The underlying list is converted in a single numpy.array call, in the
+        same order as pop_many, so from_numpy(stack.to_numpy()) rebuilds the
+        stack. NumPy is imported only when this method is called.
+        
+        Args:
+            dtype: The NumPy dtype of the array, or None to infer it.
+            
+        Returns:
+            A new numpy.ndarray with the top of the stack last.
+            
+        Raises:
+            ImportError: If NumPy is not installed.
+            
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        import numpy as np
+        
+        return np.array(self._data, dtype=dtype)
+    
+    @classmethod
+    def from_numpy(cls, arr: Any) -> 'ArrayStack':
+        """
+        Create a stack from the items of a NumPy array along its first axis.
+        
+        The items are pushed in order, so the last item ends up on top. The
+        array is converted to Python objects in a single tolist() call.
+        
+        Args:
+            arr: A NumPy array with at least one dimension.
+            
+        Returns:
+            A new stack holding the array's items.
+            
+        Raises:
+            ValueError: If the array is zero-dimensional.
+            
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if arr.ndim == 0:
+            raise ValueError("Cannot create a stack from a zero-dimensional array")
+        stack = cls()
+        stack.push_many(arr.tolist())
+        return stack
+    
+    def _batch_start(self, n: int, action: str) -> int:
+        """
+        Validate a batch size and return the index of its first element.
+        
+        Args:
+            n: The number of elements in the batch.
+            action: The operation name used in error messages.
+            
+        Returns:
+            The index in _data of the lowest element of the batch.
+            
+        Raises:
+            ValueError: If n is negative.
+            EmptyStackError: If the stack holds fewer than n elements.
+        """
+        if n < 0:
+            raise ValueError(f"Cannot {action} a negative number of elements")
+        size = len(self._data)
+        if n > size:
+            raise EmptyStackError(f"Cannot {action} {n} elements of a stack of size {size}")
+        return size - n
+    
     def peek(self) -> T:
         """
         Return the element at the top of the stack without removing it.
@@ -5,6 +5,11 @@ Unit tests for the Array-based Stack implementation.
 import unittest
 from stack import ArrayStack, EmptyStackError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class TestArrayStack(unittest.TestCase):
     """Test suite for the ArrayStack class."""
     
@@ -127,5 +132,69 @@ class TestArrayStack(unittest.TestCase):
         self.assertEqual(float_stack.pop(), 2.2)
         self.assertEqual(float_stack.pop(), 1.1)
 
+    def test_push_many(self):
+        """Test pushing several elements at once."""
+        self.stack.push_many([1, 2, 3])
+        self.stack.push_many(iter([4, 5]))
+        self.stack.push_many([])
+        self.assertEqual(self.stack.size(), 5)
+        self.assertEqual(self.stack.peek(), 5)
+        self.assertEqual(list(self.stack), [5, 4, 3, 2, 1])
+
+    def test_pop_many(self):
+        """Test popping several elements at once."""
+        self.stack.push_many([1, 2, 3, 4])
+
+        self.assertEqual(self.stack.pop_many(2), [3, 4])
+        self.assertEqual(self.stack.size(), 2)
+        self.assertEqual(self.stack.pop_many(0), [])
+        self.assertEqual(self.stack.size(), 2)
+
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop_many(3)
+        with self.assertRaises(ValueError):
+            self.stack.pop_many(-1)
+
+        self.assertEqual(self.stack.pop_many(2), [1, 2])
+        self.assertTrue(self.stack.is_empty())
+
+    def test_peek_n(self):
+        """Test reading the top elements without removing them."""
+        self.stack.push_many([1, 2, 3])
+
+        self.assertEqual(self.stack.peek_n(2), [2, 3])
+        self.assertEqual(self.stack.peek_n(0), [])
+        self.assertEqual(self.stack.peek_n(3), [1, 2, 3])
+        self.assertEqual(self.stack.size(), 3)
+
+        with self.assertRaises(EmptyStackError):
+            self.stack.peek_n(4)
+        with self.assertRaises(ValueError):
+            self.stack.peek_n(-1)
+
+    def test_iter_chunks(self):
+        """Test iterating over the stack in slices, bottom to top."""
+        self.stack.push_many(range(7))
+
+        self.assertEqual(list(self.stack.iter_chunks(3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(self.stack.iter_chunks(10)), [[0, 1, 2, 3, 4, 5, 6]])
+        self.assertEqual(self.stack.size(), 7)
+        self.assertEqual(list(ArrayStack().iter_chunks(4)), [])
+
+        with self.assertRaises(ValueError):
+            self.stack.iter_chunks(0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_round_trip(self):
+        """Test converting to and from NumPy arrays, bottom to top."""
+        self.stack.push_many([1, 2, 3])
+
+        self.assertEqual(self.stack.to_numpy().tolist(), [1, 2, 3])
+        self.assertEqual(self.stack.to_numpy(dtype=np.float32).dtype, np.float32)
+
+        stack = ArrayStack.from_numpy(np.arange(3))
+        self.assertEqual(stack.pop(), 2)
+        self.assertIs(type(stack.peek()), int)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
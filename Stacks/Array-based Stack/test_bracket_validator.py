@@ -0,0 +1,115 @@
+"""
+Unit tests for the streaming bracket validator.
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+from bracket_validator import StreamingBracketValidator, validate_chunks, validate_file
+
+def reference_offset(data: bytes):
+    """Return the offset of the first error in data, found one byte at a time."""
+    match = {ord(')'): ord('('), ord(']'): ord('['), ord('}'): ord('{')}
+    stack = []
+    for offset, byte in enumerate(data):
+        if byte in b'([{':
+            stack.append(byte)
+        elif byte in match:
+            if not stack or stack.pop() != match[byte]:
+                return offset
+    return len(data) if stack else None
+
+def split(data: bytes, size: int):
+    """Split data into chunks of the given size."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestStreamingBracketValidator(unittest.TestCase):
+    """Test suite for StreamingBracketValidator and its helpers."""
+
+    def test_valid_inputs(self):
+        """Test balanced inputs, including ones with no brackets."""
+        for data in (b'', b'abc', b'()', b'{"a": [1, (2), {"b": []}]}', b'((((x))))'):
+            result = validate_chunks([data])
+            self.assertTrue(result)
+            self.assertIsNone(result.offset)
+
+    def test_unexpected_closer(self):
+        """Test a closing bracket with nothing open."""
+        result = validate_chunks([b'ab)c'])
+        self.assertFalse(result)
+        self.assertEqual(result.offset, 2)
+        self.assertIn("unexpected", result.message)
+
+    def test_mismatched_closer(self):
+        """Test a closing bracket of the wrong type."""
+        result = validate_chunks([b'{[x)]}'])
+        self.assertEqual(result.offset, 3)
+        self.assertEqual(result.message, "mismatched ')', expected ']'")
+
+    def test_counter_path_mismatch(self):
+        """Test a single-type chunk that closes past its own openers."""
+        # The second chunk only holds parentheses, so it uses the counter
+        result = validate_chunks([b'[(', b'()))'])
+        self.assertEqual(result.offset, 5)
+        self.assertEqual(result.message, "mismatched ')', expected ']'")
+
+    def test_unclosed_at_end(self):
+        """Test that unclosed brackets are reported at the end of input."""
+        result = validate_chunks([b'[(', b'(x)'])
+        self.assertFalse(result)
+        self.assertEqual(result.offset, 5)
+        self.assertIn("2 unclosed", result.message)
+
+    def test_errors_across_chunk_boundaries(self):
+        """Test that offsets count bytes from earlier chunks."""
+        validator = StreamingBracketValidator()
+        self.assertTrue(validator.feed(b'xx(('))
+        self.assertTrue(validator.feed(b'))'))
+        self.assertFalse(validator.feed(b'yy]'))
+        self.assertFalse(validator.feed(b'()'))
+        self.assertEqual(validator.finish().offset, 8)
+
+    def test_matches_reference(self):
+        """Test random inputs and chunk sizes against a simple checker."""
+        rng = random.Random(42)
+        for _ in range(500):
+            alphabet = rng.choice([b'()x', b'([x])', b'([{x}])', b'(){}'])
+            data = bytes(rng.choice(alphabet) for _ in range(rng.randrange(0, 40)))
+            expected = reference_offset(data)
+            for size in (1, 3, 7, 64):
+                result = validate_chunks(split(data, size))
+                self.assertEqual(result.valid, expected is None, data)
+                self.assertEqual(result.offset, expected, (data, size))
+
+    def test_deep_nesting(self):
+        """Test deeply nested input split across many chunks."""
+        data = b'([{' * 5000 + b'x' + b'}])' * 5000
+        self.assertTrue(validate_chunks(split(data, 1000)))
+        broken = data[:20000] + b')' + data[20001:]
+        self.assertEqual(validate_chunks(split(broken, 1000)).offset, 20000)
+
+    def test_custom_pairs(self):
+        """Test validation with a custom set of bracket pairs."""
+        self.assertTrue(validate_chunks([b'<a>(b'], pairs=b'<>'))
+        self.assertEqual(validate_chunks([b'<<>>>'], pairs=b'<>').offset, 4)
+        with self.assertRaises(ValueError):
+            StreamingBracketValidator(b'(((')
+
+    def test_validate_file(self):
+        """Test validation of a path and of a file object."""
+        data = b'{"items": [' + b'[1, 2], ' * 1000 + b'[3]]}'
+        self.assertTrue(validate_file(io.BytesIO(data), chunk_size=10))
+
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data[:-1] + b']')
+            result = validate_file(path, chunk_size=7)
+            self.assertEqual(result.offset, len(data) - 1)
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    unittest.main()
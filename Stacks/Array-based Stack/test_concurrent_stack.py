@@ -0,0 +1,146 @@
+"""
+Unit tests for the thread-safe stacks.
+"""
+
+import threading
+import time
+import unittest
+from stack import EmptyStackError
+from concurrent_stack import ConcurrentStack, WorkStealingDeque
+
+class TestConcurrentStack(unittest.TestCase):
+    """Test suite for the ConcurrentStack class."""
+
+    def setUp(self):
+        """Set up a new stack before each test."""
+        self.stack = ConcurrentStack[int]()
+
+    def test_basic_operations(self):
+        """Test the standard stack operations."""
+        self.stack.push(1)
+        self.stack.push_many([2, 3])
+        self.assertEqual(self.stack.peek(), 3)
+        self.assertEqual(self.stack.peek_n(2), [2, 3])
+        self.assertEqual(list(self.stack), [3, 2, 1])
+        self.assertTrue(2 in self.stack)
+        self.assertEqual(self.stack.pop(), 3)
+        self.assertEqual(self.stack.pop_many(2), [1, 2])
+        self.assertTrue(self.stack.is_empty())
+        self.stack.push(4)
+        self.stack.clear()
+        self.assertEqual(len(self.stack), 0)
+
+    def test_non_blocking_pop(self):
+        """Test that pop on an empty stack raises immediately, as ArrayStack.pop does."""
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop()
+        with self.assertRaises(EmptyStackError):
+            self.stack.peek()
+        self.stack.push_many([1, 2])
+        self.assertEqual(repr(self.stack), "ConcurrentStack[1, 2]")
+        self.assertEqual(str(self.stack), "Stack: [2 (top), 1 (bottom)]")
+
+    def test_pop_timeout(self):
+        """Test that a blocking pop gives up after the timeout."""
+        start = time.monotonic()
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop_wait(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        with self.assertRaises(ValueError):
+            self.stack.pop_wait(timeout=-1)
+
+    def test_blocking_pop_wakes_on_push(self):
+        """Test that a waiting pop returns an element pushed by another thread."""
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(self.stack.pop_wait(timeout=5)))
+        consumer.start()
+        time.sleep(0.02)
+        self.stack.push(42)
+        consumer.join(5)
+        self.assertEqual(result, [42])
+
+    def test_concurrent_producers_and_consumers(self):
+        """Test that every pushed element is popped exactly once."""
+        n_threads, per_thread = 4, 2000
+        popped = [[] for _ in range(n_threads)]
+
+        def produce(base):
+            for value in range(base, base + per_thread):
+                self.stack.push(value)
+
+        def consume(out):
+            for _ in range(per_thread):
+                out.append(self.stack.pop_wait(timeout=5))
+
+        threads = [threading.Thread(target=consume, args=(out,)) for out in popped]
+        threads += [threading.Thread(target=produce, args=(i * per_thread,)) for i in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        values = sorted(value for out in popped for value in out)
+        self.assertEqual(values, list(range(n_threads * per_thread)))
+        self.assertTrue(self.stack.is_empty())
+
+class TestWorkStealingDeque(unittest.TestCase):
+    """Test suite for the WorkStealingDeque class."""
+
+    def test_owner_and_thief_ends(self):
+        """Test that the owner pops the newest task and thieves the oldest."""
+        tasks = WorkStealingDeque[int]()
+        for value in range(4):
+            tasks.push(value)
+        self.assertEqual(tasks.pop(), 3)
+        self.assertEqual(tasks.steal(), 0)
+        self.assertEqual(len(tasks), 2)
+        self.assertEqual(repr(tasks), "WorkStealingDeque([1, 2])")
+        tasks.pop()
+        tasks.steal()
+        self.assertTrue(tasks.is_empty())
+        with self.assertRaises(EmptyStackError):
+            tasks.pop()
+        with self.assertRaises(EmptyStackError):
+            tasks.steal()
+
+    def test_concurrent_stealing(self):
+        """Test that each task is taken exactly once by the owner or a thief."""
+        tasks = WorkStealingDeque[int]()
+        total = 20000
+        taken = [[] for _ in range(4)]
+        done = threading.Event()
+
+        def owner():
+            for value in range(total):
+                tasks.push(value)
+                if value % 3 == 0:
+                    try:
+                        taken[0].append(tasks.pop())
+                    except EmptyStackError:
+                        pass
+            while True:
+                try:
+                    taken[0].append(tasks.pop())
+                except EmptyStackError:
+                    break
+            done.set()
+
+        def thief(out):
+            while not done.is_set() or not tasks.is_empty():
+                try:
+                    out.append(tasks.steal())
+                except EmptyStackError:
+                    pass
+
+        threads = [threading.Thread(target=owner)]
+        threads += [threading.Thread(target=thief, args=(out,)) for out in taken[1:]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        values = sorted(value for out in taken for value in out)
+        self.assertEqual(values, list(range(total)))
+
+if __name__ == '__main__':
+    unittest.main()
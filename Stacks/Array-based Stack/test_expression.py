@@ -0,0 +1,116 @@
+"""
+Unit tests for the expression compiler and evaluator.
+"""
+
+import random
+import unittest
+from expression import ExpressionError, compile_expression, evaluate
+
+class TestExpression(unittest.TestCase):
+    """Test suite for compile_expression and Program."""
+
+    def setUp(self):
+        """Start each test with an empty program cache."""
+        compile_expression.cache_clear()
+
+    def test_precedence_and_associativity(self):
+        """Test results against Python's own evaluation."""
+        bindings = {'a': 5, 'b': 7, 'c': False}
+        namespace = {'max': max, 'min': min, 'abs': abs, 'round': round}
+        for source in ('1 + 2 * 3', 'a + b * 2', '(a + 1) * (b - 1)', '10 - 4 - 3',
+                       '-2 ** 2', '2 ** -1', '2 ** 3 ** 2', 'a // 2 + a % 2 / 4',
+                       'max(a, b + 1, 3) > 2 and not c', 'not a == b or c',
+                       'abs(-a) + min(b, 2)', 'round(a / 3, 2)', '+a - -b'):
+            self.assertEqual(evaluate(source, bindings), eval(source, namespace, bindings), source)
+
+    def test_postfix(self):
+        """Test the compiled postfix form, including constant folding."""
+        self.assertEqual(compile_expression('a + b * 2').postfix, 'a b 2 * +')
+        self.assertEqual(compile_expression('-(a + 1)').postfix, 'a 1 + neg')
+        self.assertEqual(compile_expression('x * (60 * 60)').postfix, 'x 3600 *')
+        self.assertEqual(compile_expression('max(a, 1)').postfix, 'a 1 max/2')
+        self.assertEqual(compile_expression('a and b or c').postfix, 'a b and c or')
+        self.assertEqual(compile_expression('true and x').postfix, 'x')
+        self.assertEqual(compile_expression('0 or 1 > 2 and x').postfix, 'False')
+        self.assertEqual(compile_expression('2 ** 60 * 4').postfix, '4611686018427387904')
+
+    def test_large_constants_are_not_folded(self):
+        """Test that huge integer powers and products are left for evaluation time."""
+        program = compile_expression('x > 0 or 9 ** 9 ** 9 > 1')
+        self.assertEqual(program.postfix, 'x 0 > 9 387420489 ** 1 > or')
+        self.assertIs(program.evaluate({'x': 1}), True)
+        self.assertEqual(compile_expression('2 ** 200 * 2 ** 200').postfix, '2 200 ** 2 200 ** *')
+
+    def test_short_circuit(self):
+        """Test that and/or skip the right operand when the left decides the result."""
+        guard = compile_expression('x != 0 and y / x > 1 or fallback')
+        rows = [{'x': 0, 'y': 5, 'fallback': 'none'}, {'x': 2, 'y': 5, 'fallback': 'low'},
+                {'x': 5, 'y': 2, 'fallback': 'low'}]
+        expected = [x != 0 and y / x > 1 or fallback for x, y, fallback in
+                    ((row['x'], row['y'], row['fallback']) for row in rows)]
+        self.assertEqual(expected, ['none', True, 'low'])
+        self.assertEqual(guard.evaluate_many(rows), expected)
+        columns = {name: [row[name] for row in rows] for name in ('x', 'y', 'fallback')}
+        self.assertEqual(guard.evaluate_columns(columns), expected)
+        self.assertEqual(evaluate('d == 0 or 1 / d < 0.5 and (d > 0 or 1 / 0)', {'d': 0}), True)
+        self.assertEqual(compile_expression('a or 1 / 0').evaluate_columns({'a': [1, 2]}), [1, 2])
+
+    def test_variables_and_literals(self):
+        """Test variable discovery and the true/false literals."""
+        program = compile_expression('price * qty > limit and (vip == true or qty > price)')
+        self.assertEqual(program.variables, ('price', 'qty', 'limit', 'vip'))
+        self.assertTrue(program.evaluate({'price': 3, 'qty': 4, 'limit': 10, 'vip': True}))
+        self.assertFalse(program.evaluate({'price': 3, 'qty': 2, 'limit': 10, 'vip': True}))
+
+    def test_math_functions(self):
+        """Test the math functions."""
+        self.assertEqual(evaluate('sqrt(x) + floor(2.5) + ceil(0.5)', {'x': 16}), 7)
+        self.assertAlmostEqual(evaluate('log(exp(1))', {}), 1.0)
+        self.assertAlmostEqual(evaluate('log(8, 2)', {}), 3.0)
+
+    def test_runtime_errors(self):
+        """Test errors raised during evaluation."""
+        with self.assertRaises(KeyError):
+            evaluate('a + 1', {})
+        # Folding a failing constant is left until evaluation
+        program = compile_expression('1 / 0 + a')
+        with self.assertRaises(ZeroDivisionError):
+            program.evaluate({'a': 1})
+
+    def test_syntax_errors(self):
+        """Test that invalid expressions raise ExpressionError with a position."""
+        cases = {'1 +': 3, '(1': 0, '1)': 1, '1 2': 2, 'a , b': 2, 'abs 1': 4,
+                 'max()': 4, 'round(1, 2, 3)': 0, '1 $ 2': 2, 'and': 0, '': 0}
+        for source, position in cases.items():
+            with self.assertRaises(ExpressionError, msg=source) as context:
+                compile_expression(source)
+            self.assertEqual(context.exception.position, position, source)
+
+    def test_cache(self):
+        """Test that programs are cached by source text."""
+        first = compile_expression('a * 2')
+        self.assertIs(compile_expression('a * 2'), first)
+        info = compile_expression.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_evaluate_many_and_columns(self):
+        """Test the batched modes against row-by-row evaluation."""
+        rng = random.Random(1)
+        program = compile_expression('max(a, b) * 2 - a / (b + 1) > 3 or a == 0')
+        a = [rng.randint(0, 9) for _ in range(200)]
+        b = [rng.randint(0, 9) for _ in range(200)]
+        rows = [{'a': x, 'b': y} for x, y in zip(a, b)]
+        expected = [program.evaluate(row) for row in rows]
+        self.assertEqual(program.evaluate_many(rows), expected)
+        self.assertEqual(program.evaluate_columns({'a': a, 'b': b}), expected)
+
+    def test_columns_without_variables(self):
+        """Test column evaluation of a constant program."""
+        program = compile_expression('sqrt(16) + 1')
+        self.assertEqual(program.postfix, '5.0')
+        self.assertEqual(program.evaluate_columns({}, length=3), [5.0, 5.0, 5.0])
+        with self.assertRaises(ValueError):
+            program.evaluate_columns({})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Unit tests for the aggregate-tracking stacks.
+"""
+
+import operator
+import random
+import unittest
+from math import gcd
+from stack import EmptyStackError
+from monoid_stack import MonoidStack, MinStack, MaxStack
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestMinMaxStack(unittest.TestCase):
+    """Test suite for the MinStack and MaxStack classes."""
+
+    def test_empty(self):
+        """Test that extreme queries on an empty stack raise an exception."""
+        for compressed in (False, True):
+            with self.assertRaises(EmptyStackError):
+                MinStack(compressed).get_min()
+            with self.assertRaises(EmptyStackError):
+                MaxStack(compressed).get_max()
+            with self.assertRaises(EmptyStackError):
+                MinStack(compressed).pop()
+
+    def test_min_stack(self):
+        """Test the minimum as elements are pushed and popped."""
+        for compressed in (False, True):
+            stack = MinStack[int](compressed)
+            stack.push(5)
+            stack.push(3)
+            stack.push(7)
+            stack.push(3)
+            self.assertEqual(stack.get_min(), 3)
+            self.assertEqual(stack.peek(), 3)
+            self.assertEqual(stack.pop(), 3)
+            self.assertEqual(stack.get_min(), 3)
+            self.assertEqual(stack.pop(), 7)
+            self.assertEqual(stack.pop(), 3)
+            self.assertEqual(stack.get_min(), 5)
+            self.assertEqual(stack.size(), 1)
+
+    def test_max_stack(self):
+        """Test the maximum as elements are pushed and popped."""
+        for compressed in (False, True):
+            stack = MaxStack[int](compressed)
+            for value in [1, 4, 2, 4, 9]:
+                stack.push(value)
+            self.assertEqual(stack.get_max(), 9)
+            stack.pop()
+            self.assertEqual(stack.get_max(), 4)
+            stack.pop()
+            stack.pop()
+            self.assertEqual(stack.get_max(), 4)
+            stack.pop()
+            self.assertEqual(stack.get_max(), 1)
+
+    def test_compressed_storage(self):
+        """Test that compressed mode only stores changes of the extreme."""
+        stack = MinStack[int](compressed=True)
+        stack.push(1)
+        for value in range(2, 1000):
+            stack.push(value)
+        self.assertEqual(len(stack._aggregates), 1)
+        self.assertEqual(stack.get_min(), 1)
+
+        stack.push(0)
+        self.assertEqual(len(stack._aggregates), 2)
+        stack.pop()
+        self.assertEqual(len(stack._aggregates), 1)
+
+    def test_clear(self):
+        """Test that clearing the stack resets the aggregate."""
+        stack = MinStack[int](compressed=True)
+        stack.push(1)
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        stack.push(4)
+        self.assertEqual(stack.get_min(), 4)
+
+    def test_random_operations(self):
+        """Test the extremes against full scans over random operations."""
+        rng = random.Random(27)
+        for compressed in (False, True):
+            min_stack = MinStack[int](compressed)
+            max_stack = MaxStack[int](compressed)
+            for _ in range(2000):
+                if min_stack.is_empty() or rng.random() < 0.6:
+                    value = rng.randint(0, 20)
+                    min_stack.push(value)
+                    max_stack.push(value)
+                else:
+                    self.assertEqual(min_stack.pop(), max_stack.pop())
+                if not min_stack.is_empty():
+                    self.assertEqual(min_stack.get_min(), min(min_stack))
+                    self.assertEqual(max_stack.get_max(), max(max_stack))
+
+    def test_batch_operations(self):
+        """Test that push_many and pop_many keep the extremes up to date."""
+        rng = random.Random(30)
+        for compressed in (False, True):
+            stack = MinStack[int](compressed)
+            for _ in range(300):
+                if stack.is_empty() or rng.random() < 0.5:
+                    stack.push_many(rng.randint(0, 50) for _ in range(rng.randint(0, 8)))
+                else:
+                    n = rng.randint(0, stack.size())
+                    expected = stack.peek_n(n)
+                    self.assertEqual(stack.pop_many(n), expected)
+                if not stack.is_empty():
+                    self.assertEqual(stack.get_min(), min(stack))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_from_numpy(self):
+        """Test building min and max stacks from an array."""
+        values = np.array([5, 3, 7, 3, 9])
+        for compressed in (False, True):
+            stack = MinStack.from_numpy(values, compressed=compressed)
+            self.assertEqual(list(stack), [9, 3, 7, 3, 5])
+            self.assertEqual(stack.get_min(), 3)
+            stack = MaxStack.from_numpy(values, compressed)
+            self.assertEqual(stack.get_max(), 9)
+            stack.pop()
+            self.assertEqual(stack.get_max(), 7)
+        self.assertEqual(MonoidStack.from_numpy(values, operator.add).get_aggregate(), 27)
+
+class TestMonoidStack(unittest.TestCase):
+    """Test suite for the MonoidStack class."""
+
+    def test_sum(self):
+        """Test aggregating with addition."""
+        stack = MonoidStack[int](operator.add)
+        for value in [1, 2, 3, 4]:
+            stack.push(value)
+        self.assertEqual(stack.get_aggregate(), 10)
+        stack.pop()
+        self.assertEqual(stack.get_aggregate(), 6)
+
+    def test_non_commutative(self):
+        """Test that elements are folded from bottom to top."""
+        for compressed in (False, True):
+            stack = MonoidStack[str](operator.add, compressed)
+            for value in "abc":
+                stack.push(value)
+            self.assertEqual(stack.get_aggregate(), "abc")
+
+    def test_compressed_gcd(self):
+        """Test compressed mode with an operation that is not min or max."""
+        stack = MonoidStack[int](gcd, compressed=True)
+        for value in [12, 18, 24, 36, 4]:
+            stack.push(value)
+        self.assertEqual(stack.get_aggregate(), 2)
+        self.assertEqual(stack._aggregates, [12, 6, 2])
+        stack.pop()
+        self.assertEqual(stack.get_aggregate(), 6)
+
+    def test_empty(self):
+        """Test that aggregating an empty stack raises an exception."""
+        with self.assertRaises(EmptyStackError):
+            MonoidStack[int](operator.add).get_aggregate()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit tests for the disk-spilling Stack implementation.
+"""
+
+import random
+import unittest
+from stack import EmptyStackError
+from spill_stack import SpillingStack
+
+class TestSpillingStack(unittest.TestCase):
+    """Test suite for the SpillingStack class."""
+
+    def setUp(self):
+        """Set up a new stack with a tiny hot segment before each test."""
+        self.stack = SpillingStack[int](hot_limit=8, segment_size=4)
+
+    def tearDown(self):
+        """Release the spill file."""
+        self.stack.close()
+
+    def test_empty(self):
+        """Test operations on an empty stack."""
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(len(self.stack), 0)
+        self.assertEqual(str(self.stack), "Stack: []")
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop()
+        with self.assertRaises(EmptyStackError):
+            self.stack.peek()
+
+    def test_spill_and_load(self):
+        """Test that elements survive a round trip through the spill file."""
+        for value in range(100):
+            self.stack.push(value)
+        self.assertEqual(self.stack.size(), 100)
+        self.assertGreater(self.stack.spilled, 0)
+        self.assertLessEqual(len(self.stack._hot), 8)
+
+        self.assertEqual(self.stack.peek(), 99)
+        self.assertEqual(list(self.stack), list(range(99, -1, -1)))
+        self.assertTrue(0 in self.stack)
+        self.assertFalse(100 in self.stack)
+
+        for expected in range(99, -1, -1):
+            self.assertEqual(self.stack.pop(), expected)
+            self.assertLessEqual(len(self.stack._hot), 8)
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.spilled, 0)
+
+    def test_peek_after_load(self):
+        """Test peeking when the top has to be loaded from disk."""
+        for value in range(9):
+            self.stack.push(value)
+        for _ in range(5):
+            self.stack.pop()
+        self.assertEqual(self.stack.peek(), 3)
+        self.assertEqual(self.stack.pop(), 3)
+
+    def test_record_formats(self):
+        """Test fixed-width and pickled record formats."""
+        cases = [
+            ('q', lambda i: i * 1_000_003),
+            ('<d', lambda i: i / 7),
+            ('qi', lambda i: (i, -i)),
+            ('10s', lambda i: str(i).encode().ljust(10, b'\0')),
+            ('s', lambda i: bytes([i])),
+            ('<p', lambda i: b''),
+            (None, lambda i: {'node': i, 'path': [i] * (i % 3)}),
+        ]
+        for record_format, make in cases:
+            with SpillingStack(hot_limit=5, segment_size=3, record_format=record_format) as stack:
+                values = [make(i) for i in range(50)]
+                for value in values:
+                    stack.push(value)
+                self.assertGreater(stack.spilled, 0)
+                popped = [stack.pop() for _ in range(50)]
+                self.assertEqual(popped, values[::-1], record_format)
+
+    def test_file_growth(self):
+        """Test spilling more data than the initial file size."""
+        with SpillingStack(hot_limit=1000, segment_size=1000, record_format='q') as stack:
+            for value in range(300_000):
+                stack.push(value)
+            self.assertGreater(len(stack._map), 1 << 20)
+            self.assertEqual(stack.pop(), 299_999)
+            self.assertEqual(stack.size(), 299_999)
+            for _ in range(299_998):
+                stack.pop()
+            self.assertEqual(stack.pop(), 0)
+
+    def test_clear_and_reuse(self):
+        """Test clearing a stack with spilled elements."""
+        for value in range(20):
+            self.stack.push(value)
+        self.stack.clear()
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.spilled, 0)
+        for value in range(20):
+            self.stack.push(-value)
+        self.assertEqual(list(self.stack), [-v for v in range(19, -1, -1)])
+
+    def test_random_operations(self):
+        """Test against a list over a random mix of pushes and pops."""
+        rng = random.Random(31)
+        reference = []
+        for _ in range(5000):
+            if not reference or rng.random() < 0.55:
+                value = rng.randint(0, 10**9)
+                reference.append(value)
+                self.stack.push(value)
+            else:
+                self.assertEqual(self.stack.pop(), reference.pop())
+            self.assertEqual(len(self.stack), len(reference))
+
+    def test_validation(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            SpillingStack(hot_limit=0)
+        with self.assertRaises(ValueError):
+            SpillingStack(hot_limit=4, segment_size=5)
+
+    def test_string_representation(self):
+        """Test the string representations of the stack."""
+        for value in range(1, 4):
+            self.stack.push(value)
+        self.assertEqual(str(self.stack), "Stack: [3 (top), 2, 1 (bottom)]")
+        self.assertEqual(repr(self.stack), "SpillingStack(in_memory=3, spilled=0)")
+
+if __name__ == '__main__':
+    unittest.main()
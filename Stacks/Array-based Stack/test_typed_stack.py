@@ -0,0 +1,138 @@
+"""
+Unit tests for the typed array-based Stack implementation.
+"""
+
+import io
+import unittest
+from array import array
+from stack import EmptyStackError
+from typed_stack import TypedArrayStack
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestTypedArrayStack(unittest.TestCase):
+    """Test suite for the TypedArrayStack class."""
+
+    def setUp(self):
+        """Set up a new stack of doubles before each test."""
+        self.stack = TypedArrayStack('d')
+
+    def test_basic_operations(self):
+        """Test the standard stack operations."""
+        self.assertTrue(self.stack.is_empty())
+        self.stack.push(1.5)
+        self.stack.push(2.5)
+        self.assertEqual(self.stack.size(), 2)
+        self.assertEqual(self.stack.peek(), 2.5)
+        self.assertEqual(self.stack.pop(), 2.5)
+        self.assertEqual(list(self.stack), [1.5])
+        self.assertTrue(1.5 in self.stack)
+        self.stack.clear()
+        self.assertTrue(self.stack.is_empty())
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop()
+        with self.assertRaises(EmptyStackError):
+            self.stack.peek()
+
+    def test_typecode(self):
+        """Test typecode handling and validation."""
+        stack = TypedArrayStack('i')
+        self.assertEqual(stack.typecode, 'i')
+        self.assertEqual(stack.itemsize, array('i').itemsize)
+        with self.assertRaises(TypeError):
+            stack.push(1.5)
+        with self.assertRaises(ValueError):
+            TypedArrayStack('u')
+
+    def test_push_many(self):
+        """Test pushing from iterables, arrays and buffers."""
+        self.stack.push_many([1, 2])
+        self.stack.push_many(x * 1.0 for x in range(3, 5))
+        self.stack.push_many(array('d', [5.0]))
+        self.stack.push_many(memoryview(array('d', [6.0, 7.0])))
+        self.stack.push_many(array('f', [8.0]))  # Converted element-wise
+        self.assertEqual(self.stack.peek(), 8.0)
+        self.assertEqual(self.stack.view().tolist(), [1, 2, 3, 4, 5, 6, 7, 8])
+
+        ints = TypedArrayStack('q')
+        ints.push_many(memoryview(array('l', [1, 2, 3])))
+        ints.push_many(b'\x04')
+        self.assertEqual(list(ints), [4, 3, 2, 1])
+
+    def test_iter_chunks(self):
+        """Test that chunks are arrays of the stack's typecode."""
+        self.stack.push_many([1, 2, 3])
+        chunks = list(self.stack.iter_chunks(2))
+        self.assertEqual(chunks, [array('d', [1, 2]), array('d', [3])])
+        self.assertEqual(chunks[0].typecode, 'd')
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_round_trip(self):
+        """Test that to_numpy is a view of the stack and from_numpy keeps the type."""
+        self.stack.push_many([1, 2, 3])
+        exported = self.stack.to_numpy()
+        self.assertEqual(exported.dtype, np.float64)
+        exported[0] = 9
+        self.assertEqual(self.stack.view().tolist(), [9, 2, 3])
+        with self.assertRaises(BufferError):
+            self.stack.push(4)
+        del exported
+        self.stack.push(4)
+        self.assertEqual(self.stack.to_numpy(dtype=np.int64).tolist(), [9, 2, 3, 4])
+
+        stack = TypedArrayStack.from_numpy(np.arange(5, dtype=np.int32))
+        self.assertEqual(stack.typecode, np.dtype(np.int32).char)
+        self.assertEqual(stack.pop(), 4)
+        self.assertEqual(TypedArrayStack.from_numpy(np.arange(3)[::-1], 'd').view().tolist(), [2, 1, 0])
+        with self.assertRaises(ValueError):
+            TypedArrayStack.from_numpy(np.zeros((2, 2)))
+
+    def test_pop_many(self):
+        """Test removing several elements at once."""
+        self.stack.push_many([1, 2, 3, 4])
+        popped = self.stack.pop_many(3)
+        self.assertIsInstance(popped, array)
+        self.assertEqual(popped.typecode, 'd')
+        self.assertEqual(popped.tolist(), [2, 3, 4])
+        self.assertEqual(self.stack.pop_many(0).tolist(), [])
+        self.assertEqual(self.stack.size(), 1)
+        self.assertEqual(self.stack.peek_n(1), array('d', [1]))
+
+        # Round trip leaves the stack unchanged
+        self.stack.push_many([5, 6])
+        self.stack.push_many(self.stack.pop_many(2))
+        self.assertEqual(self.stack.view().tolist(), [1, 5, 6])
+
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop_many(4)
+        with self.assertRaises(ValueError):
+            self.stack.pop_many(-1)
+
+    def test_view(self):
+        """Test the zero-copy memoryview export."""
+        self.stack.push_many([1, 2, 3])
+        with self.stack.view() as view:
+            self.assertEqual(view.format, 'd')
+            self.assertEqual(len(view), 3)
+            view[0] = 10.0
+            # The stack cannot resize while a view is exported
+            with self.assertRaises(BufferError):
+                self.stack.push(4.0)
+        self.assertEqual(self.stack.view().tolist(), [10, 2, 3])
+        self.stack.push(4.0)
+
+        buffer = io.BytesIO()
+        with self.stack.view() as view:
+            buffer.write(view)
+        self.assertEqual(buffer.getvalue(), array('d', [10, 2, 3, 4]).tobytes())
+
+    def test_repr(self):
+        """Test the detailed string representation."""
+        self.stack.push_many([1, 2])
+        self.assertEqual(repr(self.stack), "TypedArrayStack('d', [1.0, 2.0])")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the undo/redo history.
+"""
+
+import random
+import unittest
+from stack import EmptyStackError
+from undo import Edit, TextDocument, UndoHistory
+
+class TestUndoHistory(unittest.TestCase):
+    """Test suite for Edit, UndoHistory and TextDocument."""
+
+    def setUp(self):
+        """Set up a new document before each test."""
+        self.doc = TextDocument("hello")
+
+    def type_text(self, position, text):
+        """Type text one character at a time."""
+        for offset, char in enumerate(text):
+            self.doc.insert(position + offset, char)
+
+    def test_edit_apply_and_inverse(self):
+        """Test applying an edit and its inverse."""
+        edit = Edit(1, "ell", "ipp")
+        self.assertEqual(edit.apply("hello"), "hippo")
+        self.assertEqual(edit.inverse().apply("hippo"), "hello")
+
+    def test_undo_redo(self):
+        """Test undoing and redoing separate edits."""
+        self.doc.insert(5, " world")
+        self.doc.history.seal()
+        self.doc.replace(0, 1, "J")
+        self.assertEqual(self.doc.text, "Jello world")
+        self.assertTrue(self.doc.undo())
+        self.assertEqual(self.doc.text, "hello world")
+        self.assertTrue(self.doc.undo())
+        self.assertEqual(self.doc.text, "hello")
+        self.assertFalse(self.doc.undo())
+        self.assertTrue(self.doc.redo())
+        self.assertTrue(self.doc.redo())
+        self.assertEqual(self.doc.text, "Jello world")
+        self.assertFalse(self.doc.redo())
+
+    def test_new_edit_clears_redo(self):
+        """Test that recording an edit discards undone edits."""
+        self.doc.insert(5, "!")
+        self.doc.undo()
+        self.doc.insert(0, "oh ")
+        self.assertFalse(self.doc.history.can_redo())
+        with self.assertRaises(EmptyStackError):
+            self.doc.history.redo()
+
+    def test_typing_is_coalesced(self):
+        """Test that consecutive typing becomes one undo step."""
+        self.type_text(5, " there")
+        self.assertEqual(len(self.doc.history), 1)
+        self.doc.undo()
+        self.assertEqual(self.doc.text, "hello")
+
+    def test_backspace_and_delete_are_coalesced(self):
+        """Test that consecutive deletions become one undo step."""
+        for position in (4, 3, 2):
+            self.doc.delete(position, 1)  # Backspace
+        self.assertEqual(self.doc.text, "he")
+        self.doc.history.seal()
+        self.doc.insert(2, "xyz")
+        self.doc.history.seal()
+        self.doc.delete(2, 1)
+        self.doc.delete(2, 1)  # Forward delete
+        self.assertEqual(len(self.doc.history), 3)
+        self.doc.undo()
+        self.assertEqual(self.doc.text, "hexyz")
+        self.doc.undo()
+        self.doc.undo()
+        self.assertEqual(self.doc.text, "hello")
+
+    def test_coalescing_stops(self):
+        """Test that merging stops at seal, newlines, gaps and the limit."""
+        doc = TextDocument("", UndoHistory(coalesce_limit=4))
+        for char in "abcdef":
+            doc.insert(len(doc.text), char)
+        self.assertEqual(len(doc.history), 2)
+        doc.insert(len(doc.text), "\n")
+        doc.insert(len(doc.text), "g")
+        self.assertEqual(len(doc.history), 4)
+        doc.insert(0, "z")  # Not adjacent to the previous insertion
+        self.assertEqual(len(doc.history), 5)
+
+    def test_budget_drops_oldest(self):
+        """Test that the byte budget drops the oldest edits first."""
+        history = UndoHistory(budget=2000, coalesce_limit=0)
+        doc = TextDocument("", history)
+        for i in range(100):
+            doc.insert(len(doc.text), f"line {i}\n")
+        self.assertLessEqual(history.memory_usage, 2000)
+        self.assertLess(len(history), 100)
+        while doc.undo():
+            pass
+        # Only the newest edits could be undone
+        self.assertTrue(doc.text.startswith("line 0\n"))
+        self.assertEqual(history.memory_usage, sum(e.size for e in history._redo))
+
+    def test_random_session_round_trip(self):
+        """Test that undoing a random session restores every earlier state."""
+        rng = random.Random(5)
+        doc = TextDocument("The quick brown fox")
+        states = [doc.text]
+        for _ in range(300):
+            position = rng.randint(0, len(doc.text))
+            if rng.random() < 0.6 or not doc.text:
+                doc.insert(position, rng.choice(["a", "b", " ", "xyz", "\n"]))
+            else:
+                doc.delete(min(position, len(doc.text) - 1), 1)
+            if rng.random() < 0.2:
+                doc.history.seal()
+            states.append(doc.text)
+        undone = [doc.text]
+        while doc.undo():
+            undone.append(doc.text)
+        self.assertEqual(undone[-1], states[0])
+        # Every state reached by undo was a state of the session
+        self.assertTrue(set(undone) <= set(states))
+        while doc.redo():
+            pass
+        self.assertEqual(doc.text, states[-1])
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            UndoHistory(budget=-1)
+        with self.assertRaises(IndexError):
+            self.doc.delete(3, 10)
+
+if __name__ == "__main__":
+    unittest.main()
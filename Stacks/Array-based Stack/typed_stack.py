@@ -0,0 +1,215 @@
+"""
+Typed array-based Stack implementation in Python.
+
+This module provides a stack of numbers stored unboxed in an array.array,
+for numeric workloads where a list of Python objects would use several times
+the memory of the raw values.
+"""
+
+from array import array
+from typing import Any, Iterable, Optional, Union
+
+from stack import ArrayStack
+
+Number = Union[int, float]
+
+# Formats that differ in name but not in memory layout (e.g. 'l' and 'q' on
+# 64-bit Linux) are compatible as long as the kind and size match
+_FORMAT_KINDS = {
+    code: kind
+    for kind, codes in (('signed', 'bhilq'), ('unsigned', 'BHILQ'), ('float', 'fd'))
+    for code in codes
+}
+
+def _same_layout(view: memoryview, data: array) -> bool:
+    """Check whether a buffer holds native values laid out like the array."""
+    fmt = view.format.lstrip('@')
+    return (
+        view.itemsize == data.itemsize
+        and fmt in _FORMAT_KINDS
+        and _FORMAT_KINDS[fmt] == _FORMAT_KINDS.get(data.typecode)
+    )
+
+class TypedArrayStack(ArrayStack[Number]):
+    """
+    An array-based stack of numbers backed by array.array.
+
+    Elements are stored as raw machine values of a single C type, selected
+    with an array typecode ('b', 'i', 'q', 'f', 'd', ...). A stack of doubles
+    uses 8 bytes per element instead of a pointer plus a boxed float object.
+
+    Besides the standard stack operations, the stack supports bulk transfer
+    with push_many and pop_many (pop_many, peek_n and iter_chunks return
+    arrays of the same typecode), and exposes its live contents (bottom to
+    top) as a zero-copy memoryview, which can be passed to numpy.frombuffer
+    or written to a file without conversion. While a view is alive the stack
+    cannot grow or shrink, and attempts to do so raise BufferError; release
+    the view (or use it in a with statement) before modifying the stack.
+
+    Attributes:
+        _data (array): Internal array used to store stack elements.
+    """
+
+    def __init__(self, typecode: str = 'd') -> None:
+        """
+        Initialize an empty typed stack.
+
+        Args:
+            typecode: An array.array typecode describing the element type
+                (default 'd', a C double).
+
+        Raises:
+            ValueError: If the typecode is not a numeric array typecode.
+        """
+        if typecode == 'u' or typecode == 'w':
+            raise ValueError("TypedArrayStack requires a numeric typecode")
+        self._data: array = array(typecode)
+
+    @property
+    def typecode(self) -> str:
+        """The array typecode of the stored elements."""
+        return self._data.typecode
+
+    @property
+    def itemsize(self) -> int:
+        """The size in bytes of one stored element."""
+        return self._data.itemsize
+
+    def push_many(self, items: Iterable[Number]) -> None:
+        """
+        Push several elements onto the stack, in order.
+
+        The last element of items ends up on top. Arrays and other buffers
+        with a matching element format are copied in a single memory copy;
+        any other iterable is converted element by element.
+
+        Args:
+            items: An iterable or buffer of numbers.
+
+        Time complexity: O(k) where k is the number of elements pushed
+        Space complexity: O(k)
+        """
+        if isinstance(items, array):
+            # array.extend requires matching typecodes and copies in C
+            if items.typecode == self._data.typecode:
+                self._data.extend(items)
+                return
+            items = items.tolist()
+        else:
+            try:
+                view = memoryview(items)  # type: ignore[arg-type]
+            except TypeError:
+                view = None
+            if view is not None:
+                with view:
+                    if view.c_contiguous and _same_layout(view, self._data):
+                        self._data.frombytes(view.cast('B'))
+                        return
+                    items = view.tolist()
+        self._data.extend(items)
+
+    def view(self) -> memoryview:
+        """
+        Return a zero-copy memoryview of the stack contents, bottom to top.
+
+        Returns:
+            A read-write memoryview over the underlying array.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return memoryview(self._data)
+
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Return the stack contents as a NumPy array without copying them.
+
+        The array is a view of the underlying array (numpy.frombuffer), bottom
+        to top, so writes through it change the stack. As with view(), the
+        stack cannot grow or shrink while the array is alive. A dtype that
+        differs from the stack's own element type gives a converted copy.
+
+        Args:
+            dtype: The NumPy dtype of the array, or None for the stack's typecode.
+
+        Returns:
+            A numpy.ndarray over the stack contents.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Time complexity: O(1), or O(n) when converting to another dtype
+        Space complexity: O(1), or O(n) when converting to another dtype
+        """
+        import numpy as np
+
+        result = np.frombuffer(self._data, dtype=self._data.typecode)
+        if dtype is not None and np.dtype(dtype) != result.dtype:
+            return result.astype(dtype)
+        return result
+
+    @classmethod
+    def from_numpy(cls, arr: Any, typecode: Optional[str] = None) -> 'TypedArrayStack':
+        """
+        Create a typed stack from a one-dimensional NumPy array.
+
+        A contiguous array whose element type matches the typecode is copied
+        in a single memory copy, as by push_many.
+
+        Args:
+            arr: A one-dimensional numeric NumPy array.
+            typecode: The typecode of the new stack, or None to use the
+                array's own type (arr.dtype.char).
+
+        Returns:
+            A new stack holding the array's elements, the last on top.
+
+        Raises:
+            ValueError: If the array is not one-dimensional, or its type has
+                no array typecode.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if arr.ndim != 1:
+            raise ValueError("TypedArrayStack.from_numpy requires a one-dimensional array")
+        stack = cls(arr.dtype.char if typecode is None else typecode)
+        stack.push_many(arr)
+        return stack
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Export the stack contents through the buffer protocol (Python 3.12+).
+
+        This allows memoryview(stack) and numpy.frombuffer(stack, ...) to use
+        the stack directly.
+
+        Returns:
+            A memoryview over the underlying array.
+        """
+        return memoryview(self._data)
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the stack.
+
+        Raises:
+            BufferError: If a memoryview of the stack is still alive.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        del self._data[:]
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the stack.
+
+        Returns:
+            A string representation including the typecode and the elements
+            from bottom to top.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        return f"{self.__class__.__name__}('{self._data.typecode}', {self._data.tolist()})"
@@ -0,0 +1,395 @@
+"""
+Undo/redo history built on ArrayStack.
+
+This module records edits as deltas rather than snapshots: each entry holds
+the position of a change, the text it removed and the text it inserted, so
+memory grows with the size of the edits and not with the size of the
+document. Consecutive small edits (typing, backspacing) are merged into one
+entry, and a byte budget drops the oldest history when exceeded.
+
+UndoHistory only stores edits and hands back the edit to apply; TextDocument
+shows how a text buffer uses it.
+"""
+
+import sys
+from typing import Optional
+
+from stack import ArrayStack, EmptyStackError
+
+DEFAULT_BUDGET = 1 << 20  # 1 MiB
+_EDIT_OVERHEAD = sys.getsizeof(object()) + 4 * 8  # Object header plus slots
+
+def _edit_size(removed: str, inserted: str) -> int:
+    """Return the approximate memory used by an edit with the given texts."""
+    return _EDIT_OVERHEAD + sys.getsizeof(removed) + sys.getsizeof(inserted)
+
+class Edit:
+    """
+    A single change to a text: replace removed with inserted at position.
+
+    Pure insertions have an empty removed string and pure deletions an empty
+    inserted string.
+
+    Attributes:
+        position (int): The offset of the change.
+        removed (str): The text that was removed.
+        inserted (str): The text that was inserted.
+        size (int): The approximate number of bytes the edit occupies.
+    """
+
+    __slots__ = ('position', 'removed', 'inserted', 'size')
+
+    def __init__(self, position: int, removed: str, inserted: str) -> None:
+        """
+        Initialize an edit.
+
+        Args:
+            position: The offset of the change.
+            removed: The text that was removed.
+            inserted: The text that was inserted.
+        """
+        self.position = position
+        self.removed = removed
+        self.inserted = inserted
+        self.size = _edit_size(removed, inserted)
+
+    def apply(self, text: str) -> str:
+        """
+        Apply the edit to a text.
+
+        Args:
+            text: The text before the edit.
+
+        Returns:
+            The text after the edit.
+
+        Time complexity: O(n), where n is the length of the text
+        Space complexity: O(n)
+        """
+        end = self.position + len(self.removed)
+        return text[:self.position] + self.inserted + text[end:]
+
+    def inverse(self) -> 'Edit':
+        """
+        Return the edit that undoes this one.
+
+        Returns:
+            A new edit that restores the removed text.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return Edit(self.position, self.inserted, self.removed)
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the edit."""
+        return f"Edit({self.position}, {self.removed!r}, {self.inserted!r})"
+
+class _EditStack(ArrayStack[Edit]):
+    """An ArrayStack of edits that can also drop its oldest entries."""
+
+    def drop_oldest(self, excess: int) -> int:
+        """
+        Remove the oldest edits until at least excess bytes are freed.
+
+        Args:
+            excess: The number of bytes to free.
+
+        Returns:
+            The number of bytes freed.
+
+        Time complexity: O(n)
+        Space complexity: O(1)
+        """
+        freed = 0
+        count = 0
+        for edit in self._data:
+            if freed >= excess:
+                break
+            freed += edit.size
+            count += 1
+        del self._data[:count]
+        return freed
+
+class UndoHistory:
+    """
+    An undo/redo history of edits with coalescing and a memory budget.
+
+    New edits go on the undo stack and clear the redo stack. undo moves the
+    newest edit to the redo stack and returns its inverse for the caller to
+    apply; redo moves it back and returns it.
+
+    An edit is merged into the previous one when both are insertions and the
+    new text continues where the previous one ended, or both are deletions
+    and the new one is next to the previous one (backspace or forward
+    delete). Merging stops at a newline, once the merged text reaches
+    coalesce_limit characters, or after seal is called.
+
+    Attributes:
+        _undo (_EditStack): Edits that can be undone, oldest at the bottom.
+        _redo (ArrayStack[Edit]): Undone edits that can be redone.
+        _bytes (int): The memory used by the edits on both stacks.
+        _sealed (bool): True if the next edit must not be merged.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, coalesce_limit: int = 64) -> None:
+        """
+        Initialize an empty history.
+
+        Args:
+            budget: The maximum number of bytes kept in history. When exceeded,
+                the oldest edits are dropped (default 1 MiB).
+            coalesce_limit: The maximum length of a merged edit, or 0 to
+                disable merging (default 64).
+
+        Raises:
+            ValueError: If budget or coalesce_limit is negative.
+        """
+        if budget < 0 or coalesce_limit < 0:
+            raise ValueError("budget and coalesce_limit must be non-negative")
+        self._undo = _EditStack()
+        self._redo: ArrayStack[Edit] = ArrayStack()
+        self._budget = budget
+        self._coalesce_limit = coalesce_limit
+        self._bytes = 0
+        self._sealed = False
+
+    @property
+    def memory_usage(self) -> int:
+        """The approximate number of bytes used by the recorded edits."""
+        return self._bytes
+
+    def record(self, position: int, removed: str, inserted: str) -> None:
+        """
+        Record an edit that has just been applied.
+
+        Args:
+            position: The offset of the change.
+            removed: The text that was removed.
+            inserted: The text that was inserted.
+
+        Time complexity: O(1) amortized, O(n) when old edits are dropped
+        Space complexity: O(len(removed) + len(inserted))
+        """
+        if not removed and not inserted:
+            return
+        for edit in self._redo:
+            self._bytes -= edit.size
+        self._redo.clear()
+
+        if not self._merge(position, removed, inserted):
+            edit = Edit(position, removed, inserted)
+            self._undo.push(edit)
+            self._bytes += edit.size
+        self._sealed = False
+
+        if self._bytes > self._budget:
+            self._bytes -= self._undo.drop_oldest(self._bytes - self._budget)
+
+    def _merge(self, position: int, removed: str, inserted: str) -> bool:
+        """
+        Try to merge an edit into the newest one on the undo stack.
+
+        Args:
+            position: The offset of the change.
+            removed: The text that was removed.
+            inserted: The text that was inserted.
+
+        Returns:
+            True if the edit was merged, False otherwise.
+        """
+        if self._sealed or self._undo.is_empty():
+            return False
+        top = self._undo.peek()
+        limit = self._coalesce_limit
+        if '\n' in removed or '\n' in inserted or '\n' in top.removed or '\n' in top.inserted:
+            return False
+
+        if not removed and not top.removed:
+            # Typing: the new text continues the previous insertion
+            if position != top.position + len(top.inserted) or len(top.inserted) + len(inserted) > limit:
+                return False
+            top.inserted += inserted
+        elif not inserted and not top.inserted:
+            if len(top.removed) + len(removed) > limit:
+                return False
+            if position + len(removed) == top.position:
+                # Backspace: the new deletion ends where the previous one started
+                top.removed = removed + top.removed
+                top.position = position
+            elif position == top.position:
+                # Forward delete at the same position
+                top.removed += removed
+            else:
+                return False
+        else:
+            return False
+
+        size = _edit_size(top.removed, top.inserted)
+        self._bytes += size - top.size
+        top.size = size
+        return True
+
+    def seal(self) -> None:
+        """
+        Stop the next edit from being merged into the current one.
+
+        Call this when the cursor moves or after a pause in typing.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._sealed = True
+
+    def can_undo(self) -> bool:
+        """Return True if there is an edit to undo."""
+        return not self._undo.is_empty()
+
+    def can_redo(self) -> bool:
+        """Return True if there is an edit to redo."""
+        return not self._redo.is_empty()
+
+    def undo(self) -> Edit:
+        """
+        Move the newest edit to the redo stack.
+
+        Returns:
+            The edit to apply to undo the change.
+
+        Raises:
+            EmptyStackError: If there is nothing to undo.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self._undo.is_empty():
+            raise EmptyStackError("Nothing to undo")
+        edit = self._undo.pop()
+        self._redo.push(edit)
+        self._sealed = True
+        return edit.inverse()
+
+    def redo(self) -> Edit:
+        """
+        Move the most recently undone edit back to the undo stack.
+
+        Returns:
+            The edit to apply to redo the change.
+
+        Raises:
+            EmptyStackError: If there is nothing to redo.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self._redo.is_empty():
+            raise EmptyStackError("Nothing to redo")
+        edit = self._redo.pop()
+        self._undo.push(edit)
+        self._sealed = True
+        return edit
+
+    def clear(self) -> None:
+        """
+        Forget all recorded edits.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._sealed = False
+
+    def __len__(self) -> int:
+        """
+        Return the number of edits that can be undone.
+
+        Returns:
+            The size of the undo stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return len(self._undo)
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the history.
+
+        Returns:
+            A string with the stack sizes and memory use.
+        """
+        return (f"{self.__class__.__name__}(undo={len(self._undo)}, redo={len(self._redo)}, "
+                f"bytes={self._bytes})")
+
+class TextDocument:
+    """
+    A text buffer with undo and redo.
+
+    Attributes:
+        text (str): The current text.
+        history (UndoHistory): The edits made to the text.
+    """
+
+    def __init__(self, text: str = "", history: Optional[UndoHistory] = None) -> None:
+        """
+        Initialize a document.
+
+        Args:
+            text: The initial text.
+            history: The history to record edits in (default: a new
+                UndoHistory with the default budget).
+        """
+        self.text = text
+        self.history = history if history is not None else UndoHistory()
+
+    def replace(self, position: int, length: int, new_text: str) -> None:
+        """
+        Replace length characters at position with new_text.
+
+        Args:
+            position: The offset of the change.
+            length: The number of characters to remove.
+            new_text: The text to insert.
+
+        Raises:
+            IndexError: If the range is outside the text.
+        """
+        if position < 0 or length < 0 or position + length > len(self.text):
+            raise IndexError("Edit range out of bounds")
+        edit = Edit(position, self.text[position:position + length], new_text)
+        self.text = edit.apply(self.text)
+        self.history.record(edit.position, edit.removed, edit.inserted)
+
+    def insert(self, position: int, new_text: str) -> None:
+        """Insert new_text at position."""
+        self.replace(position, 0, new_text)
+
+    def delete(self, position: int, length: int) -> None:
+        """Delete length characters at position."""
+        self.replace(position, length, "")
+
+    def undo(self) -> bool:
+        """
+        Undo the newest change.
+
+        Returns:
+            True if a change was undone, False if there was nothing to undo.
+        """
+        if not self.history.can_undo():
+            return False
+        self.text = self.history.undo().apply(self.text)
+        return True
+
+    def redo(self) -> bool:
+        """
+        Redo the most recently undone change.
+
+        Returns:
+            True if a change was redone, False if there was nothing to redo.
+        """
+        if not self.history.can_redo():
+            return False
+        self.text = self.history.redo().apply(self.text)
+        return True
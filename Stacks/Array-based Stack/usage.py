@@ -3,11 +3,15 @@ Example usage of the Array-based Stack implementation.
 """
 
 from stack import ArrayStack, EmptyStackError
+from bracket_validator import validate_chunks
 
 def balanced_parentheses(expression: str) -> bool:
     """
     Check if an expression has balanced parentheses using a stack.
     
+    This delegates to the streaming validator in bracket_validator.py, which
+    also handles large files in chunks (see validate_file).
+    
     Args:
         expression: A string containing parentheses, brackets, and braces.
         
@@ -15,23 +19,7 @@ def balanced_parentheses(expression: str) -> bool:
         True if all opening brackets have matching closing brackets in the correct order,
         False otherwise.
     """
-    stack = ArrayStack[str]()
-    
-    # Dictionary to store the matching pairs
-    brackets = {')': '(', '}': '{', ']': '['}
-    
-    for char in expression:
-        # If it's an opening bracket, push to stack
-        if char in '({[':
-            stack.push(char)
-        # If it's a closing bracket
-        elif char in ')}]':
-            # If stack is empty or brackets don't match
-            if stack.is_empty() or stack.pop() != brackets[char]:
-                return False
-    
-    # If stack is empty, all brackets were matched
-    return stack.is_empty()
+    return validate_chunks([expression.encode()]).valid
 
 def reverse_string(input_str: str) -> str:
     """
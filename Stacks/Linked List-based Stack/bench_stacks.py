@@ -0,0 +1,73 @@
+"""
+Benchmark comparing LinkedStack, ArrayStack and collections.deque.
+
+For several stack depths, measures push/pop throughput (fill the stack to the
+given depth, then drain it) and the memory held by a full stack. LinkedStack is
+measured with and without a node pool.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from linked_stack import LinkedStack
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Array-based Stack'))
+from stack import ArrayStack  # noqa: E402
+
+
+def make_factories(depth):
+    """Return (name, factory, push_name, pop_name) tuples for each contender."""
+    return [
+        ("ArrayStack", ArrayStack, "push", "pop"),
+        ("LinkedStack", LinkedStack, "push", "pop"),
+        ("LinkedStack(pool)", lambda: LinkedStack(pool_size=depth), "push", "pop"),
+        ("deque", deque, "append", "pop"),
+    ]
+
+
+def throughput(factory, push_name, pop_name, depth, rounds):
+    """Return millions of push+pop pairs per second."""
+    stack = factory()
+    push = getattr(stack, push_name)
+    pop = getattr(stack, pop_name)
+    values = range(depth)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            push(value)
+        for _ in values:
+            pop()
+    elapsed = time.perf_counter() - start
+    return depth * rounds / elapsed / 1e6
+
+
+def memory(factory, push_name, depth):
+    """Return the bytes allocated by a stack holding depth small integers."""
+    tracemalloc.start()
+    stack = factory()
+    push = getattr(stack, push_name)
+    for value in range(depth):
+        push(value & 0xFF)  # Small ints are cached, so only structure is counted
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stack
+    return size
+
+
+def main():
+    print(f"{'depth':>9} {'structure':>18} {'Mops/s':>9} {'bytes/item':>11}")
+    for depth in (10, 1_000, 100_000, 1_000_000):
+        rounds = max(1, 1_000_000 // depth)
+        for name, factory, push_name, pop_name in make_factories(depth):
+            ops = throughput(factory, push_name, pop_name, depth, rounds)
+            per_item = memory(factory, push_name, depth) / depth
+            print(f"{depth:>9} {name:>18} {ops:>9.2f} {per_item:>11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Linked List-based Stack implementation in Python.
+
+This module provides a generic stack data structure implementation
+using a singly linked chain of nodes as the underlying storage.
+"""
+
+from typing import TypeVar, Generic, Iterator, Optional, Any
+
+T = TypeVar('T')
+
+class EmptyStackError(Exception):
+    """Exception raised when attempting to access elements from an empty stack."""
+    pass
+
+class _Node:
+    """
+    A node in the linked stack.
+
+    Nodes use __slots__ so that each one stores only its data and next
+    reference, without a per-instance __dict__.
+    """
+
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data: Any, next: Optional['_Node'] = None) -> None:
+        """
+        Initialize a new node.
+
+        Args:
+            data: The element stored in the node.
+            next: The node beneath this one in the stack (default None).
+        """
+        self.data = data
+        self.next = next
+
+class LinkedStack(Generic[T]):
+    """
+    A linked list-based implementation of the Stack abstract data type.
+
+    A stack is a collection that follows the Last-In-First-Out (LIFO) principle,
+    meaning the last element added is the first one to be removed.
+
+    This implementation keeps a reference to the top node, and each node points
+    to the node beneath it. It has the same interface as ArrayStack.
+
+    Popped nodes can optionally be recycled: with a non-zero pool_size, up to
+    pool_size nodes are kept on a free list and reused by later pushes instead
+    of allocating new nodes. This helps workloads that repeatedly grow and
+    shrink the stack.
+
+    Type parameters:
+        T: The type of elements stored in the stack.
+
+    Attributes:
+        _top (Optional[_Node]): The node at the top of the stack.
+        _size (int): The number of elements in the stack.
+        _free (Optional[_Node]): Head of the chain of recycled nodes.
+        _free_count (int): The number of recycled nodes.
+        _pool_size (int): The maximum number of recycled nodes to keep.
+    """
+
+    def __init__(self, pool_size: int = 0) -> None:
+        """
+        Initialize an empty stack.
+
+        Args:
+            pool_size: The maximum number of popped nodes to keep for reuse
+                (default 0, which disables node recycling).
+
+        Raises:
+            ValueError: If pool_size is negative.
+        """
+        if pool_size < 0:
+            raise ValueError("pool_size must be non-negative")
+        self._top: Optional[_Node] = None
+        self._size: int = 0
+        self._free: Optional[_Node] = None
+        self._free_count: int = 0
+        self._pool_size: int = pool_size
+
+    def push(self, item: T) -> None:
+        """
+        Add an element to the top of the stack.
+
+        Args:
+            item: The element to add to the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        node = self._free
+        if node is None:
+            self._top = _Node(item, self._top)
+        else:
+            # Reuse a recycled node
+            self._free = node.next
+            self._free_count -= 1
+            node.data = item
+            node.next = self._top
+            self._top = node
+        self._size += 1
+
+    def pop(self) -> T:
+        """
+        Remove and return the element at the top of the stack.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        node = self._top
+        if node is None:
+            raise EmptyStackError("Cannot pop from an empty stack")
+        self._top = node.next
+        self._size -= 1
+        item = node.data
+
+        if self._free_count < self._pool_size:
+            # Recycle the node, dropping the reference to the popped element
+            node.data = None
+            node.next = self._free
+            self._free = node
+            self._free_count += 1
+        return item
+
+    def peek(self) -> T:
+        """
+        Return the element at the top of the stack without removing it.
+
+        Returns:
+            The element at the top of the stack.
+
+        Raises:
+            EmptyStackError: If the stack is empty.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        if self._top is None:
+            raise EmptyStackError("Cannot peek at an empty stack")
+        return self._top.data
+
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+
+        Returns:
+            True if the stack contains no elements, False otherwise.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self._top is None
+
+    def size(self) -> int:
+        """
+        Return the number of elements in the stack.
+
+        Returns:
+            The number of elements in the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self._size
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the stack.
+
+        The node pool is kept, so the stack can be refilled without allocating.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        self._top = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the stack.
+
+        This method enables the use of the built-in len() function.
+
+        Returns:
+            The number of elements in the stack.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the stack.
+
+        Returns:
+            A string representation showing the stack contents from top to bottom.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if self.is_empty():
+            return "Stack: []"
+
+        items = [str(item) for item in self]
+        items[0] += " (top)"
+        if len(items) > 1:
+            items[-1] += " (bottom)"
+        return "Stack: [" + ", ".join(items) + "]"
+
+    def __repr__(self) -> str:
+        """
+        Return a detailed string representation of the stack.
+
+        Returns:
+            A string representation listing the elements from bottom to top.
+
+        Time complexity: O(n)
+        Space complexity: O(n)
+        """
+        if self.is_empty():
+            return f"{self.__class__.__name__}[]"
+
+        items = [repr(item) for item in self]
+        items.reverse()
+        return f"{self.__class__.__name__}[{', '.join(items)}]"
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Return an iterator over the stack elements from top to bottom.
+
+        Returns:
+            An iterator over stack elements.
+
+        Time complexity: O(1)
+        Space complexity: O(1)
+        """
+        current = self._top
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, item: T) -> bool:
+        """
+        Check if an item is in the stack.
+
+        Args:
+            item: The item to check for.
+
+        Returns:
+            True if the item is in the stack, False otherwise.
+
+        Time complexity: O(n)
+        Space complexity: O(1)
+        """
+        for value in self:
+            if value is item or value == item:
+                return True
+        return False
@@ -0,0 +1,175 @@
+"""
+Unit tests for the Linked List-based Stack implementation.
+"""
+
+import unittest
+from linked_stack import LinkedStack, EmptyStackError
+
+class TestLinkedStack(unittest.TestCase):
+    """Test suite for the LinkedStack class."""
+    
+    def setUp(self):
+        """Set up a new stack before each test."""
+        self.stack = LinkedStack[int]()
+    
+    def test_initialization(self):
+        """Test that a new stack is empty."""
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.size(), 0)
+        
+    def test_push(self):
+        """Test pushing elements onto the stack."""
+        self.stack.push(1)
+        self.assertEqual(self.stack.size(), 1)
+        self.assertFalse(self.stack.is_empty())
+        
+        self.stack.push(2)
+        self.assertEqual(self.stack.size(), 2)
+        
+    def test_pop(self):
+        """Test popping elements from the stack."""
+        self.stack.push(1)
+        self.stack.push(2)
+        
+        self.assertEqual(self.stack.pop(), 2)
+        self.assertEqual(self.stack.size(), 1)
+        
+        self.assertEqual(self.stack.pop(), 1)
+        self.assertEqual(self.stack.size(), 0)
+        self.assertTrue(self.stack.is_empty())
+    
+    def test_pop_empty(self):
+        """Test popping from an empty stack raises an exception."""
+        with self.assertRaises(EmptyStackError):
+            self.stack.pop()
+    
+    def test_peek(self):
+        """Test peeking at the top element."""
+        self.stack.push(1)
+        self.stack.push(2)
+        
+        self.assertEqual(self.stack.peek(), 2)
+        self.assertEqual(self.stack.size(), 2)  # Size should not change
+    
+    def test_peek_empty(self):
+        """Test peeking at an empty stack raises an exception."""
+        with self.assertRaises(EmptyStackError):
+            self.stack.peek()
+    
+    def test_clear(self):
+        """Test clearing the stack."""
+        self.stack.push(1)
+        self.stack.push(2)
+        
+        self.stack.clear()
+        self.assertTrue(self.stack.is_empty())
+        self.assertEqual(self.stack.size(), 0)
+    
+    def test_len(self):
+        """Test the __len__ method."""
+        self.assertEqual(len(self.stack), 0)
+        
+        self.stack.push(1)
+        self.stack.push(2)
+        
+        self.assertEqual(len(self.stack), 2)
+    
+    def test_string_representation(self):
+        """Test the string representation of the stack."""
+        # Empty stack
+        self.assertEqual(str(self.stack), "Stack: []")
+        
+        # Non-empty stack
+        self.stack.push(1)
+        self.stack.push(2)
+        self.stack.push(3)
+        
+        expected = "Stack: [3 (top), 2, 1 (bottom)]"
+        self.assertEqual(str(self.stack), expected)
+    
+    def test_iteration(self):
+        """Test iterating over the stack."""
+        values = [1, 2, 3, 4, 5]
+        
+        for val in values:
+            self.stack.push(val)
+        
+        # Iteration should be in LIFO order (top to bottom)
+        expected = list(reversed(values))
+        actual = list(self.stack)
+        
+        self.assertEqual(actual, expected)
+    
+    def test_contains(self):
+        """Test the __contains__ method."""
+        self.stack.push(1)
+        self.stack.push(2)
+        
+        self.assertTrue(1 in self.stack)
+        self.assertTrue(2 in self.stack)
+        self.assertFalse(3 in self.stack)
+
+    def test_generic_type(self):
+        """Test that the stack works with different types."""
+        # String stack
+        string_stack = LinkedStack[str]()
+        string_stack.push("hello")
+        string_stack.push("world")
+        
+        self.assertEqual(string_stack.pop(), "world")
+        self.assertEqual(string_stack.pop(), "hello")
+        
+        # Float stack
+        float_stack = LinkedStack[float]()
+        float_stack.push(1.1)
+        float_stack.push(2.2)
+        
+        self.assertEqual(float_stack.pop(), 2.2)
+        self.assertEqual(float_stack.pop(), 1.1)
+
+    def test_repr(self):
+        """Test the detailed string representation of the stack."""
+        self.assertEqual(repr(self.stack), "LinkedStack[]")
+        self.stack.push(1)
+        self.stack.push(2)
+        self.assertEqual(repr(self.stack), "LinkedStack[1, 2]")
+
+    def test_node_pool(self):
+        """Test that popped nodes are recycled up to the pool size."""
+        stack = LinkedStack[int](pool_size=2)
+        for value in range(5):
+            stack.push(value)
+        for _ in range(5):
+            stack.pop()
+        self.assertEqual(stack._free_count, 2)
+
+        # Recycled nodes must not keep popped elements alive
+        self.assertIsNone(stack._free.data)
+
+        stack.push(10)
+        stack.push(11)
+        stack.push(12)
+        self.assertEqual(stack._free_count, 0)
+        self.assertEqual(list(stack), [12, 11, 10])
+        self.assertEqual(stack.pop(), 12)
+        self.assertEqual(stack.peek(), 11)
+
+    def test_pool_size_validation(self):
+        """Test that a negative pool size is rejected."""
+        with self.assertRaises(ValueError):
+            LinkedStack(pool_size=-1)
+
+    def test_pool_clear(self):
+        """Test clearing a stack that uses a node pool."""
+        stack = LinkedStack[int](pool_size=4)
+        stack.push(1)
+        stack.pop()
+        stack.push(2)
+        stack.push(3)
+        stack.clear()
+        self.assertTrue(stack.is_empty())
+        stack.push(4)
+        self.assertEqual(list(stack), [4])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
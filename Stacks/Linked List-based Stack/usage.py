@@ -0,0 +1,89 @@
+"""
+Example usage of the Linked List-based Stack implementation.
+"""
+
+from linked_stack import LinkedStack, EmptyStackError
+
+def evaluate_postfix(expression: str) -> float:
+    """
+    Evaluate a space-separated postfix expression using a stack.
+
+    Args:
+        expression: A postfix expression such as "3 4 + 2 *".
+
+    Returns:
+        The value of the expression.
+    """
+    stack = LinkedStack[float]()
+    operators = {
+        '+': lambda a, b: a + b,
+        '-': lambda a, b: a - b,
+        '*': lambda a, b: a * b,
+        '/': lambda a, b: a / b,
+    }
+
+    for token in expression.split():
+        if token in operators:
+            right = stack.pop()
+            left = stack.pop()
+            stack.push(operators[token](left, right))
+        else:
+            stack.push(float(token))
+
+    return stack.pop()
+
+def main():
+    print("=== Linked Stack Examples ===\n")
+
+    # Example 1: Basic stack operations
+    print("Example 1: Basic stack operations")
+    stack = LinkedStack[int]()
+
+    print(f"Is empty: {stack.is_empty()}")
+
+    stack.push(10)
+    stack.push(20)
+    stack.push(30)
+
+    print(f"Stack after pushing 10, 20, 30: {stack}")
+    print(f"Size: {len(stack)}")
+    print(f"Top element: {stack.peek()}")
+
+    popped = stack.pop()
+    print(f"Popped: {popped}")
+    print(f"Stack after popping: {stack}")
+    print()
+
+    # Example 2: Recycling nodes
+    print("Example 2: Recycling nodes with a node pool")
+    pooled = LinkedStack[int](pool_size=100)
+    for round_number in range(3):
+        for value in range(100):
+            pooled.push(value)
+        while not pooled.is_empty():
+            pooled.pop()
+        print(f"Round {round_number + 1}: {pooled._free_count} nodes ready for reuse")
+    print()
+
+    # Example 3: Evaluating postfix expressions
+    print("Example 3: Evaluating postfix expressions")
+    for expr in ["3 4 +", "5 1 2 + 4 * + 3 -", "2 3 4 * +"]:
+        print(f"'{expr}' = {evaluate_postfix(expr)}")
+    print()
+
+    # Example 4: Error handling
+    print("Example 4: Error handling")
+    empty_stack = LinkedStack[float]()
+
+    try:
+        empty_stack.pop()
+    except EmptyStackError as e:
+        print(f"Error caught: {e}")
+
+    try:
+        empty_stack.peek()
+    except EmptyStackError as e:
+        print(f"Error caught: {e}")
+
+if __name__ == "__main__":
+    main()